@@ -0,0 +1,90 @@
+"""会議の参加者構成（役割と部会）の定義と設定ファイルの読み込み."""
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from meeting_agents import ROLE_INSTRUCTIONS
+
+
+@dataclass
+class RoleGroup:
+    """部会. リード（lead）が部会内の討論を進行し、全体会議に報告する."""
+
+    name: str
+    lead: str
+    members: List[str]
+
+
+@dataclass
+class BoardConfig:
+    """会議の参加者構成.
+
+    roles は役割名から役割の指示への対応（ROLE_INSTRUCTIONS と同じ形）。
+    groups を指定すると階層型の会議になり、部会ごとに並行して討論した後、
+    部会に属さない役割と各部会のリードによる全体会議を行う。
+    """
+
+    roles: Dict[str, str]
+    groups: List[RoleGroup] = field(default_factory=list)
+
+    @property
+    def hierarchical(self) -> bool:
+        return bool(self.groups)
+
+    def plenary_roles(self) -> List[str]:
+        """全体会議で発言する役割（部会に属さない役割と各部会のリード）."""
+        grouped = {member for group in self.groups for member in group.members}
+        leads = {group.lead for group in self.groups}
+        return [role for role in self.roles if role not in grouped or role in leads]
+
+    def validate(self) -> None:
+        if not self.roles:
+            raise ValueError("役割を1つ以上定義してください。")
+        seen_groups = set()
+        assigned: Dict[str, str] = {}
+        for group in self.groups:
+            if group.name in seen_groups:
+                raise ValueError(f"部会名が重複しています: {group.name}")
+            seen_groups.add(group.name)
+            if group.lead not in group.members:
+                raise ValueError(f"部会「{group.name}」のリード {group.lead} がメンバーに含まれていません。")
+            for member in group.members:
+                if member not in self.roles:
+                    raise ValueError(f"部会「{group.name}」のメンバー {member} が役割に定義されていません。")
+                if member in assigned:
+                    raise ValueError(
+                        f"{member} が複数の部会（{assigned[member]}・{group.name}）に属しています。"
+                    )
+                assigned[member] = group.name
+
+
+def default_board() -> BoardConfig:
+    """従来どおり ROLE_INSTRUCTIONS の役割全員で討論する構成."""
+    return BoardConfig(roles=dict(ROLE_INSTRUCTIONS))
+
+
+def load_board_config(path: Path) -> BoardConfig:
+    """JSON形式の参加者構成ファイルを読み込む.
+
+    roles（役割名 → 役割の指示）を省略すると ROLE_INSTRUCTIONS の役割を使う。
+    groups の各要素は name・lead・members を持ち、lead は members に含める。
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    roles = data.get("roles", ROLE_INSTRUCTIONS)
+    if not isinstance(roles, dict) or not all(
+        isinstance(text, str) for text in roles.values()
+    ):
+        raise ValueError("roles は役割名から役割の指示（文字列）への対応で指定してください。")
+    try:
+        groups = [
+            RoleGroup(
+                name=group["name"], lead=group["lead"], members=list(group["members"])
+            )
+            for group in data.get("groups", [])
+        ]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"groups の各要素には name・lead・members を指定してください: {e}") from e
+    board = BoardConfig(roles=dict(roles), groups=groups)
+    board.validate()
+    return board
@@ -0,0 +1,335 @@
+"""エージェント呼び出しの共通ラッパー."""
+import asyncio
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from agents import Agent, RunConfig, Runner
+
+from resilience import HedgePolicy, ModelRouter, usage_tokens
+from streaming import ConsoleStream, StreamTap, stream_field, text_delta
+from tracing import TraceRecorder
+
+if TYPE_CHECKING:
+    from turnstore import SpillingCallRecords
+
+T = TypeVar("T")
+
+# 実行中の呼び出しのエージェント名（モデル実装側から参照する。ドライランのスタブなど）
+CURRENT_AGENT: ContextVar[str] = ContextVar("current_agent", default="")
+
+
+@dataclass
+class CallRecord:
+    """1回のエージェント呼び出しの計測結果."""
+
+    agent: str
+    started_at: float
+    duration: float
+    hedged: bool = False
+    model: str = ""
+    # ストリーミング実行時の、開始から最初/最後のトークンまでの秒数
+    ttft: Optional[float] = None
+    ttlt: Optional[float] = None
+    # 消費トークン数（取れない場合は0）
+    tokens: int = 0
+
+
+class AgentCaller:
+    """Runner.run の呼び出しを一元化する.
+
+    複数の会議を同時に走らせる場合は1つのインスタンスを共有し、
+    max_concurrency で同時に実行中のエージェント呼び出し数を制限する。
+    会議ごとの計測は child() で作った呼び出し元に記録される。
+    hedge を指定すると、遅い呼び出しに複製を発行して先に返った結果を採用する。
+    router を指定すると、モデルごとの健全性に応じてフォールバックモデルへ振り分ける。
+    streaming を有効にすると Runner.run_streamed で実行し、最初/最後のトークンまでの時間を計測する。
+    console を指定すると生成中の本文（markdown・summary）をコンソールに逐次表示する。
+    run_config を指定するとすべての呼び出しに渡す（共有HTTPクライアントの接続プールを使う場合など）。
+    tracer を設定すると、各呼び出しと span() で囲んだ区間をタイムラインに記録する（child() でも共有する）。
+    インスタンスはイベントループ内で生成すること。
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        hedge: Optional[HedgePolicy] = None,
+        router: Optional[ModelRouter] = None,
+        streaming: bool = False,
+        console: Optional[ConsoleStream] = None,
+        run_config: Optional[RunConfig] = None,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency は1以上を指定してください。")
+        self.max_concurrency = max_concurrency
+        self.hedge = hedge
+        self.router = router
+        self.streaming = streaming
+        self.console = console
+        self.run_config = run_config
+        self._limiter = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.tracer: Optional[TraceRecorder] = None
+        self.call_count = 0
+        self.records: Union[List[CallRecord], "SpillingCallRecords"] = []
+
+    def span(self, name: str, category: str, **args: Any) -> ContextManager[None]:
+        """tracer があれば with ブロックの実行中を1区間として記録する."""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, category, **args)
+
+    def trace(self, name: str, category: str, started_at: float, **args: Any) -> None:
+        """tracer があれば started_at から現在までを1区間として記録する."""
+        if self.tracer is not None:
+            self.tracer.add(name, category, started_at, time.time(), **args)
+
+    def child(self) -> "AgentCaller":
+        """同時実行数の上限を共有し、計測記録だけを分けた呼び出し元を返す."""
+        child = AgentCaller.__new__(AgentCaller)
+        child.__dict__.update(self.__dict__)
+        child.call_count = 0
+        child.records = []
+        return child
+
+    async def run(
+        self,
+        agent: Agent,
+        prompt: str,
+        output_type: Type[T],
+        timeout: Optional[float] = None,
+        stream_path: Optional[Path] = None,
+    ) -> T:
+        """エージェントを実行し、最終出力を output_type として返す.
+
+        timeout（秒）を超えた場合は実行中の呼び出しをキャンセルして asyncio.TimeoutError を送出する。
+        ストリーミング実行時に stream_path を指定すると、生成中の本文をそのファイルに逐次書き出す。
+        """
+        self.call_count += 1
+        tap = None
+        if self.streaming:
+            tap = StreamTap(
+                agent.name,
+                stream_field(output_type),
+                console=self.console,
+                path=stream_path,
+            )
+        try:
+            if timeout is None:
+                return await self._run(agent, prompt, output_type, tap)
+            return await asyncio.wait_for(
+                self._run(agent, prompt, output_type, tap), timeout
+            )
+        finally:
+            if tap is not None:
+                tap.close()
+
+    async def _execute(
+        self, agent: Agent, prompt: str, tap: Optional[StreamTap]
+    ) -> Any:
+        kwargs: Dict[str, Any] = (
+            {"run_config": self.run_config} if self.run_config is not None else {}
+        )
+        CURRENT_AGENT.set(agent.name)
+        if not self.streaming:
+            return await Runner.run(agent, prompt, **kwargs)
+        result = Runner.run_streamed(agent, prompt, **kwargs)
+        try:
+            async for event in result.stream_events():
+                delta = text_delta(event)
+                if delta and tap is not None:
+                    tap.feed(delta)
+        except asyncio.CancelledError:
+            result.cancel()
+            raise
+        return result
+
+    async def _call(
+        self, agent: Agent, prompt: str, tap: Optional[StreamTap] = None
+    ) -> Tuple[Any, float]:
+        if self._limiter is None:
+            started_at = time.time()
+            return await self._execute(agent, prompt, tap), started_at
+        async with self._limiter:
+            started_at = time.time()
+            return await self._execute(agent, prompt, tap), started_at
+
+    async def _invoke(
+        self, agent: Agent, prompt: str, tap: Optional[StreamTap] = None
+    ) -> Tuple[Any, float, str]:
+        """1回の呼び出し（router があれば健全なモデルを順に試す）. 戻り値は結果・開始時刻・モデル名."""
+        if self.router is None:
+            result, started_at = await self._call(agent, prompt, tap)
+            return (
+                result,
+                started_at,
+                agent.model if isinstance(agent.model, str) else "",
+            )
+        primary = self.router.chain_for(agent.model)[0]
+        error: Optional[Exception] = None
+        for model in self.router.candidates(agent.model):
+            breaker = self.router.breaker(model)
+            if error is not None and tap is not None:
+                tap.restart()
+            try:
+                result, started_at = await self._call(
+                    agent.clone(model=model), prompt, tap
+                )
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception as exc:
+                breaker.record_failure()
+                error = error or exc
+                continue
+            breaker.record_success(time.time() - started_at)
+            if model != primary:
+                self.router.fallbacks += 1
+            return result, started_at, model
+        assert error is not None
+        raise error
+
+    def _append(self, record: CallRecord) -> None:
+        self.records.append(record)
+        if self.tracer is not None:
+            self.tracer.add(
+                record.agent,
+                "call",
+                record.started_at,
+                record.started_at + record.duration,
+                model=record.model or None,
+                hedged=record.hedged or None,
+            )
+
+    @staticmethod
+    def _record(
+        agent: Agent,
+        started_at: float,
+        model: str,
+        tap: Optional[StreamTap],
+        hedged: bool = False,
+        tokens: int = 0,
+    ) -> CallRecord:
+        ttft, ttlt = tap.timings(started_at) if tap is not None else (None, None)
+        return CallRecord(
+            agent.name,
+            started_at,
+            time.time() - started_at,
+            hedged=hedged,
+            model=model,
+            ttft=ttft,
+            ttlt=ttlt,
+            tokens=tokens,
+        )
+
+    async def _run(
+        self,
+        agent: Agent,
+        prompt: str,
+        output_type: Type[T],
+        tap: Optional[StreamTap] = None,
+    ) -> T:
+        if self.hedge is None:
+            result, started_at, model = await self._invoke(agent, prompt, tap)
+            self._append(
+                self._record(agent, started_at, model, tap, tokens=usage_tokens(result))
+            )
+            return result.final_output_as(output_type)
+        return await self._run_hedged(agent, prompt, output_type, tap)
+
+    async def _run_hedged(
+        self,
+        agent: Agent,
+        prompt: str,
+        output_type: Type[T],
+        tap: Optional[StreamTap] = None,
+    ) -> T:
+        """呼び出しが閾値を超えたら複製を1つ発行し、先に得られた有効な結果を採用する.
+
+        ストリーミング時の部分出力の表示・書き出しは最初の呼び出しだけが行う。
+        複製を発行した呼び出しも所要時間の分布に加える（元の呼び出しの経過時間を閾値で下限を取って記録する）。
+        除外すると遅い呼び出しほど観測されず、閾値が下がり続けて複製が増えていくため。
+        負けた側が結果を返し終えていれば、追加コストの見込みをその実際の消費に置き換える。
+        """
+        hedge = self.hedge
+        assert hedge is not None
+        key = output_type.__name__
+        requested_at = time.time()
+        tasks = [asyncio.ensure_future(self._invoke(agent, prompt, tap))]
+        try:
+            delay = hedge.threshold(key)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                reserved = None if done else hedge.acquire(key)
+                if reserved is not None:
+                    tasks.append(asyncio.ensure_future(self._invoke(agent, prompt)))
+                    winner, result, output, model = await self._first_valid(
+                        tasks, output_type
+                    )
+                    if winner is tasks[1]:
+                        hedge.record_win()
+                    loser = tasks[0] if winner is tasks[1] else tasks[1]
+                    if (
+                        loser.done()
+                        and not loser.cancelled()
+                        and loser.exception() is None
+                    ):
+                        hedge.settle(reserved, usage_tokens(loser.result()[0]))
+                    record = self._record(
+                        agent,
+                        requested_at,
+                        model,
+                        tap,
+                        hedged=True,
+                        tokens=usage_tokens(result),
+                    )
+                    hedge.observe(key, max(record.duration, delay), record.tokens)
+                    self._append(record)
+                    return output
+            result, started_at, model = await tasks[0]
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        record = self._record(
+            agent, started_at, model, tap, tokens=usage_tokens(result)
+        )
+        hedge.observe(key, record.duration, record.tokens)
+        self._append(record)
+        return result.final_output_as(output_type)
+
+    @staticmethod
+    async def _first_valid(
+        tasks: Sequence[asyncio.Future], output_type: Type[T]
+    ) -> Tuple[asyncio.Future, Any, T, str]:
+        """先に完了した有効な結果を返す（失敗した側は無視し、全て失敗したら最初の例外を送出する）."""
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    result, _, model = task.result()
+                    return task, result, result.final_output_as(output_type), model
+                except Exception as exc:
+                    error = error or exc
+        assert error is not None
+        raise error
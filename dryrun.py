@@ -0,0 +1,651 @@
+"""API を呼ばずに会議の呼び出し数・トークン数・費用・所要時間を見積もるドライラン.
+
+実際の会議と同じ _run_board_meeting の進行とプロンプト生成を、ローカルのスタブモデル
+（DryRunModelProvider）に対して実行する。スタブは出力型に合わせた現実的な大きさの仮の出力を返し、
+各呼び出しの入出力トークン数をローカルで見積もる。会議は模擬時計のイベントループ（run_simulated）で
+実行し、各呼び出しは実行履歴のエージェント別平均（ない場合は出力トークン数からの概算）だけ模擬時計を
+進める。実際には待たないため、見積もりは一瞬で終わり、並列化された段階の重なりを反映した
+クリティカルパスの所要時間が毎回同じ値で求まる。
+"""
+import asyncio
+import json
+import selectors
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from agents import Model, ModelProvider, ModelResponse, RunConfig, Usage
+from agents.models import get_default_model
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseTextDeltaEvent,
+    ResponseUsage,
+)
+from pydantic import BaseModel
+
+from board import BoardConfig
+from caller import CURRENT_AGENT
+from meeting_agents import MIN_QA_QUESTIONS, MINUTES_SECTIONS, REFINED_PROPOSAL_SECTIONS
+from speculation import SpeculationStats
+from token_count import estimate_tokens, tokenizer_name
+from workflow import MeetingResult, _run_board_meeting
+
+# モデルごとの料金（USD / 100万トークン、入力・出力）
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-5": (1.25, 10.00),
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-5-nano": (0.05, 0.40),
+}
+
+# 実行履歴がないエージェントの所要時間の概算（固定の待ち時間＋出力トークン数 / 生成速度）
+DEFAULT_LATENCY_BASE = 2.0
+DEFAULT_OUTPUT_TOKENS_PER_SECOND = 50.0
+
+# 仮の出力の大きさ（文字数）。markdown は出力型ごと、それ以外は項目名ごとに指定する
+MARKDOWN_CHARS: Dict[str, int] = {
+    "MinutesOutput": 3000,
+    "QAOutput": 5000,
+    "RefinedProposalOutput": 6000,
+    "ProposalSectionOutput": 800,
+    "EvaluationOutput": 2500,
+    "EvaluationSummary": 2000,
+    "ComparativeEvaluationOutput": 3000,
+}
+FIELD_CHARS: Dict[str, int] = {
+    "summary": 200,
+    "prompt": 120,
+    "rationale": 60,
+    "markdown": 2000,
+}
+DEFAULT_FIELD_CHARS = 60
+# 仮の出力のリストの件数。upcoming はアジェンダ計画で使い切らない件数にする
+LIST_ITEMS: Dict[str, int] = {"upcoming": 8}
+DEFAULT_LIST_ITEMS = 3
+DRY_RUN_TEXT = "これはドライラン用の仮の出力です。"
+# 成果物の仮の本文に含める見出し・質問の行（成果物の検証に通し、修復の呼び出しを見積もりに含めない）
+SAMPLE_MARKDOWN_ITEMS: Dict[str, List[str]] = {
+    "MinutesOutput": [f"## {heading}" for heading in MINUTES_SECTIONS],
+    "QAOutput": [
+        f"Q{number}: {DRY_RUN_TEXT}\nA{number}:"
+        for number in range(1, MIN_QA_QUESTIONS + 1)
+    ],
+    "RefinedProposalOutput": [f"## {heading}" for heading in REFINED_PROPOSAL_SECTIONS],
+}
+
+# 企画書がこれを超えると、企画書全文を含む呼び出しが多いため警告する
+LARGE_PROPOSAL_TOKENS = 20000
+# 企画書がこれを超えると、評価（原版・改訂版・討論ログを含む）の入力がコンテキスト長に収まらない
+MAX_PROPOSAL_TOKENS = 100000
+
+T = TypeVar("T")
+
+
+def _filler(chars: int) -> str:
+    return (DRY_RUN_TEXT * (chars // len(DRY_RUN_TEXT) + 1))[:chars]
+
+
+def _sample_markdown(owner: str) -> str:
+    chars = MARKDOWN_CHARS.get(owner, FIELD_CHARS["markdown"])
+    items = SAMPLE_MARKDOWN_ITEMS.get(owner)
+    if not items:
+        return _filler(chars)
+    per_item = (chars - sum(len(item) + 2 for item in items)) // len(items)
+    text = "".join(f"{item}\n{_filler(per_item)}\n" for item in items)
+    return (text + _filler(chars))[:chars]
+
+
+def _sample_value(annotation: Any, name: str, owner: str) -> Any:
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return next(
+            (value for value in get_args(annotation) if value), get_args(annotation)[0]
+        )
+    if origin is Union:
+        return _sample_value(
+            next(arg for arg in get_args(annotation) if arg is not type(None)),
+            name,
+            owner,
+        )
+    if origin in (list, List):
+        item = get_args(annotation)[0]
+        return [
+            _sample_value(item, name, owner)
+            for _ in range(LIST_ITEMS.get(name, DEFAULT_LIST_ITEMS))
+        ]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return sample_output(annotation).model_dump()
+    if annotation is int:
+        return 5
+    if annotation is float:
+        return 0.5
+    if annotation is bool:
+        return False
+    if name == "markdown":
+        return _sample_markdown(owner)
+    return _filler(FIELD_CHARS.get(name, DEFAULT_FIELD_CHARS))
+
+
+def sample_output(output_type: Type[BaseModel]) -> BaseModel:
+    """output_type の仮の出力（現実的な大きさの本文を持つ有効なインスタンス）を作る."""
+    values = {
+        name: _sample_value(info.annotation, name, output_type.__name__)
+        for name, info in output_type.model_fields.items()
+    }
+    return output_type.model_validate(values)
+
+
+def _input_text(model_input: Any) -> str:
+    if isinstance(model_input, str):
+        return model_input
+    parts = []
+    for item in model_input:
+        content = item.get("content") if isinstance(item, dict) else None
+        parts.append(
+            content
+            if isinstance(content, str)
+            else json.dumps(item, ensure_ascii=False, default=str)
+        )
+    return "\n".join(parts)
+
+
+class _SimulatedSelector(selectors.DefaultSelector):
+    """実行できる処理がなくタイマーだけを待つとき、実際には待たずに模擬時計を次のタイマーまで進める."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.now = 0.0
+
+    def select(
+        self, timeout: Optional[float] = None
+    ) -> List[Tuple[selectors.SelectorKey, int]]:
+        if timeout is None:
+            # タイマーがなく I/O（スレッドからの通知など）だけを待つ場合は実際に待つ
+            return super().select(None)
+        events = super().select(0)
+        if not events and timeout > 0:
+            self.now += timeout
+        return events
+
+
+class _SimulatedEventLoop(asyncio.SelectorEventLoop):
+    """time() が模擬時計を返すイベントループ（asyncio.sleep やタイムアウトは模擬時計で進む）."""
+
+    def __init__(self) -> None:
+        self._simulated = _SimulatedSelector()
+        super().__init__(selector=self._simulated)
+
+    def time(self) -> float:
+        return self._simulated.now
+
+
+def run_simulated(main: Awaitable[T]) -> Tuple[T, float]:
+    """main を模擬時計のイベントループで実行し、結果と模擬時計での経過秒数を返す.
+
+    経過秒数は、呼び出しの待ち（asyncio.sleep）が並行に重なった場合の最長の経路（クリティカルパス）になる。
+    実行中のイベントループがあるスレッドからは呼び出せない。
+    """
+    loop = _SimulatedEventLoop()
+    try:
+        result = loop.run_until_complete(main)
+        elapsed = loop.time()
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+    return result, elapsed
+
+
+@dataclass
+class DryRunCall:
+    """ドライランの1回の呼び出しの見積もり."""
+
+    agent: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    latency: float
+
+
+class DryRunModel(Model):
+    """仮の出力を返し、呼び出しごとの見積もりを記録するスタブモデル.
+
+    見積もった所要時間だけ asyncio.sleep するため、run_simulated の中で使う（模擬時計が進むだけで実際には待たない）。
+    """
+
+    def __init__(self, provider: "DryRunModelProvider", model_name: str):
+        self.provider = provider
+        self.model_name = model_name
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        **kwargs,
+    ) -> ModelResponse:
+        output_type = getattr(output_schema, "output_type", None)
+        if isinstance(output_type, type) and issubclass(output_type, BaseModel):
+            text = sample_output(output_type).model_dump_json()
+        else:
+            text = _filler(FIELD_CHARS["markdown"])
+        prompt = "\n".join(
+            [
+                system_instructions or "",
+                _input_text(input),
+                (
+                    json.dumps(output_schema.json_schema(), ensure_ascii=False)
+                    if output_schema is not None
+                    else ""
+                ),
+            ]
+        )
+        input_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(text)
+        agent = CURRENT_AGENT.get()
+        latency = self.provider.latency(agent, output_tokens)
+        self.provider.calls.append(
+            DryRunCall(agent, self.model_name, input_tokens, output_tokens, latency)
+        )
+        await asyncio.sleep(latency)
+        message = ResponseOutputMessage(
+            id="dry_run", type="message", role="assistant", status="completed",
+            content=[ResponseOutputText(type="output_text", text=text, annotations=[])],
+        )
+        usage = Usage(
+            requests=1, input_tokens=input_tokens, output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+        )
+        return ModelResponse(output=[message], usage=usage, response_id=None)
+
+    async def stream_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        **kwargs,
+    ):
+        """get_response と同じ仮の出力を、本文の差分1件と完了イベントとして返す."""
+        response = await self.get_response(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            tracing,
+            **kwargs,
+        )
+        message = response.output[0]
+        text = message.content[0].text
+        yield ResponseTextDeltaEvent(
+            type="response.output_text.delta",
+            item_id=message.id,
+            output_index=0,
+            content_index=0,
+            delta=text,
+            logprobs=[],
+            sequence_number=0,
+        )
+        usage = ResponseUsage(
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            total_tokens=response.usage.total_tokens,
+            input_tokens_details=response.usage.input_tokens_details,
+            output_tokens_details=response.usage.output_tokens_details,
+        )
+        completed = Response(
+            id="dry_run",
+            object="response",
+            created_at=time.time(),
+            model=self.model_name,
+            output=[message],
+            parallel_tool_calls=False,
+            tool_choice="auto",
+            tools=[],
+            usage=usage,
+        )
+        yield ResponseCompletedEvent(
+            type="response.completed", response=completed, sequence_number=1
+        )
+
+
+class DryRunModelProvider(ModelProvider):
+    """DryRunModel を返すモデルプロバイダ（RunConfig.model_provider に渡す）.
+
+    latencies にはエージェント名ごとの平均所要時間（秒、実行履歴から取得）を渡す。
+    """
+
+    def __init__(self, latencies: Optional[Dict[str, float]] = None):
+        self.latencies = dict(latencies or {})
+        self.calls: List[DryRunCall] = []
+
+    def latency(self, agent: str, output_tokens: int) -> float:
+        if agent in self.latencies:
+            return self.latencies[agent]
+        return DEFAULT_LATENCY_BASE + output_tokens / DEFAULT_OUTPUT_TOKENS_PER_SECOND
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        return DryRunModel(self, model_name or get_default_model())
+
+
+def validate_proposal(proposal_markdown: str) -> Tuple[List[str], List[str]]:
+    """会議を始める前に企画書を確認し、エラーと警告を返す."""
+    errors: List[str] = []
+    warnings: List[str] = []
+    if not proposal_markdown.strip():
+        errors.append("企画書が空です。")
+        return errors, warnings
+    if not any(line.startswith("#") for line in proposal_markdown.splitlines()):
+        warnings.append("見出し（# で始まる行）がありません。企画書の構成を読み取れず、改訂の精度が下がります。")
+    tokens = estimate_tokens(proposal_markdown)
+    if tokens > MAX_PROPOSAL_TOKENS:
+        errors.append(
+            f"企画書が約{tokens}トークンあり、評価の入力（原版・改訂版・討論ログ）がコンテキスト長を超えます"
+            f"（上限の目安: {MAX_PROPOSAL_TOKENS}トークン）。"
+        )
+    elif tokens > LARGE_PROPOSAL_TOKENS:
+        warnings.append(
+            f"企画書が約{tokens}トークンと大きく、全文を含む呼び出し（参加者の発言・成果物作成）の費用が増えます。"
+        )
+    return errors, warnings
+
+
+@dataclass
+class AgentEstimate:
+    """エージェントごとの呼び出し数とトークン数の見積もり."""
+
+    agent: str
+    calls: int
+    input_tokens: int
+    output_tokens: int
+    cost: Optional[float]
+
+
+@dataclass
+class ContextFormatSavings:
+    """討論のプロンプト（ファシリテーターと参加者の呼び出し）の1ターンあたりの入力トークン数の比較."""
+
+    markdown_tokens_per_round: float
+    compact_tokens_per_round: float
+
+    @property
+    def saved_ratio(self) -> float:
+        if not self.markdown_tokens_per_round:
+            return 0.0
+        return 1 - self.compact_tokens_per_round / self.markdown_tokens_per_round
+
+
+def debate_tokens_per_round(calls: List[DryRunCall], meeting: MeetingResult) -> float:
+    """討論の呼び出し（ファシリテーターと発言した役割）の入力トークン数を発言数で割った値."""
+    roles = {turn["role"] for turn in meeting.turns}
+    tokens = sum(
+        call.input_tokens
+        for call in calls
+        if call.agent.startswith("Facilitator") or call.agent in roles
+    )
+    return tokens / len(meeting.turns) if meeting.turns else 0.0
+
+
+@dataclass
+class DryRunResult:
+    """ドライランの見積もり."""
+
+    agents: List[AgentEstimate]
+    calls: List[DryRunCall]
+    projected_duration: float
+    history_agents: int
+    tokenizer: str
+    report: str
+    meeting: Optional[MeetingResult] = None
+    warnings: List[str] = field(default_factory=list)
+    context_savings: Optional[ContextFormatSavings] = None
+
+    @property
+    def total_cost(self) -> Optional[float]:
+        costs = [estimate.cost for estimate in self.agents if estimate.cost is not None]
+        return sum(costs) if len(costs) == len(self.agents) else None
+
+
+def model_price(
+    model: str, prices: Dict[str, Tuple[float, float]] = MODEL_PRICES
+) -> Optional[Tuple[float, float]]:
+    """料金表から model の料金を返す（日付つきのスナップショット名は最長一致で引く）."""
+    matches = [name for name in prices if model == name or model.startswith(name + "-")]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def call_cost(
+    call: DryRunCall, prices: Dict[str, Tuple[float, float]] = MODEL_PRICES
+) -> Optional[float]:
+    price = model_price(call.model, prices)
+    if price is None:
+        return None
+    input_price, output_price = price
+    return (
+        call.input_tokens * input_price + call.output_tokens * output_price
+    ) / 1_000_000
+
+
+def summarize_calls(calls: List[DryRunCall]) -> List[AgentEstimate]:
+    """呼び出しをエージェント別に集計する（最初に呼び出した順）."""
+    estimates: Dict[str, AgentEstimate] = {}
+    for call in calls:
+        estimate = estimates.setdefault(
+            call.agent, AgentEstimate(call.agent, 0, 0, 0, 0.0)
+        )
+        estimate.calls += 1
+        estimate.input_tokens += call.input_tokens
+        estimate.output_tokens += call.output_tokens
+        cost = call_cost(call)
+        estimate.cost = (
+            None if cost is None or estimate.cost is None else estimate.cost + cost
+        )
+    return list(estimates.values())
+
+
+def _format_cost(cost: Optional[float]) -> str:
+    return "料金表にないモデル" if cost is None else f"${cost:.4f}"
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, rest = divmod(int(round(seconds)), 60)
+    return f"{minutes}分{rest:02d}秒" if minutes else f"{rest}秒"
+
+
+def _render_dry_run_report(
+    agents: List[AgentEstimate],
+    calls: List[DryRunCall],
+    projected_duration: float,
+    history_agents: int,
+    tokenizer: str,
+    warnings: List[str],
+    speculation: Optional[SpeculationStats] = None,
+    context_savings: Optional[ContextFormatSavings] = None,
+) -> str:
+    costs = [e.cost for e in agents if e.cost is not None]
+    total_cost = sum(costs) if len(costs) == len(agents) else None
+    models = sorted({call.model for call in calls})
+    report = f"""# 経営会議 ドライラン見積もり
+
+## 概要
+- エージェント呼び出し: {len(calls)}回
+- 入力トークン: {sum(call.input_tokens for call in calls):,}
+- 出力トークン: {sum(call.output_tokens for call in calls):,}
+- 想定費用: {_format_cost(total_cost)}（モデル: {', '.join(models)}）
+- 想定所要時間: {_format_duration(projected_duration)}（並行する呼び出しの重なりを反映したクリティカルパス）
+- トークン数の見積もり: {tokenizer}
+- 所要時間の根拠: 実行履歴のあるエージェント{history_agents}種類（それ以外は出力トークン数からの概算）
+
+## エージェント別
+
+| エージェント | 呼び出し | 入力トークン/回 | 出力トークン/回 | 想定費用 |
+|--------------|----------|-----------------|-----------------|----------|
+"""
+    for estimate in agents:
+        report += (
+            f"| {estimate.agent} | {estimate.calls} "
+            f"| {estimate.input_tokens // estimate.calls:,} "
+            f"| {estimate.output_tokens // estimate.calls:,} "
+            f"| {_format_cost(estimate.cost)} |\n"
+        )
+    if speculation is not None:
+        report += (
+            "\n## 投機的実行\n"
+            f"- 的中: {speculation.hits}/{speculation.attempts}回"
+            f"（的中率 {speculation.hit_rate:.0%}）\n"
+            f"- 外れ: 発言者 {speculation.speaker_misses}回・"
+            f"指示 {speculation.instruction_misses}回"
+            f"（取り消し {speculation.cancelled}回）\n"
+            f"- 無駄になったトークン: {speculation.wasted_tokens:,}"
+            f"（うち取り消した呼び出しの入力見積もり {speculation.cancelled_tokens:,}）\n"
+        )
+    if context_savings is not None:
+        report += (
+            "\n## 発言履歴の簡潔な形式（compact）\n"
+            "- 討論の入力トークン/ターン: "
+            f"Markdown {context_savings.markdown_tokens_per_round:,.0f} → "
+            f"compact {context_savings.compact_tokens_per_round:,.0f}"
+            f"（{context_savings.saved_ratio:.0%}削減）\n"
+        )
+    if warnings:
+        report += "\n## 企画書の確認\n\n" + "".join(
+            f"- ⚠️ {warning}\n" for warning in warnings
+        )
+    return report
+
+
+def _simulate_meeting(
+    proposal_markdown: str, provider: DryRunModelProvider, **options: Any
+) -> Tuple[MeetingResult, float]:
+    """スタブモデルで会議を模擬時計上で実行し、会議結果と想定所要時間（クリティカルパス）を返す."""
+    meetings: List[MeetingResult] = []
+    _, elapsed = run_simulated(
+        _run_board_meeting(
+            proposal_markdown=proposal_markdown,
+            verbose=False,
+            on_result=meetings.append,
+            run_config=RunConfig(model_provider=provider, tracing_disabled=True),
+            **options,
+        )
+    )
+    return meetings[0], elapsed
+
+
+def run_dry_run(
+    proposal_markdown: str,
+    rounds: int = 12,
+    context_turns: int = 6,
+    latencies: Optional[Dict[str, float]] = None,
+    agenda_size: int = 1,
+    digest_block_size: Optional[int] = None,
+    board: Optional[BoardConfig] = None,
+    group_rounds: Optional[int] = None,
+    section_refine: bool = False,
+    axis_evaluate: bool = False,
+    opening_statements: bool = False,
+    draft_interval: Optional[int] = None,
+    speculate: bool = False,
+    context_format: str = "markdown",
+    validate_outputs: bool = False,
+) -> DryRunResult:
+    """API を呼ばずに会議を実行し、呼び出し数・トークン数・費用・所要時間を見積もる.
+
+    企画書に問題がある場合（空など）は会議を行わず ValueError を送出する。
+    latencies にはエージェント別の平均所要時間（RunStore.average_latencies）を渡す。
+    想定所要時間は、各呼び出しが見積もった時間だけ模擬時計を進めて会議を1回実行したときの
+    クリティカルパスの長さ（実際には待たないため毎回同じ値になる）。
+    context_format が "compact" の場合は Markdown の会議も実行し、
+    討論の1ターンあたりの入力トークン数の削減を context_savings とレポートに含める。
+    実行中のイベントループがあるスレッドからは呼び出せない。
+    """
+    errors, warnings = validate_proposal(proposal_markdown)
+    if errors:
+        raise ValueError(" ".join(errors))
+
+    options: Dict[str, Any] = dict(
+        rounds=rounds,
+        context_turns=context_turns,
+        agenda_size=agenda_size,
+        digest_block_size=digest_block_size,
+        board=board,
+        group_rounds=group_rounds,
+        section_refine=section_refine,
+        axis_evaluate=axis_evaluate,
+        opening_statements=opening_statements,
+        draft_interval=draft_interval,
+        speculate=speculate,
+        validate_outputs=validate_outputs,
+    )
+    provider = DryRunModelProvider(latencies)
+    meeting, projected_duration = _simulate_meeting(
+        proposal_markdown, provider, context_format=context_format, **options
+    )
+    context_savings = None
+    if context_format == "compact":
+        # 同じ条件の Markdown の会議も実行し、討論の入力トークン数を比べる
+        baseline = DryRunModelProvider(latencies)
+        baseline_meeting, _ = _simulate_meeting(
+            proposal_markdown, baseline, context_format="markdown", **options
+        )
+        context_savings = ContextFormatSavings(
+            markdown_tokens_per_round=debate_tokens_per_round(
+                baseline.calls, baseline_meeting
+            ),
+            compact_tokens_per_round=debate_tokens_per_round(provider.calls, meeting),
+        )
+    agents = summarize_calls(provider.calls)
+    history_agents = len(
+        {call.agent for call in provider.calls if call.agent in provider.latencies}
+    )
+    return DryRunResult(
+        agents=agents,
+        calls=provider.calls,
+        projected_duration=projected_duration,
+        history_agents=history_agents,
+        tokenizer=tokenizer_name(),
+        report=_render_dry_run_report(
+            agents,
+            provider.calls,
+            projected_duration,
+            history_agents,
+            tokenizer_name(),
+            warnings,
+            speculation=meeting.speculation,
+            context_savings=context_savings,
+        ),
+        meeting=meeting,
+        warnings=warnings,
+        context_savings=context_savings,
+    )
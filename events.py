@@ -0,0 +1,54 @@
+"""会議の進行中に発生するイベント（MeetingSession のイベントストリームで受け取る）."""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
+from models import ParticipantResponse
+
+
+@dataclass
+class TurnStarted:
+    """発言者が決まり、発言の生成を始めた.
+
+    round は討論（部会がある場合は部会ごと）の何ラウンド目か（1始まり）。
+    """
+
+    round: int
+    speaker: str
+    group: Optional[str] = None
+
+
+@dataclass
+class TurnFinished:
+    """発言の生成が終わった."""
+
+    round: int
+    speaker: str
+    response: ParticipantResponse
+    model: str = ""
+    group: Optional[str] = None
+
+
+@dataclass
+class ArtifactReady:
+    """成果物（minutes・qa・refined_proposal・evaluation）が完成した."""
+
+    kind: str
+    markdown: str
+    model: str = ""
+
+
+@dataclass
+class MeetingMetrics:
+    """会議全体の計測値（最後のイベント）.
+
+    repairs は成果物ごとの不足分を補った呼び出し回数（validate_outputs 指定時のみ）。
+    """
+
+    duration: float
+    calls: int
+    turns: int
+    degradation: List[str] = field(default_factory=list)
+    repairs: Dict[str, int] = field(default_factory=dict)
+
+
+MeetingEvent = Union[TurnStarted, TurnFinished, ArtifactReady, MeetingMetrics]
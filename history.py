@@ -0,0 +1,568 @@
+"""会議実行履歴のローカルストア（SQLite＋圧縮済みの内容アドレス型Blob）とCLI.
+
+使い方:
+    python history.py runs --proposal inputs/proposal.md
+    python history.py trend --proposal inputs/proposal.md
+    python history.py stages --days 7
+    python history.py show <run_id> --artifact minutes
+    python history.py prune --keep 50
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # 型注釈のためだけに読み込む（履歴CLIでエージェント実行系を読み込まないようにする）
+    from workflow import MeetingResult
+
+DEFAULT_HISTORY_DIR = "./history"
+# CLI（main.py）で記録するときに残す実行件数の既定値
+DEFAULT_HISTORY_KEEP = 200
+# 書き込み直後でまだ実行から参照されていないBlobをGCで消さないための猶予（秒）
+DEFAULT_BLOB_GRACE = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    group_id TEXT,
+    proposal_hash TEXT NOT NULL,
+    proposal_name TEXT NOT NULL DEFAULT '',
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    rounds INTEGER NOT NULL,
+    call_count INTEGER NOT NULL,
+    total_original INTEGER,
+    total_refined INTEGER,
+    verdict TEXT,
+    settings TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_proposal ON runs(proposal_hash, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_name ON runs(proposal_name, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_group ON runs(group_id);
+
+CREATE TABLE IF NOT EXISTS turns (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    concerns TEXT NOT NULL,
+    proposals TEXT NOT NULL,
+    questions TEXT NOT NULL,
+    model TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (run_id, idx)
+);
+CREATE INDEX IF NOT EXISTS idx_turns_role ON turns(role);
+
+CREATE TABLE IF NOT EXISTS calls (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    agent TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    model TEXT NOT NULL DEFAULT '',
+    ttft REAL,
+    ttlt REAL,
+    PRIMARY KEY (run_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_calls_started ON calls(started_at, agent);
+
+CREATE TABLE IF NOT EXISTS scores (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    axis TEXT NOT NULL,
+    original INTEGER NOT NULL,
+    refined INTEGER NOT NULL,
+    PRIMARY KEY (run_id, axis)
+);
+CREATE INDEX IF NOT EXISTS idx_scores_axis ON scores(axis);
+
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    blob_hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    model TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (run_id, kind)
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_blob ON artifacts(blob_hash);
+"""
+
+# 既存のDBに後から追加した列（テーブル名, 列名, 定義）
+_ADDED_COLUMNS = [
+    ("turns", "model", "TEXT NOT NULL DEFAULT ''"),
+    ("calls", "model", "TEXT NOT NULL DEFAULT ''"),
+    ("artifacts", "model", "TEXT NOT NULL DEFAULT ''"),
+    ("calls", "ttft", "REAL"),
+    ("calls", "ttlt", "REAL"),
+]
+
+
+class RunStore:
+    """会議の実行履歴を保存・検索する.
+
+    メタデータ・発言・計測値・スコアは root/history.sqlite3 に、成果物の本文は
+    SHA-256 をキーにzlib圧縮して root/blobs/ に保存する（同一内容は1つだけ保持）。
+    ディレクトリとDBは最初の書き込み・読み出し時に作成される。
+    keep を指定すると、記録のたびに新しい順に keep 件を残して古い実行と参照されなくなったBlobを削除する。
+    Blobの書き込みから行の挿入まで、およびGCはDBの書き込みロック（BEGIN IMMEDIATE）の下で行うため、
+    別プロセスのGCが記録途中のBlobを消すことはない。記録を経ずに put_blob したBlobは、
+    更新から blob_grace 秒が経つまでGCの対象にしない（一時ファイルは常に対象外）。
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        keep: Optional[int] = None,
+        blob_grace: float = DEFAULT_BLOB_GRACE,
+    ):
+        if keep is not None and keep < 1:
+            raise ValueError("keep は1以上を指定してください。")
+        self.root = Path(root)
+        self.keep = keep
+        self.blob_grace = blob_grace
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def blob_dir(self) -> Path:
+        return self.root / "blobs"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.root / "history.sqlite3", timeout=30.0)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(_SCHEMA)
+            self._migrate(self._conn)
+        return self._conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        for table, column, definition in _ADDED_COLUMNS:
+            columns = {
+                row["name"] for row in conn.execute(f"PRAGMA table_info({table})")
+            }
+            if column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[sqlite3.Connection]:
+        """他プロセスの記録・GCと排他するトランザクション（BEGIN IMMEDIATE）."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --- Blob ---------------------------------------------------------------
+
+    def _blob_path(self, blob_hash: str) -> Path:
+        return self.blob_dir / blob_hash[:2] / blob_hash[2:]
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        """既存のBlobの更新時刻を現在にしてGCの猶予を延ばす。存在しなければ False."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def put_blob(self, data: bytes) -> str:
+        blob_hash = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(blob_hash)
+        if not self._touch(path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            tmp_path.write_bytes(zlib.compress(data, 9))
+            os.replace(tmp_path, path)
+        return blob_hash
+
+    def put_blob_file(self, path: Path, chunk_size: int = 1 << 20) -> str:
+        """ファイルを読み込み全体をメモリに載せずにBlobとして保存する."""
+        digest = hashlib.sha256()
+        compressor = zlib.compressobj(9)
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.blob_dir / f"{uuid.uuid4().hex}.tmp"
+        with open(path, "rb") as source, open(tmp_path, "wb") as target:
+            for chunk in iter(lambda: source.read(chunk_size), b""):
+                digest.update(chunk)
+                target.write(compressor.compress(chunk))
+            target.write(compressor.flush())
+        blob_hash = digest.hexdigest()
+        blob_path = self._blob_path(blob_hash)
+        if self._touch(blob_path):
+            tmp_path.unlink()
+        else:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, blob_path)
+        return blob_hash
+
+    def get_blob(self, blob_hash: str) -> bytes:
+        return zlib.decompress(self._blob_path(blob_hash).read_bytes())
+
+    # --- 書き込み -----------------------------------------------------------
+
+    def record_run(
+        self,
+        result: "MeetingResult",
+        proposal_markdown: str,
+        settings: Dict[str, Any],
+        proposal_name: str = "",
+        group_id: Optional[str] = None,
+    ) -> str:
+        """会議結果を1件記録し、run_id を返す."""
+        run_id = uuid.uuid4().hex
+        evaluation = result.evaluation_output
+        artifacts = {
+            "proposal": proposal_markdown,
+            "minutes": result.minutes,
+            "qa": result.qa,
+            "refined_proposal": result.refined_proposal,
+            "discussion_log": result.discussion_log,
+            "evaluation": result.evaluation,
+        }
+        with self._write_lock() as conn:
+            # Blobの書き込みから参照行の挿入までの間に他プロセスのGCが走らないよう、ロック内で書く
+            blob_hashes = {
+                kind: self.put_blob(text.encode("utf-8"))
+                for kind, text in artifacts.items()
+            }
+            sizes = {
+                kind: len(text.encode("utf-8")) for kind, text in artifacts.items()
+            }
+            if result.discussion_log_path is not None:
+                # 省メモリモードの対話履歴はファイルから直接保存する
+                blob_hashes["discussion_log"] = self.put_blob_file(
+                    result.discussion_log_path
+                )
+                sizes["discussion_log"] = result.discussion_log_path.stat().st_size
+
+            conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    group_id,
+                    blob_hashes["proposal"],
+                    proposal_name,
+                    result.started_at or time.time(),
+                    result.duration,
+                    len(result.turns),
+                    len(result.call_records),
+                    (
+                        evaluation.total_original
+                        if evaluation and evaluation.axis_scores
+                        else None
+                    ),
+                    (
+                        evaluation.total_refined
+                        if evaluation and evaluation.axis_scores
+                        else None
+                    ),
+                    evaluation.verdict if evaluation and evaluation.verdict else None,
+                    json.dumps(settings, ensure_ascii=False, sort_keys=True),
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO turns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        idx,
+                        turn["role"],
+                        turn["decision"].prompt,
+                        turn["response"].summary,
+                        json.dumps(turn["response"].concerns, ensure_ascii=False),
+                        json.dumps(turn["response"].proposals, ensure_ascii=False),
+                        json.dumps(turn["response"].questions, ensure_ascii=False),
+                        turn.get("model", ""),
+                    )
+                    for idx, turn in enumerate(result.turns, start=1)
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO calls "
+                "(run_id, seq, agent, started_at, duration, model, ttft, ttlt) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        seq,
+                        record.agent,
+                        record.started_at,
+                        record.duration,
+                        record.model,
+                        record.ttft,
+                        record.ttlt,
+                    )
+                    for seq, record in enumerate(result.call_records, start=1)
+                ],
+            )
+            if evaluation is not None:
+                conn.executemany(
+                    "INSERT INTO scores VALUES (?, ?, ?, ?)",
+                    [
+                        (run_id, score.axis, score.original, score.refined)
+                        for score in evaluation.scores_by_axis().values()
+                    ],
+                )
+            conn.executemany(
+                "INSERT INTO artifacts VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        kind,
+                        blob_hashes[kind],
+                        sizes[kind],
+                        result.artifact_models.get(kind, ""),
+                    )
+                    for kind in artifacts
+                ],
+            )
+        if self.keep is not None and self._delete_old_runs(self.keep):
+            self.collect_garbage()
+        return run_id
+
+    # --- 検索 ---------------------------------------------------------------
+
+    def _proposal_filter(self, proposal: Optional[str]) -> Tuple[str, tuple]:
+        """企画書ファイルのパス・本文ハッシュ・名前のいずれかで runs を絞り込む条件."""
+        if proposal is None:
+            return "1 = 1", ()
+        path = Path(proposal).expanduser()
+        if path.is_file():
+            proposal_hash = hashlib.sha256(
+                path.read_text(encoding="utf-8").encode("utf-8")
+            ).hexdigest()
+            return "runs.proposal_hash = ?", (proposal_hash,)
+        where = "(runs.proposal_hash = ? OR runs.proposal_name = ?)"
+        return where, (proposal, proposal)
+
+    def resolve_run_id(self, prefix: str) -> str:
+        rows = self._connect().execute(
+            "SELECT run_id FROM runs WHERE run_id LIKE ? LIMIT 2", (prefix + "%",)
+        ).fetchall()
+        if len(rows) != 1:
+            raise KeyError(f"run_id を特定できません: {prefix}")
+        return rows[0]["run_id"]
+
+    def list_runs(
+        self, proposal: Optional[str] = None, limit: int = 50
+    ) -> List[sqlite3.Row]:
+        where, params = self._proposal_filter(proposal)
+        rows = self._connect().execute(
+            f"SELECT * FROM runs WHERE {where} ORDER BY started_at DESC LIMIT ?",
+            params + (limit,),
+        )
+        return rows.fetchall()
+
+    def score_trend(
+        self, proposal: Optional[str] = None, axis: Optional[str] = None
+    ) -> List[sqlite3.Row]:
+        """実行順のスコア推移（axis 指定時はその観点、未指定時は合計点）."""
+        where, params = self._proposal_filter(proposal)
+        if axis is None:
+            rows = self._connect().execute(
+                "SELECT run_id, started_at, total_original AS original, "
+                "total_refined AS refined, verdict "
+                f"FROM runs WHERE {where} AND total_refined IS NOT NULL "
+                "ORDER BY started_at",
+                params,
+            )
+            return rows.fetchall()
+        rows = self._connect().execute(
+            "SELECT runs.run_id, runs.started_at, scores.original, scores.refined, "
+            "runs.verdict FROM runs JOIN scores ON scores.run_id = runs.run_id "
+            f"WHERE {where} AND scores.axis = ? ORDER BY runs.started_at",
+            params + (axis,),
+        )
+        return rows.fetchall()
+
+    def slowest_stages(self, since: float, limit: int = 10) -> List[sqlite3.Row]:
+        """since 以降のエージェント（段階）別の呼び出し時間を平均の遅い順に返す.
+
+        avg_ttft はストリーミング実行で計測した最初のトークンまでの平均秒数（計測がなければ NULL）。
+        """
+        rows = self._connect().execute(
+            "SELECT agent, COUNT(*) AS calls, AVG(duration) AS avg_duration, "
+            "MAX(duration) AS max_duration, SUM(duration) AS total_duration, "
+            "AVG(ttft) AS avg_ttft FROM calls WHERE started_at >= ? "
+            "GROUP BY agent ORDER BY avg_duration DESC LIMIT ?",
+            (since, limit),
+        )
+        return rows.fetchall()
+
+    def average_latencies(self, since: float = 0.0) -> Dict[str, float]:
+        """since 以降のエージェント別の平均呼び出し時間（秒）."""
+        rows = self._connect().execute(
+            "SELECT agent, AVG(duration) AS avg_duration FROM calls "
+            "WHERE started_at >= ? GROUP BY agent",
+            (since,),
+        )
+        return {row["agent"]: row["avg_duration"] for row in rows.fetchall()}
+
+    def get_artifact(self, run_id: str, kind: str) -> str:
+        row = self._connect().execute(
+            "SELECT blob_hash FROM artifacts WHERE run_id = ? AND kind = ?",
+            (run_id, kind),
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"{run_id} の {kind} は記録されていません。")
+        return self.get_blob(row["blob_hash"]).decode("utf-8")
+
+    # --- 容量管理 -----------------------------------------------------------
+
+    def _delete_old_runs(self, keep: int) -> int:
+        conn = self._connect()
+        with conn:
+            return conn.execute(
+                "DELETE FROM runs WHERE run_id NOT IN "
+                "(SELECT run_id FROM runs ORDER BY started_at DESC LIMIT ?)",
+                (keep,),
+            ).rowcount
+
+    def prune(self, keep: int) -> int:
+        """新しい順に keep 件を残して古い実行を削除し、参照されなくなったBlobを消す."""
+        deleted = self._delete_old_runs(keep)
+        self.collect_garbage()
+        return deleted
+
+    def collect_garbage(self) -> int:
+        """どの実行からも参照されていないBlobファイルを削除する.
+
+        書き込み中の一時ファイルと、更新から blob_grace 秒以内のBlobは残す。
+        """
+        removed = 0
+        if not self.blob_dir.exists():
+            return removed
+        with self._write_lock() as conn:
+            referenced = {
+                row["blob_hash"]
+                for row in conn.execute("SELECT DISTINCT blob_hash FROM artifacts")
+            }
+            cutoff = time.time() - self.blob_grace
+            for path in self.blob_dir.glob("??/*"):
+                if path.suffix == ".tmp" or path.parent.name + path.name in referenced:
+                    continue
+                try:
+                    if path.stat().st_mtime > cutoff:
+                        continue
+                    path.unlink()
+                except FileNotFoundError:
+                    continue
+                removed += 1
+        return removed
+
+    def disk_usage(self) -> int:
+        return sum(
+            path.stat().st_size for path in self.root.rglob("*") if path.is_file()
+        )
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="経営会議の実行履歴を検索します。")
+    parser.add_argument(
+        "--history-dir",
+        default=DEFAULT_HISTORY_DIR,
+        help=f"履歴ストアのディレクトリ（デフォルト: {DEFAULT_HISTORY_DIR}）",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    runs = subparsers.add_parser("runs", help="実行一覧")
+    runs.add_argument("--proposal", help="企画書ファイルのパス、またはハッシュ/名前")
+    runs.add_argument("--limit", type=int, default=50)
+
+    trend = subparsers.add_parser("trend", help="スコア推移")
+    trend.add_argument("--proposal", help="企画書ファイルのパス、またはハッシュ/名前")
+    trend.add_argument("--axis", help="評価観点（未指定時は合計点）")
+
+    stages = subparsers.add_parser("stages", help="段階（エージェント）別の所要時間")
+    stages.add_argument("--days", type=float, default=7, help="直近何日分を対象にするか（デフォルト: 7）")
+
+    show = subparsers.add_parser("show", help="記録された成果物を表示")
+    show.add_argument("run_id")
+    show.add_argument(
+        "--artifact",
+        default="minutes",
+        help="proposal/minutes/qa/refined_proposal/discussion_log/evaluation",
+    )
+
+    prune = subparsers.add_parser("prune", help="古い実行と不要なBlobを削除")
+    prune.add_argument("--keep", type=int, required=True, help="残す実行件数")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    store = RunStore(Path(args.history_dir).expanduser().resolve())
+
+    if args.command == "runs":
+        for row in store.list_runs(args.proposal, args.limit):
+            total = (
+                f"{row['total_original']}→{row['total_refined']}"
+                if row["total_refined"] is not None
+                else "-"
+            )
+            name = row["proposal_name"] or row["proposal_hash"][:12]
+            print(
+                f"{row['run_id'][:12]}  {_format_time(row['started_at'])}  {name}"
+                f"  ラウンド:{row['rounds']}  所要:{row['duration']:.1f}秒"
+                f"  スコア:{total}  判定:{row['verdict'] or '-'}"
+            )
+    elif args.command == "trend":
+        for row in store.score_trend(args.proposal, args.axis):
+            print(
+                f"{_format_time(row['started_at'])}  {row['original']}→{row['refined']}"
+                f"  {row['verdict'] or '-'}"
+            )
+    elif args.command == "stages":
+        since = time.time() - args.days * 86400
+        for row in store.slowest_stages(since):
+            ttft = (
+                f" / 最初のトークンまで平均 {row['avg_ttft']:.1f}秒"
+                if row["avg_ttft"] is not None
+                else ""
+            )
+            print(
+                f"{row['agent']}: 平均 {row['avg_duration']:.1f}秒"
+                f" / 最大 {row['max_duration']:.1f}秒"
+                f" / 合計 {row['total_duration']:.1f}秒（{row['calls']}回）{ttft}"
+            )
+    elif args.command == "show":
+        try:
+            print(store.get_artifact(store.resolve_run_id(args.run_id), args.artifact))
+        except KeyError as exc:
+            print(f"❌ {exc.args[0]}")
+            sys.exit(1)
+    elif args.command == "prune":
+        deleted = store.prune(args.keep)
+        print(f"🧹 {deleted}件の実行を削除しました（使用容量: {store.disk_usage() / 1024:.0f} KB）")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""全エージェント・同時実行する全会議で共有するHTTP接続プール."""
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+from agents import RunConfig
+from agents.models.multi_provider import MultiProvider
+from openai import AsyncOpenAI
+
+# httpcore が新しい接続を確立したときに送るトレースイベント
+_CONNECT_EVENT = "connection.connect_tcp.complete"
+
+
+@dataclass
+class HttpPoolConfig:
+    """共有HTTPクライアントの設定.
+
+    max_connections は同時に開く接続数の上限、max_keepalive_connections は
+    アイドル状態で保持する接続数の上限（未指定時は max_connections。keepalive_expiry 秒で切断）。
+    http2 を有効にすると1本の接続で複数の呼び出しを多重化する（h2 パッケージが必要）。
+    max_retries は接続エラー・429・5xx の応答に対してOpenAIクライアントが再試行する回数。
+    """
+
+    max_connections: int = 64
+    max_keepalive_connections: Optional[int] = None
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 10.0
+    timeout: float = 600.0
+    http2: bool = False
+    max_retries: int = 2
+
+    def validate(self) -> None:
+        if self.max_connections < 1:
+            raise ValueError("max_connections は1以上を指定してください。")
+        if self.max_retries < 0:
+            raise ValueError("max_retries は0以上を指定してください。")
+        keepalive = self.max_keepalive_connections
+        if keepalive is not None and not 0 <= keepalive <= self.max_connections:
+            raise ValueError(
+                "max_keepalive_connections は0以上 max_connections 以下を指定してください。"
+            )
+        if self.http2:
+            try:
+                import h2  # type: ignore[import-not-found]  # noqa: F401
+            except ImportError as e:
+                raise ValueError(
+                    "HTTP/2 を使うには h2 パッケージが必要です（pip install 'httpx[http2]'）。"
+                ) from e
+
+
+@dataclass
+class PoolStats:
+    """接続プールの統計（stats() 呼び出し時点のスナップショット）."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    peak_connections: int = 0
+    open_connections: int = 0
+    idle_connections: int = 0
+
+    @property
+    def requests_per_connection(self) -> float:
+        return (
+            self.requests / self.connections_opened if self.connections_opened else 0.0
+        )
+
+
+class _CountingTransport(httpx.AsyncHTTPTransport):
+    """リクエスト数と新規接続数を数えるトランスポート."""
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.requests = 0
+        self.connections_opened = 0
+        self.peak_connections = 0
+
+    @property
+    def connections(self) -> list:
+        return list(self._pool.connections)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        request.extensions["trace"] = self._counting_trace(
+            request.extensions.get("trace")
+        )
+        return await super().handle_async_request(request)
+
+    def _counting_trace(
+        self, inner: Optional[Callable[[str, Dict], Awaitable[None]]]
+    ) -> Callable[[str, Dict], Awaitable[None]]:
+        async def trace(event_name: str, info: Dict) -> None:
+            if event_name == _CONNECT_EVENT:
+                self.connections_opened += 1
+                self.peak_connections = max(
+                    self.peak_connections, len(self._pool.connections)
+                )
+            if inner is not None:
+                await inner(event_name, info)
+
+        return trace
+
+
+class SharedHttpClient:
+    """1つの非同期HTTPクライアントと、それを使うOpenAIクライアント・RunConfig.
+
+    AgentCaller に run_config を渡すと、すべての Runner.run がこのクライアントの接続プールを使う。
+    SDKの既定でもプロセス共通のクライアントが使い回されるが、接続数の上限・keep-alive・
+    タイムアウト・HTTP/2 は指定できず、接続プールの統計も取れない。
+    接続はイベントループに結び付くため、インスタンスはイベントループ内で生成し、
+    終了時に aclose() すること。
+    """
+
+    def __init__(
+        self,
+        config: Optional[HttpPoolConfig] = None,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ):
+        self.config = config or HttpPoolConfig()
+        self.config.validate()
+        self._transport = _CountingTransport(
+            http2=self.config.http2,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+        )
+        self.http_client = httpx.AsyncClient(
+            transport=self._transport,
+            timeout=httpx.Timeout(
+                self.config.timeout, connect=self.config.connect_timeout
+            ),
+        )
+        self.openai_client = AsyncOpenAI(
+            http_client=self.http_client,
+            base_url=base_url,
+            api_key=api_key,
+            max_retries=self.config.max_retries,
+        )
+        self.run_config = RunConfig(
+            model_provider=MultiProvider(openai_client=self.openai_client)
+        )
+
+    def stats(self) -> PoolStats:
+        connections = self._transport.connections
+        return PoolStats(
+            requests=self._transport.requests,
+            connections_opened=self._transport.connections_opened,
+            peak_connections=self._transport.peak_connections,
+            open_connections=len(connections),
+            idle_connections=sum(
+                1 for connection in connections if connection.is_idle()
+            ),
+        )
+
+    async def aclose(self) -> None:
+        await self.http_client.aclose()
+
+
+def format_pool_stats(stats: PoolStats) -> str:
+    return (
+        f"🔌 HTTP接続プール: リクエスト{stats.requests}回 / 新規接続{stats.connections_opened}本"
+        f"（最大同時{stats.peak_connections}本、1接続あたり{stats.requests_per_connection:.1f}回）"
+    )
@@ -0,0 +1,598 @@
+"""ローカルの OpenAI 互換モックサーバーに対して複数の会議を同時に実行する負荷試験.
+
+モックサーバーは Responses API（/v1/responses）に、リクエストの出力スキーマ（models.py の型）に合った
+仮の出力（dryrun.sample_output）を、指定した分布の待ち時間の後に返す。指定した割合で 500 と 429 を返す。
+会議は実際の OpenAI クライアント・共有HTTP接続プール・同時実行数の上限・クライアントの再試行を通して
+_run_meeting で実行し、スループット・会議の所要時間のパーセンタイル・エラーからの回復を報告する。
+
+使い方:
+    python loadtest.py --input inputs/proposal.md --meetings 20 --workers 5 \\
+        --max-concurrency 16
+    python loadtest.py --meetings 50 --workers 10 --rate-limit-rate 0.05 \\
+        --error-rate 0.01 --output loadtest.md
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+import models
+from caller import AgentCaller
+from dryrun import DRY_RUN_TEXT, sample_output
+from http_pool import HttpPoolConfig, PoolStats, SharedHttpClient
+from token_count import estimate_tokens
+from workflow import MeetingResult, _run_meeting
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+DEFAULT_PROPOSAL = "inputs/proposal.md"
+
+
+@dataclass
+class MockServerConfig:
+    """モックサーバーの応答の設定.
+
+    latency は待ち時間（秒）の分布。fixed は常に latency_median、uniform は latency_median の
+    ±latency_spread 倍の一様分布、lognormal は中央値 latency_median・対数標準偏差 latency_spread の対数正規分布。
+    error_rate・rate_limit_rate の割合で 500・429（再試行までの待ち時間 retry_after 秒を示す）を返す。
+    """
+
+    latency: str = "lognormal"
+    latency_median: float = 0.05
+    latency_spread: float = 0.5
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 0.05
+    seed: Optional[int] = None
+
+    def validate(self) -> None:
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"latency は {', '.join(LATENCY_DISTRIBUTIONS)} のいずれかを指定してください。"
+            )
+        if self.latency_median < 0 or self.latency_spread < 0 or self.retry_after < 0:
+            raise ValueError("待ち時間は0以上を指定してください。")
+        if self.latency == "uniform" and self.latency_spread > 1:
+            raise ValueError("uniform の latency_spread は0以上1以下を指定してください。")
+        if not (
+            0 <= self.error_rate <= 1
+            and 0 <= self.rate_limit_rate <= 1
+            and self.error_rate + self.rate_limit_rate <= 1
+        ):
+            raise ValueError("error_rate と rate_limit_rate は0以上で、合計1以下を指定してください。")
+
+    def sample_latency(self, rng: random.Random) -> float:
+        if self.latency == "uniform":
+            return rng.uniform(
+                self.latency_median * (1 - self.latency_spread),
+                self.latency_median * (1 + self.latency_spread),
+            )
+        if self.latency == "lognormal" and self.latency_median > 0:
+            return rng.lognormvariate(
+                math.log(self.latency_median), self.latency_spread
+            )
+        return self.latency_median
+
+    def describe(self) -> str:
+        if self.latency == "fixed":
+            return f"固定 {self.latency_median:.3f}秒"
+        if self.latency == "uniform":
+            return f"一様分布 {self.latency_median:.3f}秒 ±{self.latency_spread:.0%}"
+        return f"対数正規分布 中央値 {self.latency_median:.3f}秒・σ {self.latency_spread}"
+
+
+@dataclass
+class ServerStats:
+    """モックサーバーが受けたリクエストと返した応答の集計.
+
+    errors_by_retry はクライアントが送る x-stainless-retry-count（何回目の再試行か）ごとの 429・5xx の数、
+    retried_responses は再試行で正常な応答を返した（エラーから回復した）リクエストの数。
+    """
+
+    requests: int = 0
+    responses: int = 0
+    server_errors: int = 0
+    rate_limited: int = 0
+    schemas: Dict[str, int] = field(default_factory=dict)
+    retried_responses: int = 0
+    errors_by_retry: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def injected_errors(self) -> int:
+        return self.server_errors + self.rate_limited
+
+    def final_errors(self, max_retries: int) -> int:
+        """再試行の上限に達した試行で返した 429・5xx の数（クライアントがそれ以上再試行しない応答）."""
+        return sum(
+            count
+            for retries, count in self.errors_by_retry.items()
+            if retries >= max_retries
+        )
+
+
+def output_type_for(request: Dict[str, Any]) -> Optional[Type[BaseModel]]:
+    """Responses API のリクエストの出力スキーマに対応する models.py の型（構造化出力でなければ None）."""
+    schema = ((request.get("text") or {}).get("format") or {}).get("schema") or {}
+    candidate = getattr(models, str(schema.get("title", "")), None)
+    if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+        return candidate
+    properties = set(schema.get("properties", {}))
+    for candidate in vars(models).values():
+        if (
+            isinstance(candidate, type)
+            and issubclass(candidate, BaseModel)
+            and set(candidate.model_fields) == properties
+        ):
+            return candidate
+    return None
+
+
+def _response_body(request: Dict[str, Any], text: str) -> Dict[str, Any]:
+    input_tokens = estimate_tokens(
+        json.dumps(
+            [request.get("instructions"), request.get("input")], ensure_ascii=False
+        )
+    )
+    output_tokens = estimate_tokens(text)
+    return {
+        "id": "resp_loadtest",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": request.get("model", ""),
+        "status": "completed",
+        "output": [{
+            "type": "message",
+            "id": "msg_loadtest",
+            "role": "assistant",
+            "status": "completed",
+            "content": [{"type": "output_text", "text": text, "annotations": []}],
+        }],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens_details": {"reasoning_tokens": 0},
+        },
+    }
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """keep-alive に対応した OpenAI 互換のハンドラ（/v1/models と /v1/responses）."""
+
+    protocol_version = "HTTP/1.1"
+    server: "MockOpenAIServer"
+
+    def do_GET(self) -> None:
+        self._reply(200, {"object": "list", "data": []})
+
+    def do_POST(self) -> None:
+        request = json.loads(
+            self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}"
+        )
+        status, latency = self.server.draw(
+            int(self.headers.get("x-stainless-retry-count") or 0)
+        )
+        time.sleep(latency)
+        if status == 429:
+            retry_ms = str(int(self.server.config.retry_after * 1000))
+            error = {
+                "message": "Rate limit reached (loadtest)",
+                "type": "requests",
+                "code": "rate_limit_exceeded",
+            }
+            self._reply(429, {"error": error}, {"retry-after-ms": retry_ms})
+            return
+        if status == 500:
+            self._reply(
+                500,
+                {
+                    "error": {
+                        "message": "Injected server error (loadtest)",
+                        "type": "server_error",
+                        "code": None,
+                    }
+                },
+            )
+            return
+        output_type = output_type_for(request)
+        text = (
+            sample_output(output_type).model_dump_json()
+            if output_type is not None
+            else DRY_RUN_TEXT
+        )
+        self.server.count_schema(
+            output_type.__name__ if output_type is not None else "text"
+        )
+        self._reply(200, _response_body(request, text))
+
+    def _reply(
+        self,
+        status: int,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    """別スレッドで動く OpenAI 互換のモックサーバー（with 文で起動・停止する）.
+
+    base_url を OpenAI クライアントの base_url に渡す。stats に応答の集計が残る。
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        config: Optional[MockServerConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or MockServerConfig()
+        self.config.validate()
+        self.stats = ServerStats()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._thread: Optional[threading.Thread] = None
+        super().__init__((host, port), _MockHandler)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        if isinstance(host, (bytes, bytearray)):
+            host = host.decode()
+        return f"http://{host}:{port}/v1"
+
+    def draw(self, retries_taken: int = 0) -> Tuple[int, float]:
+        """次の応答のステータスと待ち時間を決めて集計する（retries_taken はそのリクエストの再試行回数）."""
+        with self._lock:
+            self.stats.requests += 1
+            roll = self._rng.random()
+            latency = self.config.sample_latency(self._rng)
+            if roll < self.config.rate_limit_rate + self.config.error_rate:
+                self.stats.errors_by_retry[retries_taken] = (
+                    self.stats.errors_by_retry.get(retries_taken, 0) + 1
+                )
+            if roll < self.config.rate_limit_rate:
+                self.stats.rate_limited += 1
+                return 429, 0.0
+            if roll < self.config.rate_limit_rate + self.config.error_rate:
+                self.stats.server_errors += 1
+                return 500, latency
+            self.stats.responses += 1
+            if retries_taken:
+                self.stats.retried_responses += 1
+            return 200, latency
+
+    def count_schema(self, name: str) -> None:
+        with self._lock:
+            self.stats.schemas[name] = self.stats.schemas.get(name, 0) + 1
+
+    def __enter__(self) -> "MockOpenAIServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """q（0〜100）パーセンタイル（順位の線形補間、値がなければ0）."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass
+class LoadTestResult:
+    """負荷試験の結果.
+
+    durations は完了した会議の所要時間（同時実行数の空き待ちを除く）、unrecovered は
+    再試行の上限に達しても 429・5xx だったリクエストの数（失敗した会議の数は failures の件数）。
+    """
+
+    meetings: int
+    durations: List[float]
+    failures: List[str]
+    elapsed: float
+    calls: int
+    turns: int
+    unrecovered: int
+    server: ServerStats
+    pool: PoolStats
+    report: str = ""
+
+    @property
+    def throughput(self) -> float:
+        """1分あたりに完了した会議の数."""
+        return len(self.durations) / self.elapsed * 60 if self.elapsed else 0.0
+
+    @property
+    def recovered(self) -> int:
+        """429・5xx を受けたあと再試行で正常な応答を得たリクエストの数."""
+        return self.server.retried_responses
+
+    def latency(self, q: float) -> float:
+        return percentile(self.durations, q)
+
+
+def _render_load_test_report(
+    result: LoadTestResult,
+    config: MockServerConfig,
+    workers: int,
+    rounds: int,
+    max_concurrency: Optional[int],
+    http_pool: HttpPoolConfig,
+) -> str:
+    server = result.server
+    pool = result.pool
+    turns = result.turns / len(result.durations) if result.durations else 0
+    calls_per_second = result.calls / result.elapsed if result.elapsed else 0
+    report = (
+        "# 負荷試験レポート\n\n## 条件\n"
+        f"- 会議: {result.meetings}件（同時に{workers}件）、"
+        f"討論 {rounds}ラウンド（全員が発言するまでは延長）\n"
+        f"- エージェント呼び出しの同時実行数上限: {max_concurrency or 'なし'}、"
+        f"HTTP接続数上限: {http_pool.max_connections}、"
+        f"再試行: 最大{http_pool.max_retries}回\n"
+        f"- モックの待ち時間: {config.describe()}、"
+        f"500: {config.error_rate:.0%}、429: {config.rate_limit_rate:.0%}\n"
+        "\n## 結果\n"
+        f"- 完了: {len(result.durations)}/{result.meetings}件"
+        f"（所要 {result.elapsed:.1f}秒、スループット {result.throughput:.1f}件/分）\n"
+        f"- 会議の所要時間: p50 {result.latency(50):.2f}秒 / "
+        f"p95 {result.latency(95):.2f}秒 / p99 {result.latency(99):.2f}秒\n"
+        f"- 発言: 完了した会議あたり平均 {turns:.1f}件\n"
+        f"- エージェント呼び出し: {result.calls}回（{calls_per_second:.1f}回/秒）\n"
+        f"- HTTPリクエスト: {server.requests}回（正常 {server.responses}・"
+        f"500 {server.server_errors}・429 {server.rate_limited}）\n"
+        "- エラーからの回復: 429・5xx を受けたリクエストのうち"
+        f"{result.recovered}件が再試行で回復、"
+        f"{result.unrecovered}件が再試行の上限に達して失敗"
+        f"（失敗した会議 {len(result.failures)}件）\n"
+        f"- 接続: 新規{pool.connections_opened}本"
+        f"（最大同時{pool.peak_connections}本、"
+        f"1接続あたり{pool.requests_per_connection:.1f}回）\n"
+    )
+    if result.failures:
+        report += "\n## 失敗した会議\n\n" + "".join(
+            f"- {failure}\n" for failure in result.failures
+        )
+    return report
+
+
+async def _run_load_test(
+    proposal_markdown: str,
+    server: MockOpenAIServer,
+    meetings: int = 10,
+    workers: int = 4,
+    rounds: int = 4,
+    context_turns: int = 6,
+    max_concurrency: Optional[int] = None,
+    http_pool: Optional[HttpPoolConfig] = None,
+    verbose: bool = True,
+) -> LoadTestResult:
+    if meetings < 1 or workers < 1:
+        raise ValueError("meetings と workers は1以上を指定してください。")
+    http_pool = http_pool or HttpPoolConfig()
+    pool = SharedHttpClient(http_pool, base_url=server.base_url, api_key="loadtest")
+    # モック相手の実行のトレースは送らない
+    pool.run_config.tracing_disabled = True
+    caller = AgentCaller(max_concurrency=max_concurrency, run_config=pool.run_config)
+    gate = asyncio.Semaphore(workers)
+
+    async def run_one(meeting_idx: int) -> MeetingResult:
+        async with gate:
+            result = await _run_meeting(
+                proposal_markdown=proposal_markdown,
+                rounds=rounds,
+                context_turns=context_turns,
+                verbose=False,
+                caller=caller.child(),
+            )
+        if verbose:
+            print(f"✅ 会議 {meeting_idx}/{meetings} 完了（{result.duration:.2f}秒）")
+        return result
+
+    started_at = time.perf_counter()
+    try:
+        outcomes = await asyncio.gather(
+            *[run_one(idx) for idx in range(1, meetings + 1)], return_exceptions=True
+        )
+        elapsed = time.perf_counter() - started_at
+        pool_stats = pool.stats()
+    finally:
+        await pool.aclose()
+
+    results = [outcome for outcome in outcomes if isinstance(outcome, MeetingResult)]
+    errors = [
+        (idx, outcome)
+        for idx, outcome in enumerate(outcomes, start=1)
+        if not isinstance(outcome, MeetingResult)
+    ]
+    for _, error in errors:
+        if not isinstance(error, Exception):
+            raise error
+    return LoadTestResult(
+        meetings=meetings,
+        durations=[result.duration for result in results],
+        failures=[f"会議{idx}: {type(error).__name__}: {error}" for idx, error in errors],
+        elapsed=elapsed,
+        calls=sum(len(result.call_records) for result in results),
+        turns=sum(len(result.turns) for result in results),
+        unrecovered=server.stats.final_errors(http_pool.max_retries),
+        server=server.stats,
+        pool=pool_stats,
+    )
+
+
+def run_load_test(
+    proposal_markdown: str,
+    config: Optional[MockServerConfig] = None,
+    meetings: int = 10,
+    workers: int = 4,
+    rounds: int = 4,
+    context_turns: int = 6,
+    max_concurrency: Optional[int] = None,
+    http_pool: Optional[HttpPoolConfig] = None,
+    verbose: bool = True,
+) -> LoadTestResult:
+    """モックサーバーを起動し、meetings 件の会議を workers 件ずつ同時に実行して計測する.
+
+    エージェント呼び出しは全会議で1つの AgentCaller（max_concurrency）と共有HTTP接続プール
+    （http_pool、再試行回数は http_pool.max_retries）を使う。失敗した会議があっても全件を実行し、
+    LoadTestResult.failures に記録する。
+    """
+    config = config or MockServerConfig()
+    http_pool = http_pool or HttpPoolConfig()
+    with MockOpenAIServer(config) as server:
+        result = asyncio.run(
+            _run_load_test(
+                proposal_markdown,
+                server,
+                meetings=meetings,
+                workers=workers,
+                rounds=rounds,
+                context_turns=context_turns,
+                max_concurrency=max_concurrency,
+                http_pool=http_pool,
+                verbose=verbose,
+            )
+        )
+    result.report = _render_load_test_report(
+        result, config, workers, rounds, max_concurrency, http_pool
+    )
+    return result
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ローカルのモックサーバーに対して複数の会議を同時に実行する負荷試験です。")
+    parser.add_argument(
+        "--input",
+        default=DEFAULT_PROPOSAL,
+        help=f"企画書ファイル（デフォルト: {DEFAULT_PROPOSAL}）",
+    )
+    parser.add_argument("--meetings", type=int, default=10, help="実行する会議の数（デフォルト: 10）")
+    parser.add_argument("--workers", type=int, default=4, help="同時に実行する会議の数（デフォルト: 4）")
+    parser.add_argument("--rounds", type=int, default=4, help="各会議の討論ラウンド数（デフォルト: 4）")
+    parser.add_argument(
+        "--context-turns",
+        type=int,
+        default=6,
+        help="エージェントに渡す直近の発言数（デフォルト: 6）",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="全会議合計のエージェント呼び出しの同時実行数上限",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=HttpPoolConfig.max_connections,
+        help="HTTP接続数の上限",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=HttpPoolConfig.max_retries,
+        help="429・5xx の再試行回数",
+    )
+    parser.add_argument(
+        "--latency",
+        choices=LATENCY_DISTRIBUTIONS,
+        default="lognormal",
+        help="モックの待ち時間の分布",
+    )
+    parser.add_argument(
+        "--latency-median", type=float, default=0.05, help="待ち時間の中央値（秒）"
+    )
+    parser.add_argument(
+        "--latency-spread",
+        type=float,
+        default=0.5,
+        help="待ち時間のばらつき（uniform: 中央値に対する幅の割合、lognormal: σ）",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 を返す割合")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 を返す割合")
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=0.05,
+        help="429 で示す再試行までの待ち時間（秒）",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="待ち時間とエラー注入の乱数シード")
+    parser.add_argument("--output", default=None, help="レポートの書き出し先（Markdown）")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    proposal_path = Path(args.input).expanduser()
+    if not proposal_path.exists():
+        print(f"❌ 企画書が見つかりません: {proposal_path}")
+        sys.exit(1)
+    config = MockServerConfig(
+        latency=args.latency,
+        latency_median=args.latency_median,
+        latency_spread=args.latency_spread,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    try:
+        http_pool = HttpPoolConfig(
+            max_connections=args.max_connections, max_retries=args.max_retries
+        )
+        result = run_load_test(
+            proposal_path.read_text(encoding="utf-8"),
+            config,
+            meetings=args.meetings,
+            workers=args.workers,
+            rounds=args.rounds,
+            context_turns=args.context_turns,
+            max_concurrency=args.max_concurrency,
+            http_pool=http_pool,
+        )
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        sys.exit(1)
+    print("\n" + result.report)
+    if args.output:
+        Path(args.output).write_text(result.report, encoding="utf-8")
+        print(f"📝 レポートを書き出しました: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
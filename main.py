@@ -1,11 +1,24 @@
 """board_meeting - 経営会議討論シミュレーションCLI."""
 import argparse
 import os
+import shutil
+import sqlite3
 import sys
+import tracemalloc
+import uuid
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+from agents import set_tracing_disabled
 from dotenv import load_dotenv
 
-from workflow import run_board_meeting
+from board import BoardConfig, load_board_config
+from dryrun import run_dry_run, validate_proposal
+from history import DEFAULT_HISTORY_DIR, DEFAULT_HISTORY_KEEP, RunStore
+from http_pool import HttpPoolConfig
+from resilience import HedgePolicy, ModelRouter
+from sampling import run_sampled_meetings
+from sweep import run_sweep
+from workflow import MeetingResult, run_board_meeting, run_comparative_meeting
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,19 +47,206 @@ def parse_args() -> argparse.Namespace:
         default=6,
         help="各発言時に参照する直近の発言数（デフォルト: 6）",
     )
+    parser.add_argument(
+        "--agenda-size",
+        type=int,
+        default=1,
+        help="ファシリテーターが1回の呼び出しでまとめて指名する人数（デフォルト: 1 = 毎ラウンド指名）",
+    )
+    parser.add_argument(
+        "--digest-block-size",
+        type=int,
+        default=None,
+        help="討論ログがこのターン数より長い場合、このターン数ごとに並列要約したダイジェストを成果物作成に使う",
+    )
+    parser.add_argument(
+        "--opening-statements",
+        action="store_true",
+        help="全員の冒頭発言を企画書だけをもとに同時に行ってから、ファシリテーターの指名による討論を始めます",
+    )
+    parser.add_argument(
+        "--draft-interval",
+        type=int,
+        default=None,
+        metavar="N",
+        help="討論中に発言N件ごとに議事録・想定問答の下書きをバックグラウンドで更新し、討論後は仕上げだけを行います",
+    )
+    parser.add_argument(
+        "--speculate",
+        action="store_true",
+        help="ファシリテーターの指名を待たずに次の発言者を予測して発言を始め、指名と一致すれば採用します（的中率と無駄になったトークン数を表示）",
+    )
+    parser.add_argument(
+        "--context-format",
+        choices=["markdown", "compact"],
+        default="markdown",
+        help="エージェントに渡す発言履歴の形式。compact は指名理由を省いた簡潔な形式で入力トークンを減らします（対話履歴は常にMarkdown）",
+    )
+    parser.add_argument(
+        "--validate-outputs",
+        action="store_true",
+        help="議事録・改訂企画書の必須見出しと想定問答集の問数を確認し、不足があれば不足分だけを追加の呼び出しで補います",
+    )
+    parser.add_argument(
+        "--roles-config",
+        default=None,
+        metavar="FILE",
+        help="参加者構成（役割と部会）のJSONファイル。部会を定義すると部会ごとの討論を並行して行う階層型の会議になります",
+    )
+    parser.add_argument(
+        "--group-rounds",
+        type=int,
+        default=None,
+        help="階層型の会議で各部会が行う討論ラウンド数（デフォルト: 部会のメンバー数）",
+    )
+    parser.add_argument(
+        "--bounded-memory",
+        action="store_true",
+        help="省メモリモード。発言をディスクに逐次書き出し、対話履歴もファイルへ直接出力します（長時間の会議向け）",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="+",
+        default=None,
+        metavar="FILE",
+        help="--input と比較する候補企画書（指定すると1回の会議で全候補を比較評価します）",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=1,
+        help="同じ企画書で独立に実施する会議の回数。2以上で並行実行しスコアを集計します（デフォルト: 1）",
+    )
+    parser.add_argument(
+        "--sweep-rounds",
+        nargs="+",
+        type=int,
+        default=None,
+        metavar="N",
+        help="パラメータスイープする討論ラウンド数（複数指定可）。共通する討論の序盤は1回だけ実行します",
+    )
+    parser.add_argument(
+        "--sweep-context-turns",
+        nargs="+",
+        type=int,
+        default=None,
+        metavar="N",
+        help="パラメータスイープする直近発言の参照数（複数指定可）",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="--samples・スイープ使用時のエージェント同時呼び出し数の上限（デフォルト: 8）",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="会議全体の時間予算（秒）。超えそうな場合は討論を短縮し、必ず成果物を出力します",
+    )
+    parser.add_argument(
+        "--section-refine",
+        action="store_true",
+        help="改訂企画書を見出しごとに並列で作成し、最後に見出し間の整合性を確認します（長い企画書向け）",
+    )
+    parser.add_argument(
+        "--axis-evaluate",
+        action="store_true",
+        help="評価観点ごとに並列で採点し、最後に総合評価をまとめます",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="ストリーミング実行。生成中の本文をコンソールに逐次表示し、成果物ファイルにも逐次書き出します（通常モードのみ）",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=None,
+        help="全エージェント・全サンプルで共有するHTTP接続プールの接続数上限。指定すると接続を使い回します",
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="共有HTTP接続プールでHTTP/2を使います（h2 パッケージが必要）",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="遅いエージェント呼び出しに複製を発行し、先に返った結果を採用する（テールレイテンシ対策）",
+    )
+    parser.add_argument(
+        "--hedge-quantile",
+        type=float,
+        default=0.9,
+        help="--hedge 使用時に複製を発行する所要時間のパーセンタイル（デフォルト: 0.9 = p90）",
+    )
+    parser.add_argument(
+        "--hedge-budget",
+        type=float,
+        default=0.1,
+        help="--hedge 使用時に許容する追加トークンの割合（デフォルト: 0.1 = 10%%）",
+    )
+    parser.add_argument(
+        "--fallback-models",
+        nargs="+",
+        default=None,
+        metavar="MODEL",
+        help="優先順位順のモデル一覧。障害・遅延が続くモデルを一時的に避け、次のモデルで呼び出しを続けます",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="APIを呼ばずにスタブで会議を実行し、呼び出し数・トークン数・想定費用・想定所要時間を見積もります",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help=(
+            "会議のタイムライン（段階・ラウンド・エージェント呼び出し）を "
+            "trace.json（Chrome trace / Perfetto 形式）に書き出します"
+        ),
+    )
+    parser.add_argument(
+        "--no-remote-tracing",
+        action="store_true",
+        help="Agents SDK のトレースをモデル提供元へ送信しません（オフライン環境向け）",
+    )
+    parser.add_argument(
+        "--history-dir",
+        default=DEFAULT_HISTORY_DIR,
+        help=f"実行履歴ストアのディレクトリ（デフォルト: {DEFAULT_HISTORY_DIR}）",
+    )
+    parser.add_argument(
+        "--history-keep",
+        type=int,
+        default=DEFAULT_HISTORY_KEEP,
+        help=(
+            "実行履歴に残す実行件数。記録のたびに古い実行と参照されなくなった成果物を削除します"
+            f"（デフォルト: {DEFAULT_HISTORY_KEEP}、0で無制限）"
+        ),
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="実行履歴を記録しない",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     load_dotenv()
+    args = parse_args()
 
     api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    if not api_key and not args.dry_run:
         print("❌ エラー: OPENAI_API_KEY が設定されていません。")
         print(".env に OPENAI_API_KEY を設定するか、環境変数に設定してください。")
         sys.exit(1)
 
-    args = parse_args()
+    if args.no_remote_tracing:
+        set_tracing_disabled(True)
     input_path = Path(args.input).expanduser().resolve()
     output_dir = Path(args.output_dir).expanduser().resolve()
 
@@ -58,8 +258,115 @@ def main() -> None:
         print("❌ rounds は1以上を指定してください。")
         sys.exit(1)
 
+    if any(n < 1 for n in args.sweep_rounds or []) or any(
+        n < 0 for n in args.sweep_context_turns or []
+    ):
+        print("❌ sweep-rounds は1以上、sweep-context-turns は0以上を指定してください。")
+        sys.exit(1)
+
+    if args.agenda_size < 1:
+        print("❌ agenda-size は1以上を指定してください。")
+        sys.exit(1)
+
+    if args.digest_block_size is not None and args.digest_block_size < 1:
+        print("❌ digest-block-size は1以上を指定してください。")
+        sys.exit(1)
+
+    if args.group_rounds is not None and args.group_rounds < 1:
+        print("❌ group-rounds は1以上を指定してください。")
+        sys.exit(1)
+
+    if args.draft_interval is not None and args.draft_interval < 1:
+        print("❌ draft-interval は1以上を指定してください。")
+        sys.exit(1)
+
+    if args.samples < 1 or args.max_concurrency < 1:
+        print("❌ samples と max-concurrency は1以上を指定してください。")
+        sys.exit(1)
+
+    if args.history_keep < 0:
+        print("❌ history-keep は0以上を指定してください。")
+        sys.exit(1)
+
+    if args.time_budget is not None and args.time_budget <= 0:
+        print("❌ time-budget は0より大きい値を指定してください。")
+        sys.exit(1)
+
+    if not 0 < args.hedge_quantile < 1 or args.hedge_budget < 0:
+        print("❌ hedge-quantile は0より大きく1未満、hedge-budget は0以上を指定してください。")
+        sys.exit(1)
+
+    conflicts = dry_run_conflicts(args)
+    if args.dry_run and conflicts:
+        print(f"❌ --dry-run と {'・'.join(conflicts)} は同時に指定できません（ドライランは通常モードのみ）。")
+        sys.exit(1)
+
+    if args.compare and args.samples > 1:
+        print("❌ --compare と --samples は同時に指定できません。")
+        sys.exit(1)
+
+    if args.stream and (args.compare or args.samples > 1):
+        print("❌ --stream は通常モードでのみ指定できます。")
+        sys.exit(1)
+
+    if args.compare and args.roles_config:
+        print("❌ --compare と --roles-config は同時に指定できません。")
+        sys.exit(1)
+    if args.compare and (args.section_refine or args.axis_evaluate):
+        print("❌ --compare と --section-refine・--axis-evaluate は同時に指定できません。")
+        sys.exit(1)
+    conflicts = compare_conflicts(args)
+    if args.compare and conflicts:
+        print(f"❌ --compare と {'・'.join(conflicts)} は同時に指定できません（比較会議モードでは使えません）。")
+        sys.exit(1)
+
+    sweeping = bool(args.sweep_rounds or args.sweep_context_turns)
+    if sweeping and (args.compare or args.samples > 1):
+        print("❌ パラメータスイープは --compare・--samples と同時に指定できません。")
+        sys.exit(1)
+    conflicts = sweep_conflicts(args)
+    if sweeping and conflicts:
+        print(f"❌ パラメータスイープと {'・'.join(conflicts)} は同時に指定できません。")
+        sys.exit(1)
+
+    try:
+        board = board_config(args)
+    except (OSError, ValueError) as exc:
+        print(f"❌ 参加者構成ファイルを読み込めません: {exc}")
+        sys.exit(1)
+    if sweeping and board is not None and board.hierarchical:
+        print("❌ 部会のある参加者構成ではパラメータスイープを実行できません。")
+        sys.exit(1)
+
+    try:
+        http_pool = http_pool_config(args)
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        sys.exit(1)
+
+    if args.dry_run:
+        run_dry_run_mode(args, input_path, output_dir, board=board)
+        return
+
+    if args.compare:
+        run_comparison(args, input_path, output_dir, http_pool=http_pool)
+        return
+
+    if args.samples > 1:
+        run_sampling(args, input_path, output_dir, board=board, http_pool=http_pool)
+        return
+
+    if sweeping:
+        run_parameter_sweep(
+            args, input_path, output_dir, board=board, http_pool=http_pool
+        )
+        return
+
     proposal_text = input_path.read_text(encoding="utf-8")
     output_dir.mkdir(parents=True, exist_ok=True)
+    store = open_history(args)
+    spill_dir = start_bounded_memory(args, output_dir)
+    meetings: List[MeetingResult] = []
 
     try:
         minutes_md, qa_md, refined_md, discussion_log_md, evaluation_md = run_board_meeting(
@@ -67,6 +374,357 @@ def main() -> None:
             rounds=args.rounds,
             context_turns=args.context_turns,
             verbose=True,
+            on_result=meetings.append,
+            time_budget=args.time_budget,
+            hedge=hedge_policy(args),
+            router=model_router(args),
+            agenda_size=args.agenda_size,
+            digest_block_size=args.digest_block_size,
+            spill_dir=spill_dir,
+            board=board,
+            group_rounds=args.group_rounds,
+            stream_dir=output_dir if args.stream else None,
+            section_refine=args.section_refine,
+            axis_evaluate=args.axis_evaluate,
+            http_pool=http_pool,
+            opening_statements=args.opening_statements,
+            trace=args.trace,
+            draft_interval=args.draft_interval,
+            speculate=args.speculate,
+            context_format=args.context_format,
+            validate_outputs=args.validate_outputs,
+        )
+    except KeyboardInterrupt:
+        print("\n❌ ユーザーによって中断されました。")
+        sys.exit(1)
+    except Exception as exc:
+        print(f"\n❌ エラーが発生しました: {exc}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    paths = write_meeting_outputs(
+        output_dir, minutes_md, qa_md, refined_md, discussion_log_md, evaluation_md
+    )
+    trace_path = None
+    for result in meetings:
+        place_discussion_log(result, paths["discussion_log"])
+        trace_path = write_trace(result, output_dir)
+        record_history(
+            store,
+            result,
+            proposal_text,
+            run_settings(args),
+            proposal_name=input_path.name,
+        )
+    finish_bounded_memory(spill_dir)
+
+    print("✅ 生成完了")
+    print(f"- 議事録: {paths['minutes']}")
+    print(f"- 想定問答: {paths['qa']}")
+    print(f"- 改訂企画書: {paths['refined_proposal']}")
+    print(f"- 対話履歴: {paths['discussion_log']}")
+    print(f"- 評価レポート: {paths['evaluation']}")
+    if trace_path is not None:
+        print(f"- タイムライン: {trace_path}")
+
+
+def compare_conflicts(args: argparse.Namespace) -> List[str]:
+    """比較会議モードが対応していない、指定済みのオプション名."""
+    options = {
+        "--time-budget": args.time_budget is not None,
+        "--hedge": args.hedge,
+        "--fallback-models": bool(args.fallback_models),
+        "--agenda-size": args.agenda_size != 1,
+        "--digest-block-size": args.digest_block_size is not None,
+        "--group-rounds": args.group_rounds is not None,
+        "--bounded-memory": args.bounded_memory,
+        "--opening-statements": args.opening_statements,
+        "--draft-interval": args.draft_interval is not None,
+        "--speculate": args.speculate,
+        "--context-format": args.context_format != "markdown",
+        "--validate-outputs": args.validate_outputs,
+        "--trace": args.trace,
+    }
+    return [name for name, given in options.items() if given]
+
+
+def sweep_conflicts(args: argparse.Namespace) -> List[str]:
+    """パラメータスイープが対応していない、指定済みのオプション名."""
+    options = {
+        "--time-budget": args.time_budget is not None,
+        "--agenda-size": args.agenda_size != 1,
+        "--group-rounds": args.group_rounds is not None,
+        "--bounded-memory": args.bounded_memory,
+        "--stream": args.stream,
+        "--opening-statements": args.opening_statements,
+        "--draft-interval": args.draft_interval is not None,
+        "--speculate": args.speculate,
+        "--context-format": args.context_format != "markdown",
+        "--validate-outputs": args.validate_outputs,
+        "--trace": args.trace,
+    }
+    return [name for name, given in options.items() if given]
+
+
+def dry_run_conflicts(args: argparse.Namespace) -> List[str]:
+    """ドライランが対応していない、指定済みのオプション名."""
+    options = {
+        "--compare": bool(args.compare),
+        "--samples": args.samples > 1,
+        "--sweep-rounds": bool(args.sweep_rounds),
+        "--sweep-context-turns": bool(args.sweep_context_turns),
+        "--time-budget": args.time_budget is not None,
+        "--stream": args.stream,
+        "--hedge": args.hedge,
+        "--fallback-models": bool(args.fallback_models),
+        "--bounded-memory": args.bounded_memory,
+        "--max-connections": args.max_connections is not None,
+        "--http2": args.http2,
+        "--trace": args.trace,
+    }
+    return [name for name, given in options.items() if given]
+
+
+def open_history(args: argparse.Namespace) -> Optional[RunStore]:
+    if args.no_history:
+        return None
+    return RunStore(
+        Path(args.history_dir).expanduser().resolve(), keep=args.history_keep or None
+    )
+
+
+def record_history(
+    store: Optional[RunStore],
+    result: MeetingResult,
+    proposal_text: str,
+    settings: Dict[str, Any],
+    **kwargs: Any,
+) -> None:
+    """会議結果を実行履歴に記録する（成果物は書き出し済みのため、失敗しても警告にとどめる）."""
+    if store is None:
+        return
+    try:
+        store.record_run(result, proposal_text, settings, **kwargs)
+    except (sqlite3.Error, OSError) as exc:
+        print(f"⚠️ 実行履歴を記録できませんでした: {exc}")
+
+
+def hedge_policy(args: argparse.Namespace) -> Optional[HedgePolicy]:
+    if not args.hedge:
+        return None
+    return HedgePolicy(
+        quantile=args.hedge_quantile, max_extra_fraction=args.hedge_budget
+    )
+
+
+def http_pool_config(args: argparse.Namespace) -> Optional[HttpPoolConfig]:
+    if args.max_connections is None and not args.http2:
+        return None
+    config = HttpPoolConfig(http2=args.http2)
+    if args.max_connections is not None:
+        config.max_connections = args.max_connections
+    config.validate()
+    return config
+
+
+def board_config(args: argparse.Namespace) -> Optional[BoardConfig]:
+    if not args.roles_config:
+        return None
+    return load_board_config(Path(args.roles_config).expanduser())
+
+
+def model_router(args: argparse.Namespace) -> Optional[ModelRouter]:
+    if not args.fallback_models:
+        return None
+    return ModelRouter(args.fallback_models)
+
+
+def run_settings(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "rounds": args.rounds,
+        "context_turns": args.context_turns,
+        "agenda_size": args.agenda_size,
+        "opening_statements": args.opening_statements,
+        "draft_interval": args.draft_interval,
+        "speculate": args.speculate,
+        "context_format": args.context_format,
+        "validate_outputs": args.validate_outputs,
+        "digest_block_size": args.digest_block_size,
+        "bounded_memory": args.bounded_memory,
+        "roles_config": args.roles_config,
+        "group_rounds": args.group_rounds,
+        "samples": args.samples,
+        "sweep_rounds": args.sweep_rounds,
+        "sweep_context_turns": args.sweep_context_turns,
+        "time_budget": args.time_budget,
+        "stream": args.stream,
+        "section_refine": args.section_refine,
+        "axis_evaluate": args.axis_evaluate,
+        "hedge": args.hedge,
+        "fallback_models": args.fallback_models,
+        "max_connections": args.max_connections,
+        "http2": args.http2,
+        "trace": args.trace,
+    }
+
+
+def write_meeting_outputs(
+    output_dir: Path,
+    minutes_md: str,
+    qa_md: str,
+    refined_md: str,
+    discussion_log_md: str,
+    evaluation_md: str,
+) -> Dict[str, Path]:
+    paths = {
+        "minutes": output_dir / "minutes.md",
+        "qa": output_dir / "qa.md",
+        "refined_proposal": output_dir / "refined_proposal.md",
+        "discussion_log": output_dir / "discussion_log.md",
+        "evaluation": output_dir / "evaluation.md",
+    }
+    contents = {
+        "minutes": minutes_md,
+        "qa": qa_md,
+        "refined_proposal": refined_md,
+        "discussion_log": discussion_log_md,
+        "evaluation": evaluation_md,
+    }
+    for key, path in paths.items():
+        path.write_text(contents[key], encoding="utf-8")
+    return paths
+
+
+def start_bounded_memory(args: argparse.Namespace, output_dir: Path) -> Optional[Path]:
+    """省メモリモードならメモリ計測を開始し、発言の書き出し先ディレクトリを返す."""
+    if not args.bounded_memory:
+        return None
+    tracemalloc.start()
+    return output_dir / ".spill"
+
+
+def finish_bounded_memory(spill_dir: Optional[Path]) -> None:
+    if spill_dir is None:
+        return
+    shutil.rmtree(spill_dir, ignore_errors=True)
+    print(peak_memory_report())
+    tracemalloc.stop()
+
+
+def peak_memory_report() -> str:
+    parts = []
+    if tracemalloc.is_tracing():
+        _, peak = tracemalloc.get_traced_memory()
+        parts.append(f"Pythonオブジェクト {peak / 2**20:.1f} MB")
+    try:
+        import resource
+    except ImportError:  # Windows
+        pass
+    else:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux は KB、macOS は バイト単位
+        max_rss_mb = max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
+        parts.append(f"プロセス最大RSS {max_rss_mb:.1f} MB")
+    return "🧠 ピークメモリ: " + " / ".join(parts)
+
+
+def place_discussion_log(result: MeetingResult, path: Path) -> None:
+    """省メモリモードで書き出された対話履歴を出力先へ移動する."""
+    if result.discussion_log_path is None:
+        return
+    os.replace(result.discussion_log_path, path)
+    result.discussion_log_path = path
+
+
+def run_dry_run_mode(
+    args: argparse.Namespace,
+    input_path: Path,
+    output_dir: Path,
+    board: Optional[BoardConfig] = None,
+) -> None:
+    proposal_text = input_path.read_text(encoding="utf-8")
+    errors, _ = validate_proposal(proposal_text)
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        sys.exit(1)
+
+    store = open_history(args)
+    latencies = store.average_latencies() if store is not None else {}
+    try:
+        dry_run = run_dry_run(
+            proposal_markdown=proposal_text,
+            rounds=args.rounds,
+            context_turns=args.context_turns,
+            latencies=latencies,
+            agenda_size=args.agenda_size,
+            digest_block_size=args.digest_block_size,
+            board=board,
+            group_rounds=args.group_rounds,
+            section_refine=args.section_refine,
+            axis_evaluate=args.axis_evaluate,
+            opening_statements=args.opening_statements,
+            draft_interval=args.draft_interval,
+            speculate=args.speculate,
+            context_format=args.context_format,
+            validate_outputs=args.validate_outputs,
+        )
+    except KeyboardInterrupt:
+        print("\n❌ ユーザーによって中断されました。")
+        sys.exit(1)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / "dry_run_report.md"
+    report_path.write_text(dry_run.report, encoding="utf-8")
+    print(dry_run.report)
+    print(f"- ドライラン見積もり: {report_path}")
+
+
+def write_trace(result: MeetingResult, output_dir: Path) -> Optional[Path]:
+    """記録したタイムラインを output_dir/trace.json に書き出す."""
+    if result.trace is None:
+        return None
+    return result.trace.write(output_dir / "trace.json")
+
+
+def run_sampling(
+    args: argparse.Namespace,
+    input_path: Path,
+    output_dir: Path,
+    board: Optional[BoardConfig] = None,
+    http_pool: Optional[HttpPoolConfig] = None,
+) -> None:
+    proposal_text = input_path.read_text(encoding="utf-8")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    spill_dir = start_bounded_memory(args, output_dir)
+
+    try:
+        sampling = run_sampled_meetings(
+            proposal_markdown=proposal_text,
+            samples=args.samples,
+            rounds=args.rounds,
+            context_turns=args.context_turns,
+            max_concurrency=args.max_concurrency,
+            verbose=True,
+            hedge=hedge_policy(args),
+            router=model_router(args),
+            agenda_size=args.agenda_size,
+            digest_block_size=args.digest_block_size,
+            spill_dir=spill_dir,
+            board=board,
+            group_rounds=args.group_rounds,
+            section_refine=args.section_refine,
+            axis_evaluate=args.axis_evaluate,
+            http_pool=http_pool,
+            opening_statements=args.opening_statements,
+            trace=args.trace,
+            draft_interval=args.draft_interval,
+            speculate=args.speculate,
+            context_format=args.context_format,
+            validate_outputs=args.validate_outputs,
+            time_budget=args.time_budget,
         )
     except KeyboardInterrupt:
         print("\n❌ ユーザーによって中断されました。")
@@ -78,24 +736,166 @@ def main() -> None:
         traceback.print_exc()
         sys.exit(1)
 
+    store = open_history(args)
+    group_id = uuid.uuid4().hex
+    for sample_idx, result in enumerate(sampling.results, start=1):
+        sample_dir = output_dir / "samples" / f"sample_{sample_idx:02d}"
+        sample_dir.mkdir(parents=True, exist_ok=True)
+        paths = write_meeting_outputs(sample_dir, *result.as_tuple())
+        place_discussion_log(result, paths["discussion_log"])
+        write_trace(result, sample_dir)
+        record_history(
+            store,
+            result,
+            proposal_text,
+            dict(run_settings(args), sample=sample_idx),
+            proposal_name=input_path.name,
+            group_id=group_id,
+        )
+
+    report_path = output_dir / "sampling_report.md"
+    report_path.write_text(sampling.report, encoding="utf-8")
+    finish_bounded_memory(spill_dir)
+
+    print("✅ 生成完了")
+    print(f"- サンプル別成果物: {output_dir / 'samples'}")
+    print(f"- サンプリング統合レポート: {report_path}")
+
+
+def run_parameter_sweep(
+    args: argparse.Namespace,
+    input_path: Path,
+    output_dir: Path,
+    board: Optional[BoardConfig] = None,
+    http_pool: Optional[HttpPoolConfig] = None,
+) -> None:
+    proposal_text = input_path.read_text(encoding="utf-8")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        sweep = run_sweep(
+            proposal_markdown=proposal_text,
+            rounds=args.sweep_rounds or [args.rounds],
+            context_turns=args.sweep_context_turns or [args.context_turns],
+            max_concurrency=args.max_concurrency,
+            verbose=True,
+            hedge=hedge_policy(args),
+            router=model_router(args),
+            digest_block_size=args.digest_block_size,
+            board=board,
+            section_refine=args.section_refine,
+            axis_evaluate=args.axis_evaluate,
+            http_pool=http_pool,
+        )
+    except KeyboardInterrupt:
+        print("\n❌ ユーザーによって中断されました。")
+        sys.exit(1)
+    except Exception as exc:
+        print(f"\n❌ エラーが発生しました: {exc}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    store = open_history(args)
+    group_id = uuid.uuid4().hex
+    for variant, result in zip(sweep.variants, sweep.results):
+        variant_dir = output_dir / "sweep" / variant.label
+        variant_dir.mkdir(parents=True, exist_ok=True)
+        write_meeting_outputs(variant_dir, *result.as_tuple())
+        record_history(
+            store,
+            result,
+            proposal_text,
+            dict(
+                run_settings(args),
+                rounds=variant.rounds,
+                context_turns=variant.context_turns,
+            ),
+            proposal_name=input_path.name,
+            group_id=group_id,
+        )
+
+    report_path = output_dir / "sweep_report.md"
+    report_path.write_text(sweep.report, encoding="utf-8")
+
+    print("✅ 生成完了")
+    print(f"- 設定別成果物: {output_dir / 'sweep'}")
+    print(f"- パラメータスイープレポート: {report_path}")
+
+
+def run_comparison(
+    args: argparse.Namespace,
+    input_path: Path,
+    output_dir: Path,
+    http_pool: Optional[HttpPoolConfig] = None,
+) -> None:
+    candidate_paths = [input_path] + [
+        Path(p).expanduser().resolve() for p in args.compare
+    ]
+    for path in candidate_paths:
+        if not path.exists():
+            print(f"❌ 入力ファイルが見つかりません: {path}")
+            sys.exit(1)
+
+    proposals = {}
+    for idx, path in enumerate(candidate_paths):
+        proposals[f"案{chr(ord('A') + idx)}"] = path.read_text(encoding="utf-8")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    store = open_history(args)
+    meetings: List[MeetingResult] = []
+
+    try:
+        minutes_md, discussion_log_md, comparison_md = run_comparative_meeting(
+            proposals=proposals,
+            rounds=args.rounds,
+            context_turns=args.context_turns,
+            verbose=True,
+            cache_dir=output_dir / ".digest_cache",
+            http_pool=http_pool,
+            on_result=meetings.append,
+        )
+    except KeyboardInterrupt:
+        print("\n❌ ユーザーによって中断されました。")
+        sys.exit(1)
+    except Exception as exc:
+        print(f"\n❌ エラーが発生しました: {exc}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    candidates_md = "\n".join(
+        f"- {candidate_id}: {path.name}"
+        for candidate_id, path in zip(proposals.keys(), candidate_paths)
+    )
     minutes_path = output_dir / "minutes.md"
-    qa_path = output_dir / "qa.md"
-    refined_path = output_dir / "refined_proposal.md"
     discussion_log_path = output_dir / "discussion_log.md"
-    evaluation_path = output_dir / "evaluation.md"
+    comparison_path = output_dir / "comparison.md"
 
     minutes_path.write_text(minutes_md, encoding="utf-8")
-    qa_path.write_text(qa_md, encoding="utf-8")
-    refined_path.write_text(refined_md, encoding="utf-8")
     discussion_log_path.write_text(discussion_log_md, encoding="utf-8")
-    evaluation_path.write_text(evaluation_md, encoding="utf-8")
+    comparison_path.write_text(
+        f"{comparison_md}\n\n## 候補一覧\n{candidates_md}\n", encoding="utf-8"
+    )
+    # 実行履歴には候補をまとめた本文を企画書として記録する（同じ候補の組み合わせの実行を検索できる）
+    candidates_text = "\n\n".join(
+        f"# {candidate_id}: {path.name}\n\n{text}"
+        for (candidate_id, text), path in zip(proposals.items(), candidate_paths)
+    )
+    for result in meetings:
+        record_history(
+            store,
+            result,
+            candidates_text,
+            dict(run_settings(args), compare=[path.name for path in candidate_paths]),
+            proposal_name=" / ".join(path.name for path in candidate_paths),
+        )
 
     print("✅ 生成完了")
     print(f"- 議事録: {minutes_path}")
-    print(f"- 想定問答: {qa_path}")
-    print(f"- 改訂企画書: {refined_path}")
     print(f"- 対話履歴: {discussion_log_path}")
-    print(f"- 評価レポート: {evaluation_path}")
+    print(f"- 比較評価レポート: {comparison_path}")
 
 
 if __name__ == "__main__":
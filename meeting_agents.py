@@ -1,13 +1,23 @@
 """経営会議のエージェント定義."""
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from agents import Agent
 from models import (
     FacilitatorDecision,
+    FacilitatorAgenda,
     MinutesOutput,
     ParticipantResponse,
     QAOutput,
     RefinedProposalOutput,
+    ProposalSectionOutput,
+    SectionRepairOutput,
+    ConsistencyReview,
     EvaluationOutput,
+    EvaluationSummary,
+    AxisScore,
+    ProposalDigest,
+    ComparativeEvaluationOutput,
+    ConsolidatedConcernsOutput,
+    DiscussionDigest,
 )
 
 
@@ -46,8 +56,50 @@ def create_facilitator() -> Agent:
     )
 
 
-def create_participant(role: str) -> Agent:
-    role_instruction = ROLE_INSTRUCTIONS[role]
+def create_agenda_facilitator(agenda_size: int) -> Agent:
+    return Agent(
+        name="Facilitator",
+        instructions=f"""あなたは経営会議のファシリテーターです。
+参加者の発言バランスを重視し、議論が偏らないよう指名します。
+今後{agenda_size}人分の発言順（アジェンダ）と、それぞれへの質問/指示をまとめて決めてください。
+- 最初の1人は next_speaker・prompt・rationale に、2人目以降は upcoming に発言順で入れる。
+- 前の発言を受けて議論が深まるよう、指名の順番と質問をつなげる。
+- 指名理由は簡潔に。
+- 重要な論点が未整理ならその論点を明確化する質問を優先。
+- 発言が少ない人を優先的に指名する。""",
+        output_type=FacilitatorAgenda,
+    )
+
+
+def create_group_facilitator(group_name: str) -> Agent:
+    return Agent(
+        name=f"Facilitator（{group_name}）",
+        instructions=f"""あなたは経営会議の部会「{group_name}」のリードとして、部会内の討論を進行します。
+部会メンバーの発言バランスを重視し、次の発言者と質問/指示を決めてください。
+- 指名理由は簡潔に。
+- 部会の担当領域で重要な論点が未整理ならその論点を明確化する質問を優先。
+- 発言が少ない人を優先的に指名する。""",
+        output_type=FacilitatorDecision,
+    )
+
+
+def create_group_reporter(group_name: str, lead: str) -> Agent:
+    return Agent(
+        name=f"{lead}（{group_name}報告）",
+        instructions=f"""あなたは部会「{group_name}」のリード（{lead}）です。
+部会内の討論を、全体会議に向けた報告としてまとめてください。
+- summary には部会の結論と主な論点を簡潔に
+- concerns・proposals には部会で挙がった懸念点と改善提案を、重要なものから
+- questions には全体会議や他の部会に確認したい事項を
+- 意見が割れた点は両論を残す""",
+        output_type=ParticipantResponse,
+    )
+
+
+def create_participant(role: str, instruction: Optional[str] = None) -> Agent:
+    role_instruction = (
+        instruction if instruction is not None else ROLE_INSTRUCTIONS[role]
+    )
     return Agent(
         name=role,
         instructions=f"""{role_instruction}
@@ -61,19 +113,18 @@ def create_participant(role: str) -> Agent:
     )
 
 
+# 議事録の必須見出し（記載順）と、想定問答集の最低問数
+MINUTES_SECTIONS: Tuple[str, ...] = ("会議概要", "参加者", "主な論点", "合意事項", "未決事項", "次のアクション")
+MIN_QA_QUESTIONS = 12
+
+
 def create_minutes_writer() -> Agent:
     return Agent(
         name="Minutes Writer",
         instructions="""あなたは経営会議の議事録作成者です。
 討論内容を要点整理し、意思決定に使える議事録をMarkdownで作成してください。
 必ず以下の見出しを含めてください:
-- 会議概要
-- 参加者
-- 主な論点
-- 合意事項
-- 未決事項
-- 次のアクション
-""",
+""" + "".join(f"- {heading}\n" for heading in MINUTES_SECTIONS),
         output_type=MinutesOutput,
     )
 
@@ -81,34 +132,93 @@ def create_minutes_writer() -> Agent:
 def create_qa_writer() -> Agent:
     return Agent(
         name="Q&A Writer",
-        instructions="""あなたは経営会議の内容をもとに想定問答集を作成します。
+        instructions=f"""あなたは経営会議の内容をもとに想定問答集を作成します。
 経営層・現場・法務・知財・会計の観点を含め、質疑応答をMarkdownで整理してください。
 - Q: と A: を使って簡潔に
-- 最低12問
+- 最低{MIN_QA_QUESTIONS}問
 """,
         output_type=QAOutput,
     )
 
 
+def create_section_repairer(artifact: str) -> Agent:
+    return Agent(
+        name=f"Section Repairer（{artifact}）",
+        instructions=f"""あなたは経営会議の{artifact}の不足を補う担当です。
+作成済みの{artifact}に足りない見出しの本文だけを、討論の内容をもとにMarkdownで作成してください。
+- 指定された見出しだけを sections に入れる（heading は指定どおりの文字列）
+- 見出し行は含めず本文だけを書く。小見出しは ### 以下を使う
+- 作成済みの本文と矛盾させず、重複する内容は書かない
+""",
+        output_type=SectionRepairOutput,
+    )
+
+
+def create_qa_supplementer() -> Agent:
+    return Agent(
+        name="Q&A Supplementer",
+        instructions="""あなたは経営会議の想定問答集の不足を補う担当です。
+作成済みの想定問答集にない質問だけを、指定された問数、討論の内容をもとにMarkdownで追加してください。
+- Q: と A: を使って簡潔に
+- 見出しは付けず、追加する質疑応答だけを書く
+- 作成済みの質問と重複させない
+""",
+        output_type=QAOutput,
+    )
+
+
+# 改訂企画書の必須見出し（記載順）と、見出しごとの改訂に渡す発言を選ぶキーワード
+REFINED_PROPOSAL_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "背景と目的": ("背景", "目的", "市場", "課題", "ビジョン", "戦略"),
+    "事業概要": ("事業", "サービス", "製品", "商品", "ビジネスモデル", "提供"),
+    "顧客価値と差別化": ("顧客", "価値", "差別化", "競合", "ニーズ", "ブランド"),
+    "実行計画（フェーズ）": ("計画", "フェーズ", "スケジュール", "段階", "導入", "製造", "パイロット"),
+    "体制と役割": ("体制", "人員", "人材", "採用", "組織", "役割", "担当"),
+    "予算と収益見通し": ("予算", "コスト", "費用", "投資", "収益", "売上", "利益", "価格", "回収"),
+    "リスクと対策（法務・知財含む）": ("リスク", "法務", "法的", "規制", "契約", "知財", "特許", "商標", "対策"),
+    "成功指標（KPI）": ("KPI", "指標", "目標", "達成", "測定"),
+}
+
+
 def create_refiner() -> Agent:
     return Agent(
         name="Proposal Refiner",
         instructions="""あなたは経営会議の議論を踏まえて企画書をブラッシュアップする担当です。
 入力の企画書を改善し、実行可能性とリスク対策を強化した改訂版をMarkdownで作成してください。
 以下の見出しを含めてください:
-- 背景と目的
-- 事業概要
-- 顧客価値と差別化
-- 実行計画（フェーズ）
-- 体制と役割
-- 予算と収益見通し
-- リスクと対策（法務・知財含む）
-- 成功指標（KPI）
-""",
+""" + "".join(f"- {heading}\n" for heading in REFINED_PROPOSAL_SECTIONS),
         output_type=RefinedProposalOutput,
     )
 
 
+def create_section_refiner(heading: str) -> Agent:
+    return Agent(
+        name=f"Section Refiner（{heading}）",
+        instructions=f"""あなたは経営会議の議論を踏まえて企画書をブラッシュアップする担当です。
+改訂企画書のうち「{heading}」の見出しの本文だけを、実行可能性とリスク対策を強化してMarkdownで作成してください。
+- 入力の企画書全体と、この見出しに関係する発言を参考にする
+- 見出し行（## {heading}）は含めず本文だけを書く。小見出しは ### 以下を使う
+- 他の見出しの内容は書かない
+""",
+        output_type=ProposalSectionOutput,
+    )
+
+
+def create_consistency_checker() -> Agent:
+    return Agent(
+        name="Consistency Checker",
+        instructions="""あなたは見出しごとに分担して書かれた改訂企画書の整合性を確認する担当です。
+見出し間で数値・時期・体制・前提が食い違っていないか（例: 予算と収益見通しの金額とKPIの目標値、
+実行計画のフェーズと体制、リスク対策の費用が予算に含まれているか）を確認してください。
+- 食い違いは issues に列挙する
+- 食い違いを解消するために書き直しが必要な見出しだけを revised_sections に入れる
+  （heading は入力の見出しと同じ文字列、markdown は見出し行を除いた修正後の本文全体）
+- 問題がなければ issues・revised_sections とも空にする
+""",
+        output_type=ConsistencyReview,
+    )
+
+
 def create_evaluator() -> Agent:
     return Agent(
         name="Proposal Evaluator",
@@ -126,12 +236,145 @@ def create_evaluator() -> Agent:
 - 情報の事実性と根拠の妥当性
 - 次に取るべきアクションの明確性
 
-## 出力形式
+## スコア（axis_scores）
+- 次の9観点すべてについて、原版と改訂版をそれぞれ0〜10点で採点する（各観点1件）
+  売上規模 / スケーラビリティ / コスト構造 / リスク / シナジー / 実現可能性 / 網羅性 / 事実性 / 次のアクション
+- 改訂版に対するGo/No-Go判定（verdict）と、その前提条件または理由（verdict_conditions）を出す
+
+## 出力形式（markdown）
 - 総合評価（5段階評価と点数）
 - 各観点の詳細評価（改善点と課題を含む）
-- 定量的評価スコアカード（100点満点）
 - 推奨事項（Go/No-Go判断基準を含む）
 - 結論とサマリー
+- 定量的評価スコアカードの表はaxis_scoresから自動生成されるため、markdownには書かない
 """,
         output_type=EvaluationOutput,
     )
+
+
+# 観点ごとの評価で採点する内容と、評価に渡す発言を選ぶキーワード（EVALUATION_AXES と同じ順序）
+EVALUATION_AXIS_FOCUS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "売上規模": ("期待される売上規模と成長性", ("売上", "市場", "成長", "需要", "顧客", "価格")),
+    "スケーラビリティ": ("事業規模の拡大可能性", ("拡大", "展開", "スケール", "量産", "海外", "供給")),
+    "コスト構造": ("コスト構造と削減効果", ("コスト", "費用", "原価", "投資", "削減", "予算")),
+    "リスク": ("リスクとリスクマネジメントの妥当性", ("リスク", "懸念", "規制", "法務", "知財", "対策")),
+    "シナジー": ("既存事業とのシナジー", ("シナジー", "既存", "連携", "相乗", "ブランド", "顧客基盤")),
+    "実現可能性": (
+        "自社のブランドやケイパビリティからみた実現可能性",
+        ("実現", "体制", "人材", "技術", "製造", "ケイパビリティ"),
+    ),
+    "網羅性": ("経営判断に必要な情報の網羅性", ("情報", "不足", "前提", "検討", "不明", "判断")),
+    "事実性": ("情報の事実性と根拠の妥当性", ("根拠", "データ", "数値", "調査", "事実", "実績")),
+    "次のアクション": ("次に取るべきアクションの明確性", ("アクション", "次", "計画", "スケジュール", "検証", "パイロット")),
+}
+
+
+def create_axis_evaluator(axis: str) -> Agent:
+    description, _ = EVALUATION_AXIS_FOCUS[axis]
+    return Agent(
+        name=f"Axis Evaluator（{axis}）",
+        instructions=f"""あなたは経営会議の議論を踏まえて企画書を評価する専門家です。
+原版と改訂版の企画書を「{axis}」（{description}）の観点だけで比較し、採点してください。
+- axis は「{axis}」とする
+- 原版（original）と改訂版（refined）をそれぞれ0〜10点で採点する
+- comment に採点理由を1-2文で書く（改訂で改善した点・残る課題）
+""",
+        output_type=AxisScore,
+    )
+
+
+def create_evaluation_aggregator() -> Agent:
+    return Agent(
+        name="Evaluation Aggregator",
+        instructions="""あなたは経営会議の議論を踏まえて企画書を評価する専門家です。
+観点ごとに採点済みのスコアと採点理由をもとに、改訂版の総合評価をまとめてください。
+- 改訂版に対するGo/No-Go判定（verdict）と、その前提条件または理由（verdict_conditions）を出す
+- 各観点のスコアは変更しない
+
+## 出力形式（markdown）
+- 総合評価（5段階評価と点数）
+- 各観点の詳細評価（改善点と課題を含む）
+- 推奨事項（Go/No-Go判断基準を含む）
+- 結論とサマリー
+- 定量的評価スコアカードの表は観点ごとのスコアから自動生成されるため、markdownには書かない
+""",
+        output_type=EvaluationSummary,
+    )
+
+
+def create_digest_writer() -> Agent:
+    return Agent(
+        name="Proposal Digest Writer",
+        instructions="""あなたは経営会議の事務局です。
+企画書を読み、複数案を比較検討する会議で使う要約（ダイジェスト）を作成してください。
+- 企画名、要約、主要な論点、予算・投資規模、主なリスクを簡潔に
+- 企画書に書かれていない数値や事実を補わない""",
+        output_type=ProposalDigest,
+    )
+
+
+def create_discussion_summarizer() -> Agent:
+    return Agent(
+        name="Discussion Summarizer",
+        instructions="""あなたは経営会議の事務局です。
+討論ログの一部（ターン番号付き）を読み、構造化した要約を作成してください。
+- 議論の流れ、役職ごとの立場、懸念点、提案、未解決の質問を整理する
+- 各項目には発言した役職と根拠となるターン番号を必ず付ける
+- 同じ趣旨の発言は1項目にまとめる
+- ログに書かれていない内容を補わない""",
+        output_type=DiscussionDigest,
+    )
+
+
+def create_discussion_reducer() -> Agent:
+    return Agent(
+        name="Discussion Digest Reducer",
+        instructions="""あなたは経営会議の事務局です。
+討論ログの区間ごとに作成された複数の要約を、会議全体の1つの構造化ダイジェストに統合してください。
+- 区間をまたいで同じ趣旨の項目は1つにまとめ、役職とターン番号はすべて引き継ぐ
+- 議論の流れの要約は会議全体の時系列がわかるように書き直す
+- 役職ごとの立場は、会議を通じて変化があれば最終的な立場を記す
+- 要約に書かれていない内容を補わない""",
+        output_type=DiscussionDigest,
+    )
+
+
+def create_comparative_evaluator() -> Agent:
+    return Agent(
+        name="Comparative Evaluator",
+        instructions="""あなたは経営会議の議論を踏まえて複数の候補企画書を比較評価する専門家です。
+同じ予算枠を競う候補を同一の基準で比較し、順位付けした比較評価レポートをMarkdownで作成してください。
+
+## 評価観点
+- 期待される売上規模と成長性
+- 事業規模の拡大可能性（スケーラビリティ）
+- コスト構造と投資対効果
+- リスクとリスクマネジメントの妥当性
+- 既存事業とのシナジー
+- 自社のブランドやケイパビリティからみた実現可能性
+
+## 順位（rankings）と推奨案（recommendation）
+- すべての候補について、候補ID・順位（1が最上位、重複なし）・総合スコア（100点満点）・強み・弱みを出す
+- 推奨案とその判断理由、Go/No-Go判断基準を recommendation にまとめる
+
+## 出力形式（markdown）
+- 観点別の比較表
+- 観点ごとの比較の考察
+- 結論とサマリー
+- 候補の順位表と推奨案はrankingsとrecommendationから自動生成されるため、markdownには書かない
+""",
+        output_type=ComparativeEvaluationOutput,
+    )
+
+
+def create_concern_consolidator() -> Agent:
+    return Agent(
+        name="Concern Consolidator",
+        instructions="""あなたは同じ企画書について独立に実施した複数回の経営会議の結果を統合する分析担当です。
+各サンプルで挙がった懸念点を読み、同じ趣旨の懸念をまとめてください。
+- 表現が異なっても趣旨が同じ懸念は1件に統合する
+- 各懸念が何サンプルで挙がったか（sample_count）を正確に数える
+- 多くのサンプルで一貫して挙がった懸念から順に並べる
+- 1サンプルでしか挙がらなかった懸念は重要なものに限る""",
+        output_type=ConsolidatedConcernsOutput,
+    )
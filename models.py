@@ -1,6 +1,6 @@
 """board_meeting 用の出力スキーマ."""
-from typing import List
-from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional, get_args
+from pydantic import BaseModel, Field, computed_field
 
 
 class FacilitatorDecision(BaseModel):
@@ -9,6 +9,20 @@ class FacilitatorDecision(BaseModel):
     rationale: str = Field(..., description="指名理由の簡潔な説明")
 
 
+class FacilitatorAgenda(FacilitatorDecision):
+    """次の1人（基底クラスのフィールド）に続けて、その後の指名予定をまとめて返すアジェンダ."""
+
+    upcoming: List[FacilitatorDecision] = Field(
+        default_factory=list, description="2人目以降の指名予定（発言順）"
+    )
+
+    def decisions(self) -> List[FacilitatorDecision]:
+        first = FacilitatorDecision(
+            next_speaker=self.next_speaker, prompt=self.prompt, rationale=self.rationale
+        )
+        return [first] + list(self.upcoming)
+
+
 class ParticipantResponse(BaseModel):
     summary: str = Field(..., description="発言の要約（2-4文）")
     concerns: List[str] = Field(default_factory=list, description="懸念点")
@@ -28,5 +42,180 @@ class RefinedProposalOutput(BaseModel):
     markdown: str = Field(..., description="改訂企画書Markdown")
 
 
+class ProposalSectionOutput(BaseModel):
+    markdown: str = Field(..., description="改訂企画書の1見出し分の本文Markdown（見出し行を除く）")
+
+
+class ProposalSection(BaseModel):
+    heading: str = Field(..., description="見出し（改訂企画書の必須見出しのいずれか）")
+    markdown: str = Field(..., description="修正後の本文Markdown（見出し行を除く）")
+
+
+class ArtifactSection(BaseModel):
+    heading: str = Field(..., description="見出し（補う必要のある見出しのいずれか）")
+    markdown: str = Field(..., description="見出しの本文Markdown（見出し行を除く）")
+
+
+class SectionRepairOutput(BaseModel):
+    sections: List[ArtifactSection] = Field(
+        default_factory=list, description="不足していた見出しの本文"
+    )
+
+
+class ConsistencyIssue(BaseModel):
+    headings: List[str] = Field(default_factory=list, description="食い違いのある見出し")
+    issue: str = Field(..., description="食い違いの内容（例: 予算とKPIの数値が合わない）")
+
+
+class ConsistencyReview(BaseModel):
+    issues: List[ConsistencyIssue] = Field(
+        default_factory=list, description="見出し間の食い違い"
+    )
+    revised_sections: List[ProposalSection] = Field(
+        default_factory=list, description="食い違いを解消するために書き直した見出しだけの本文"
+    )
+
+
+EvaluationAxis = Literal[
+    "売上規模",
+    "スケーラビリティ",
+    "コスト構造",
+    "リスク",
+    "シナジー",
+    "実現可能性",
+    "網羅性",
+    "事実性",
+    "次のアクション",
+]
+
+# スコアベクトルの並び順（EvaluationOutput.score_vector と同じ順序）
+EVALUATION_AXES: List[str] = list(get_args(EvaluationAxis))
+
+AXIS_MAX_SCORE = 10
+
+
+class AxisScore(BaseModel):
+    axis: EvaluationAxis = Field(..., description="評価観点")
+    original: int = Field(..., ge=0, le=AXIS_MAX_SCORE, description="原版のスコア（0-10点）")
+    refined: int = Field(..., ge=0, le=AXIS_MAX_SCORE, description="改訂版のスコア（0-10点）")
+    comment: str = Field("", description="採点理由（1-2文）")
+
+
+class EvaluationSummary(BaseModel):
+    """観点ごとのスコアをまとめた総合評価（スコアそのものは含まない）."""
+
+    markdown: str = Field(..., description="企画書評価レポートMarkdown（スコアカード表を除く本文）")
+    verdict: Literal["Go", "条件付きGo", "No-Go", ""] = Field(
+        "", description="改訂版に対するGo/No-Go判定"
+    )
+    verdict_conditions: List[str] = Field(
+        default_factory=list, description="Go判定の前提条件・No-Goの理由"
+    )
+
+
 class EvaluationOutput(BaseModel):
-    markdown: str = Field(..., description="企画書評価レポートMarkdown")
+    markdown: str = Field(..., description="企画書評価レポートMarkdown（スコアカード表を除く本文）")
+    axis_scores: List[AxisScore] = Field(
+        default_factory=list, description="評価観点ごとのスコア（各観点1件）"
+    )
+    verdict: Literal["Go", "条件付きGo", "No-Go", ""] = Field(
+        "", description="改訂版に対するGo/No-Go判定"
+    )
+    verdict_conditions: List[str] = Field(
+        default_factory=list, description="Go判定の前提条件・No-Goの理由"
+    )
+
+    def scores_by_axis(self) -> Dict[str, AxisScore]:
+        return {score.axis: score for score in self.axis_scores}
+
+    def score_vector(self, version: str = "refined") -> List[Optional[float]]:
+        """EVALUATION_AXES順のスコア列（欠けた観点は None）."""
+        by_axis = self.scores_by_axis()
+        return [
+            float(getattr(by_axis[axis], version)) if axis in by_axis else None
+            for axis in EVALUATION_AXES
+        ]
+
+    def _total(self, version: str) -> int:
+        if not self.axis_scores:
+            return 0
+        points = sum(
+            getattr(score, version) for score in self.scores_by_axis().values()
+        )
+        return round(points * 100 / (AXIS_MAX_SCORE * len(self.scores_by_axis())))
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def total_original(self) -> int:
+        """原版の合計点（100点満点換算）."""
+        return self._total("original")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def total_refined(self) -> int:
+        """改訂版の合計点（100点満点換算）."""
+        return self._total("refined")
+
+
+class ProposalDigest(BaseModel):
+    title: str = Field(..., description="企画名")
+    summary: str = Field(..., description="企画の要約（3-5文）")
+    key_points: List[str] = Field(default_factory=list, description="主要な論点・特徴")
+    investment: str = Field("", description="予算・投資規模の要約")
+    risks: List[str] = Field(default_factory=list, description="主なリスク")
+
+
+class DiscussionPoint(BaseModel):
+    point: str = Field(..., description="論点・懸念点・提案・質問の内容")
+    roles: List[str] = Field(default_factory=list, description="発言した役職")
+    turns: List[int] = Field(default_factory=list, description="根拠となる発言のターン番号")
+
+
+class RolePosition(BaseModel):
+    role: str = Field(..., description="役職")
+    position: str = Field(..., description="その役職の立場・主張の要約（1-2文）")
+
+
+class DiscussionDigest(BaseModel):
+    """討論ログの構造化ダイジェスト（ブロック単位の要約と、その統合結果の両方に使う）."""
+
+    summary: str = Field(..., description="議論の流れの要約（3-6文）")
+    role_positions: List[RolePosition] = Field(
+        default_factory=list, description="役職ごとの立場"
+    )
+    concerns: List[DiscussionPoint] = Field(default_factory=list, description="主な懸念点")
+    proposals: List[DiscussionPoint] = Field(
+        default_factory=list, description="主な提案・改善案"
+    )
+    open_questions: List[DiscussionPoint] = Field(
+        default_factory=list, description="未解決の質問"
+    )
+
+
+class CandidateRanking(BaseModel):
+    candidate_id: str = Field(..., description="候補ID（例: 案A）")
+    rank: int = Field(..., description="順位（1が最上位）")
+    score: int = Field(..., description="総合スコア（100点満点）")
+    strengths: List[str] = Field(default_factory=list, description="強み")
+    weaknesses: List[str] = Field(default_factory=list, description="弱み")
+
+
+class ComparativeEvaluationOutput(BaseModel):
+    rankings: List[CandidateRanking] = Field(
+        default_factory=list, description="候補ごとの順位と評価"
+    )
+    recommendation: str = Field(..., description="推奨案と判断理由")
+    markdown: str = Field(..., description="比較評価レポートMarkdown")
+
+
+class RecurringConcern(BaseModel):
+    concern: str = Field(..., description="繰り返し指摘された懸念点（統合後の表現）")
+    sample_count: int = Field(..., description="その懸念が挙がったサンプル数")
+    roles: List[str] = Field(default_factory=list, description="懸念を指摘した役職")
+
+
+class ConsolidatedConcernsOutput(BaseModel):
+    concerns: List[RecurringConcern] = Field(
+        default_factory=list, description="サンプル横断で統合した懸念点"
+    )
+    summary: str = Field(..., description="サンプル横断の傾向の要約")
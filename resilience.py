@@ -0,0 +1,245 @@
+"""エージェント呼び出しのテールレイテンシ・障害対策（ヘッジリクエスト、フォールバックモデルとサーキットブレーカー）."""
+import math
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+
+def usage_tokens(result: Any) -> int:
+    """RunResult から消費トークン数を取り出す（取れない場合は0）."""
+    usage = getattr(getattr(result, "context_wrapper", None), "usage", None)
+    total = getattr(usage, "total_tokens", 0)
+    return total if isinstance(total, int) else 0
+
+
+class HedgePolicy:
+    """ヘッジリクエストの発行判断と追加コストの上限管理.
+
+    呼び出しの種類（出力型）ごとに直近の所要時間分布を保持し、実行中の呼び出しが
+    その quantile（例: p90）を超えたら複製を1つ発行する。複製で増える消費は
+    通常呼び出しの max_extra_fraction 倍までに抑える（トークン数が取れない場合は呼び出し回数で数える）。
+    追加の消費は発行時に同種の呼び出しの平均で見込み計上し、負けた側の実際の消費が分かれば置き換える
+    （取り消して消費が分からない場合は見込みのまま残す）。
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.9,
+        max_extra_fraction: float = 0.1,
+        min_samples: int = 8,
+        window: int = 200,
+        min_delay: float = 0.5,
+    ):
+        if not 0 < quantile < 1:
+            raise ValueError("quantile は0より大きく1未満を指定してください。")
+        if max_extra_fraction < 0:
+            raise ValueError("max_extra_fraction は0以上を指定してください。")
+        self.quantile = quantile
+        self.max_extra_fraction = max_extra_fraction
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._latencies: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self._tokens: Dict[str, Deque[int]] = defaultdict(lambda: deque(maxlen=window))
+        self.primary_calls = 0
+        self.primary_tokens = 0
+        self.hedges_issued = 0
+        self.hedges_won = 0
+        self.extra_tokens = 0
+
+    def observe(self, key: str, latency: float, tokens: int = 0) -> None:
+        self._latencies[key].append(latency)
+        self._tokens[key].append(tokens)
+        self.primary_calls += 1
+        self.primary_tokens += tokens
+
+    def threshold(self, key: str) -> Optional[float]:
+        """複製を発行するまでの待ち時間（観測が不足している場合は None）."""
+        latencies = self._latencies[key]
+        if len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, math.ceil(self.quantile * len(ordered)) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def _expected_tokens(self, key: str) -> int:
+        tokens = self._tokens[key]
+        return round(sum(tokens) / len(tokens)) if tokens else 0
+
+    def acquire(self, key: str) -> Optional[int]:
+        """追加コストの上限内であれば複製の発行を記録し、見込みで計上したトークン数を返す（上限超過なら None）.
+
+        計上した見込みは、負けた側の実際の消費が分かった時点で settle で置き換える。
+        """
+        expected = 0
+        if self.primary_tokens > 0:
+            expected = self._expected_tokens(key)
+            if (
+                self.extra_tokens + expected
+                > self.max_extra_fraction * self.primary_tokens
+            ):
+                return None
+            self.extra_tokens += expected
+        elif self.hedges_issued + 1 > self.max_extra_fraction * self.primary_calls:
+            return None
+        self.hedges_issued += 1
+        return expected
+
+    def try_acquire(self, key: str) -> bool:
+        """追加コストの上限内であれば複製の発行を記録して True を返す."""
+        return self.acquire(key) is not None
+
+    def settle(self, reserved: int, tokens: int) -> None:
+        """acquire で見込み計上した reserved を、負けた側の呼び出しが実際に消費した tokens に置き換える."""
+        self.extra_tokens += tokens - reserved
+
+    def record_win(self) -> None:
+        self.hedges_won += 1
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "primary_calls": self.primary_calls,
+            "hedges_issued": self.hedges_issued,
+            "hedges_won": self.hedges_won,
+            "extra_tokens": self.extra_tokens,
+            "primary_tokens": self.primary_tokens,
+        }
+
+
+class CircuitBreaker:
+    """1つのモデルの健全性を直近の呼び出し結果から判定する.
+
+    直近 window 回のうち失敗（例外、または slow_call_threshold 秒を超えた呼び出し）の割合が
+    failure_rate_threshold 以上になると開放状態（open）になり、そのモデルへの新規呼び出しを止める。
+    cooldown 秒が経過すると半開状態（half_open）として試行呼び出しを1つだけ通し、
+    成功すれば閉状態（closed）に戻り、失敗すれば再び開放状態になる。
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: Optional[float] = 120.0,
+        window: int = 10,
+        min_calls: int = 4,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self.cooldown
+        ):
+            return self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """新規呼び出しを通してよいか（半開状態では試行呼び出しを1つだけ通す）."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def record_success(self, duration: float) -> None:
+        if self.slow_call_threshold is not None and duration > self.slow_call_threshold:
+            self.record_failure()
+            return
+        if self._probing:
+            self._probing = False
+            self._state = self.CLOSED
+            self._outcomes.clear()
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        if self._probing:
+            self._probing = False
+            self._trip()
+            return
+        self._outcomes.append(False)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and self.failure_rate() >= self.failure_rate_threshold
+        ):
+            self._trip()
+
+    def release(self) -> None:
+        """結果を判定せずに呼び出しが終わった場合（キャンセル等）に試行枠を戻す."""
+        self._probing = False
+
+    def _trip(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+
+class ModelRouter:
+    """優先順位付きのモデル一覧から、健全なモデルを選んで呼び出しを振り分ける.
+
+    モデルごとの CircuitBreaker は全エージェント・全会議で共有される。
+    エージェントに固有のモデルが設定されている場合は、そのモデルを先頭にした一覧を使う。
+    """
+
+    def __init__(
+        self,
+        models: List[str],
+        breaker_factory: Callable[[], CircuitBreaker] = CircuitBreaker,
+    ):
+        if not models:
+            raise ValueError("models には1つ以上のモデルを指定してください。")
+        self.models = list(dict.fromkeys(models))
+        self._breaker_factory = breaker_factory
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.fallbacks = 0
+
+    def breaker(self, model: str) -> CircuitBreaker:
+        if model not in self.breakers:
+            self.breakers[model] = self._breaker_factory()
+        return self.breakers[model]
+
+    def chain_for(self, agent_model: Any = None) -> List[str]:
+        """エージェントに適用するモデルの優先順位."""
+        if isinstance(agent_model, str) and agent_model:
+            return [agent_model] + [
+                model for model in self.models if model != agent_model
+            ]
+        return list(self.models)
+
+    def candidates(self, agent_model: Any = None) -> Iterator[str]:
+        """呼び出しを試す順にモデルを返す（すべて開放状態なら最優先のモデルに試行させる）.
+
+        遅延評価のため、前のモデルで成功した時点で後続のモデルの試行枠は消費されない。
+        """
+        chain = self.chain_for(agent_model)
+        allowed_any = False
+        for model in chain:
+            if self.breaker(model).allow():
+                allowed_any = True
+                yield model
+        if not allowed_any:
+            yield chain[0]
+
+    def summary(self) -> Dict[str, str]:
+        return {model: self.breaker(model).state for model in self.models}
@@ -0,0 +1,375 @@
+"""同一企画書に対する複数回の会議（モンテカルロ・サンプリング）と評価スコアの集計."""
+import asyncio
+import math
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from board import BoardConfig
+from caller import AgentCaller
+from http_pool import HttpPoolConfig, PoolStats, SharedHttpClient, format_pool_stats
+from meeting_agents import create_concern_consolidator, create_digest_writer
+from models import EVALUATION_AXES, ConsolidatedConcernsOutput, EvaluationOutput
+from resilience import HedgePolicy, ModelRouter
+from scheduler import MeetingDeadline
+from workflow import MeetingResult, _get_proposal_digest, _run_meeting
+
+TOTAL_AXIS = "合計"
+# 時間予算のうち、サンプル横断の懸念点の統合用に残しておく割合
+CONSOLIDATION_RESERVE_RATIO = 0.1
+VERSIONS = (("original", "原版"), ("refined", "改訂版"))
+
+# 95%信頼区間用のt分布の臨界値（両側、自由度1〜20）
+_T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+]
+
+
+def _t_critical(df: int) -> float:
+    if df <= len(_T_CRITICAL_95):
+        return _T_CRITICAL_95[df - 1]
+    return 2.042 if df <= 30 else 1.96
+
+
+@dataclass
+class ScoreStatistics:
+    """1つの評価観点・1つの版に対するサンプル統計."""
+
+    axis: str
+    version: str
+    n: int
+    mean: float
+    variance: float
+    ci_low: float
+    ci_high: float
+
+
+def summarize_scores(values: List[float], axis: str, version: str) -> ScoreStatistics:
+    n = len(values)
+    mean = statistics.fmean(values)
+    if n < 2:
+        return ScoreStatistics(axis, version, n, mean, 0.0, mean, mean)
+    variance = statistics.variance(values, xbar=mean)
+    half_width = _t_critical(n - 1) * math.sqrt(variance / n)
+    return ScoreStatistics(
+        axis, version, n, mean, variance, mean - half_width, mean + half_width
+    )
+
+
+def score_matrix(
+    evaluations: List[EvaluationOutput], version: str
+) -> List[List[Optional[float]]]:
+    """評価結果を行=サンプル、列=EVALUATION_AXES＋合計 の行列にする."""
+    return [
+        evaluation.score_vector(version)
+        + [float(getattr(evaluation, f"total_{version}"))]
+        for evaluation in evaluations
+        if evaluation.axis_scores
+    ]
+
+
+def aggregate_evaluations(evaluations: List[EvaluationOutput]) -> List[ScoreStatistics]:
+    """複数サンプルの構造化スコアを観点・版ごとに集計する（欠けた観点はそのサンプルを除外）."""
+    axes = EVALUATION_AXES + [TOTAL_AXIS]
+    stats: List[ScoreStatistics] = []
+    matrices = {version: score_matrix(evaluations, version) for version, _ in VERSIONS}
+    for column, axis in enumerate(axes):
+        for version, label in VERSIONS:
+            column_values = (row[column] for row in matrices[version])
+            values = [value for value in column_values if value is not None]
+            if values:
+                stats.append(summarize_scores(values, axis, label))
+    return stats
+
+
+def count_verdicts(evaluations: List[EvaluationOutput]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for evaluation in evaluations:
+        verdict = evaluation.verdict or "判定なし"
+        counts[verdict] = counts.get(verdict, 0) + 1
+    return counts
+
+
+@dataclass
+class SamplingResult:
+    """複数サンプルの会議結果と統合レポート."""
+
+    results: List[MeetingResult]
+    statistics: List[ScoreStatistics]
+    verdicts: Dict[str, int]
+    concerns: ConsolidatedConcernsOutput
+    report: str
+    failures: List[str] = field(default_factory=list)
+    http_pool_stats: Optional[PoolStats] = None
+
+
+def _collect_concerns(results: List[MeetingResult]) -> str:
+    sections: List[str] = []
+    for sample_idx, result in enumerate(results, start=1):
+        lines = [f"## サンプル{sample_idx}"]
+        for turn in result.turns:
+            lines.extend(
+                f"- {turn['role']}: {concern}" for concern in turn["response"].concerns
+            )
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+def _render_sampling_report(
+    sample_count: int,
+    statistics_list: List[ScoreStatistics],
+    verdicts: Dict[str, int],
+    concerns: ConsolidatedConcernsOutput,
+    failures: List[str],
+) -> str:
+    succeeded = sample_count - len(failures)
+    report = f"""# 経営会議 サンプリング統合レポート
+
+## 実行情報
+- サンプル数: {sample_count}
+- 成功: {succeeded}
+- 失敗: {len(failures)}
+
+## 評価スコアの統計（95%信頼区間）
+
+| 評価観点 | 版 | n | 平均 | 分散 | 95%信頼区間 |
+|----------|----|---|------|------|-------------|
+"""
+    for stat in statistics_list:
+        report += (
+            f"| {stat.axis} | {stat.version} | {stat.n} "
+            f"| {stat.mean:.1f} | {stat.variance:.2f} "
+            f"| {stat.ci_low:.1f} – {stat.ci_high:.1f} |\n"
+        )
+    if not statistics_list:
+        report += "| (構造化スコアがありません) | | | | | |\n"
+
+    report += "\n## Go/No-Go判定の分布\n\n"
+    report += "".join(f"- {verdict}: {count}件\n" for verdict, count in verdicts.items())
+
+    report += f"\n## サンプル横断で一貫して挙がった懸念点\n\n{concerns.summary}\n\n"
+    for concern in concerns.concerns:
+        roles = f"（{', '.join(concern.roles)}）" if concern.roles else ""
+        report += f"- [{concern.sample_count}/{succeeded}] {concern.concern}{roles}\n"
+
+    if failures:
+        report += "\n## 失敗したサンプル\n\n"
+        report += "".join(f"- {failure}\n" for failure in failures)
+    return report
+
+
+async def _run_sampled_meetings(
+    proposal_markdown: str,
+    samples: int,
+    rounds: int = 12,
+    context_turns: int = 6,
+    max_concurrency: int = 8,
+    verbose: bool = True,
+    hedge: Optional[HedgePolicy] = None,
+    router: Optional[ModelRouter] = None,
+    agenda_size: int = 1,
+    digest_block_size: Optional[int] = None,
+    spill_dir: Optional[Path] = None,
+    board: Optional[BoardConfig] = None,
+    group_rounds: Optional[int] = None,
+    section_refine: bool = False,
+    axis_evaluate: bool = False,
+    http_pool: Optional[HttpPoolConfig] = None,
+    opening_statements: bool = False,
+    trace: bool = False,
+    draft_interval: Optional[int] = None,
+    speculate: bool = False,
+    context_format: str = "markdown",
+    validate_outputs: bool = False,
+    time_budget: Optional[float] = None,
+) -> SamplingResult:
+    """同じ企画書で独立した会議を samples 回並行実行し、スコアと懸念点を集計する.
+
+    ダイジェストは1回だけ生成して全サンプルで共有し、エージェント呼び出しの同時実行数は
+    全サンプル合計で max_concurrency までに制限する。hedge の所要時間分布と
+    router のモデル健全性も全サンプルで共有する。spill_dir を指定すると各サンプルを
+    省メモリモードで実行し、発言を spill_dir/sample_NN に書き出す。
+    http_pool を指定すると、全サンプルの呼び出しで1つの共有HTTPクライアント（接続プール）を使う。
+    trace を指定すると、サンプルごとのタイムラインを各 MeetingResult.trace に記録する。
+    time_budget（秒）を指定すると、ダイジェストの生成から懸念点の統合までをその時間内に収める。
+    各サンプルは統合用の時間を残した予算で縮退モードの会議を行い、統合が間に合わなければ省略する。
+    """
+    if samples < 1:
+        raise ValueError("samples は1以上を指定してください。")
+    overall = MeetingDeadline(time_budget) if time_budget else None
+
+    pool = SharedHttpClient(http_pool) if http_pool is not None else None
+    try:
+        caller = AgentCaller(
+            max_concurrency=max_concurrency,
+            hedge=hedge,
+            router=router,
+            run_config=pool.run_config if pool is not None else None,
+        )
+        try:
+            digest = await asyncio.wait_for(
+                _get_proposal_digest(
+                    proposal_markdown, create_digest_writer(), caller=caller
+                ),
+                timeout=overall.debate_call_timeout() if overall is not None else None,
+            )
+        except asyncio.TimeoutError:
+            if overall is None:
+                raise
+            digest = None
+
+        if verbose:
+            print("=" * 80)
+            print(f"🎲 {samples}回の経営会議を並行実行します（同時実行数上限: {max_concurrency}）")
+            print("=" * 80)
+
+        async def run_sample(sample_idx: int) -> MeetingResult:
+            deadline = None
+            if overall is not None:
+                reserve = overall.time_budget * CONSOLIDATION_RESERVE_RATIO
+                deadline = MeetingDeadline(max(overall.remaining() - reserve, 1e-3))
+            result = await _run_meeting(
+                proposal_markdown=proposal_markdown,
+                rounds=rounds,
+                context_turns=context_turns,
+                verbose=False,
+                caller=caller,
+                deadline=deadline,
+                proposal_digest=digest,
+                agenda_size=agenda_size,
+                digest_block_size=digest_block_size,
+                spill_dir=(
+                    Path(spill_dir) / f"sample_{sample_idx:02d}" if spill_dir else None
+                ),
+                board=board,
+                group_rounds=group_rounds,
+                section_refine=section_refine,
+                axis_evaluate=axis_evaluate,
+                opening_statements=opening_statements,
+                trace=trace,
+                draft_interval=draft_interval,
+                speculate=speculate,
+                context_format=context_format,
+                validate_outputs=validate_outputs,
+            )
+            if verbose:
+                print(f"✅ サンプル {sample_idx}/{samples} 完了")
+            return result
+
+        outcomes = await asyncio.gather(
+            *[run_sample(idx) for idx in range(1, samples + 1)], return_exceptions=True
+        )
+        results = [
+            outcome for outcome in outcomes if isinstance(outcome, MeetingResult)
+        ]
+        failures = [
+            f"サンプル{idx}: {outcome}"
+            for idx, outcome in enumerate(outcomes, start=1)
+            if not isinstance(outcome, MeetingResult)
+        ]
+        if not results:
+            raise next(
+                outcome for outcome in outcomes if isinstance(outcome, BaseException)
+            )
+
+        evaluations = [
+            r.evaluation_output for r in results if r.evaluation_output is not None
+        ]
+        statistics_list = aggregate_evaluations(evaluations)
+        verdicts = count_verdicts(evaluations)
+
+        if verbose:
+            print("\n📊 サンプル横断の懸念点を統合中...\n")
+
+        consolidation_prompt = f"""以下は同じ企画書について独立に実施した{len(results)}回の経営会議で挙がった懸念点です。
+サンプル横断で一貫して挙がった懸念点を統合してください。
+
+{_collect_concerns(results)}
+"""
+        try:
+            concerns = await caller.run(
+                create_concern_consolidator(),
+                consolidation_prompt,
+                ConsolidatedConcernsOutput,
+                timeout=overall.remaining() if overall is not None else None,
+            )
+        except asyncio.TimeoutError:
+            if overall is None:
+                raise
+            concerns = ConsolidatedConcernsOutput(
+                summary="時間予算内に統合が終わらなかったため、サンプル横断の懸念点の統合を省略しました。"
+            )
+
+        report = _render_sampling_report(
+            samples, statistics_list, verdicts, concerns, failures
+        )
+        if pool is not None and verbose:
+            print(format_pool_stats(pool.stats()))
+        return SamplingResult(
+            results=results,
+            statistics=statistics_list,
+            verdicts=verdicts,
+            concerns=concerns,
+            report=report,
+            failures=failures,
+            http_pool_stats=pool.stats() if pool is not None else None,
+        )
+    finally:
+        if pool is not None:
+            await pool.aclose()
+
+
+def run_sampled_meetings(
+    proposal_markdown: str,
+    samples: int,
+    rounds: int = 12,
+    context_turns: int = 6,
+    max_concurrency: int = 8,
+    verbose: bool = True,
+    hedge: Optional[HedgePolicy] = None,
+    router: Optional[ModelRouter] = None,
+    agenda_size: int = 1,
+    digest_block_size: Optional[int] = None,
+    spill_dir: Optional[Path] = None,
+    board: Optional[BoardConfig] = None,
+    group_rounds: Optional[int] = None,
+    section_refine: bool = False,
+    axis_evaluate: bool = False,
+    http_pool: Optional[HttpPoolConfig] = None,
+    opening_statements: bool = False,
+    trace: bool = False,
+    draft_interval: Optional[int] = None,
+    speculate: bool = False,
+    context_format: str = "markdown",
+    validate_outputs: bool = False,
+    time_budget: Optional[float] = None,
+) -> SamplingResult:
+    return asyncio.run(
+        _run_sampled_meetings(
+            proposal_markdown=proposal_markdown,
+            samples=samples,
+            rounds=rounds,
+            context_turns=context_turns,
+            max_concurrency=max_concurrency,
+            verbose=verbose,
+            hedge=hedge,
+            router=router,
+            agenda_size=agenda_size,
+            digest_block_size=digest_block_size,
+            spill_dir=spill_dir,
+            board=board,
+            group_rounds=group_rounds,
+            section_refine=section_refine,
+            axis_evaluate=axis_evaluate,
+            http_pool=http_pool,
+            opening_statements=opening_statements,
+            trace=trace,
+            draft_interval=draft_interval,
+            speculate=speculate,
+            context_format=context_format,
+            validate_outputs=validate_outputs,
+            time_budget=time_budget,
+        )
+    )
@@ -0,0 +1,93 @@
+"""時間予算つきの会議スケジューラ."""
+import math
+import time
+from typing import Callable, List
+
+# 成果物作成（議事録・想定問答・改訂企画書・評価）の呼び出し数
+WRITER_CALLS = 4
+# 成果物作成の1呼び出しは討論の1呼び出しの何倍かかる想定か（長文出力のため）
+WRITER_LATENCY_FACTOR = 3.0
+# 計測値がないときに成果物作成用に確保する時間予算の割合
+DEFAULT_WRITER_RESERVE_RATIO = 0.3
+
+
+class MeetingDeadline:
+    """会議全体の時間予算を管理する.
+
+    討論中は1ラウンドの所要時間と成果物作成に必要な時間を見積もり、
+    予算が足りなくなりそうなら（全員が発言済みであれば）討論を打ち切る。
+    各呼び出しには残り時間から算出したタイムアウトを与え、
+    縮退が発生した理由は reasons に記録する。
+    """
+
+    def __init__(
+        self,
+        time_budget: float,
+        writer_reserve_ratio: float = DEFAULT_WRITER_RESERVE_RATIO,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if time_budget <= 0:
+            raise ValueError("time_budget は0より大きい値を指定してください。")
+        self.time_budget = time_budget
+        self.writer_reserve_ratio = writer_reserve_ratio
+        self._clock = clock
+        self.started_at = clock()
+        self.call_latencies: List[float] = []
+        self.round_durations: List[float] = []
+        self.reasons: List[str] = []
+
+    @property
+    def degraded(self) -> bool:
+        return bool(self.reasons)
+
+    def degrade(self, reason: str) -> None:
+        self.reasons.append(reason)
+
+    def elapsed(self) -> float:
+        return self._clock() - self.started_at
+
+    def remaining(self) -> float:
+        return max(0.0, self.time_budget - self.elapsed())
+
+    def observe_call(self, duration: float) -> None:
+        self.call_latencies.append(duration)
+
+    def observe_round(self, duration: float) -> None:
+        self.round_durations.append(duration)
+
+    def _p90(self, values: List[float]) -> float:
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, math.ceil(0.9 * len(ordered)) - 1)]
+
+    def expected_round_time(self) -> float:
+        if self.round_durations:
+            return self._p90(self.round_durations)
+        return 0.0
+
+    def writer_reserve(self, writer_calls: int = WRITER_CALLS) -> float:
+        """成果物作成のために残しておくべき時間."""
+        floor = self.time_budget * self.writer_reserve_ratio
+        if not self.call_latencies:
+            return floor
+        estimate = writer_calls * WRITER_LATENCY_FACTOR * self._p90(self.call_latencies)
+        return min(max(floor, estimate), self.time_budget)
+
+    def should_stop_debate(self) -> bool:
+        """次のラウンドを実施すると成果物作成の時間が足りなくなるか."""
+        return self.remaining() - self.expected_round_time() < self.writer_reserve()
+
+    def debate_call_timeout(self) -> float:
+        """討論中の1呼び出しのタイムアウト（成果物作成分を残す）."""
+        return max(0.0, self.remaining() - self.writer_reserve())
+
+    def writer_call_timeout(self, writer_calls_left: int) -> float:
+        """成果物作成の1呼び出しのタイムアウト（残り時間を残りの呼び出しで等分）."""
+        return self.remaining() / max(1, writer_calls_left)
+
+    def notice(self) -> str:
+        """縮退して生成した成果物の先頭に付ける注記."""
+        reasons = "".join(f"> - {reason}\n" for reason in self.reasons)
+        return (
+            f"> ⚠️ この成果物は時間予算（{self.time_budget:.0f}秒）内に収めるため縮退モードで生成されました。\n"
+            f"{reasons}\n"
+        )
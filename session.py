@@ -0,0 +1,174 @@
+"""既存のイベントループ内から使う非同期の会議API（発言・成果物のイベントストリームつき）."""
+import asyncio
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Generator, List, Optional
+
+from board import BoardConfig
+from caller import AgentCaller
+from events import MeetingEvent
+from http_pool import HttpPoolConfig, PoolStats, SharedHttpClient
+from resilience import HedgePolicy, ModelRouter
+from scheduler import MeetingDeadline
+from workflow import MeetingResult, _run_meeting
+
+# イベントキューの終端
+_DONE = object()
+
+
+class MeetingRun:
+    """開始済みの1回の会議.
+
+    async for で発生順のイベント（events.MeetingEvent）を受け取り、await で MeetingResult を受け取る。
+    イベントを読まなくても会議は進み、イベントは読み出されるまで保持される。
+    会議が失敗した場合は、イベントを最後まで読んだ時点と await の両方で例外を送出する。
+    run_id は会議ごとに一意の ID（省メモリモードの書き出し先のディレクトリ名に使う）。
+    """
+
+    def __init__(
+        self,
+        meeting: Callable[[Callable[[MeetingEvent], None]], Awaitable[MeetingResult]],
+        run_id: Optional[str] = None,
+    ):
+        self.run_id = run_id or uuid.uuid4().hex
+        self._queue: "asyncio.Queue" = asyncio.Queue()
+        self._finished = False
+        self._task = asyncio.ensure_future(meeting(self._queue.put_nowait))
+        self._task.add_done_callback(lambda _: self._queue.put_nowait(_DONE))
+
+    @property
+    def done(self) -> bool:
+        return self._task.done()
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+    def __await__(self) -> Generator[None, None, MeetingResult]:
+        return self._task.__await__()
+
+    async def events(self) -> AsyncIterator[MeetingEvent]:
+        while not self._finished:
+            event = await self._queue.get()
+            if event is _DONE:
+                self._finished = True
+                break
+            yield event
+        if not self._task.cancelled():
+            error = self._task.exception()
+            if error is not None:
+                raise error
+
+    def __aiter__(self) -> AsyncIterator[MeetingEvent]:
+        return self.events()
+
+
+class MeetingSession:
+    """既存のイベントループ内で複数の会議を開始・並行実行するための非同期API.
+
+    同じセッションで開始した会議は1つの AgentCaller（同時実行数の上限・hedge の所要時間分布・
+    router のモデル健全性）と、http_pool を指定した場合は1つの共有HTTPクライアントを共有する。
+    インスタンスはイベントループ内で生成し、終了時に aclose() すること（async with でも使える）。
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        hedge: Optional[HedgePolicy] = None,
+        router: Optional[ModelRouter] = None,
+        http_pool: Optional[HttpPoolConfig] = None,
+    ):
+        self._pool = SharedHttpClient(http_pool) if http_pool is not None else None
+        self.caller = AgentCaller(
+            max_concurrency=max_concurrency,
+            hedge=hedge,
+            router=router,
+            run_config=self._pool.run_config if self._pool is not None else None,
+        )
+        self._runs: List[MeetingRun] = []
+        self._closed = False
+
+    def start(
+        self,
+        proposal_markdown: str,
+        rounds: int = 12,
+        context_turns: int = 6,
+        time_budget: Optional[float] = None,
+        agenda_size: int = 1,
+        digest_block_size: Optional[int] = None,
+        spill_dir: Optional[Path] = None,
+        board: Optional[BoardConfig] = None,
+        group_rounds: Optional[int] = None,
+        section_refine: bool = False,
+        axis_evaluate: bool = False,
+        opening_statements: bool = False,
+        draft_interval: Optional[int] = None,
+        speculate: bool = False,
+        context_format: str = "markdown",
+        validate_outputs: bool = False,
+    ) -> MeetingRun:
+        """会議をバックグラウンドで開始する（引数は run_board_meeting と同じ意味）.
+
+        spill_dir を指定した場合、発言は spill_dir/meeting_<run_id> に書き出す（同じ spill_dir を
+        渡した複数の会議・セッションが互いの書き出しを上書きしないよう、会議ごとに分ける）。
+        """
+        if self._closed:
+            raise RuntimeError("終了したセッションでは会議を開始できません。")
+        deadline = MeetingDeadline(time_budget) if time_budget else None
+        run_id = uuid.uuid4().hex
+        meeting_spill_dir = Path(spill_dir) / f"meeting_{run_id}" if spill_dir else None
+
+        def meeting(
+            on_event: Callable[[MeetingEvent], None],
+        ) -> Awaitable[MeetingResult]:
+            return _run_meeting(
+                proposal_markdown=proposal_markdown,
+                rounds=rounds,
+                context_turns=context_turns,
+                verbose=False,
+                caller=self.caller,
+                deadline=deadline,
+                agenda_size=agenda_size,
+                digest_block_size=digest_block_size,
+                spill_dir=meeting_spill_dir,
+                board=board,
+                group_rounds=group_rounds,
+                section_refine=section_refine,
+                axis_evaluate=axis_evaluate,
+                opening_statements=opening_statements,
+                draft_interval=draft_interval,
+                speculate=speculate,
+                context_format=context_format,
+                validate_outputs=validate_outputs,
+                on_event=on_event,
+            )
+
+        run = MeetingRun(meeting, run_id=run_id)
+        self._runs = [r for r in self._runs if not r.done] + [run]
+        return run
+
+    async def run(self, proposal_markdown: str, **options) -> MeetingResult:
+        """会議を実行して結果を返す（イベントが不要な場合）."""
+        return await self.start(proposal_markdown, **options)
+
+    def http_pool_stats(self) -> Optional[PoolStats]:
+        return self._pool.stats() if self._pool is not None else None
+
+    async def aclose(self) -> None:
+        """実行中の会議をキャンセルし、共有HTTPクライアントを閉じる."""
+        self._closed = True
+        running = [run for run in self._runs if not run.done]
+        for run in running:
+            run.cancel()
+        if running:
+            await asyncio.gather(
+                *[run._task for run in running], return_exceptions=True
+            )
+        self._runs = []
+        if self._pool is not None:
+            await self._pool.aclose()
+
+    async def __aenter__(self) -> "MeetingSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
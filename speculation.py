@@ -0,0 +1,182 @@
+"""参加者の発言の投機的実行（ファシリテーターの指名を待たずに、次の発言者の発言を始める）."""
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from agents import Agent
+
+from caller import AgentCaller
+from models import ParticipantResponse
+from token_count import estimate_tokens
+
+# 投機的な発言で使う汎用の指示
+SPECULATIVE_PROMPT = "これまでの議論を踏まえ、役割の観点から見解を述べてください"
+# ファシリテーターの指示のうち、投機的な発言でカバーされているべき割合（文字bigram単位）
+MIN_INSTRUCTION_MATCH = 0.5
+
+_IGNORED_CHARS = re.compile(r"[\s、。，．,.・「」『』（）()？?！!：:]")
+
+
+def predict_next_speaker(
+    turns: Sequence[Dict], counts: Dict[str, int], allowed_roles: List[str]
+) -> str:
+    """ファシリテーターが次に指名しそうな役割を返す.
+
+    直前の発言の質問で名前が挙がった役割を優先し、なければ発言回数の最も少ない役割
+    （同数なら allowed_roles の順）とする。直前の発言者は続けて指名されないものとみなす。
+    """
+    last = turns[-1] if len(turns) else None
+    last_role = last["role"] if last is not None else None
+    candidates = [role for role in allowed_roles if role != last_role]
+    candidates = candidates or list(allowed_roles)
+    if last is not None:
+        for question in last["response"].questions:
+            for role in candidates:
+                if role in question:
+                    return role
+    return min(candidates, key=lambda role: counts.get(role, 0))
+
+
+def _bigrams(text: str) -> Set[str]:
+    text = _IGNORED_CHARS.sub("", text)
+    return {text[idx:idx + 2] for idx in range(len(text) - 1)}
+
+
+def instruction_match(instruction: str, response: ParticipantResponse) -> float:
+    """ファシリテーターの指示の文字bigramのうち、汎用の指示と投機的な発言の内容に含まれる割合."""
+    wanted = _bigrams(instruction)
+    if not wanted:
+        return 1.0
+    text = " ".join(
+        [
+            SPECULATIVE_PROMPT,
+            response.summary,
+            *response.concerns,
+            *response.proposals,
+            *response.questions,
+        ]
+    )
+    return len(wanted & _bigrams(text)) / len(wanted)
+
+
+@dataclass
+class SpeculationStats:
+    """投機的実行の集計（会議ごと、部会があれば全部会の合計）.
+
+    wasted_tokens は捨てた投機的な発言の消費トークン数。完了前に取り消した呼び出しは実際の消費が分からないため、
+    送信済みの入力（指示とプロンプト）の見積もりを数え、その内訳を cancelled_tokens にも記録する。
+    saved_seconds は指名の決定後に待たずに済んだ時間の合計。
+    """
+
+    attempts: int = 0
+    hits: int = 0
+    speaker_misses: int = 0
+    instruction_misses: int = 0
+    failures: int = 0
+    cancelled: int = 0
+    cancelled_tokens: int = 0
+    wasted_tokens: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.attempts if self.attempts else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "hits": self.hits,
+            "hit_rate": round(self.hit_rate, 3),
+            "speaker_misses": self.speaker_misses,
+            "instruction_misses": self.instruction_misses,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "cancelled_tokens": self.cancelled_tokens,
+            "wasted_tokens": self.wasted_tokens,
+            "saved_seconds": round(self.saved_seconds, 2),
+        }
+
+
+def format_speculation_stats(stats: SpeculationStats) -> str:
+    return (
+        f"🔮 投機的実行: {stats.attempts}回中{stats.hits}回的中"
+        f"（的中率 {stats.hit_rate:.0%}）、"
+        f"外れ {stats.speaker_misses + stats.instruction_misses}回"
+        f"（発言者 {stats.speaker_misses}・指示 {stats.instruction_misses}）、"
+        f"失敗 {stats.failures}回、取り消し {stats.cancelled}回、"
+        f"無駄になったトークン {stats.wasted_tokens}"
+        f"（うち取り消し分の入力見積もり {stats.cancelled_tokens}）、"
+        f"短縮 {stats.saved_seconds:.1f}秒"
+    )
+
+
+class SpeculativeTurn:
+    """ファシリテーターの呼び出しと並行して始めた、予測した発言者の発言.
+
+    呼び出しは child() で分けた呼び出し元で行い（コンソールへの逐次表示はしない）、
+    resolve() で採否を決めた時点で計測を caller に加える。
+    """
+
+    def __init__(
+        self,
+        caller: AgentCaller,
+        agent: Agent,
+        speaker: str,
+        prompt: str,
+        timeout: Optional[float] = None,
+    ):
+        self.caller = caller
+        self.speaker = speaker
+        instructions = agent.instructions if isinstance(agent.instructions, str) else ""
+        self._input_text = instructions + prompt
+        self._child = caller.child()
+        self._child.console = None
+        self._task = asyncio.ensure_future(
+            self._child.run(agent, prompt, ParticipantResponse, timeout=timeout)
+        )
+
+    def _merge(self) -> None:
+        self.caller.records.extend(self._child.records)
+        self.caller.call_count += self._child.call_count
+
+    def cancel(self, stats: Optional[SpeculationStats] = None) -> None:
+        """捨てる. 完了済みなら消費トークンを、実行中なら取り消して送信済みの入力の見積もりを無駄として数える."""
+        if not self._task.done():
+            self._task.cancel()
+            if stats is not None:
+                tokens = estimate_tokens(self._input_text)
+                stats.cancelled += 1
+                stats.cancelled_tokens += tokens
+                stats.wasted_tokens += tokens
+        elif not self._task.cancelled() and self._task.exception() is None:
+            if stats is not None:
+                stats.wasted_tokens += self._child.records[-1].tokens
+        self._merge()
+
+    async def resolve(
+        self, speaker: str, instruction: str, stats: SpeculationStats
+    ) -> Optional[ParticipantResponse]:
+        """指名された発言者・指示と一致すれば投機的な発言を返し、一致しなければ捨てて None を返す."""
+        stats.attempts += 1
+        if speaker != self.speaker:
+            stats.speaker_misses += 1
+            self.cancel(stats)
+            return None
+        decided_at = time.time()
+        try:
+            response = await self._task
+        except Exception:
+            stats.failures += 1
+            self._merge()
+            return None
+        self._merge()
+        record = self.caller.records[-1]
+        if instruction_match(instruction, response) < MIN_INSTRUCTION_MATCH:
+            stats.instruction_misses += 1
+            stats.wasted_tokens += record.tokens
+            return None
+        stats.hits += 1
+        stats.saved_seconds += max(0.0, record.duration - (time.time() - decided_at))
+        return response
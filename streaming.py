@@ -0,0 +1,180 @@
+"""ストリーミング実行時の部分出力の表示・ファイル書き出しと、最初/最後のトークンまでの時間の計測."""
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional, TextIO, Tuple
+
+# 部分出力として表示・書き出す出力型のフィールド（先に見つかったもの）
+STREAM_FIELDS = ("markdown", "summary")
+
+
+def text_delta(event: Any) -> str:
+    """Runner.run_streamed の stream_events() のイベントから出力テキストの差分を取り出す."""
+    if getattr(event, "type", "") != "raw_response_event":
+        return ""
+    data = getattr(event, "data", None)
+    if getattr(data, "type", "") != "response.output_text.delta":
+        return ""
+    return getattr(data, "delta", "") or ""
+
+
+def stream_field(output_type: Any) -> Optional[str]:
+    """出力型のうち部分出力として表示するフィールド名（該当しなければ None）."""
+    fields = getattr(output_type, "model_fields", {})
+    return next((name for name in STREAM_FIELDS if name in fields), None)
+
+
+class JsonStringField:
+    """生成途中のJSONテキストから、指定したキーの文字列値を届いた分だけデコードする."""
+
+    _ESCAPES = {
+        '"': '"',
+        "\\": "\\",
+        "/": "/",
+        "b": "\b",
+        "f": "\f",
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+    }
+
+    def __init__(self, name: str):
+        self._key = re.compile(r'"%s"\s*:\s*"' % re.escape(name))
+        self._head = ""
+        self._started = False
+        self._escape = ""
+        self._high_surrogate: Optional[int] = None
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        """JSONテキストの続きを受け取り、新たにデコードできた文字列を返す."""
+        if self.done:
+            return ""
+        if not self._started:
+            self._head += chunk
+            match = self._key.search(self._head)
+            if match is None:
+                return ""
+            self._started = True
+            chunk = self._head[match.end():]
+            self._head = ""
+
+        decoded = []
+        for char in chunk:
+            if self._escape:
+                self._escape += char
+                if self._escape[1] != "u":
+                    decoded.append(self._ESCAPES.get(char, char))
+                elif len(self._escape) == 6:
+                    decoded.append(self._decode_unicode(int(self._escape[2:], 16)))
+                else:
+                    continue
+                self._escape = ""
+            elif char == "\\":
+                self._escape = char
+            elif char == '"':
+                self.done = True
+                break
+            else:
+                decoded.append(char)
+        return "".join(decoded)
+
+    def _decode_unicode(self, code: int) -> str:
+        if 0xD800 <= code < 0xDC00:
+            self._high_surrogate = code
+            return ""
+        if 0xDC00 <= code < 0xE000 and self._high_surrogate is not None:
+            high, self._high_surrogate = self._high_surrogate, None
+            return chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00))
+        return chr(code)
+
+
+class ConsoleStream:
+    """複数の呼び出しの部分出力をコンソールに表示する（表示中の呼び出しが替わると見出しを付ける）."""
+
+    def __init__(self, out: Optional[TextIO] = None):
+        self._out = out
+        self._current: Optional[str] = None
+
+    @property
+    def out(self) -> TextIO:
+        return self._out or sys.stdout
+
+    def write(self, label: str, text: str) -> None:
+        if label != self._current:
+            self.out.write(f"\n✍️  {label}: ")
+            self._current = label
+        self.out.write(text)
+        self.out.flush()
+
+    def end(self, label: str) -> None:
+        if self._current == label:
+            self.out.write("\n")
+            self.out.flush()
+            self._current = None
+
+
+class StreamTap:
+    """1回の呼び出しのストリーミング出力を受け取り、表示・ファイル書き出しと時間計測を行う.
+
+    field を指定すると、生成中のJSONからそのフィールドの文字列を取り出して console と path に
+    逐次書き出す。path のファイルは最初の部分出力が届いた時点で作成（上書き）される。
+    """
+
+    def __init__(
+        self,
+        label: str,
+        field: Optional[str],
+        console: Optional[ConsoleStream] = None,
+        path: Optional[Path] = None,
+    ):
+        self.label = label
+        self.field = field
+        self.console = console
+        self.path = Path(path) if path is not None else None
+        self._decoder = JsonStringField(field) if field else None
+        self._file: Optional[TextIO] = None
+        self.first_token_at: Optional[float] = None
+        self.last_token_at: Optional[float] = None
+
+    def feed(self, delta: str) -> None:
+        now = time.time()
+        if self.first_token_at is None:
+            self.first_token_at = now
+        self.last_token_at = now
+        if self._decoder is None:
+            return
+        text = self._decoder.feed(delta)
+        if not text:
+            return
+        if self.console is not None:
+            self.console.write(self.label, text)
+        if self.path is not None:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "w", encoding="utf-8")
+            self._file.write(text)
+            self._file.flush()
+
+    def restart(self) -> None:
+        """フォールバックモデルでの再試行時に、途中までの出力と計測を破棄する."""
+        self.close()
+        if self.path is not None and self.path.exists():
+            self.path.unlink()
+        self._decoder = JsonStringField(self.field) if self.field else None
+        self.first_token_at = None
+        self.last_token_at = None
+
+    def timings(self, started_at: float) -> Tuple[Optional[float], Optional[float]]:
+        """started_at からの最初/最後のトークンまでの秒数（トークンが届かなかった場合は None）."""
+        if self.first_token_at is None or self.last_token_at is None:
+            return None, None
+        return self.first_token_at - started_at, self.last_token_at - started_at
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.console is not None:
+            self.console.end(self.label)
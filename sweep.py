@@ -0,0 +1,309 @@
+"""討論の共通部分を1回だけ実行し、設定ごとに分岐させるパラメータスイープ.
+
+rounds・context_turns だけが異なる会議は、序盤の討論が同じプロンプトになる。
+context_turns が c の会議では、c 件目までの発言を行う時点の直近の議論は全発言と一致するため、
+全設定の最小の context_turns を c_min とすると最初の c_min + 1 発言は設定によらず共通になる。
+rounds は討論の打ち切り位置にしか影響しない。そこで共通部分を1回だけ実行して
+発言履歴をチェックポイントとして保存し、設定が分かれる時点で分岐を並行して進める。
+"""
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from board import BoardConfig, default_board
+from caller import AgentCaller
+from http_pool import HttpPoolConfig, PoolStats, SharedHttpClient, format_pool_stats
+from meeting_agents import create_facilitator, create_participant
+from resilience import HedgePolicy, ModelRouter
+from workflow import DebateCheckpoint, MeetingResult, _run_debate, _run_meeting
+
+
+@dataclass(frozen=True)
+class SweepVariant:
+    """スイープする1つの設定."""
+
+    rounds: int
+    context_turns: int
+
+    @property
+    def label(self) -> str:
+        return f"rounds_{self.rounds}_context_{self.context_turns}"
+
+
+@dataclass
+class SweepResult:
+    """設定ごとの会議結果とスイープレポート.
+
+    debate_calls は実際に行った討論の呼び出し数、independent_debate_calls は
+    各設定を独立に実行した場合の討論の呼び出し数。
+    """
+
+    variants: List[SweepVariant]
+    results: List[MeetingResult]
+    shared_turns: Dict[SweepVariant, int]
+    debate_calls: int
+    independent_debate_calls: int
+    report: str
+    failures: List[str] = field(default_factory=list)
+    http_pool_stats: Optional[PoolStats] = None
+
+
+def sweep_variants(
+    rounds: Sequence[int], context_turns: Sequence[int]
+) -> List[SweepVariant]:
+    """rounds と context_turns の全組み合わせ（重複を除き、指定順）."""
+    variants: List[SweepVariant] = []
+    for r, c in itertools.product(rounds, context_turns):
+        if r < 1 or c < 0:
+            raise ValueError("rounds は1以上、context_turns は0以上を指定してください。")
+        variant = SweepVariant(r, c)
+        if variant not in variants:
+            variants.append(variant)
+    return variants
+
+
+def shared_prefix_end(variants: Sequence[SweepVariant], role_count: int) -> int:
+    """variants の全設定で討論が一致するラウンド数（通算）."""
+    end = min(max(v.rounds, role_count) for v in variants)
+    contexts = {v.context_turns for v in variants}
+    if len(contexts) > 1:
+        end = min(end, min(contexts) + 1)
+    return end
+
+
+def _render_sweep_report(
+    variants: List[SweepVariant],
+    results: Dict[SweepVariant, MeetingResult],
+    shared_turns: Dict[SweepVariant, int],
+    debate_calls: int,
+    independent_debate_calls: int,
+    failures: List[str],
+) -> str:
+    saved = independent_debate_calls - debate_calls
+    ratio = saved / independent_debate_calls if independent_debate_calls else 0.0
+    calls = (
+        f"{debate_calls}（設定ごとに独立して実行した場合: {independent_debate_calls}、"
+        f"削減: {saved}回 / {ratio:.0%}）"
+    )
+    report = f"""# 経営会議 パラメータスイープレポート
+
+## 実行情報
+- 設定数: {len(variants)}
+- 成功: {len(results)}
+- 失敗: {len(failures)}
+- 討論の呼び出し数: {calls}
+
+## 設定別の結果
+
+"""
+    report += (
+        "| rounds | context_turns | 発言数 | 共通部分の発言数 "
+        "| 合計（原版） | 合計（改訂版） | 判定 |\n"
+        "|--------|---------------|--------|------------------"
+        "|--------------|----------------|------|\n"
+    )
+    for variant in variants:
+        result = results.get(variant)
+        if result is None:
+            continue
+        evaluation = result.evaluation_output
+        scored = (
+            evaluation if evaluation is not None and evaluation.axis_scores else None
+        )
+        report += (
+            f"| {variant.rounds} | {variant.context_turns} | {len(result.turns)} "
+            f"| {shared_turns.get(variant, 0)} "
+            f"| {scored.total_original if scored else '-'} "
+            f"| {scored.total_refined if scored else '-'} "
+            f"| {(evaluation.verdict if evaluation else '') or '-'} |\n"
+        )
+    if failures:
+        report += "\n## 失敗した設定\n\n"
+        report += "".join(f"- {failure}\n" for failure in failures)
+    return report
+
+
+async def _run_sweep(
+    proposal_markdown: str,
+    rounds: Sequence[int],
+    context_turns: Sequence[int],
+    max_concurrency: int = 8,
+    verbose: bool = True,
+    hedge: Optional[HedgePolicy] = None,
+    router: Optional[ModelRouter] = None,
+    digest_block_size: Optional[int] = None,
+    board: Optional[BoardConfig] = None,
+    section_refine: bool = False,
+    axis_evaluate: bool = False,
+    http_pool: Optional[HttpPoolConfig] = None,
+) -> SweepResult:
+    """rounds × context_turns の各設定で会議を行い、共通する討論の序盤は1回だけ実行する.
+
+    討論が分岐した後の各分岐と、設定ごとの成果物作成は並行して行い、エージェント呼び出しの
+    同時実行数は全設定合計で max_concurrency までに制限する。部会のある参加者構成には対応しない。
+    """
+    variants = sweep_variants(rounds, context_turns)
+    if not variants:
+        raise ValueError("スイープする設定がありません。")
+    board = board or default_board()
+    if board.hierarchical:
+        raise ValueError("部会のある参加者構成ではパラメータスイープを実行できません。")
+    roles = list(board.roles)
+    role_count = len(board.plenary_roles())
+    facilitator = create_facilitator()
+    participants = {role: create_participant(role, board.roles[role]) for role in roles}
+
+    pool = SharedHttpClient(http_pool) if http_pool is not None else None
+    try:
+        caller = AgentCaller(
+            max_concurrency=max_concurrency,
+            hedge=hedge,
+            router=router,
+            run_config=pool.run_config if pool is not None else None,
+        )
+        debates: Dict[SweepVariant, DebateCheckpoint] = {}
+        shared_turns: Dict[SweepVariant, int] = {}
+        debate_calls = 0
+
+        if verbose:
+            print("=" * 80)
+            print(f"🔀 {len(variants)}通りの設定でパラメータスイープを実行します（同時実行数上限: {max_concurrency}）")
+            print("=" * 80)
+
+        async def fork(group: List[SweepVariant], checkpoint: DebateCheckpoint) -> None:
+            nonlocal debate_calls
+            end = shared_prefix_end(group, role_count)
+            if end > checkpoint.rounds:
+                segment_caller = caller.child()
+                if verbose:
+                    targets = ", ".join(v.label for v in group)
+                    print(f"▶️  ラウンド{checkpoint.rounds + 1}〜{end}を実行（{targets}）")
+                turns, counts = await _run_debate(
+                    proposal_markdown=proposal_markdown,
+                    roles=roles,
+                    facilitator=facilitator,
+                    participants=participants,
+                    effective_rounds=max(max(v.rounds, role_count) for v in group),
+                    context_turns=min(v.context_turns for v in group),
+                    verbose=False,
+                    caller=segment_caller,
+                    checkpoint=checkpoint,
+                    stop_at=end,
+                )
+                debate_calls += len(segment_caller.records)
+                checkpoint = DebateCheckpoint(
+                    turns, counts, [*checkpoint.records, *segment_caller.records]
+                )
+            if len(group) > 1:
+                for variant in group:
+                    shared_turns[variant] = checkpoint.rounds
+
+            remaining = []
+            for variant in group:
+                if max(variant.rounds, role_count) <= checkpoint.rounds:
+                    debates[variant] = checkpoint
+                else:
+                    remaining.append(variant)
+            if not remaining:
+                return
+            min_context = min(v.context_turns for v in remaining)
+            branches = [
+                [v for v in remaining if v.context_turns == min_context],
+                [v for v in remaining if v.context_turns != min_context],
+            ]
+            branches = [branch for branch in branches if branch]
+            if verbose and len(branches) > 1:
+                print(f"🔀 ラウンド{checkpoint.rounds}の時点で分岐します")
+            await asyncio.gather(*[fork(branch, checkpoint) for branch in branches])
+
+        await fork(variants, DebateCheckpoint(counts={role: 0 for role in roles}))
+
+        async def finish(variant: SweepVariant) -> MeetingResult:
+            result = await _run_meeting(
+                proposal_markdown=proposal_markdown,
+                rounds=variant.rounds,
+                context_turns=variant.context_turns,
+                verbose=False,
+                caller=caller,
+                digest_block_size=digest_block_size,
+                board=board,
+                section_refine=section_refine,
+                axis_evaluate=axis_evaluate,
+                debate=debates[variant],
+            )
+            if verbose:
+                print(f"✅ {variant.label} の成果物を作成しました")
+            return result
+
+        outcomes = await asyncio.gather(
+            *[finish(v) for v in variants], return_exceptions=True
+        )
+        results = {
+            v: o for v, o in zip(variants, outcomes) if isinstance(o, MeetingResult)
+        }
+        failures = [
+            f"{v.label}: {o}"
+            for v, o in zip(variants, outcomes)
+            if not isinstance(o, MeetingResult)
+        ]
+        if not results:
+            raise next(o for o in outcomes if isinstance(o, BaseException))
+
+        # 独立に実行した場合は1ラウンドにつきファシリテーターと参加者の2呼び出し
+        independent_debate_calls = sum(2 * len(debates[v].turns) for v in variants)
+        report = _render_sweep_report(
+            variants,
+            results,
+            shared_turns,
+            debate_calls,
+            independent_debate_calls,
+            failures,
+        )
+        if pool is not None and verbose:
+            print(format_pool_stats(pool.stats()))
+        return SweepResult(
+            variants=[v for v in variants if v in results],
+            results=[results[v] for v in variants if v in results],
+            shared_turns=shared_turns,
+            debate_calls=debate_calls,
+            independent_debate_calls=independent_debate_calls,
+            report=report,
+            failures=failures,
+            http_pool_stats=pool.stats() if pool is not None else None,
+        )
+    finally:
+        if pool is not None:
+            await pool.aclose()
+
+
+def run_sweep(
+    proposal_markdown: str,
+    rounds: Sequence[int],
+    context_turns: Sequence[int],
+    max_concurrency: int = 8,
+    verbose: bool = True,
+    hedge: Optional[HedgePolicy] = None,
+    router: Optional[ModelRouter] = None,
+    digest_block_size: Optional[int] = None,
+    board: Optional[BoardConfig] = None,
+    section_refine: bool = False,
+    axis_evaluate: bool = False,
+    http_pool: Optional[HttpPoolConfig] = None,
+) -> SweepResult:
+    return asyncio.run(
+        _run_sweep(
+            proposal_markdown=proposal_markdown,
+            rounds=rounds,
+            context_turns=context_turns,
+            max_concurrency=max_concurrency,
+            verbose=verbose,
+            hedge=hedge,
+            router=router,
+            digest_block_size=digest_block_size,
+            board=board,
+            section_refine=section_refine,
+            axis_evaluate=axis_evaluate,
+            http_pool=http_pool,
+        )
+    )
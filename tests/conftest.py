@@ -1,6 +1,7 @@
 """pytest共通フィクスチャとテストデータ."""
+import asyncio
 import pytest
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 
 @pytest.fixture
@@ -75,3 +76,169 @@ def all_roles() -> List[str]:
         "法務の専門家",
         "会計の専門家",
     ]
+
+
+class FakeRunResult:
+    """Runner.run の戻り値を模したオブジェクト."""
+
+    def __init__(self, output):
+        self.final_output = output
+
+    def final_output_as(self, cls, raise_if_incorrect_type=False):
+        return self.final_output
+
+
+def make_fake_output(agent):
+    """エージェントの出力型に応じたダミー出力を生成する."""
+    from meeting_agents import MINUTES_SECTIONS, REFINED_PROPOSAL_SECTIONS
+    from models import (
+        ArtifactSection,
+        AxisScore,
+        ComparativeEvaluationOutput,
+        CandidateRanking,
+        ConsistencyReview,
+        ConsolidatedConcernsOutput,
+        DiscussionDigest,
+        DiscussionPoint,
+        FacilitatorAgenda,
+        FacilitatorDecision,
+        ParticipantResponse,
+        ProposalDigest,
+        SectionRepairOutput,
+    )
+
+    output_type = agent.output_type
+    if output_type is FacilitatorAgenda:
+        upcoming = [
+            FacilitatorDecision(
+                next_speaker="社長", prompt="続けて", rationale="テスト"
+            )
+        ] * 4
+        return FacilitatorAgenda(
+            next_speaker="社長",
+            prompt="ご意見を",
+            rationale="テスト",
+            upcoming=upcoming,
+        )
+    if output_type is FacilitatorDecision:
+        return FacilitatorDecision(next_speaker="社長", prompt="ご意見を", rationale="テスト")
+    if output_type is ParticipantResponse:
+        return ParticipantResponse(
+            summary=f"{agent.name}の発言",
+            concerns=[f"{agent.name}の懸念"],
+            proposals=[f"{agent.name}の提案"],
+        )
+    if output_type is ProposalDigest:
+        return ProposalDigest(
+            title="テスト企画",
+            summary="テスト要約",
+            key_points=["論点"],
+            investment="5000万円",
+        )
+    if output_type is ComparativeEvaluationOutput:
+        return ComparativeEvaluationOutput(
+            rankings=[CandidateRanking(candidate_id="案A", rank=1, score=80)],
+            recommendation="案Aを推奨",
+            markdown="# 比較評価レポート",
+        )
+    if output_type is DiscussionDigest:
+        return DiscussionDigest(
+            summary=f"{agent.name}による要約",
+            concerns=[DiscussionPoint(point="共通の懸念", roles=["社長"], turns=[1])],
+        )
+    if output_type is ConsolidatedConcernsOutput:
+        return ConsolidatedConcernsOutput(concerns=[], summary="統合結果")
+    if output_type is ConsistencyReview:
+        return ConsistencyReview()
+    if output_type is SectionRepairOutput:
+        headings = [*MINUTES_SECTIONS, *REFINED_PROPOSAL_SECTIONS]
+        return SectionRepairOutput(
+            sections=[
+                ArtifactSection(heading=h, markdown=f"{h}の本文") for h in headings
+            ]
+        )
+    if output_type is AxisScore:
+        return AxisScore(axis="売上規模", original=5, refined=7, comment=f"{agent.name}の採点")
+    return output_type(markdown=f"# {agent.name}")
+
+
+class FakeRunner:
+    """workflow.Runner.run を置き換える非同期フェイク（呼び出しを記録する）.
+
+    overrides でエージェント名ごとの出力を差し替え、delay で各呼び出しに待ち時間を入れる。
+    in_flight_peak には同時に実行中だった呼び出し数の最大値が記録される。
+    """
+
+    def __init__(self, overrides: Optional[Dict] = None, delay: float = 0.0):
+        self.calls: List[Tuple[str, str]] = []
+        self.overrides = overrides or {}
+        self.delay = delay
+        self.in_flight = 0
+        self.in_flight_peak = 0
+
+    async def __call__(self, agent, prompt, **kwargs):
+        self.calls.append((agent.name, prompt))
+        self.in_flight += 1
+        self.in_flight_peak = max(self.in_flight_peak, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if agent.name in self.overrides:
+            return FakeRunResult(self.overrides[agent.name])
+        return FakeRunResult(make_fake_output(agent))
+
+    def count(self, agent_name: str) -> int:
+        return sum(1 for name, _ in self.calls if name == agent_name)
+
+
+class FakeStreamedResult:
+    """Runner.run_streamed の戻り値を模したオブジェクト（出力JSONを chunk_size 文字ずつ流す）."""
+
+    def __init__(self, output, chunk_size: int = 5, delay: float = 0.0):
+        self.final_output = output
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self.cancelled = False
+
+    async def stream_events(self):
+        from types import SimpleNamespace
+
+        yield SimpleNamespace(type="agent_updated_stream_event", new_agent=None)
+        text = self.final_output.model_dump_json()
+        for start in range(0, len(text), self.chunk_size):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            data = SimpleNamespace(
+                type="response.output_text.delta",
+                delta=text[start:start + self.chunk_size],
+            )
+            yield SimpleNamespace(type="raw_response_event", data=data)
+
+    def final_output_as(self, cls, raise_if_incorrect_type=False):
+        return self.final_output
+
+    def cancel(self, mode="immediate"):
+        self.cancelled = True
+
+
+class FakeStreamedRunner(FakeRunner):
+    """workflow.Runner.run_streamed を置き換えるフェイク（同期関数として結果を返す）."""
+
+    def __init__(
+        self, overrides: Optional[Dict] = None, delay: float = 0.0, chunk_size: int = 5
+    ):
+        super().__init__(overrides=overrides, delay=delay)
+        self.chunk_size = chunk_size
+
+    def __call__(self, agent, prompt, **kwargs):
+        self.calls.append((agent.name, prompt))
+        output = self.overrides.get(agent.name) or make_fake_output(agent)
+        return FakeStreamedResult(output, chunk_size=self.chunk_size, delay=self.delay)
+
+
+@pytest.fixture
+def fake_runner() -> FakeRunner:
+    """呼び出しを記録するRunner.runのフェイク."""
+    return FakeRunner()
@@ -0,0 +1,147 @@
+"""board.pyの単体テスト."""
+import json
+
+import pytest
+
+from board import BoardConfig, RoleGroup, default_board, load_board_config
+from meeting_agents import ROLE_INSTRUCTIONS
+
+
+def write_config(tmp_path, data) -> str:
+    path = tmp_path / "roles.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class TestBoardConfig:
+    """BoardConfigのテスト."""
+
+    def test_default_board_uses_role_instructions(self):
+        """既定の構成はROLE_INSTRUCTIONSの全役割で、階層型ではないことをテスト."""
+        board = default_board()
+        assert board.roles == ROLE_INSTRUCTIONS
+        assert not board.hierarchical
+        assert board.plenary_roles() == list(ROLE_INSTRUCTIONS)
+
+    def test_plenary_roles_are_ungrouped_and_leads(self):
+        """全体会議には部会に属さない役割と各部会のリードが参加することをテスト."""
+        board = BoardConfig(
+            roles={"社長": "a", "営業部長": "b", "営業課長": "c", "工場長": "d", "品質課長": "e"},
+            groups=[
+                RoleGroup(name="営業部会", lead="営業部長", members=["営業部長", "営業課長"]),
+                RoleGroup(name="製造部会", lead="工場長", members=["工場長", "品質課長"]),
+            ],
+        )
+        assert board.hierarchical
+        assert board.plenary_roles() == ["社長", "営業部長", "工場長"]
+
+
+class TestLoadBoardConfig:
+    """load_board_configのテスト."""
+
+    def test_load_roles_and_groups(self, tmp_path):
+        """役割と部会を読み込めることをテスト."""
+        path = write_config(
+            tmp_path,
+            {
+                "roles": {
+                    "社長": "あなたは社長です。",
+                    "営業部長": "あなたは営業部長です。",
+                    "営業課長": "課長",
+                },
+                "groups": [
+                    {
+                        "name": "営業部会",
+                        "lead": "営業部長",
+                        "members": ["営業部長", "営業課長"],
+                    }
+                ],
+            },
+        )
+        board = load_board_config(path)
+        assert board.roles["社長"] == "あなたは社長です。"
+        assert board.groups == [
+            RoleGroup(
+                name="営業部会", lead="営業部長", members=["営業部長", "営業課長"]
+            )
+        ]
+
+    def test_roles_default_to_role_instructions(self, tmp_path):
+        """roles を省略すると既定の役割を使うことをテスト."""
+        path = write_config(
+            tmp_path,
+            {
+                "groups": [
+                    {
+                        "name": "専門家",
+                        "lead": "法務の専門家",
+                        "members": ["法務の専門家", "会計の専門家"],
+                    }
+                ]
+            },
+        )
+        board = load_board_config(path)
+        assert board.roles == ROLE_INSTRUCTIONS
+        assert "会計の専門家" not in board.plenary_roles()
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            ({"roles": {}}, "1つ以上"),
+            ({"roles": ["社長"]}, "役割名から"),
+            (
+                {
+                    "groups": [
+                        {"name": "部会", "lead": "社長", "members": ["会計の専門家"]}
+                    ]
+                },
+                "リード",
+            ),
+            (
+                {
+                    "groups": [
+                        {"name": "部会", "lead": "社長", "members": ["社長", "会長"]}
+                    ]
+                },
+                "会長",
+            ),
+            (
+                {"groups": [{"name": "部会", "members": ["社長"]}]},
+                "name・lead・members",
+            ),
+            (
+                {
+                    "groups": [
+                        {
+                            "name": "A",
+                            "lead": "社長",
+                            "members": ["社長", "法務の専門家"],
+                        },
+                        {
+                            "name": "B",
+                            "lead": "会計の専門家",
+                            "members": ["会計の専門家", "法務の専門家"],
+                        },
+                    ]
+                },
+                "複数の部会",
+            ),
+            (
+                {
+                    "groups": [
+                        {"name": "A", "lead": "社長", "members": ["社長"]},
+                        {
+                            "name": "A",
+                            "lead": "会計の専門家",
+                            "members": ["会計の専門家"],
+                        },
+                    ]
+                },
+                "重複",
+            ),
+        ],
+    )
+    def test_invalid_configs(self, tmp_path, data, message):
+        """不正な構成でValueErrorになることをテスト."""
+        with pytest.raises(ValueError, match=message):
+            load_board_config(write_config(tmp_path, data))
@@ -0,0 +1,380 @@
+"""caller.pyのAgentCallerの単体テスト."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytest
+from caller import AgentCaller
+from meeting_agents import create_participant
+from models import ParticipantResponse
+from resilience import HedgePolicy, ModelRouter
+from tests.conftest import FakeRunner
+
+
+class TestAgentCaller:
+    """AgentCallerのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_returns_typed_output(self):
+        """出力型を指定して最終出力を取り出せることをテスト."""
+        runner = FakeRunner()
+        caller = AgentCaller()
+        with patch("workflow.Runner.run", new=runner):
+            response = await caller.run(
+                create_participant("社長"), "質問", ParticipantResponse
+            )
+        assert isinstance(response, ParticipantResponse)
+        assert caller.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """max_concurrencyを超えて同時実行されないことをテスト."""
+        runner = FakeRunner(delay=0.01)
+        caller = AgentCaller(max_concurrency=2)
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            await asyncio.gather(
+                *[caller.run(agent, "質問", ParticipantResponse) for _ in range(6)]
+            )
+        assert runner.in_flight_peak == 2
+        assert caller.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_unlimited_by_default(self):
+        """上限未指定なら全呼び出しが同時に走ることをテスト."""
+        runner = FakeRunner(delay=0.01)
+        caller = AgentCaller()
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            await asyncio.gather(
+                *[caller.run(agent, "質問", ParticipantResponse) for _ in range(4)]
+            )
+        assert runner.in_flight_peak == 4
+
+    def test_invalid_max_concurrency(self):
+        """max_concurrencyが0以下ならエラーになることをテスト."""
+        with pytest.raises(ValueError):
+            AgentCaller(max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_call(self):
+        """タイムアウト時に実行中の呼び出しがキャンセルされることをテスト."""
+        runner = FakeRunner(delay=1.0)
+        caller = AgentCaller(max_concurrency=1)
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            with pytest.raises(asyncio.TimeoutError):
+                await caller.run(agent, "質問", ParticipantResponse, timeout=0.01)
+        assert runner.in_flight == 0
+        assert caller.records == []
+        # キャンセル後もセマフォが解放されている
+        with patch("workflow.Runner.run", new=FakeRunner()):
+            await caller.run(agent, "質問", ParticipantResponse, timeout=1.0)
+
+
+class SlowFirstRunner(FakeRunner):
+    """指定した呼び出しだけ遅延させるフェイク."""
+
+    def __init__(self, slow_calls, slow_delay=1.0, fail_calls=()):
+        super().__init__()
+        self.slow_calls = set(slow_calls)
+        self.slow_delay = slow_delay
+        self.fail_calls = set(fail_calls)
+        self.cancelled = 0
+
+    async def __call__(self, agent, prompt, **kwargs):
+        index = len(self.calls)
+        self.calls.append((agent.name, prompt))
+        try:
+            if index in self.slow_calls:
+                await asyncio.sleep(self.slow_delay)
+            else:
+                await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if index in self.fail_calls:
+            raise RuntimeError("一時的な障害")
+        from tests.conftest import FakeRunResult, make_fake_output
+
+        return FakeRunResult(make_fake_output(agent))
+
+
+class UsageRunner(SlowFirstRunner):
+    """呼び出しごとの消費トークン数を返し、指定した呼び出しの出力を不正にするフェイク."""
+
+    def __init__(self, tokens, invalid_calls=(), **kwargs):
+        super().__init__(**kwargs)
+        self.tokens = tokens
+        self.invalid_calls = set(invalid_calls)
+
+    async def __call__(self, agent, prompt, **kwargs):
+        index = len(self.calls)
+        result = await super().__call__(agent, prompt, **kwargs)
+        result.context_wrapper = SimpleNamespace(
+            usage=SimpleNamespace(total_tokens=self.tokens[index])
+        )
+        if index in self.invalid_calls:
+            def invalid(cls, raise_if_incorrect_type=False):
+                raise TypeError("出力型が一致しません")
+
+            result.final_output_as = invalid
+        return result
+
+
+class TestHedgedCalls:
+    """ヘッジリクエストのテスト."""
+
+    def make_caller(self, **kwargs):
+        policy = HedgePolicy(
+            min_samples=2, min_delay=0.01, max_extra_fraction=1.0, **kwargs
+        )
+        return AgentCaller(hedge=policy), policy
+
+    @pytest.mark.asyncio
+    async def test_backup_wins_and_primary_cancelled(self):
+        """閾値を超えた呼び出しに複製が発行され、遅い側がキャンセルされることをテスト."""
+        runner = SlowFirstRunner(slow_calls={2})
+        caller, policy = self.make_caller()
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            for _ in range(2):
+                await caller.run(agent, "質問", ParticipantResponse)
+            response = await caller.run(agent, "質問", ParticipantResponse)
+        assert isinstance(response, ParticipantResponse)
+        assert len(runner.calls) == 4
+        assert runner.cancelled == 1
+        assert policy.hedges_issued == 1
+        assert policy.hedges_won == 1
+        assert caller.records[-1].hedged
+        assert caller.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_before_min_samples(self):
+        """観測数が不足している間は複製を発行しないことをテスト."""
+        runner = SlowFirstRunner(slow_calls={0}, slow_delay=0.05)
+        caller, policy = self.make_caller()
+        with patch("workflow.Runner.run", new=runner):
+            await caller.run(create_participant("社長"), "質問", ParticipantResponse)
+        assert len(runner.calls) == 1
+        assert policy.hedges_issued == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_backup_falls_back_to_primary(self):
+        """複製が失敗した場合は元の呼び出しの結果を採用することをテスト."""
+        runner = SlowFirstRunner(slow_calls={2}, slow_delay=0.05, fail_calls={3})
+        caller, policy = self.make_caller()
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            for _ in range(3):
+                response = await caller.run(agent, "質問", ParticipantResponse)
+        assert isinstance(response, ParticipantResponse)
+        assert policy.hedges_issued == 1
+        assert policy.hedges_won == 0
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted_waits_for_primary(self):
+        """追加コストの上限に達したら複製を発行しないことをテスト."""
+        runner = SlowFirstRunner(slow_calls={2}, slow_delay=0.05)
+        policy = HedgePolicy(min_samples=2, min_delay=0.01, max_extra_fraction=0.0)
+        caller = AgentCaller(hedge=policy)
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            for _ in range(3):
+                await caller.run(agent, "質問", ParticipantResponse)
+        assert len(runner.calls) == 3
+        assert policy.hedges_issued == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_both_calls(self):
+        """タイムアウト時に元の呼び出しと複製の両方がキャンセルされることをテスト."""
+        runner = SlowFirstRunner(slow_calls={2, 3}, slow_delay=1.0)
+        caller, policy = self.make_caller()
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            for _ in range(2):
+                await caller.run(agent, "質問", ParticipantResponse)
+            with pytest.raises(asyncio.TimeoutError):
+                await caller.run(agent, "質問", ParticipantResponse, timeout=0.1)
+        assert len(runner.calls) == 4
+        assert runner.cancelled == 2
+
+    @pytest.mark.asyncio
+    async def test_budget_charged_with_loser_usage(self):
+        """負けた側が結果を返していれば、見込みではなく実際の消費トークン数で追加コストを計上することをテスト."""
+        runner = UsageRunner(
+            tokens=[100, 100, 100, 30],
+            invalid_calls={3},
+            slow_calls={2},
+            slow_delay=0.05,
+        )
+        caller, policy = self.make_caller()
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            for _ in range(3):
+                await caller.run(agent, "質問", ParticipantResponse)
+        assert policy.hedges_issued == 1
+        assert policy.hedges_won == 0
+        assert policy.extra_tokens == 30
+        assert policy.primary_tokens == 300
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loser_keeps_expected_charge(self):
+        """負けた側を取り消して消費が分からない場合は、見込みの計上が残ることをテスト."""
+        runner = UsageRunner(tokens=[100, 200, 150, 40], slow_calls={2})
+        caller, policy = self.make_caller()
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            for _ in range(3):
+                await caller.run(agent, "質問", ParticipantResponse)
+        assert runner.cancelled == 1
+        assert policy.hedges_won == 1
+        assert policy.extra_tokens == 150
+
+    @pytest.mark.asyncio
+    async def test_hedged_calls_are_observed(self):
+        """複製を発行した呼び出しも観測に加わり、繰り返しても閾値が下がらないことをテスト."""
+        rounds = 5
+        runner = SlowFirstRunner(
+            slow_calls={2 + 2 * i for i in range(rounds)}, slow_delay=0.2
+        )
+        caller, policy = self.make_caller()
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            for _ in range(2):
+                await caller.run(agent, "質問", ParticipantResponse)
+            before = policy.threshold("ParticipantResponse")
+            for _ in range(rounds):
+                await caller.run(agent, "質問", ParticipantResponse)
+        assert policy.hedges_issued == rounds
+        assert policy.primary_calls == 2 + rounds
+        assert policy.threshold("ParticipantResponse") >= before
+
+
+class FailingModelRunner(FakeRunner):
+    """指定したモデルでの呼び出しを失敗させるフェイク."""
+
+    def __init__(self, failing_models):
+        super().__init__()
+        self.failing_models = set(failing_models)
+        self.models = []
+
+    async def __call__(self, agent, prompt, **kwargs):
+        self.models.append(agent.model)
+        if agent.model in self.failing_models:
+            raise RuntimeError(f"{agent.model} は障害中")
+        return await super().__call__(agent, prompt, **kwargs)
+
+
+class TestModelFallback:
+    """フォールバックモデルとサーキットブレーカーのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_next_model(self):
+        """障害中のモデルの代わりに次のモデルで呼び出すことをテスト."""
+        runner = FailingModelRunner({"primary"})
+        router = ModelRouter(["primary", "backup"])
+        caller = AgentCaller(router=router)
+        with patch("workflow.Runner.run", new=runner):
+            response = await caller.run(
+                create_participant("社長"), "質問", ParticipantResponse
+            )
+        assert isinstance(response, ParticipantResponse)
+        assert runner.models == ["primary", "backup"]
+        assert caller.records[-1].model == "backup"
+        assert router.fallbacks == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_routes_directly(self):
+        """開放状態になったモデルには新規呼び出しを送らないことをテスト."""
+        runner = FailingModelRunner({"primary"})
+        router = ModelRouter(["primary", "backup"])
+        caller = AgentCaller(router=router)
+        agent = create_participant("社長")
+        with patch("workflow.Runner.run", new=runner):
+            for _ in range(6):
+                await caller.run(agent, "質問", ParticipantResponse)
+        assert runner.models.count("primary") == 4
+        assert runner.models[-2:] == ["backup", "backup"]
+        assert router.summary()["primary"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_all_models_fail(self):
+        """すべてのモデルが失敗したら最初の例外を送出することをテスト."""
+        runner = FailingModelRunner({"primary", "backup"})
+        caller = AgentCaller(router=ModelRouter(["primary", "backup"]))
+        with patch("workflow.Runner.run", new=runner):
+            with pytest.raises(RuntimeError, match="primary"):
+                await caller.run(create_participant("社長"), "質問", ParticipantResponse)
+
+    @pytest.mark.asyncio
+    async def test_records_model_without_router(self):
+        """routerなしではエージェントに設定されたモデル名を記録することをテスト."""
+        caller = AgentCaller()
+        agent = create_participant("社長").clone(model="gpt-4.1")
+        with patch("workflow.Runner.run", new=FakeRunner()):
+            await caller.run(agent, "質問", ParticipantResponse)
+        assert caller.records[-1].model == "gpt-4.1"
+
+
+class TestStreamingCalls:
+    """ストリーミング実行のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_output_and_timings(self, tmp_path):
+        """生成中の本文が表示・書き出され、最初/最後のトークンまでの時間が記録されることをテスト."""
+        import io
+        from meeting_agents import create_minutes_writer
+        from models import MinutesOutput
+        from streaming import ConsoleStream
+        from tests.conftest import FakeStreamedRunner
+
+        out = io.StringIO()
+        runner = FakeStreamedRunner(
+            overrides={"Minutes Writer": MinutesOutput(markdown="# 議事録\n\n本文")},
+            delay=0.001,
+        )
+        caller = AgentCaller(streaming=True, console=ConsoleStream(out))
+        path = tmp_path / "minutes.md"
+        with patch("workflow.Runner.run_streamed", new=runner):
+            output = await caller.run(
+                create_minutes_writer(), "議事録を", MinutesOutput, stream_path=path
+            )
+
+        assert output.markdown == "# 議事録\n\n本文"
+        assert path.read_text(encoding="utf-8") == "# 議事録\n\n本文"
+        assert "Minutes Writer: # 議事録" in out.getvalue()
+        record = caller.records[-1]
+        assert 0 < record.ttft <= record.ttlt <= record.duration
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_has_no_timings(self):
+        """通常実行ではTTFT/TTLTを記録しないことをテスト."""
+        caller = AgentCaller()
+        with patch("workflow.Runner.run", new=FakeRunner()):
+            await caller.run(create_participant("社長"), "質問", ParticipantResponse)
+        assert caller.records[-1].ttft is None
+        assert caller.records[-1].ttlt is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_stream_is_cancelled(self):
+        """タイムアウトで打ち切った場合、ストリーミング実行もキャンセルされることをテスト."""
+        from tests.conftest import FakeStreamedRunner
+
+        results = []
+        runner = FakeStreamedRunner(delay=0.05)
+
+        def tracking_runner(agent, prompt, **kwargs):
+            result = runner(agent, prompt, **kwargs)
+            results.append(result)
+            return result
+
+        caller = AgentCaller(streaming=True)
+        with patch("workflow.Runner.run_streamed", new=tracking_runner):
+            with pytest.raises(asyncio.TimeoutError):
+                await caller.run(
+                    create_participant("社長"),
+                    "質問",
+                    ParticipantResponse,
+                    timeout=0.01,
+                )
+        assert results[0].cancelled
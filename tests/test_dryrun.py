@@ -0,0 +1,258 @@
+"""dryrun.pyの単体テスト."""
+import pytest
+import models
+from dryrun import (
+    DryRunCall,
+    DryRunModelProvider,
+    MARKDOWN_CHARS,
+    model_price,
+    run_dry_run,
+    run_simulated,
+    sample_output,
+    summarize_calls,
+    validate_proposal,
+)
+
+
+class TestSampleOutput:
+    """sample_output関数のテスト."""
+
+    @pytest.mark.parametrize(
+        "output_type",
+        [
+            models.FacilitatorDecision,
+            models.FacilitatorAgenda,
+            models.ParticipantResponse,
+            models.MinutesOutput,
+            models.QAOutput,
+            models.RefinedProposalOutput,
+            models.ProposalSectionOutput,
+            models.ConsistencyReview,
+            models.AxisScore,
+            models.EvaluationSummary,
+            models.EvaluationOutput,
+            models.ProposalDigest,
+            models.DiscussionDigest,
+            models.ComparativeEvaluationOutput,
+            models.ConsolidatedConcernsOutput,
+            models.SectionRepairOutput,
+        ],
+    )
+    def test_valid_for_every_output_type(self, output_type):
+        """すべての出力型で検証を通る仮の出力が作れることをテスト."""
+        output = sample_output(output_type)
+        assert output_type.model_validate_json(output.model_dump_json()) == output
+
+    def test_realistic_sizes(self):
+        """成果物の本文が出力型ごとの大きさになり、アジェンダは使い切らない件数になることをテスト."""
+        assert (
+            len(sample_output(models.QAOutput).markdown) == MARKDOWN_CHARS["QAOutput"]
+        )
+        assert len(sample_output(models.FacilitatorAgenda).decisions()) > 5
+
+    def test_artifacts_pass_validation(self):
+        """成果物の仮の本文は必須見出し・最低問数を満たし、修復の呼び出しが起きないことをテスト."""
+        from validation import check_artifact
+
+        minutes = sample_output(models.MinutesOutput).markdown
+        refined = sample_output(models.RefinedProposalOutput).markdown
+        assert check_artifact("minutes", minutes).ok
+        assert check_artifact("qa", sample_output(models.QAOutput).markdown).ok
+        assert check_artifact("refined_proposal", refined).ok
+        assert len(refined) == MARKDOWN_CHARS["RefinedProposalOutput"]
+
+
+class TestValidateProposal:
+    """validate_proposal関数のテスト."""
+
+    def test_empty_proposal_is_error(self):
+        """空の企画書はエラーになることをテスト."""
+        errors, _ = validate_proposal("  \n")
+        assert errors
+
+    def test_warnings(self):
+        """見出しのない企画書は警告のみで実行できることをテスト."""
+        errors, warnings = validate_proposal("新規事業の企画です。")
+        assert errors == []
+        assert len(warnings) == 1
+
+    def test_too_large_proposal_is_error(self):
+        """コンテキスト長を超える大きさの企画書はエラーになることをテスト."""
+        errors, _ = validate_proposal("# 企画書\n" + "あ" * 200000)
+        assert errors
+
+    def test_valid_proposal(self, sample_proposal_text):
+        """通常の企画書はエラーも警告もないことをテスト."""
+        assert validate_proposal(sample_proposal_text) == ([], [])
+
+
+class TestCost:
+    """料金の見積もりのテスト."""
+
+    def test_model_price_matches_snapshot_names(self):
+        """日付つきのモデル名は最長一致で料金表を引くことをテスト."""
+        assert model_price("gpt-4.1") == (2.00, 8.00)
+        assert model_price("gpt-4.1-mini-2025-04-14") == (0.40, 1.60)
+        assert model_price("unknown-model") is None
+
+    def test_summarize_calls(self):
+        """エージェント別に呼び出し数・トークン数・費用を集計することをテスト."""
+        calls = [
+            DryRunCall("Facilitator", "gpt-4.1", 1_000_000, 0, 1.0),
+            DryRunCall("Facilitator", "gpt-4.1", 0, 1_000_000, 1.0),
+            DryRunCall("社長", "unknown-model", 10, 10, 1.0),
+        ]
+        facilitator, president = summarize_calls(calls)
+        assert (
+            facilitator.calls,
+            facilitator.input_tokens,
+            facilitator.output_tokens,
+        ) == (2, 1_000_000, 1_000_000)
+        assert facilitator.cost == pytest.approx(10.0)
+        assert president.cost is None
+
+
+class TestDryRunModel:
+    """DryRunModelのテスト."""
+
+    def test_streaming_returns_same_stub_output(self, tmp_path):
+        """ストリーミング実行でも仮の出力が差分として流れ、見積もりが記録されることをテスト."""
+        from agents import RunConfig
+
+        from caller import AgentCaller
+        from meeting_agents import create_minutes_writer
+
+        provider = DryRunModelProvider()
+        caller = AgentCaller(
+            streaming=True,
+            run_config=RunConfig(model_provider=provider, tracing_disabled=True),
+        )
+        stream_path = tmp_path / "minutes.md"
+        output, elapsed = run_simulated(
+            caller.run(
+                create_minutes_writer(),
+                "議事録を作成してください。",
+                models.MinutesOutput,
+                stream_path=stream_path,
+            )
+        )
+
+        assert output.markdown
+        assert stream_path.read_text(encoding="utf-8") == output.markdown
+        assert [call.agent for call in provider.calls] == ["Minutes Writer"]
+        call = provider.calls[0]
+        assert caller.records[-1].tokens == call.input_tokens + call.output_tokens
+        assert caller.records[-1].ttft is not None
+        # 見積もった所要時間は模擬時計で進み、実際には待たない
+        assert elapsed == pytest.approx(call.latency)
+        assert caller.records[-1].duration < 1
+
+
+class TestRunSimulated:
+    """run_simulated関数のテスト."""
+
+    def test_elapsed_is_critical_path(self):
+        """並行する待ちは重なり、直列の待ちは足し合わされた模擬時間になることをテスト."""
+        import asyncio
+
+        async def meeting():
+            await asyncio.gather(asyncio.sleep(30), asyncio.sleep(10))
+            await asyncio.sleep(5)
+            return "done"
+
+        assert run_simulated(meeting()) == ("done", pytest.approx(35))
+
+    def test_timeouts_use_simulated_clock(self):
+        """タイムアウトも模擬時計で判定されることをテスト."""
+        import asyncio
+
+        async def meeting():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.sleep(100), 20)
+
+        _, elapsed = run_simulated(meeting())
+        assert elapsed == pytest.approx(20)
+
+
+class TestRunDryRun:
+    """run_dry_run関数のテスト."""
+
+    def test_counts_calls_through_real_orchestration(
+        self, sample_proposal_text, all_roles
+    ):
+        """実際の会議の進行どおりの呼び出し数とトークン数が見積もられることをテスト."""
+        dry_run = run_dry_run(sample_proposal_text, rounds=12)
+
+        calls = {estimate.agent: estimate.calls for estimate in dry_run.agents}
+        assert calls["Facilitator"] == 12
+        assert sum(calls[role] for role in all_roles) == 12
+        assert all(
+            calls[writer] == 1
+            for writer in (
+                "Minutes Writer",
+                "Q&A Writer",
+                "Proposal Refiner",
+                "Proposal Evaluator",
+            )
+        )
+        assert len(dry_run.calls) == 28
+        assert len(dry_run.meeting.turns) == 12
+        assert all(
+            call.input_tokens > 0 and call.output_tokens > 0 for call in dry_run.calls
+        )
+        assert "エージェント呼び出し: 28回" in dry_run.report
+
+    def test_projected_time_reflects_concurrency(self, sample_proposal_text, all_roles):
+        """履歴の所要時間を使い、同時に行う冒頭発言は重なった時間として見積もられることをテスト."""
+        agents = [
+            "Facilitator",
+            "Minutes Writer",
+            "Q&A Writer",
+            "Proposal Refiner",
+            "Proposal Evaluator",
+        ]
+        latencies = {name: 10.0 for name in agents + list(all_roles)}
+        rounds = len(all_roles)
+        serial = run_dry_run(sample_proposal_text, rounds=rounds, latencies=latencies)
+        opening = run_dry_run(
+            sample_proposal_text,
+            rounds=rounds,
+            latencies=latencies,
+            opening_statements=True,
+        )
+
+        assert serial.history_agents == len(latencies)
+        # 9ラウンド × (指名 + 発言) + 成果物4件 = 22回 × 10秒
+        assert serial.projected_duration == pytest.approx(220)
+        # 冒頭発言は同時に1回分 + 成果物4件 = 50秒
+        assert opening.projected_duration == pytest.approx(50)
+
+    def test_projection_is_deterministic_and_bounded(self, sample_proposal_text):
+        """想定所要時間は毎回同じで、全呼び出しを直列にした合計を超えないことをテスト."""
+        first = run_dry_run(
+            sample_proposal_text, rounds=4, section_refine=True, axis_evaluate=True
+        )
+        second = run_dry_run(
+            sample_proposal_text, rounds=4, section_refine=True, axis_evaluate=True
+        )
+
+        assert first.projected_duration == second.projected_duration
+        assert first.projected_duration < sum(call.latency for call in first.calls)
+
+    def test_compact_context_savings(self, sample_proposal_text):
+        """compact の場合は Markdown と比べた討論の1ターンあたりの入力トークン数の削減を示すことをテスト."""
+        markdown = run_dry_run(sample_proposal_text, rounds=12)
+        compact = run_dry_run(sample_proposal_text, rounds=12, context_format="compact")
+
+        assert markdown.context_savings is None
+        assert "## 発言履歴の簡潔な形式" not in markdown.report
+        savings = compact.context_savings
+        assert savings.compact_tokens_per_round < savings.markdown_tokens_per_round
+        assert 0 < savings.saved_ratio < 1
+        assert "## 発言履歴の簡潔な形式（compact）" in compact.report
+        assert len(compact.calls) == len(markdown.calls)
+
+    def test_invalid_proposal_raises(self):
+        """企画書にエラーがある場合は会議を行わずエラーになることをテスト."""
+        with pytest.raises(ValueError):
+            run_dry_run("")
@@ -0,0 +1,410 @@
+"""history.pyの実行履歴ストアとCLIの単体テスト."""
+import os
+import time
+import pytest
+from caller import CallRecord
+from history import RunStore, main
+from models import AxisScore, EvaluationOutput, FacilitatorDecision, ParticipantResponse
+from workflow import MeetingResult
+
+
+def make_result(
+    refined_score: int = 9, started_at: float = None, minutes: str = "# 議事録"
+) -> MeetingResult:
+    """履歴に記録するための会議結果を作る."""
+    started_at = started_at or time.time()
+    turn = {
+        "role": "社長",
+        "decision": FacilitatorDecision(
+            next_speaker="社長", prompt="ご意見を", rationale="最初"
+        ),
+        "response": ParticipantResponse(
+            summary="投資対効果を重視", concerns=["市場リスク"]
+        ),
+    }
+    evaluation = EvaluationOutput(
+        markdown="# 評価",
+        axis_scores=[
+            AxisScore(axis="リスク", original=6, refined=refined_score),
+            AxisScore(axis="シナジー", original=7, refined=8),
+        ],
+        verdict="Go",
+    )
+    return MeetingResult(
+        minutes=minutes,
+        qa="# Q&A",
+        refined_proposal="# 改訂企画書",
+        discussion_log="# 対話履歴",
+        evaluation="# 評価",
+        turns=[turn],
+        evaluation_output=evaluation,
+        started_at=started_at,
+        duration=12.5,
+        call_records=[
+            CallRecord("Facilitator", started_at, 1.0),
+            CallRecord("社長", started_at + 1, 3.0),
+            CallRecord("Proposal Refiner", started_at + 4, 8.0),
+        ],
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    run_store = RunStore(tmp_path / "history")
+    yield run_store
+    run_store.close()
+
+
+class TestRunStoreRecord:
+    """RunStore.record_runのテスト."""
+
+    def test_record_and_read_back(self, store):
+        """記録した実行のメタデータと成果物を読み出せることをテスト."""
+        run_id = store.record_run(
+            make_result(), "# 企画書", {"rounds": 12}, proposal_name="proposal.md"
+        )
+        row = store.list_runs()[0]
+        assert row["run_id"] == run_id
+        assert row["rounds"] == 1
+        assert row["call_count"] == 3
+        assert row["total_refined"] == 85
+        assert row["verdict"] == "Go"
+        assert store.get_artifact(run_id, "minutes") == "# 議事録"
+        assert store.get_artifact(run_id, "proposal") == "# 企画書"
+
+    def test_turns_and_scores_recorded(self, store):
+        """発言とスコアが行として記録されることをテスト."""
+        run_id = store.record_run(make_result(), "# 企画書", {})
+        conn = store._connect()
+        turn = conn.execute(
+            "SELECT * FROM turns WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        assert turn["role"] == "社長"
+        assert "市場リスク" in turn["concerns"]
+        axes = {
+            r["axis"]
+            for r in conn.execute("SELECT axis FROM scores WHERE run_id = ?", (run_id,))
+        }
+        assert axes == {"リスク", "シナジー"}
+
+    def test_identical_artifacts_are_deduplicated(self, store):
+        """同一内容の成果物はBlobを共有することをテスト."""
+        store.record_run(make_result(), "# 企画書", {})
+        blob_count = len(list(store.blob_dir.glob("??/*")))
+        store.record_run(make_result(), "# 企画書", {})
+        assert len(list(store.blob_dir.glob("??/*"))) == blob_count
+
+    def test_blobs_are_compressed(self, store):
+        """Blobが圧縮されて保存されることをテスト."""
+        large = "# 議事録\n" + "同じ内容の繰り返し。" * 2000
+        blob_hash = store.put_blob(large.encode("utf-8"))
+        stored = store._blob_path(blob_hash).stat().st_size
+        assert stored < len(large.encode("utf-8")) / 10
+        assert store.get_blob(blob_hash).decode("utf-8") == large
+
+    def test_missing_artifact(self, store):
+        """存在しない成果物はKeyErrorになることをテスト."""
+        run_id = store.record_run(make_result(), "# 企画書", {})
+        with pytest.raises(KeyError):
+            store.get_artifact(run_id, "unknown")
+
+    def test_store_created_lazily(self, tmp_path):
+        """生成しただけではディレクトリを作らないことをテスト."""
+        RunStore(tmp_path / "lazy")
+        assert not (tmp_path / "lazy").exists()
+
+
+class TestRunStoreQueries:
+    """RunStoreの検索のテスト."""
+
+    def test_filter_by_proposal_file_and_name(self, store, tmp_path):
+        """企画書ファイル・名前で実行を絞り込めることをテスト."""
+        proposal_file = tmp_path / "a.md"
+        proposal_file.write_text("# 企画書A", encoding="utf-8")
+        store.record_run(make_result(), "# 企画書A", {}, proposal_name="a.md")
+        store.record_run(make_result(), "# 企画書B", {}, proposal_name="b.md")
+        assert len(store.list_runs(str(proposal_file))) == 1
+        assert len(store.list_runs("b.md")) == 1
+        assert len(store.list_runs()) == 2
+
+    def test_score_trend(self, store):
+        """合計点・観点別のスコア推移が実行順に返ることをテスト."""
+        now = time.time()
+        store.record_run(
+            make_result(refined_score=7, started_at=now - 100),
+            "# 企画書",
+            {},
+            proposal_name="a.md",
+        )
+        store.record_run(
+            make_result(refined_score=10, started_at=now),
+            "# 企画書",
+            {},
+            proposal_name="a.md",
+        )
+        totals = [row["refined"] for row in store.score_trend("a.md")]
+        assert totals == [75, 90]
+        risk = [row["refined"] for row in store.score_trend("a.md", axis="リスク")]
+        assert risk == [7, 10]
+
+    def test_slowest_stages_since(self, store):
+        """期間内の呼び出しだけを遅い順に集計することをテスト."""
+        now = time.time()
+        store.record_run(make_result(started_at=now - 30 * 86400), "# 企画書", {})
+        store.record_run(make_result(started_at=now), "# 企画書", {})
+        stages = store.slowest_stages(since=now - 7 * 86400)
+        assert [row["agent"] for row in stages] == [
+            "Proposal Refiner",
+            "社長",
+            "Facilitator",
+        ]
+        assert stages[0]["calls"] == 1
+
+    def test_average_latencies(self, store):
+        """エージェント別の平均呼び出し時間を返すことをテスト."""
+        now = time.time()
+        store.record_run(make_result(started_at=now - 30 * 86400), "# 企画書", {})
+        store.record_run(make_result(started_at=now), "# 企画書", {})
+        assert store.average_latencies() == {
+            "Facilitator": 1.0,
+            "社長": 3.0,
+            "Proposal Refiner": 8.0,
+        }
+        assert store.average_latencies(since=now + 60) == {}
+
+    def test_queries_use_indexes(self, store):
+        """主要な検索がインデックスを使うことをテスト."""
+        conn = store._connect()
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM runs "
+                "WHERE runs.proposal_hash = ? ORDER BY started_at",
+                ("x",),
+            )
+        )
+        assert "idx_runs_proposal" in plan
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT agent, AVG(duration) FROM calls "
+                "WHERE started_at >= ? GROUP BY agent",
+                (0,),
+            )
+        )
+        assert "idx_calls_started" in plan
+
+
+class TestRunStorePrune:
+    """RunStore.prune / collect_garbageのテスト."""
+
+    def test_prune_removes_old_runs_and_blobs(self, tmp_path):
+        """古い実行と参照されなくなったBlobが削除されることをテスト."""
+        store = RunStore(tmp_path / "history", blob_grace=0)
+        now = time.time()
+        old_id = store.record_run(
+            make_result(started_at=now - 100, minutes="# 古い議事録"), "# 企画書", {}
+        )
+        new_id = store.record_run(make_result(started_at=now), "# 企画書", {})
+        before = len(list(store.blob_dir.glob("??/*")))
+
+        assert store.prune(keep=1) == 1
+        assert [row["run_id"] for row in store.list_runs()] == [new_id]
+        assert len(list(store.blob_dir.glob("??/*"))) == before - 1
+        conn = store._connect()
+        assert (
+            conn.execute(
+                "SELECT COUNT(*) FROM turns WHERE run_id = ?", (old_id,)
+            ).fetchone()[0]
+            == 0
+        )
+        assert store.get_artifact(new_id, "minutes") == "# 議事録"
+        store.close()
+
+    def test_gc_keeps_blobs_not_yet_recorded(self, store):
+        """記録前に書き込まれたBlobと一時ファイルはGCで消えないことをテスト."""
+        blob_hash = store.put_blob("# 記録途中".encode("utf-8"))
+        tmp_path = store._blob_path(blob_hash).with_suffix(".0123.tmp")
+        tmp_path.write_bytes(b"partial")
+
+        assert store.collect_garbage() == 0
+        assert store.get_blob(blob_hash) == "# 記録途中".encode("utf-8")
+        assert tmp_path.exists()
+
+    def test_gc_removes_stale_unreferenced_blobs(self, tmp_path):
+        """猶予を過ぎた未参照のBlobは削除され、既存Blobの再書き込みで猶予が延びることをテスト."""
+        store = RunStore(tmp_path / "history", blob_grace=60)
+        stale = store.put_blob(b"stale")
+        reused = store.put_blob(b"reused")
+        old = time.time() - 120
+        for blob_hash in (stale, reused):
+            os.utime(store._blob_path(blob_hash), (old, old))
+        store.put_blob(b"reused")
+
+        assert store.collect_garbage() == 1
+        assert not store._blob_path(stale).exists()
+        assert store.get_blob(reused) == b"reused"
+        store.close()
+
+    def test_keep_applied_on_record(self, tmp_path):
+        """keep を指定すると記録のたびに古い実行と参照されなくなったBlobが削除されることをテスト."""
+        store = RunStore(tmp_path / "history", keep=2, blob_grace=0)
+        now = time.time()
+        run_ids = [
+            store.record_run(
+                make_result(started_at=now + idx, minutes=f"# 議事録{idx}"),
+                "# 企画書",
+                {},
+            )
+            for idx in range(4)
+        ]
+        minutes_blobs = {
+            store._connect()
+            .execute(
+                "SELECT blob_hash FROM artifacts WHERE run_id = ? AND kind = 'minutes'",
+                (run_id,),
+            )
+            .fetchone()[0]
+            for run_id in run_ids[2:]
+        }
+
+        assert [row["run_id"] for row in store.list_runs()] == run_ids[:1:-1]
+        # 共有する企画書などのBlobは残り、削除した実行の議事録のBlobは消える
+        blobs = {path.parent.name + path.name for path in store.blob_dir.glob("??/*")}
+        assert minutes_blobs <= blobs
+        referenced = {
+            row[0]
+            for row in store._connect().execute("SELECT blob_hash FROM artifacts")
+        }
+        assert blobs == referenced
+        store.close()
+
+    def test_invalid_keep(self, tmp_path):
+        """keep が1未満ならValueErrorになることをテスト."""
+        with pytest.raises(ValueError):
+            RunStore(tmp_path / "history", keep=0)
+
+
+class TestHistoryCli:
+    """history.pyのCLIのテスト."""
+
+    def test_runs_and_show(self, store, tmp_path, capsys):
+        """runs / show サブコマンドのテスト."""
+        run_id = store.record_run(make_result(), "# 企画書", {}, proposal_name="a.md")
+        store.close()
+        history_dir = str(tmp_path / "history")
+
+        main(["--history-dir", history_dir, "runs"])
+        assert run_id[:12] in capsys.readouterr().out
+
+        main(["--history-dir", history_dir, "show", run_id[:8], "--artifact", "qa"])
+        assert "# Q&A" in capsys.readouterr().out
+
+    def test_stages(self, store, tmp_path, capsys):
+        """stages サブコマンドのテスト."""
+        store.record_run(make_result(), "# 企画書", {})
+        store.close()
+        main(["--history-dir", str(tmp_path / "history"), "stages", "--days", "7"])
+        out = capsys.readouterr().out
+        assert out.index("Proposal Refiner") < out.index("Facilitator")
+
+    def test_show_unknown_run(self, store, tmp_path, capsys):
+        """存在しないrun_idはエラー終了することをテスト."""
+        store.record_run(make_result(), "# 企画書", {})
+        store.close()
+        with pytest.raises(SystemExit):
+            main(["--history-dir", str(tmp_path / "history"), "show", "zzzz"])
+        assert "特定できません" in capsys.readouterr().out
+
+
+class TestRunStoreModels:
+    """生成モデルの記録のテスト."""
+
+    def test_models_recorded(self, store):
+        """発言・呼び出し・成果物ごとのモデルが記録されることをテスト."""
+        result = make_result()
+        result.turns[0]["model"] = "backup"
+        result.call_records[1].model = "backup"
+        result.artifact_models = {"minutes": "primary"}
+        run_id = store.record_run(result, "# 企画書", {})
+        conn = store._connect()
+        turn = conn.execute("SELECT model FROM turns WHERE run_id = ?", (run_id,))
+        assert turn.fetchone()[0] == "backup"
+        calls = conn.execute(
+            "SELECT model FROM calls WHERE run_id = ? ORDER BY seq", (run_id,)
+        )
+        models = [row[0] for row in calls]
+        assert models == ["", "backup", ""]
+        row = conn.execute(
+            "SELECT model FROM artifacts WHERE run_id = ? AND kind = 'minutes'",
+            (run_id,),
+        ).fetchone()
+        assert row[0] == "primary"
+
+    def test_stream_timings_recorded(self, store):
+        """ストリーミング実行のTTFTが記録され、段階別集計に含まれることをテスト."""
+        result = make_result()
+        result.call_records[0].ttft = 0.4
+        result.call_records[0].ttlt = 0.9
+        run_id = store.record_run(result, "# 企画書", {})
+        rows = store._connect().execute(
+            "SELECT ttft, ttlt FROM calls WHERE run_id = ? ORDER BY seq", (run_id,)
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [(0.4, 0.9), (None, None), (None, None)]
+        stages = {row["agent"]: row for row in store.slowest_stages(0)}
+        assert stages["Facilitator"]["avg_ttft"] == pytest.approx(0.4)
+        assert stages["社長"]["avg_ttft"] is None
+
+    def test_migrates_existing_database(self, tmp_path):
+        """model列のない既存DBに列が追加されることをテスト."""
+        import sqlite3
+
+        root = tmp_path / "history"
+        root.mkdir()
+        conn = sqlite3.connect(root / "history.sqlite3")
+        conn.execute(
+            "CREATE TABLE calls (run_id TEXT NOT NULL, seq INTEGER NOT NULL, "
+            "agent TEXT NOT NULL, started_at REAL NOT NULL, duration REAL NOT NULL, "
+            "PRIMARY KEY (run_id, seq))"
+        )
+        conn.close()
+
+        run_store = RunStore(root)
+        try:
+            run_id = run_store.record_run(make_result(), "# 企画書", {})
+            count = run_store._connect().execute(
+                "SELECT COUNT(*) FROM calls WHERE run_id = ? AND model = ''", (run_id,)
+            ).fetchone()[0]
+        finally:
+            run_store.close()
+        assert count == 3
+
+
+class TestRunStoreDiscussionLogFile:
+    """省メモリモードで書き出された対話履歴の記録のテスト."""
+
+    def test_log_file_stored_as_blob(self, store, tmp_path):
+        """対話履歴ファイルの内容がBlobとして保存されることをテスト."""
+        log_path = tmp_path / "discussion_log.md"
+        log_text = "# 対話履歴\n" + "### ラウンド 1: 社長\n\n発言\n" * 500
+        log_path.write_text(log_text, encoding="utf-8")
+        result = make_result()
+        result.discussion_log = ""
+        result.discussion_log_path = log_path
+
+        run_id = store.record_run(result, "# 企画書", {})
+
+        assert store.get_artifact(run_id, "discussion_log") == log_text
+        size = store._connect().execute(
+            "SELECT size FROM artifacts WHERE run_id = ? AND kind = 'discussion_log'",
+            (run_id,),
+        ).fetchone()[0]
+        assert size == len(log_text.encode("utf-8"))
+
+    def test_same_content_shares_blob(self, store, tmp_path):
+        """ファイル経由でも同一内容のBlobは1つだけ保持されることをテスト."""
+        log_path = tmp_path / "discussion_log.md"
+        log_path.write_text("# 対話履歴", encoding="utf-8")
+        assert store.put_blob_file(log_path, chunk_size=4) == store.put_blob(
+            "# 対話履歴".encode("utf-8")
+        )
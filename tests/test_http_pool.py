@@ -0,0 +1,187 @@
+"""http_pool.pyの単体テスト（ローカルのモックエンドポイントに接続する）."""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from caller import AgentCaller
+from http_pool import HttpPoolConfig, PoolStats, SharedHttpClient, format_pool_stats
+from meeting_agents import create_minutes_writer
+from models import MinutesOutput
+
+
+def responses_body(text: str) -> bytes:
+    """Responses API の応答（出力テキスト1件）."""
+    return json.dumps({
+        "id": "resp_test",
+        "object": "response",
+        "created_at": 0,
+        "model": "gpt-4.1",
+        "status": "completed",
+        "output": [{
+            "type": "message",
+            "id": "msg_test",
+            "role": "assistant",
+            "status": "completed",
+            "content": [{"type": "output_text", "text": text, "annotations": []}],
+        }],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "total_tokens": 15,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens_details": {"reasoning_tokens": 0},
+        },
+    }).encode("utf-8")
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """keep-alive に対応した OpenAI 互換のモック（/v1/models と /v1/responses）."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._reply(json.dumps({"object": "list", "data": []}).encode("utf-8"))
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(
+            responses_body(
+                json.dumps({"markdown": "# モックの議事録"}, ensure_ascii=False)
+            )
+        )
+
+    def _reply(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpPoolConfig:
+    """HttpPoolConfigのテスト."""
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            HttpPoolConfig(max_connections=0),
+            HttpPoolConfig(max_connections=4, max_keepalive_connections=8),
+            HttpPoolConfig(max_retries=-1),
+        ],
+    )
+    def test_invalid(self, config):
+        """不正な接続数でValueErrorになることをテスト."""
+        with pytest.raises(ValueError):
+            config.validate()
+
+    def test_http2_requires_h2(self):
+        """h2 がない環境でHTTP/2を指定するとValueErrorになることをテスト."""
+        try:
+            import h2  # noqa: F401
+            pytest.skip("h2 がインストールされている")
+        except ImportError:
+            pass
+        with pytest.raises(ValueError, match="h2"):
+            HttpPoolConfig(http2=True).validate()
+
+
+class TestSharedHttpClient:
+    """SharedHttpClientのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_one_connection(self, mock_endpoint):
+        """順番に行う呼び出しは1本の接続を使い回すことをテスト."""
+        pool = SharedHttpClient(base_url=mock_endpoint, api_key="test")
+        try:
+            for _ in range(10):
+                await pool.openai_client.models.list()
+            stats = pool.stats()
+        finally:
+            await pool.aclose()
+        assert stats.requests == 10
+        assert stats.connections_opened == 1
+        assert stats.idle_connections == 1
+
+    @pytest.mark.asyncio
+    async def test_connections_bounded_under_load(self, mock_endpoint):
+        """同時に多数の呼び出しをしても接続数は上限以内に収まることをテスト."""
+        pool = SharedHttpClient(
+            HttpPoolConfig(max_connections=4), base_url=mock_endpoint, api_key="test"
+        )
+        try:
+            await asyncio.gather(*[pool.openai_client.models.list() for _ in range(50)])
+            stats = pool.stats()
+        finally:
+            await pool.aclose()
+        assert stats.requests == 50
+        assert 1 <= stats.connections_opened <= 4
+        assert stats.peak_connections <= 4
+        assert stats.requests_per_connection >= 12.5
+
+    @pytest.mark.asyncio
+    async def test_agent_calls_share_pool(self, mock_endpoint):
+        """エージェント呼び出しが共有クライアントの接続プールを通ることをテスト."""
+        pool = SharedHttpClient(
+            HttpPoolConfig(max_connections=3), base_url=mock_endpoint, api_key="test"
+        )
+        caller = AgentCaller(run_config=pool.run_config)
+        try:
+            outputs = await asyncio.gather(
+                *[
+                    caller.run(create_minutes_writer(), "議事録を作成", MinutesOutput)
+                    for _ in range(12)
+                ]
+            )
+            stats = pool.stats()
+        finally:
+            await pool.aclose()
+        assert all(output.markdown == "# モックの議事録" for output in outputs)
+        assert stats.requests == 12
+        assert stats.connections_opened <= 3
+
+
+class TestRunConfigThreading:
+    """run_config の受け渡しのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_caller_and_children_pass_run_config(self):
+        """呼び出し元と child() の呼び出しに同じ run_config が渡されることをテスト."""
+        pool = SharedHttpClient(api_key="test")
+        caller = AgentCaller(run_config=pool.run_config)
+        mock_run = AsyncMock(
+            return_value=AsyncMock(
+                final_output_as=lambda cls: MinutesOutput(markdown="x")
+            )
+        )
+        with patch("caller.Runner.run", new=mock_run):
+            await caller.child().run(create_minutes_writer(), "prompt", MinutesOutput)
+        await pool.aclose()
+        assert mock_run.call_args[1]["run_config"] is pool.run_config
+
+    def test_format_pool_stats(self):
+        """接続プールの統計の表示をテスト."""
+        text = format_pool_stats(
+            PoolStats(requests=20, connections_opened=4, peak_connections=4)
+        )
+        assert "リクエスト20回" in text
+        assert "1接続あたり5.0回" in text
@@ -0,0 +1,255 @@
+"""loadtest.pyの単体テスト（ローカルのモックサーバーに実際のクライアントで接続する）."""
+import inspect
+import random
+
+import httpx
+import pytest
+from agents import AgentOutputSchema
+from pydantic import BaseModel
+
+import models
+from http_pool import HttpPoolConfig
+from loadtest import (
+    MockOpenAIServer,
+    MockServerConfig,
+    _run_load_test,
+    _render_load_test_report,
+    main,
+    output_type_for,
+    percentile,
+)
+
+ALL_OUTPUT_TYPES = [
+    cls
+    for _, cls in inspect.getmembers(models, inspect.isclass)
+    if issubclass(cls, BaseModel)
+    and cls is not BaseModel
+    and cls.__module__ == models.__name__
+]
+
+
+def _request(output_type):
+    schema = AgentOutputSchema(output_type).json_schema()
+    return {
+        "model": "gpt-4.1",
+        "input": "テスト",
+        "text": {
+            "format": {
+                "type": "json_schema",
+                "name": "final_output",
+                "schema": schema,
+                "strict": True,
+            }
+        },
+    }
+
+
+class TestMockServerConfig:
+    """MockServerConfigのテスト."""
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            MockServerConfig(latency="normal"),
+            MockServerConfig(latency_median=-1),
+            MockServerConfig(latency="uniform", latency_spread=1.5),
+            MockServerConfig(error_rate=0.6, rate_limit_rate=0.6),
+        ],
+    )
+    def test_invalid(self, config):
+        """不正な設定でValueErrorになることをテスト."""
+        with pytest.raises(ValueError):
+            config.validate()
+
+    def test_latency_distributions(self):
+        """待ち時間が分布どおりの範囲・中央値になることをテスト."""
+        rng = random.Random(0)
+        fixed = MockServerConfig(latency="fixed", latency_median=0.2)
+        assert fixed.sample_latency(rng) == 0.2
+        config = MockServerConfig(
+            latency="uniform", latency_median=1.0, latency_spread=0.5
+        )
+        uniform = [config.sample_latency(rng) for _ in range(200)]
+        assert all(0.5 <= value <= 1.5 for value in uniform)
+        config = MockServerConfig(latency_median=1.0, latency_spread=0.5)
+        lognormal = [config.sample_latency(rng) for _ in range(2000)]
+        assert 0.9 < percentile(lognormal, 50) < 1.1
+        assert percentile(lognormal, 99) > 2.0
+
+
+class TestMockOpenAIServer:
+    """MockOpenAIServerのテスト."""
+
+    @pytest.mark.parametrize(
+        "output_type", ALL_OUTPUT_TYPES, ids=lambda cls: cls.__name__
+    )
+    def test_valid_output_for_every_schema(self, output_type):
+        """models.py のすべての出力型について、スキーマを満たす構造化出力を返すことをテスト."""
+        request = _request(output_type)
+        assert output_type_for(request) is output_type
+        with MockOpenAIServer(
+            MockServerConfig(latency="fixed", latency_median=0)
+        ) as server:
+            response = httpx.post(f"{server.base_url}/responses", json=request)
+        assert response.status_code == 200
+        body = response.json()
+        output_type.model_validate_json(body["output"][0]["content"][0]["text"])
+        assert body["usage"]["output_tokens"] > 0
+        assert server.stats.schemas == {output_type.__name__: 1}
+
+    def test_injects_errors_and_rate_limits(self):
+        """指定した割合で 500 と、再試行までの待ち時間つきの 429 を返すことをテスト."""
+        request = _request(models.MinutesOutput)
+        with MockOpenAIServer(
+            MockServerConfig(latency="fixed", latency_median=0, rate_limit_rate=1.0)
+        ) as server:
+            limited = httpx.post(f"{server.base_url}/responses", json=request)
+        assert limited.status_code == 429
+        assert limited.headers["retry-after-ms"] == "50"
+        with MockOpenAIServer(
+            MockServerConfig(latency="fixed", latency_median=0, error_rate=1.0)
+        ) as server:
+            failed = httpx.post(f"{server.base_url}/responses", json=request)
+        assert failed.status_code == 500
+        assert (
+            server.stats.requests == 1
+            and server.stats.server_errors == 1
+            and server.stats.responses == 0
+        )
+        assert (
+            server.stats.errors_by_retry == {0: 1}
+            and server.stats.final_errors(0) == 1
+            and server.stats.final_errors(1) == 0
+        )
+
+
+class TestPercentile:
+    """percentile関数のテスト."""
+
+    def test_interpolates(self):
+        """順位の線形補間でパーセンタイルを求めることをテスト."""
+        values = [float(value) for value in range(1, 101)]
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([3.0], 95) == 3.0
+        assert percentile([], 50) == 0.0
+
+
+class TestRunLoadTest:
+    """_run_load_test関数のテスト（実際のOpenAIクライアントで会議を実行する）."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_meetings_recover_from_rate_limits(
+        self, sample_proposal_text, all_roles
+    ):
+        """429 が混じっても再試行で回復し、全会議が完了して計測値が報告されることをテスト."""
+        config = MockServerConfig(
+            latency="fixed",
+            latency_median=0.001,
+            rate_limit_rate=0.1,
+            retry_after=0.001,
+            seed=1,
+        )
+        http_pool = HttpPoolConfig(max_connections=4, max_retries=5)
+        with MockOpenAIServer(config) as server:
+            result = await _run_load_test(
+                sample_proposal_text, server, meetings=3, workers=2, rounds=1,
+                max_concurrency=4, http_pool=http_pool, verbose=False,
+            )
+
+        assert len(result.durations) == 3 and result.failures == []
+        assert result.turns == 3 * len(all_roles)
+        assert result.server.rate_limited > 0
+        assert (
+            result.unrecovered == 0
+            and 0 < result.recovered <= result.server.injected_errors
+        )
+        assert result.server.requests == result.calls + result.server.rate_limited
+        assert result.pool.peak_connections <= 4
+        assert result.latency(50) <= result.latency(95) <= result.latency(99)
+        assert result.throughput > 0
+        report = _render_load_test_report(result, config, 2, 1, 4, http_pool)
+        assert "完了: 3/3件" in report
+        assert f"{result.recovered}件が再試行で回復、0件が再試行の上限に達して失敗" in report
+
+    @pytest.mark.asyncio
+    async def test_unrecovered_errors_fail_meetings(self, sample_proposal_text):
+        """再試行しないとエラーで会議が失敗し、回復できなかった応答と失敗した会議を別々に報告することをテスト."""
+        config = MockServerConfig(latency="fixed", latency_median=0, error_rate=1.0)
+        with MockOpenAIServer(config) as server:
+            result = await _run_load_test(
+                sample_proposal_text, server, meetings=2, workers=2, rounds=1,
+                http_pool=HttpPoolConfig(max_retries=0), verbose=False,
+            )
+
+        assert result.durations == [] and len(result.failures) == 2
+        assert all("InternalServerError" in failure for failure in result.failures)
+        assert (
+            result.unrecovered == result.server.injected_errors
+            and result.recovered == 0
+        )
+        report = _render_load_test_report(
+            result, config, 2, 1, None, HttpPoolConfig(max_retries=0)
+        )
+        assert f"0件が再試行で回復、{result.unrecovered}件が再試行の上限に達して失敗" in report
+        assert "失敗した会議 2件" in report and "## 失敗した会議" in report
+
+    @pytest.mark.asyncio
+    async def test_recovered_counts_responses_not_meetings(self, sample_proposal_text):
+        """再試行しても失敗したリクエストは回復に数えず、上限に達した試行だけを失敗として数えることをテスト."""
+        config = MockServerConfig(latency="fixed", latency_median=0, error_rate=1.0)
+        with MockOpenAIServer(config) as server:
+            result = await _run_load_test(
+                sample_proposal_text, server, meetings=1, workers=1, rounds=1,
+                http_pool=HttpPoolConfig(max_retries=1), verbose=False,
+            )
+
+        assert len(result.failures) == 1
+        assert set(result.server.errors_by_retry) == {0, 1}
+        assert result.unrecovered == result.server.errors_by_retry[1]
+        assert result.recovered == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self, sample_proposal_text):
+        """会議数・同時実行数が1未満ならValueErrorになることをテスト."""
+        with MockOpenAIServer() as server:
+            with pytest.raises(ValueError):
+                await _run_load_test(sample_proposal_text, server, meetings=0)
+
+
+class TestMain:
+    """loadtest.py のCLIのテスト."""
+
+    def test_writes_report(self, tmp_path, sample_proposal_text, capsys):
+        """指定した条件で会議を実行し、レポートを書き出すことをテスト."""
+        proposal = tmp_path / "proposal.md"
+        proposal.write_text(sample_proposal_text, encoding="utf-8")
+        output = tmp_path / "loadtest.md"
+        main(
+            [
+                "--input",
+                str(proposal),
+                "--meetings",
+                "2",
+                "--workers",
+                "2",
+                "--rounds",
+                "1",
+                "--latency",
+                "fixed",
+                "--latency-median",
+                "0",
+                "--output",
+                str(output),
+            ]
+        )
+        assert "# 負荷試験レポート" in output.read_text(encoding="utf-8")
+        assert "完了: 2/2件" in capsys.readouterr().out
+
+    def test_invalid_rate(self, tmp_path, sample_proposal_text, capsys):
+        """不正なエラー率はエラーメッセージを表示して終了することをテスト."""
+        proposal = tmp_path / "proposal.md"
+        proposal.write_text(sample_proposal_text, encoding="utf-8")
+        with pytest.raises(SystemExit):
+            main(["--input", str(proposal), "--error-rate", "2"])
+        assert "❌" in capsys.readouterr().out
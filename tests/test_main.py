@@ -1,4 +1,5 @@
 """main.pyのCLI機能の単体テスト."""
+import json
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -304,3 +305,1362 @@ class TestMainIntegration:
         assert "改訂版" in (output_dir / "refined_proposal.md").read_text()
         assert "発言記録" in (output_dir / "discussion_log.md").read_text()
         assert "85点" in (output_dir / "evaluation.md").read_text()
+
+
+class TestMainComparison:
+    """--compare（比較会議モード）のテスト."""
+
+    def test_parse_args_compare(self):
+        """--compareに複数ファイルを指定できることをテスト."""
+        test_args = ["--input", "a.md", "--compare", "b.md", "c.md"]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            args = parse_args()
+            assert args.compare == ["b.md", "c.md"]
+
+    def test_compare_default_none(self):
+        """--compare未指定時はNoneであることをテスト."""
+        with patch.object(sys, "argv", ["main.py", "--input", "a.md"]):
+            assert parse_args().compare is None
+
+    def test_main_compare_writes_comparison(self, tmp_path):
+        """比較モードで比較評価レポートが出力されることをテスト."""
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.md"
+        first.write_text("# 案1")
+        second.write_text("# 案2")
+        output_dir = tmp_path / "outputs"
+
+        test_args = [
+            "--input",
+            str(first),
+            "--compare",
+            str(second),
+            "--output-dir",
+            str(output_dir),
+        ]
+        mock_return = ("# 議事録", "# 対話履歴", "# 比較評価")
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch(
+                    "main.run_comparative_meeting", return_value=mock_return
+                ) as mock:
+                    with patch("main.run_board_meeting") as single:
+                        main()
+                    single.assert_not_called()
+                    proposals = mock.call_args[1]["proposals"]
+                    assert proposals == {"案A": "# 案1", "案B": "# 案2"}
+                    assert mock.call_args[1]["http_pool"] is None
+
+        comparison = (output_dir / "comparison.md").read_text()
+        assert comparison.startswith("# 比較評価")
+        assert "- 案B: second.md" in comparison
+        assert (output_dir / "minutes.md").read_text() == "# 議事録"
+        assert not (output_dir / "qa.md").exists()
+
+    def test_main_compare_records_run(self, tmp_path):
+        """比較モードの実行も候補をまとめた本文を企画書として履歴ストアに記録することをテスト."""
+        from history import RunStore
+        from workflow import MeetingResult
+
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.md"
+        first.write_text("# 案1")
+        second.write_text("# 案2")
+        history_dir = tmp_path / "history"
+        result = MeetingResult("# 議事録", "", "", "# 対話履歴", "# 比較評価")
+
+        def fake_run_comparative_meeting(**kwargs):
+            kwargs["on_result"](result)
+            return result.minutes, result.discussion_log, result.evaluation
+
+        test_args = [
+            "--input",
+            str(first),
+            "--compare",
+            str(second),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--history-dir",
+            str(history_dir),
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch(
+                    "main.run_comparative_meeting",
+                    side_effect=fake_run_comparative_meeting,
+                ):
+                    main()
+
+        store = RunStore(history_dir)
+        runs = store.list_runs("first.md / second.md")
+        assert len(runs) == 1
+        assert json.loads(runs[0]["settings"])["compare"] == ["first.md", "second.md"]
+        assert store.get_artifact(runs[0]["run_id"], "evaluation") == "# 比較評価"
+        assert "# 案B: second.md\n\n# 案2" in store.get_artifact(
+            runs[0]["run_id"], "proposal"
+        )
+        store.close()
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            ["--time-budget", "600"],
+            ["--hedge"],
+            ["--fallback-models", "gpt-4.1-mini"],
+            ["--agenda-size", "3"],
+            ["--digest-block-size", "8"],
+            ["--group-rounds", "2"],
+            ["--bounded-memory"],
+            ["--draft-interval", "3"],
+            ["--speculate"],
+            ["--context-format", "compact"],
+            ["--validate-outputs"],
+            ["--trace"],
+        ],
+    )
+    def test_main_compare_rejects_unsupported_options(self, tmp_path, capsys, option):
+        """比較モードが対応していないオプションは黙って無視せずエラーにすることをテスト."""
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.md"
+        first.write_text("# 案1")
+        second.write_text("# 案2")
+        test_args = ["--input", str(first), "--compare", str(second)] + option
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_comparative_meeting") as mock:
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+                    mock.assert_not_called()
+        assert exc_info.value.code == 1
+        assert option[0] in capsys.readouterr().out
+
+    def test_main_compare_missing_candidate(self, tmp_path, capsys):
+        """比較対象ファイルが存在しない場合のテスト."""
+        first = tmp_path / "first.md"
+        first.write_text("# 案1")
+        test_args = ["--input", str(first), "--compare", str(tmp_path / "none.md")]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+                assert exc_info.value.code == 1
+        assert "見つかりません" in capsys.readouterr().out
+
+
+class TestMainSampling:
+    """--samples（サンプリングモード）のテスト."""
+
+    def test_parse_args_sampling_defaults(self):
+        """--samples / --max-concurrency のデフォルト値テスト."""
+        with patch.object(sys, "argv", ["main.py", "--input", "a.md"]):
+            args = parse_args()
+            assert args.samples == 1
+            assert args.max_concurrency == 8
+
+    def test_main_samples_writes_report(self, tmp_path):
+        """サンプルごとの成果物と統合レポートが出力されることをテスト."""
+        from workflow import MeetingResult
+
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        output_dir = tmp_path / "outputs"
+        sampling = MagicMock()
+        sampling.results = [
+            MeetingResult("# 議事録", "# Q&A", "# 改訂", "# ログ", f"# 評価{i}")
+            for i in range(2)
+        ]
+        sampling.report = "# 統合レポート"
+
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(output_dir),
+            "--samples",
+            "2",
+            "--history-dir",
+            str(tmp_path / "history"),
+            "--time-budget",
+            "600",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_sampled_meetings", return_value=sampling) as mock:
+                    main()
+                    assert mock.call_args[1]["samples"] == 2
+                    assert mock.call_args[1]["max_concurrency"] == 8
+                    assert mock.call_args[1]["time_budget"] == 600
+
+        assert (output_dir / "sampling_report.md").read_text() == "# 統合レポート"
+        assert (
+            output_dir / "samples" / "sample_02" / "evaluation.md"
+        ).read_text() == "# 評価1"
+
+        from history import RunStore
+
+        runs = RunStore(tmp_path / "history").list_runs()
+        assert len(runs) == 2
+        assert runs[0]["group_id"] == runs[1]["group_id"]
+
+    def test_main_samples_with_compare_rejected(self, tmp_path, capsys):
+        """--compareと--samplesの併用はエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--compare",
+            str(input_file),
+            "--samples",
+            "3",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+                assert exc_info.value.code == 1
+        assert "同時に指定できません" in capsys.readouterr().out
+
+
+class TestMainHistory:
+    """実行履歴の記録のテスト."""
+
+    def test_parse_args_history_defaults(self):
+        """--history-dir / --no-history のデフォルト値テスト."""
+        with patch.object(sys, "argv", ["main.py", "--input", "a.md"]):
+            args = parse_args()
+            assert args.history_dir == "./history"
+            assert args.history_keep == 200
+            assert args.no_history is False
+
+    def test_main_records_run(self, tmp_path):
+        """通常実行の結果が履歴ストアに記録されることをテスト."""
+        from history import RunStore
+        from workflow import MeetingResult
+
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        history_dir = tmp_path / "history"
+        result = MeetingResult("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+
+        def fake_run_board_meeting(**kwargs):
+            kwargs["on_result"](result)
+            return result.as_tuple()
+
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--history-dir", str(history_dir),
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch(
+                    "main.run_board_meeting", side_effect=fake_run_board_meeting
+                ):
+                    main()
+
+        store = RunStore(history_dir)
+        runs = store.list_runs(str(input_file))
+        assert len(runs) == 1
+        assert runs[0]["proposal_name"] == "proposal.md"
+        assert store.get_artifact(runs[0]["run_id"], "minutes") == "# 議事録"
+
+    def test_history_keep_limits_stored_runs(self, tmp_path):
+        """--history-keep の件数を超えた古い実行は記録のたびに削除されることをテスト."""
+        from history import RunStore
+        from workflow import MeetingResult
+
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        history_dir = tmp_path / "history"
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--history-dir", str(history_dir), "--history-keep", "2",
+        ]
+        for idx in range(3):
+            result = MeetingResult(
+                f"# 議事録{idx}",
+                "# Q&A",
+                "# 改訂",
+                "# ログ",
+                "# 評価",
+                started_at=float(idx + 1),
+            )
+
+            def fake_run_board_meeting(**kwargs):
+                kwargs["on_result"](result)
+                return result.as_tuple()
+
+            with patch.object(sys, "argv", ["main.py"] + test_args):
+                with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                    with patch(
+                        "main.run_board_meeting", side_effect=fake_run_board_meeting
+                    ):
+                        main()
+
+        store = RunStore(history_dir)
+        runs = store.list_runs()
+        assert len(runs) == 2
+        assert store.get_artifact(runs[-1]["run_id"], "minutes") == "# 議事録1"
+        store.close()
+
+    def test_negative_history_keep_rejected(self, tmp_path, capsys):
+        """--history-keep に負の値を指定するとエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        with patch.object(
+            sys, "argv", ["main.py", "--input", str(input_file), "--history-keep", "-1"]
+        ):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit):
+                    main()
+        assert "history-keep は0以上" in capsys.readouterr().out
+
+    def test_history_failure_keeps_outputs(self, tmp_path, capsys):
+        """履歴の記録に失敗しても成果物が書き出され、書き出し先が片付くことをテスト."""
+        import sqlite3
+
+        from workflow import MeetingResult
+
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        output_dir = tmp_path / "out"
+
+        def fake_run_board_meeting(**kwargs):
+            spill_dir = kwargs["spill_dir"]
+            spill_dir.mkdir(parents=True)
+            log_path = spill_dir / "discussion_log.md"
+            log_path.write_text("# 対話履歴（ファイル）", encoding="utf-8")
+            result = MeetingResult(
+                minutes="# 議事録", qa="# Q&A", refined_proposal="# 改訂", discussion_log="",
+                evaluation="# 評価", discussion_log_path=log_path,
+            )
+            kwargs["on_result"](result)
+            return result.as_tuple()
+
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(output_dir),
+            "--bounded-memory",
+            "--history-dir",
+            str(tmp_path / "history"),
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch(
+                    "main.run_board_meeting", side_effect=fake_run_board_meeting
+                ):
+                    with patch(
+                        "main.RunStore.record_run",
+                        side_effect=sqlite3.OperationalError("database is locked"),
+                    ):
+                        main()
+
+        assert (output_dir / "minutes.md").read_text(encoding="utf-8") == "# 議事録"
+        log_text = (output_dir / "discussion_log.md").read_text(encoding="utf-8")
+        assert log_text == "# 対話履歴（ファイル）"
+        assert not (output_dir / ".spill").exists()
+        out = capsys.readouterr().out
+        assert "実行履歴を記録できませんでした" in out
+        assert "生成完了" in out
+
+    def test_main_no_history(self, tmp_path):
+        """--no-historyでは履歴ストアを作成しないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        history_dir = tmp_path / "history"
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+
+        def fake_run_board_meeting(**kwargs):
+            from workflow import MeetingResult
+
+            kwargs["on_result"](MeetingResult(*mock_return))
+            return mock_return
+
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--history-dir", str(history_dir), "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch(
+                    "main.run_board_meeting", side_effect=fake_run_board_meeting
+                ):
+                    main()
+
+        assert not history_dir.exists()
+
+
+class TestMainTimeBudget:
+    """--time-budget（時間予算）のテスト."""
+
+    def test_time_budget_passed_to_workflow(self, tmp_path):
+        """--time-budgetがrun_board_meetingに渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--time-budget", "600", "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["time_budget"] == 600.0
+
+    def test_time_budget_default_none(self):
+        """--time-budget未指定時はNoneであることをテスト."""
+        with patch.object(sys, "argv", ["main.py", "--input", "a.md"]):
+            assert parse_args().time_budget is None
+
+    def test_invalid_time_budget(self, tmp_path, capsys):
+        """0以下の時間予算はエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = ["--input", str(input_file), "--time-budget", "0"]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+                assert exc_info.value.code == 1
+        assert "time-budget" in capsys.readouterr().out
+
+
+class TestMainHedge:
+    """--hedge（ヘッジリクエスト）のテスト."""
+
+    def test_hedge_policy_passed_to_workflow(self, tmp_path):
+        """--hedge指定時にHedgePolicyがrun_board_meetingに渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--hedge",
+            "--hedge-quantile",
+            "0.95",
+            "--hedge-budget",
+            "0.05",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    policy = mock.call_args[1]["hedge"]
+        assert policy.quantile == 0.95
+        assert policy.max_extra_fraction == 0.05
+
+    def test_hedge_disabled_by_default(self, tmp_path):
+        """--hedge未指定時はヘッジしないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["hedge"] is None
+
+    def test_invalid_hedge_quantile(self, tmp_path, capsys):
+        """範囲外のパーセンタイルはエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = ["--input", str(input_file), "--hedge", "--hedge-quantile", "1.5"]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+                assert exc_info.value.code == 1
+        assert "hedge-quantile" in capsys.readouterr().out
+
+
+class TestMainFallbackModels:
+    """--fallback-models（フォールバックモデル）のテスト."""
+
+    def test_router_passed_to_workflow(self, tmp_path):
+        """--fallback-models指定時にModelRouterがrun_board_meetingに渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--fallback-models", "gpt-4.1", "gpt-4.1-mini", "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    router = mock.call_args[1]["router"]
+        assert router.models == ["gpt-4.1", "gpt-4.1-mini"]
+
+    def test_no_router_by_default(self, tmp_path):
+        """--fallback-models未指定時はrouterを使わないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["router"] is None
+
+
+class TestMainAgendaSize:
+    """--agenda-size（アジェンダ計画）のテスト."""
+
+    def test_agenda_size_passed_to_workflow(self, tmp_path):
+        """--agenda-sizeがrun_board_meetingに渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--agenda-size", "3", "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["agenda_size"] == 3
+
+    def test_invalid_agenda_size(self, tmp_path, capsys):
+        """0以下のagenda-sizeはエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = ["--input", str(input_file), "--agenda-size", "0"]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+                assert exc_info.value.code == 1
+        assert "agenda-size" in capsys.readouterr().out
+
+
+class TestMainDigestBlockSize:
+    """--digest-block-size（討論ログのダイジェスト）のテスト."""
+
+    def test_digest_block_size_passed_to_workflow(self, tmp_path):
+        """--digest-block-sizeがrun_board_meetingに渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--digest-block-size", "8", "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["digest_block_size"] == 8
+
+    def test_disabled_by_default(self):
+        """未指定時はダイジェストを使わないことをテスト."""
+        with patch.object(sys, "argv", ["main.py", "--input", "a.md"]):
+            assert parse_args().digest_block_size is None
+
+
+class TestMainBoundedMemory:
+    """--bounded-memory（省メモリモード）のテスト."""
+
+    def test_spill_dir_passed_and_log_placed(self, tmp_path, capsys):
+        """書き出し先が渡され、対話履歴が出力先に移動されることをテスト."""
+        from workflow import MeetingResult
+
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        output_dir = tmp_path / "out"
+
+        def fake_run_board_meeting(*args, **kwargs):
+            spill_dir = kwargs["spill_dir"]
+            spill_dir.mkdir(parents=True)
+            log_path = spill_dir / "discussion_log.md"
+            log_path.write_text("# 対話履歴（ファイル）", encoding="utf-8")
+            result = MeetingResult(
+                minutes="# 議事録", qa="# Q&A", refined_proposal="# 改訂", discussion_log="",
+                evaluation="# 評価", discussion_log_path=log_path,
+            )
+            kwargs["on_result"](result)
+            return result.as_tuple()
+
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(output_dir),
+            "--bounded-memory",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch(
+                    "main.run_board_meeting", side_effect=fake_run_board_meeting
+                ) as mock:
+                    main()
+                    assert mock.call_args[1]["spill_dir"] == output_dir / ".spill"
+
+        log_text = (output_dir / "discussion_log.md").read_text(encoding="utf-8")
+        assert log_text == "# 対話履歴（ファイル）"
+        assert not (output_dir / ".spill").exists()
+        assert "ピークメモリ" in capsys.readouterr().out
+
+    def test_disabled_by_default(self, tmp_path):
+        """未指定時は書き出し先を渡さないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["spill_dir"] is None
+        log_text = (tmp_path / "out" / "discussion_log.md").read_text(encoding="utf-8")
+        assert log_text == "# ログ"
+
+
+class TestMainRolesConfig:
+    """--roles-config（参加者構成ファイル）のテスト."""
+
+    def test_board_passed_to_workflow(self, tmp_path):
+        """読み込んだ参加者構成と部会のラウンド数がrun_board_meetingに渡されることをテスト."""
+        import json
+
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        config = tmp_path / "roles.json"
+        config.write_text(
+            json.dumps(
+                {
+                    "groups": [
+                        {
+                            "name": "専門家",
+                            "lead": "法務の専門家",
+                            "members": ["法務の専門家", "会計の専門家"],
+                        }
+                    ]
+                },
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--roles-config", str(config), "--group-rounds", "4", "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    kwargs = mock.call_args[1]
+                    assert kwargs["board"].groups[0].name == "専門家"
+                    assert kwargs["group_rounds"] == 4
+
+    def test_invalid_config_exits(self, tmp_path, capsys):
+        """不正な構成ファイルではエラー終了することをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        config = tmp_path / "roles.json"
+        config.write_text('{"roles": {}}', encoding="utf-8")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--roles-config",
+            str(config),
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit):
+                    main()
+        assert "参加者構成ファイルを読み込めません" in capsys.readouterr().out
+
+    def test_default_board_when_not_specified(self, tmp_path):
+        """未指定時は参加者構成を渡さないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["board"] is None
+
+
+class TestMainStream:
+    """--stream（ストリーミング実行）のテスト."""
+
+    def test_stream_dir_is_output_dir(self, tmp_path):
+        """--streamで出力ディレクトリが逐次書き出し先として渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--stream",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert (
+                        mock.call_args[1]["stream_dir"] == (tmp_path / "out").resolve()
+                    )
+        # 最終版で上書きされる
+        assert (tmp_path / "out" / "minutes.md").read_text(encoding="utf-8") == "# 議事録"
+
+    def test_stream_rejected_in_sampling_mode(self, tmp_path, capsys):
+        """サンプリングモードでは--streamを指定できないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = ["--input", str(input_file), "--stream", "--samples", "3"]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit):
+                    main()
+        assert "通常モードでのみ" in capsys.readouterr().out
+
+
+class TestMainSectionRefine:
+    """--section-refine（見出しごとの並列改訂）・--axis-evaluate（観点ごとの並列評価）のテスト."""
+
+    def test_flag_passed_to_meeting(self, tmp_path):
+        """--section-refineが会議の実行に渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--section-refine",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["section_refine"] is True
+                    assert mock.call_args[1]["axis_evaluate"] is False
+
+    def test_axis_evaluate_passed_to_meeting(self, tmp_path):
+        """--axis-evaluateが会議の実行に渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--axis-evaluate",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["axis_evaluate"] is True
+
+    def test_rejected_with_compare(self, tmp_path, capsys):
+        """比較モードでは--section-refineを指定できないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--compare",
+            str(input_file),
+            "--section-refine",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit):
+                    main()
+        assert "--section-refine" in capsys.readouterr().out
+
+
+class TestMainHttpPool:
+    """--max-connections・--http2（共有HTTP接続プール）のテスト."""
+
+    def test_pool_config_passed(self, tmp_path):
+        """--max-connectionsで接続プールの設定が会議の実行に渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--max-connections",
+            "8",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    config = mock.call_args[1]["http_pool"]
+                    assert config.max_connections == 8
+                    assert not config.http2
+
+    def test_no_pool_by_default(self, tmp_path):
+        """指定しない場合は接続プールを使わないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["http_pool"] is None
+
+    def test_invalid_max_connections(self, tmp_path, capsys):
+        """max-connectionsが1未満の場合にエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = ["--input", str(input_file), "--max-connections", "0"]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit):
+                    main()
+        assert "max_connections" in capsys.readouterr().out
+
+    def test_pool_used_in_compare_mode(self, tmp_path):
+        """比較モードでも接続プールの設定が渡されることをテスト."""
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.md"
+        first.write_text("# 案1")
+        second.write_text("# 案2")
+        test_args = [
+            "--input", str(first), "--compare", str(second),
+            "--output-dir", str(tmp_path / "out"), "--max-connections", "4",
+        ]
+        mock_return = ("# 議事録", "# 対話履歴", "# 比較評価")
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch(
+                    "main.run_comparative_meeting", return_value=mock_return
+                ) as mock:
+                    main()
+                    assert mock.call_args[1]["http_pool"].max_connections == 4
+
+
+class TestMainSweep:
+    """--sweep-rounds / --sweep-context-turns（パラメータスイープ）のテスト."""
+
+    def test_main_sweep_writes_variants(self, tmp_path):
+        """設定ごとの成果物とスイープレポートが出力され、履歴に設定値が記録されることをテスト."""
+        from sweep import SweepVariant
+        from workflow import MeetingResult
+
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        output_dir = tmp_path / "outputs"
+        sweep = MagicMock()
+        sweep.variants = [SweepVariant(8, 4), SweepVariant(12, 4)]
+        sweep.results = [
+            MeetingResult("# 議事録", "# Q&A", "# 改訂", "# ログ", f"# 評価{i}")
+            for i in range(2)
+        ]
+        sweep.report = "# スイープレポート"
+
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(output_dir),
+            "--sweep-rounds", "8", "12", "--context-turns", "4",
+            "--history-dir", str(tmp_path / "history"),
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_sweep", return_value=sweep) as mock:
+                    with patch("main.run_board_meeting") as single:
+                        main()
+                    single.assert_not_called()
+                    assert mock.call_args[1]["rounds"] == [8, 12]
+                    assert mock.call_args[1]["context_turns"] == [4]
+
+        assert (output_dir / "sweep_report.md").read_text() == "# スイープレポート"
+        assert (
+            output_dir / "sweep" / "rounds_12_context_4" / "evaluation.md"
+        ).read_text() == "# 評価1"
+
+        from history import RunStore
+
+        runs = RunStore(tmp_path / "history").list_runs()
+        assert len(runs) == 2
+        assert runs[0]["group_id"] == runs[1]["group_id"]
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            ["--samples", "2"],
+            ["--time-budget", "600"],
+            ["--agenda-size", "3"],
+            ["--stream"],
+            ["--bounded-memory"],
+            ["--draft-interval", "3"],
+            ["--speculate"],
+            ["--context-format", "compact"],
+            ["--validate-outputs"],
+            ["--trace"],
+        ],
+    )
+    def test_main_sweep_rejects_unsupported_options(self, tmp_path, capsys, option):
+        """スイープが対応していないオプションとの併用はエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--sweep-context-turns",
+            "4",
+            "6",
+        ] + option
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_sweep") as mock:
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+                    mock.assert_not_called()
+        assert exc_info.value.code == 1
+        assert "同時に指定できません" in capsys.readouterr().out
+
+
+class TestMainOpeningStatements:
+    """--opening-statements（冒頭発言の同時実行）のテスト."""
+
+    def test_opening_statements_passed_to_workflow(self, tmp_path):
+        """--opening-statements指定時にrun_board_meetingへ渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--opening-statements",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["opening_statements"] is True
+
+    def test_disabled_by_default(self, tmp_path):
+        """未指定時は冒頭発言を同時に行わないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["opening_statements"] is False
+
+
+class TestMainDraftInterval:
+    """--draft-interval（議事録・想定問答の下書きの逐次更新）のテスト."""
+
+    def test_draft_interval_passed_to_workflow(self, tmp_path):
+        """--draft-intervalがrun_board_meetingに渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input", str(input_file), "--output-dir", str(tmp_path / "out"),
+            "--draft-interval", "4", "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["draft_interval"] == 4
+
+    def test_disabled_by_default(self, tmp_path):
+        """未指定時は下書きを更新しないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["draft_interval"] is None
+
+    def test_invalid_draft_interval(self, tmp_path, capsys):
+        """0以下のdraft-intervalはエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = ["--input", str(input_file), "--draft-interval", "0"]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+                assert exc_info.value.code == 1
+        assert "draft-interval" in capsys.readouterr().out
+
+
+class TestMainSpeculate:
+    """--speculate（次の発言者の投機的実行）のテスト."""
+
+    def test_speculate_passed_to_workflow(self, tmp_path):
+        """--speculate指定時にrun_board_meetingへ渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--speculate",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["speculate"] is True
+
+    def test_speculate_in_dry_run(self, tmp_path):
+        """ドライランでも投機的実行を指定でき、見積もりに的中率が含まれることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書\n\n## 背景\n新製品を開発します。")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--dry-run",
+            "--speculate",
+            "--rounds",
+            "2",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            main()
+        report = (tmp_path / "out" / "dry_run_report.md").read_text(encoding="utf-8")
+        assert "## 投機的実行" in report
+
+
+class TestMainContextFormat:
+    """--context-format（発言履歴の形式）のテスト."""
+
+    def test_context_format_passed_to_workflow(self, tmp_path):
+        """未指定時は markdown、指定時はその形式が run_board_meeting へ渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        for extra, expected in (
+            ([], "markdown"),
+            (["--context-format", "compact"], "compact"),
+        ):
+            test_args = [
+                "--input",
+                str(input_file),
+                "--output-dir",
+                str(tmp_path / "out"),
+                "--no-history",
+            ] + extra
+            with patch.object(sys, "argv", ["main.py"] + test_args):
+                with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                    with patch(
+                        "main.run_board_meeting", return_value=mock_return
+                    ) as mock:
+                        main()
+                        assert mock.call_args[1]["context_format"] == expected
+
+    def test_compact_in_dry_run(self, tmp_path):
+        """ドライランで compact を指定すると Markdown との入力トークン数の比較が見積もりに含まれることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書\n\n## 背景\n新製品を開発します。")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--dry-run",
+            "--context-format",
+            "compact",
+            "--rounds",
+            "2",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            main()
+        report = (tmp_path / "out" / "dry_run_report.md").read_text(encoding="utf-8")
+        assert "## 発言履歴の簡潔な形式（compact）" in report
+
+
+class TestMainValidateOutputs:
+    """--validate-outputs（成果物の検証と不足分の修復）のテスト."""
+
+    def test_validate_outputs_passed_to_workflow(self, tmp_path):
+        """--validate-outputs指定時にrun_board_meetingへ渡されることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--validate-outputs",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_board_meeting", return_value=mock_return) as mock:
+                    main()
+                    assert mock.call_args[1]["validate_outputs"] is True
+
+    def test_dry_run_needs_no_repairs(self, tmp_path):
+        """ドライランの仮の成果物は検証に通るため、修復の呼び出しを見積もりに含めないことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書\n\n## 背景\n新製品を開発します。")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--dry-run",
+            "--validate-outputs",
+            "--rounds",
+            "2",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            main()
+        report = (tmp_path / "out" / "dry_run_report.md").read_text(encoding="utf-8")
+        assert "Repairer" not in report and "Supplementer" not in report
+
+
+class TestMainTrace:
+    """--trace・--no-remote-tracing のテスト."""
+
+    def test_trace_written_to_output_dir(self, tmp_path):
+        """--trace指定時に会議のタイムラインが trace.json に書き出されることをテスト."""
+        import json
+        from tracing import TraceRecorder
+        from workflow import MeetingResult
+
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        output_dir = tmp_path / "out"
+        recorder = TraceRecorder()
+        recorder.add("Facilitator", "call", 1.0, 2.0)
+
+        def fake_run_board_meeting(**kwargs):
+            assert kwargs["trace"] is True
+            kwargs["on_result"](
+                MeetingResult(
+                    "# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価", trace=recorder
+                )
+            )
+            return ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(output_dir),
+            "--trace",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch(
+                    "main.run_board_meeting", side_effect=fake_run_board_meeting
+                ):
+                    main()
+
+        trace = json.loads((output_dir / "trace.json").read_text(encoding="utf-8"))
+        assert any(event["name"] == "Facilitator" for event in trace["traceEvents"])
+
+    def test_no_remote_tracing(self, tmp_path):
+        """--no-remote-tracing指定時のみSDKのトレース送信を無効にすることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        mock_return = ("# 議事録", "# Q&A", "# 改訂", "# ログ", "# 評価")
+        base_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--no-history",
+        ]
+        for extra, expected in ((["--no-remote-tracing"], [((True,),)]), ([], [])):
+            with patch.object(sys, "argv", ["main.py"] + base_args + extra):
+                with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                    with patch("main.run_board_meeting", return_value=mock_return):
+                        with patch("main.set_tracing_disabled") as disable:
+                            main()
+            assert disable.call_args_list == expected
+
+
+class TestMainDryRun:
+    """--dry-run（ドライラン）のテスト."""
+
+    def test_dry_run_without_api_key(self, tmp_path, capsys):
+        """APIキーなしで見積もりを実行し、レポートを書き出すことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        output_dir = tmp_path / "out"
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(output_dir),
+            "--dry-run",
+            "--rounds",
+            "6",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {}, clear=True):
+                with patch("main.load_dotenv"):
+                    with patch(
+                        "main.run_dry_run",
+                        return_value=MagicMock(report="# 経営会議 ドライラン見積もり"),
+                    ) as mock:
+                        with patch("main.run_board_meeting") as meeting:
+                            main()
+        assert mock.call_args[1]["rounds"] == 6
+        assert mock.call_args[1]["latencies"] == {}
+        meeting.assert_not_called()
+        report = (output_dir / "dry_run_report.md").read_text(encoding="utf-8")
+        assert report == "# 経営会議 ドライラン見積もり"
+        assert "ドライラン見積もり" in capsys.readouterr().out
+
+    def test_dry_run_uses_history_latencies(self, tmp_path):
+        """実行履歴のエージェント別平均所要時間を見積もりに使うことをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--dry-run",
+            "--history-dir",
+            str(tmp_path / "history"),
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.RunStore") as store:
+                    store.return_value.average_latencies.return_value = {
+                        "Facilitator": 2.5
+                    }
+                    with patch(
+                        "main.run_dry_run", return_value=MagicMock(report="# 見積もり")
+                    ) as mock:
+                        main()
+        assert mock.call_args[1]["latencies"] == {"Facilitator": 2.5}
+
+    def test_invalid_proposal_rejected(self, tmp_path, capsys):
+        """空の企画書は見積もりを行わずエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("\n")
+        test_args = [
+            "--input",
+            str(input_file),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--dry-run",
+            "--no-history",
+        ]
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_dry_run") as mock:
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+        assert exc_info.value.code == 1
+        mock.assert_not_called()
+        assert "企画書が空です" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            ["--samples", "2"],
+            ["--stream"],
+            ["--time-budget", "600"],
+            ["--compare", "b.md"],
+            ["--trace"],
+        ],
+    )
+    def test_dry_run_rejects_unsupported_options(self, tmp_path, capsys, option):
+        """ドライランが対応していないオプションとの併用はエラーになることをテスト."""
+        input_file = tmp_path / "proposal.md"
+        input_file.write_text("# テスト企画書")
+        test_args = ["--input", str(input_file), "--dry-run"] + option
+        with patch.object(sys, "argv", ["main.py"] + test_args):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                with patch("main.run_dry_run") as mock:
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+        assert exc_info.value.code == 1
+        mock.assert_not_called()
+        assert option[0] in capsys.readouterr().out
@@ -4,19 +4,41 @@ from agents import Agent
 from meeting_agents import (
     ROLE_INSTRUCTIONS,
     create_facilitator,
+    create_agenda_facilitator,
+    create_group_facilitator,
+    create_group_reporter,
     create_participant,
     create_minutes_writer,
     create_qa_writer,
     create_refiner,
+    create_section_refiner,
+    create_consistency_checker,
+    REFINED_PROPOSAL_SECTIONS,
+    EVALUATION_AXIS_FOCUS,
+    create_axis_evaluator,
+    create_evaluation_aggregator,
     create_evaluator,
+    create_digest_writer,
+    create_comparative_evaluator,
+    create_discussion_summarizer,
+    create_discussion_reducer,
 )
 from models import (
+    FacilitatorAgenda,
     FacilitatorDecision,
     ParticipantResponse,
     MinutesOutput,
     QAOutput,
     RefinedProposalOutput,
+    ProposalSectionOutput,
+    ConsistencyReview,
     EvaluationOutput,
+    EvaluationSummary,
+    AxisScore,
+    EVALUATION_AXES,
+    ProposalDigest,
+    ComparativeEvaluationOutput,
+    DiscussionDigest,
 )
 
 
@@ -72,6 +94,22 @@ class TestCreateFacilitator:
         assert "ファシリテーター" in facilitator.instructions
 
 
+class TestCreateAgendaFacilitator:
+    """create_agenda_facilitator関数のテスト."""
+
+    def test_output_type(self):
+        """出力型がFacilitatorAgendaであることをテスト."""
+        facilitator = create_agenda_facilitator(3)
+        assert facilitator.name == "Facilitator"
+        assert facilitator.output_type == FacilitatorAgenda
+
+    def test_instructions_mention_agenda_size(self):
+        """まとめて指名する人数が指示に含まれることをテスト."""
+        facilitator = create_agenda_facilitator(4)
+        assert "4人分" in facilitator.instructions
+        assert "upcoming" in facilitator.instructions
+
+
 class TestCreateParticipant:
     """create_participant関数のテスト."""
 
@@ -101,6 +139,13 @@ class TestCreateParticipant:
         sales = create_participant("営業担当役員")
         assert "営業" in sales.instructions
 
+    def test_custom_instruction(self):
+        """設定ファイルの役割の指示を使えることをテスト."""
+        agent = create_participant("品質保証部長", "あなたは品質保証部長です。")
+        assert agent.name == "品質保証部長"
+        assert "あなたは品質保証部長です。" in agent.instructions
+        assert "## 出力ルール" in agent.instructions
+
     def test_instructions_contain_common_rules(self):
         """すべてのエージェントに共通ルールが含まれることをテスト."""
         agent = create_participant("社長")
@@ -210,6 +255,31 @@ class TestCreateRefiner:
             assert section in refiner.instructions, f"{section}がインストラクションに含まれていません"
 
 
+class TestCreateSectionRefiner:
+    """create_section_refiner・create_consistency_checker関数のテスト."""
+
+    def test_required_sections_listed_in_refiner(self):
+        """必須見出しがすべて一括改訂のインストラクションに含まれることをテスト."""
+        refiner = create_refiner()
+        assert len(REFINED_PROPOSAL_SECTIONS) == 8
+        for heading in REFINED_PROPOSAL_SECTIONS:
+            assert f"- {heading}" in refiner.instructions
+
+    def test_section_refiner(self):
+        """見出しごとの改訂エージェントの名前・出力型・インストラクションをテスト."""
+        agent = create_section_refiner("予算と収益見通し")
+        assert agent.name == "Section Refiner（予算と収益見通し）"
+        assert agent.output_type == ProposalSectionOutput
+        assert "「予算と収益見通し」" in agent.instructions
+
+    def test_consistency_checker(self):
+        """整合性確認エージェントの出力型をテスト."""
+        agent = create_consistency_checker()
+        assert agent.name == "Consistency Checker"
+        assert agent.output_type == ConsistencyReview
+        assert "KPI" in agent.instructions
+
+
 class TestCreateEvaluator:
     """create_evaluator関数のテスト."""
 
@@ -253,6 +323,14 @@ class TestCreateEvaluator:
         for element in output_elements:
             assert element in evaluator.instructions, f"{element}が出力形式に含まれていません"
 
+    def test_instructions_list_all_scored_axes(self):
+        """構造化スコアの全観点名がインストラクションに含まれることをテスト."""
+        from models import EVALUATION_AXES
+
+        evaluator = create_evaluator()
+        for axis in EVALUATION_AXES:
+            assert axis in evaluator.instructions, f"{axis}が採点観点に含まれていません"
+
 
 class TestAgentsIntegration:
     """エージェント統合テスト."""
@@ -288,3 +366,101 @@ class TestAgentsIntegration:
 
         for agent, expected_type in agent_output_pairs:
             assert agent.output_type == expected_type
+
+
+class TestCreateDigestWriter:
+    """create_digest_writer関数のテスト."""
+
+    def test_output_type(self):
+        """出力型がProposalDigestであることをテスト."""
+        writer = create_digest_writer()
+        assert isinstance(writer, Agent)
+        assert writer.output_type == ProposalDigest
+
+    def test_instructions_forbid_fabrication(self):
+        """企画書にない事実を補わない指示が含まれることをテスト."""
+        writer = create_digest_writer()
+        assert "補わない" in writer.instructions
+
+
+class TestCreateComparativeEvaluator:
+    """create_comparative_evaluator関数のテスト."""
+
+    def test_output_type(self):
+        """出力型がComparativeEvaluationOutputであることをテスト."""
+        evaluator = create_comparative_evaluator()
+        assert isinstance(evaluator, Agent)
+        assert evaluator.name == "Comparative Evaluator"
+        assert evaluator.output_type == ComparativeEvaluationOutput
+
+    def test_instructions_require_ranking(self):
+        """順位付けと推奨案の指示が含まれることをテスト."""
+        evaluator = create_comparative_evaluator()
+        assert "順位" in evaluator.instructions
+        assert "推奨案" in evaluator.instructions
+
+    def test_ranking_table_not_in_markdown(self):
+        """順位表と推奨案は自動生成されるためmarkdownに書かない指示があることをテスト."""
+        markdown_section = create_comparative_evaluator().instructions.split(
+            "## 出力形式（markdown）"
+        )[1]
+        assert "markdownには書かない" in markdown_section
+        assert "順位・スコア" not in markdown_section
+
+
+class TestCreateDiscussionDigestAgents:
+    """討論ログのダイジェスト用エージェントのテスト."""
+
+    def test_output_types(self):
+        """要約・統合エージェントの出力型がDiscussionDigestであることをテスト."""
+        assert create_discussion_summarizer().output_type == DiscussionDigest
+        assert create_discussion_reducer().output_type == DiscussionDigest
+
+    def test_instructions_require_turn_references(self):
+        """ターン番号を残す指示が含まれることをテスト."""
+        assert "ターン番号" in create_discussion_summarizer().instructions
+        assert "ターン番号" in create_discussion_reducer().instructions
+
+
+class TestCreateGroupAgents:
+    """部会用エージェントのテスト."""
+
+    def test_group_facilitator(self):
+        """部会のファシリテーターが部会名を含み、1人ずつ指名することをテスト."""
+        agent = create_group_facilitator("製造部会")
+        assert agent.name == "Facilitator（製造部会）"
+        assert "製造部会" in agent.instructions
+        assert agent.output_type == FacilitatorDecision
+
+    def test_group_reporter(self):
+        """部会の報告エージェントがリードとして全体会議への報告を返すことをテスト."""
+        agent = create_group_reporter("製造部会", "製造担当役員")
+        assert "製造担当役員" in agent.name
+        assert "全体会議" in agent.instructions
+        assert agent.output_type == ParticipantResponse
+
+
+class TestCreateAxisEvaluator:
+    """create_axis_evaluator・create_evaluation_aggregator関数のテスト."""
+
+    def test_focus_covers_all_axes_in_order(self):
+        """観点ごとの評価の定義がEVALUATION_AXESと同じ観点・順序であることをテスト."""
+        assert list(EVALUATION_AXIS_FOCUS) == EVALUATION_AXES
+
+    def test_axis_evaluator(self):
+        """観点ごとの評価エージェントの名前・出力型・インストラクションをテスト."""
+        agent = create_axis_evaluator("コスト構造")
+        assert agent.name == "Axis Evaluator（コスト構造）"
+        assert agent.output_type == AxisScore
+        assert "コスト構造と削減効果" in agent.instructions
+
+    def test_unknown_axis(self):
+        """評価観点でない名前ではKeyErrorになることをテスト."""
+        with pytest.raises(KeyError):
+            create_axis_evaluator("デザイン")
+
+    def test_aggregator(self):
+        """総合評価エージェントの出力型をテスト."""
+        agent = create_evaluation_aggregator()
+        assert agent.name == "Evaluation Aggregator"
+        assert agent.output_type == EvaluationSummary
@@ -2,15 +2,51 @@
 import pytest
 from pydantic import ValidationError
 from models import (
+    FacilitatorAgenda,
     FacilitatorDecision,
     ParticipantResponse,
     MinutesOutput,
     QAOutput,
     RefinedProposalOutput,
+    ConsistencyReview,
+    ProposalSection,
     EvaluationOutput,
+    ProposalDigest,
+    CandidateRanking,
+    ComparativeEvaluationOutput,
+    AxisScore,
+    EVALUATION_AXES,
+    DiscussionDigest,
+    DiscussionPoint,
 )
 
 
+class TestFacilitatorAgenda:
+    """FacilitatorAgendaモデルのテスト."""
+
+    def test_extends_facilitator_decision(self):
+        """FacilitatorDecisionとして扱えることをテスト."""
+        agenda = FacilitatorAgenda(next_speaker="社長", prompt="ご意見を", rationale="最初")
+        assert isinstance(agenda, FacilitatorDecision)
+        assert agenda.upcoming == []
+
+    def test_decisions_in_order(self):
+        """最初の指名に続けて予定の指名が並ぶことをテスト."""
+        agenda = FacilitatorAgenda(
+            next_speaker="社長",
+            prompt="ご意見を",
+            rationale="最初",
+            upcoming=[
+                FacilitatorDecision(
+                    next_speaker="会計の専門家", prompt="収益性は", rationale="数字"
+                )
+            ],
+        )
+        decisions = agenda.decisions()
+        assert [d.next_speaker for d in decisions] == ["社長", "会計の専門家"]
+        assert type(decisions[0]) is FacilitatorDecision
+
+
 class TestFacilitatorDecision:
     """FacilitatorDecisionモデルのテスト."""
 
@@ -151,6 +187,21 @@ class TestRefinedProposalOutput:
         assert len(refined.markdown) > 10000
 
 
+class TestConsistencyReview:
+    """ConsistencyReviewモデルのテスト."""
+
+    def test_defaults_to_no_issues(self):
+        """問題がない場合は空の指摘・修正になることをテスト."""
+        review = ConsistencyReview()
+        assert review.issues == []
+        assert review.revised_sections == []
+
+    def test_revised_section_requires_heading(self):
+        """修正した見出しには見出し名が必須であることをテスト."""
+        with pytest.raises(ValidationError):
+            ProposalSection(markdown="本文")
+
+
 class TestEvaluationOutput:
     """EvaluationOutputモデルのテスト."""
 
@@ -166,6 +217,113 @@ class TestEvaluationOutput:
         assert "85/100" in evaluation.markdown
         assert "Go" in evaluation.markdown
 
+    def test_structured_fields_default_empty(self):
+        """markdownのみでも作成でき、構造化スコアは空であることをテスト."""
+        evaluation = EvaluationOutput(markdown="# 評価")
+        assert evaluation.axis_scores == []
+        assert evaluation.verdict == ""
+        assert evaluation.total_original == 0
+        assert evaluation.score_vector() == [None] * len(EVALUATION_AXES)
+
+    def test_totals_scaled_to_100(self):
+        """合計点が100点満点に換算されることをテスト."""
+        evaluation = EvaluationOutput(
+            markdown="# 評価",
+            axis_scores=[
+                AxisScore(axis=axis, original=7, refined=9) for axis in EVALUATION_AXES
+            ],
+            verdict="Go",
+        )
+        assert evaluation.total_original == 70
+        assert evaluation.total_refined == 90
+        dumped = evaluation.model_dump()
+        assert dumped["total_refined"] == 90
+
+    def test_score_vector_order(self):
+        """スコアベクトルがEVALUATION_AXESの順序に従うことをテスト."""
+        evaluation = EvaluationOutput(
+            markdown="# 評価",
+            axis_scores=[
+                AxisScore(axis="次のアクション", original=5, refined=8),
+                AxisScore(axis="売上規模", original=6, refined=7),
+            ],
+        )
+        vector = evaluation.score_vector("original")
+        assert vector[0] == 6.0
+        assert vector[-1] == 5.0
+        assert vector[1] is None
+
+    def test_axis_score_range(self):
+        """0〜10点の範囲外はエラーになることをテスト."""
+        with pytest.raises(ValidationError):
+            AxisScore(axis="リスク", original=11, refined=5)
+
+    def test_unknown_axis_rejected(self):
+        """定義外の観点名はエラーになることをテスト."""
+        with pytest.raises(ValidationError):
+            AxisScore(axis="その他", original=5, refined=5)
+
+    def test_invalid_verdict_rejected(self):
+        """定義外の判定はエラーになることをテスト."""
+        with pytest.raises(ValidationError):
+            EvaluationOutput(markdown="# 評価", verdict="保留")
+
+    def test_computed_totals_not_in_output_schema(self):
+        """合計点はモデルの出力スキーマに含まれない（ローカルで計算される）ことをテスト."""
+        schema = EvaluationOutput.model_json_schema()
+        assert "total_refined" not in schema["properties"]
+        assert "axis_scores" in schema["properties"]
+
+
+class TestProposalDigest:
+    """ProposalDigestモデルのテスト."""
+
+    def test_defaults(self):
+        """任意フィールドのデフォルト値テスト."""
+        digest = ProposalDigest(title="新製品", summary="要約")
+        assert digest.key_points == []
+        assert digest.investment == ""
+        assert digest.risks == []
+
+    def test_json_round_trip(self):
+        """JSONキャッシュの読み書きで内容が保持されることをテスト."""
+        digest = ProposalDigest(
+            title="新製品",
+            summary="要約",
+            key_points=["論点"],
+            investment="5000万円",
+            risks=["競合"],
+        )
+        restored = ProposalDigest.model_validate_json(digest.model_dump_json())
+        assert restored == digest
+
+
+class TestComparativeEvaluationOutput:
+    """ComparativeEvaluationOutputモデルのテスト."""
+
+    def test_valid_creation(self):
+        """順位付き比較評価の作成テスト."""
+        output = ComparativeEvaluationOutput(
+            rankings=[
+                CandidateRanking(
+                    candidate_id="案A", rank=1, score=82, strengths=["市場性"]
+                ),
+                CandidateRanking(
+                    candidate_id="案B", rank=2, score=70, weaknesses=["コスト"]
+                ),
+            ],
+            recommendation="案Aを推奨",
+            markdown="# 比較評価",
+        )
+        assert [r.candidate_id for r in output.rankings] == ["案A", "案B"]
+        assert output.rankings[1].weaknesses == ["コスト"]
+
+    def test_missing_recommendation(self):
+        """recommendation欠損のエラーテスト."""
+        with pytest.raises(ValidationError) as exc_info:
+            ComparativeEvaluationOutput(markdown="# 比較評価")
+        assert "recommendation" in str(exc_info.value)
+
 
 class TestModelsIntegration:
     """複数のモデルを組み合わせた統合テスト."""
@@ -210,3 +368,19 @@ class TestModelsIntegration:
             assert isinstance(turn["decision"], FacilitatorDecision)
             assert isinstance(turn["response"], ParticipantResponse)
             assert turn["decision"].next_speaker == turn["role"]
+
+
+class TestDiscussionDigest:
+    """DiscussionDigestモデルのテスト."""
+
+    def test_defaults(self):
+        """要約以外は省略できることをテスト."""
+        digest = DiscussionDigest(summary="要約")
+        assert digest.concerns == []
+        assert digest.role_positions == []
+
+    def test_point_references(self):
+        """項目に役職とターン番号を保持できることをテスト."""
+        point = DiscussionPoint(point="価格設定", roles=["営業担当役員"], turns=[2, 5])
+        digest = DiscussionDigest(summary="要約", concerns=[point])
+        assert digest.concerns[0].turns == [2, 5]
@@ -0,0 +1,211 @@
+"""resilience.pyのHedgePolicyの単体テスト."""
+import pytest
+from resilience import CircuitBreaker, HedgePolicy, ModelRouter, usage_tokens
+from tests.test_scheduler import FakeClock
+
+
+class TestHedgePolicy:
+    """HedgePolicyのテスト."""
+
+    def test_threshold_requires_min_samples(self):
+        """観測数が不足している間は閾値がないことをテスト."""
+        policy = HedgePolicy(min_samples=3, min_delay=0.0)
+        policy.observe("ParticipantResponse", 1.0)
+        policy.observe("ParticipantResponse", 2.0)
+        assert policy.threshold("ParticipantResponse") is None
+        policy.observe("ParticipantResponse", 3.0)
+        assert policy.threshold("ParticipantResponse") == 3.0
+
+    def test_threshold_is_quantile(self):
+        """閾値が指定パーセンタイルの所要時間になることをテスト."""
+        policy = HedgePolicy(quantile=0.9, min_samples=1, min_delay=0.0)
+        for latency in range(1, 11):
+            policy.observe("FacilitatorDecision", float(latency))
+        assert policy.threshold("FacilitatorDecision") == 9.0
+        assert policy.threshold("MinutesOutput") is None
+
+    def test_threshold_floor(self):
+        """閾値がmin_delayを下回らないことをテスト."""
+        policy = HedgePolicy(min_samples=1, min_delay=0.5)
+        policy.observe("ParticipantResponse", 0.01)
+        assert policy.threshold("ParticipantResponse") == 0.5
+
+    def test_budget_by_calls(self):
+        """トークン数が取れない場合は呼び出し回数で追加コストを制限することをテスト."""
+        policy = HedgePolicy(max_extra_fraction=0.2)
+        for _ in range(10):
+            policy.observe("ParticipantResponse", 1.0)
+        assert policy.try_acquire("ParticipantResponse")
+        assert policy.try_acquire("ParticipantResponse")
+        assert not policy.try_acquire("ParticipantResponse")
+        assert policy.hedges_issued == 2
+
+    def test_budget_by_tokens(self):
+        """トークン数で追加コストを制限することをテスト."""
+        policy = HedgePolicy(max_extra_fraction=0.1)
+        for _ in range(10):
+            policy.observe("ParticipantResponse", 1.0, tokens=100)
+        assert policy.try_acquire("ParticipantResponse")
+        assert policy.extra_tokens == 100
+        assert not policy.try_acquire("ParticipantResponse")
+
+    def test_settle_replaces_expected_tokens(self):
+        """見込みで計上した追加コストを実際の消費トークン数に置き換えることをテスト."""
+        policy = HedgePolicy(max_extra_fraction=0.2)
+        for _ in range(10):
+            policy.observe("ParticipantResponse", 1.0, tokens=100)
+        reserved = policy.acquire("ParticipantResponse")
+        assert reserved == 100 and policy.extra_tokens == 100
+        policy.settle(reserved, 20)
+        assert policy.extra_tokens == 20
+        assert policy.acquire("ParticipantResponse") == 100
+        assert policy.acquire("ParticipantResponse") is None
+
+    def test_zero_budget_never_hedges(self):
+        """追加コスト0なら複製を発行しないことをテスト."""
+        policy = HedgePolicy(max_extra_fraction=0.0)
+        policy.observe("ParticipantResponse", 1.0)
+        assert not policy.try_acquire("ParticipantResponse")
+
+    def test_invalid_parameters(self):
+        """不正なパラメータでエラーになることをテスト."""
+        with pytest.raises(ValueError):
+            HedgePolicy(quantile=1.0)
+        with pytest.raises(ValueError):
+            HedgePolicy(max_extra_fraction=-0.1)
+
+    def test_usage_tokens(self):
+        """RunResultから消費トークン数を取り出せることをテスト."""
+
+        class Usage:
+            total_tokens = 42
+
+        class Context:
+            usage = Usage()
+
+        class Result:
+            context_wrapper = Context()
+
+        assert usage_tokens(Result()) == 42
+        assert usage_tokens(object()) == 0
+
+
+class TestCircuitBreaker:
+    """CircuitBreakerのテスト."""
+
+    def make_breaker(self, clock):
+        return CircuitBreaker(
+            failure_rate_threshold=0.5,
+            slow_call_threshold=10.0,
+            min_calls=4,
+            cooldown=30.0,
+            clock=clock,
+        )
+
+    def test_trips_on_failure_rate(self):
+        """失敗率が閾値を超えると開放状態になることをテスト."""
+        breaker = self.make_breaker(FakeClock())
+        breaker.record_success(1.0)
+        breaker.record_success(1.0)
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_slow_calls_count_as_failures(self):
+        """閾値を超えて遅い呼び出しが失敗として数えられることをテスト."""
+        breaker = self.make_breaker(FakeClock())
+        for _ in range(4):
+            breaker.record_success(60.0)
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_allows_single_probe(self):
+        """クールダウン後は試行呼び出しを1つだけ通すことをテスト."""
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.advance(30.0)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+    def test_probe_success_closes(self):
+        """試行呼び出しが成功すると閉状態に戻ることをテスト."""
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.advance(30.0)
+        breaker.allow()
+        breaker.record_success(1.0)
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+    def test_probe_failure_reopens(self):
+        """試行呼び出しが失敗すると再び開放状態になることをテスト."""
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.advance(30.0)
+        breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.advance(29.0)
+        assert not breaker.allow()
+
+    def test_release_returns_probe(self):
+        """キャンセルされた試行呼び出しの枠が戻ることをテスト."""
+        clock = FakeClock()
+        breaker = self.make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.advance(30.0)
+        assert breaker.allow()
+        breaker.release()
+        assert breaker.allow()
+
+
+class TestModelRouter:
+    """ModelRouterのテスト."""
+
+    def test_chain_prefers_agent_model(self):
+        """エージェント固有のモデルが先頭になることをテスト."""
+        router = ModelRouter(["gpt-4.1", "gpt-4.1-mini"])
+        assert router.chain_for(None) == ["gpt-4.1", "gpt-4.1-mini"]
+        assert router.chain_for("gpt-4.1-mini") == ["gpt-4.1-mini", "gpt-4.1"]
+        assert router.chain_for("o3") == ["o3", "gpt-4.1", "gpt-4.1-mini"]
+
+    def test_skips_open_models(self):
+        """開放状態のモデルを飛ばすことをテスト."""
+        router = ModelRouter(["primary", "backup"])
+        for _ in range(10):
+            router.breaker("primary").record_failure()
+        assert list(router.candidates()) == ["backup"]
+
+    def test_all_open_tries_primary(self):
+        """すべて開放状態なら最優先のモデルを試すことをテスト."""
+        router = ModelRouter(["primary", "backup"])
+        for model in ("primary", "backup"):
+            for _ in range(10):
+                router.breaker(model).record_failure()
+        assert list(router.candidates()) == ["primary"]
+
+    def test_candidates_are_lazy(self):
+        """先頭のモデルで成功した場合は後続の試行枠を消費しないことをテスト."""
+        clock = FakeClock()
+        router = ModelRouter(
+            ["primary", "backup"], breaker_factory=lambda: CircuitBreaker(clock=clock)
+        )
+        for _ in range(10):
+            router.breaker("backup").record_failure()
+        clock.advance(60.0)
+        assert next(router.candidates()) == "primary"
+        assert router.breaker("backup").allow()
+
+    def test_requires_models(self):
+        """モデル一覧が空ならエラーになることをテスト."""
+        with pytest.raises(ValueError):
+            ModelRouter([])
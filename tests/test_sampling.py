@@ -0,0 +1,198 @@
+"""sampling.pyの単体テスト."""
+from unittest.mock import patch
+import pytest
+from models import (
+    EVALUATION_AXES,
+    AxisScore,
+    ConsolidatedConcernsOutput,
+    EvaluationOutput,
+    RecurringConcern,
+)
+from sampling import (
+    TOTAL_AXIS,
+    aggregate_evaluations,
+    count_verdicts,
+    score_matrix,
+    summarize_scores,
+    _run_sampled_meetings,
+)
+from tests.conftest import FakeRunner
+
+
+def make_evaluation(original, refined, verdict="Go"):
+    """全観点に同じ点数を付けた構造化評価を作る."""
+    return EvaluationOutput(
+        markdown="# 評価レポート",
+        axis_scores=[
+            AxisScore(axis=axis, original=original, refined=refined)
+            for axis in EVALUATION_AXES
+        ],
+        verdict=verdict,
+    )
+
+
+class TestScoreMatrix:
+    """score_matrix関数のテスト."""
+
+    def test_rows_follow_axis_order_with_total(self):
+        """行がEVALUATION_AXES順のスコア＋合計になることをテスト."""
+        matrix = score_matrix([make_evaluation(6, 9), make_evaluation(7, 8)], "refined")
+        assert matrix[0] == [9.0] * len(EVALUATION_AXES) + [90.0]
+        assert matrix[1][-1] == 80.0
+
+    def test_skips_unscored_evaluations(self):
+        """構造化スコアのない評価は行にならないことをテスト."""
+        assert score_matrix([EvaluationOutput(markdown="# 評価")], "original") == []
+
+
+class TestSummarizeScores:
+    """summarize_scores / aggregate_scorecards関数のテスト."""
+
+    def test_single_sample_has_zero_width_interval(self):
+        """サンプル1件では分散0・区間幅0になることをテスト."""
+        stat = summarize_scores([70.0], "合計", "原版")
+        assert stat.mean == 70.0
+        assert stat.variance == 0.0
+        assert stat.ci_low == stat.ci_high == 70.0
+
+    def test_confidence_interval_contains_mean(self):
+        """信頼区間が平均を中心に対称であることをテスト."""
+        stat = summarize_scores([60.0, 64.0, 68.0], "合計", "改訂版")
+        assert stat.mean == pytest.approx(64.0)
+        assert stat.variance == pytest.approx(16.0)
+        # t(2) = 4.303, sd/sqrt(n) = 4/sqrt(3)
+        assert stat.ci_high - stat.mean == pytest.approx(4.303 * 4 / 3 ** 0.5, rel=1e-3)
+        assert stat.mean - stat.ci_low == pytest.approx(stat.ci_high - stat.mean)
+
+    def test_aggregate_skips_missing_axes(self):
+        """観点が欠けたサンプルはその観点の集計から除外されることをテスト."""
+        partial = EvaluationOutput(
+            markdown="# 評価", axis_scores=[AxisScore(axis="シナジー", original=8, refined=9)]
+        )
+        stats = aggregate_evaluations([make_evaluation(6, 8), partial])
+        by_key = {(s.axis, s.version): s for s in stats}
+        assert by_key[("シナジー", "原版")].n == 2
+        assert by_key[("シナジー", "改訂版")].mean == pytest.approx(8.5)
+        assert by_key[("リスク", "原版")].n == 1
+        assert by_key[(TOTAL_AXIS, "改訂版")].mean == pytest.approx(85.0)
+
+    def test_count_verdicts(self):
+        """Go/No-Go判定の件数集計テスト."""
+        evaluations = [
+            make_evaluation(6, 8),
+            make_evaluation(6, 8, "No-Go"),
+            make_evaluation(6, 8),
+        ]
+        evaluations.append(EvaluationOutput(markdown="# 評価"))
+        assert count_verdicts(evaluations) == {"Go": 2, "No-Go": 1, "判定なし": 1}
+
+
+class TestRunSampledMeetings:
+    """_run_sampled_meetings関数のテスト."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        import workflow
+
+        workflow._DIGEST_CACHE.clear()
+        yield
+        workflow._DIGEST_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_samples_run_concurrently_with_shared_digest(
+        self, sample_proposal_text, all_roles
+    ):
+        """サンプルが並行実行され、ダイジェストは1回だけ生成されることをテスト."""
+        runner = FakeRunner(
+            overrides={
+                "Proposal Evaluator": make_evaluation(6, 9),
+                "Concern Consolidator": ConsolidatedConcernsOutput(
+                    concerns=[
+                        RecurringConcern(
+                            concern="市場リスク", sample_count=3, roles=["社長"]
+                        )
+                    ],
+                    summary="市場リスクが一貫して指摘された",
+                ),
+            },
+            delay=0.001,
+        )
+        with patch("workflow.Runner.run", new=runner):
+            sampling = await _run_sampled_meetings(
+                proposal_markdown=sample_proposal_text,
+                samples=3,
+                rounds=1,
+                max_concurrency=3,
+                verbose=False,
+            )
+
+        assert len(sampling.results) == 3
+        assert runner.count("Proposal Digest Writer") == 1
+        assert runner.count("Facilitator") == 3 * len(all_roles)
+        assert runner.in_flight_peak == 3
+        facilitator_prompt = next(
+            p for name, p in runner.calls if name == "Facilitator"
+        )
+        assert "### テスト企画" in facilitator_prompt
+        total = next(
+            s
+            for s in sampling.statistics
+            if s.axis == TOTAL_AXIS and s.version == "改訂版"
+        )
+        assert total.n == 3 and total.mean == 90.0
+        assert sampling.verdicts == {"Go": 3}
+        assert "- [3/3] 市場リスク（社長）" in sampling.report
+        assert "- Go: 3件" in sampling.report
+        consolidation_prompt = next(
+            p for name, p in runner.calls if name == "Concern Consolidator"
+        )
+        assert "## サンプル3" in consolidation_prompt
+        assert "\nサンプル横断で一貫して挙がった懸念点を統合してください。\n\n## サンプル1" in consolidation_prompt
+
+    @pytest.mark.asyncio
+    async def test_invalid_samples(self, sample_proposal_text):
+        """samplesが0の場合はエラーになることをテスト."""
+        with pytest.raises(ValueError):
+            await _run_sampled_meetings(
+                proposal_markdown=sample_proposal_text, samples=0, verbose=False
+            )
+
+    @pytest.mark.asyncio
+    async def test_spill_dir_per_sample(self, sample_proposal_text, tmp_path):
+        """省メモリモードでは各サンプルの発言が別ディレクトリに書き出されることをテスト."""
+        with patch("workflow.Runner.run", new=FakeRunner()):
+            sampling = await _run_sampled_meetings(
+                proposal_markdown=sample_proposal_text,
+                samples=2,
+                rounds=1,
+                verbose=False,
+                spill_dir=tmp_path,
+            )
+        paths = [result.discussion_log_path for result in sampling.results]
+        assert paths == [
+            tmp_path / "sample_01" / "discussion_log.md",
+            tmp_path / "sample_02" / "discussion_log.md",
+        ]
+        assert all(path.exists() for path in paths)
+
+    @pytest.mark.asyncio
+    async def test_time_budget_applies_to_each_sample(self, sample_proposal_text):
+        """時間予算を指定すると各サンプルが縮退モードで予算内に終わることをテスト."""
+        import time
+
+        runner = FakeRunner(delay=0.02)
+        started = time.monotonic()
+        with patch("workflow.Runner.run", new=runner):
+            sampling = await _run_sampled_meetings(
+                proposal_markdown=sample_proposal_text,
+                samples=2,
+                rounds=100,
+                verbose=False,
+                time_budget=1.5,
+            )
+
+        assert time.monotonic() - started < 2.0
+        assert len(sampling.results) == 2
+        assert all("討論を" in result.degradation[0] for result in sampling.results)
+        assert all(result.minutes.startswith("> ⚠️") for result in sampling.results)
+        assert runner.count("Concern Consolidator") == 1
@@ -0,0 +1,91 @@
+"""scheduler.pyのMeetingDeadlineの単体テスト."""
+import pytest
+from scheduler import (
+    DEFAULT_WRITER_RESERVE_RATIO,
+    WRITER_CALLS,
+    WRITER_LATENCY_FACTOR,
+    MeetingDeadline,
+)
+
+
+class FakeClock:
+    """手動で進めるテスト用の時計."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestMeetingDeadline:
+    """MeetingDeadlineのテスト."""
+
+    def test_elapsed_and_remaining(self):
+        """経過時間と残り時間の計算テスト."""
+        clock = FakeClock()
+        deadline = MeetingDeadline(100, clock=clock)
+        clock.advance(30)
+        assert deadline.elapsed() == 30
+        assert deadline.remaining() == 70
+        clock.advance(100)
+        assert deadline.remaining() == 0
+
+    def test_writer_reserve_defaults_to_ratio(self):
+        """計測値がない場合は予算の一定割合を確保することをテスト."""
+        deadline = MeetingDeadline(200, clock=FakeClock())
+        assert deadline.writer_reserve() == pytest.approx(
+            200 * DEFAULT_WRITER_RESERVE_RATIO
+        )
+
+    def test_writer_reserve_grows_with_latency(self):
+        """呼び出しが遅いほど成果物作成用の確保時間が増えることをテスト."""
+        deadline = MeetingDeadline(1000, clock=FakeClock())
+        for latency in [5, 6, 7, 8, 30]:
+            deadline.observe_call(latency)
+        assert deadline.writer_reserve() == pytest.approx(
+            WRITER_CALLS * WRITER_LATENCY_FACTOR * 30
+        )
+
+    def test_writer_reserve_capped_by_budget(self):
+        """確保時間は予算全体を超えないことをテスト."""
+        deadline = MeetingDeadline(60, clock=FakeClock())
+        deadline.observe_call(100)
+        assert deadline.writer_reserve() == 60
+
+    def test_should_stop_debate(self):
+        """次ラウンド分の時間が取れなくなったら打ち切り判定になることをテスト."""
+        clock = FakeClock()
+        deadline = MeetingDeadline(100, clock=clock)
+        deadline.observe_round(20)
+        assert not deadline.should_stop_debate()  # 100 - 20 >= 30
+        clock.advance(55)
+        assert deadline.should_stop_debate()  # 45 - 20 < 30
+
+    def test_call_timeouts(self):
+        """討論・成果物作成のタイムアウト計算テスト."""
+        clock = FakeClock()
+        deadline = MeetingDeadline(100, clock=clock)
+        assert deadline.debate_call_timeout() == pytest.approx(70)
+        clock.advance(60)
+        assert deadline.writer_call_timeout(4) == pytest.approx(10)
+        clock.advance(50)
+        assert deadline.debate_call_timeout() == 0
+
+    def test_degrade_and_notice(self):
+        """縮退理由の記録と注記のテスト."""
+        deadline = MeetingDeadline(90, clock=FakeClock())
+        assert not deadline.degraded
+        deadline.degrade("討論を打ち切りました")
+        assert deadline.degraded
+        notice = deadline.notice()
+        assert "時間予算（90秒）" in notice
+        assert "> - 討論を打ち切りました" in notice
+
+    def test_invalid_budget(self):
+        """0以下の予算はエラーになることをテスト."""
+        with pytest.raises(ValueError):
+            MeetingDeadline(0)
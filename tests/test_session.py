@@ -0,0 +1,113 @@
+"""session.pyのMeetingSessionの単体テスト."""
+import asyncio
+from unittest.mock import patch
+import pytest
+from events import ArtifactReady, MeetingMetrics, TurnFinished, TurnStarted
+from session import MeetingSession
+from tests.conftest import FakeRunner
+from workflow import MeetingResult
+
+
+class TestMeetingSession:
+    """MeetingSessionのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_event_stream_and_result(self, sample_proposal_text, all_roles):
+        """発言・成果物・計測値のイベントが発生順に届き、await で結果を受け取れることをテスト."""
+        runner = FakeRunner()
+        with patch("workflow.Runner.run", new=runner):
+            async with MeetingSession() as session:
+                run = session.start(sample_proposal_text, rounds=1)
+                events = [event async for event in run]
+                result = await run
+
+        assert isinstance(result, MeetingResult)
+        started = [e for e in events if isinstance(e, TurnStarted)]
+        finished = [e for e in events if isinstance(e, TurnFinished)]
+        assert [e.round for e in started] == list(range(1, len(all_roles) + 1))
+        assert [e.speaker for e in finished] == [turn["role"] for turn in result.turns]
+        assert events.index(started[1]) > events.index(finished[0])
+        artifacts = [e for e in events if isinstance(e, ArtifactReady)]
+        assert [e.kind for e in artifacts] == [
+            "minutes",
+            "qa",
+            "refined_proposal",
+            "evaluation",
+        ]
+        assert artifacts[0].markdown == result.minutes
+        assert isinstance(events[-1], MeetingMetrics)
+        assert events[-1].turns == len(result.turns)
+        assert events[-1].calls == len(result.call_records)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_meetings_share_limit(self, sample_proposal_text):
+        """同じセッションの会議が並行して進み、同時実行数の上限を共有することをテスト."""
+        runner = FakeRunner(delay=0.005)
+        with patch("workflow.Runner.run", new=runner):
+            async with MeetingSession(max_concurrency=2) as session:
+                results = await asyncio.gather(
+                    *[session.run(sample_proposal_text, rounds=1) for _ in range(3)]
+                )
+        assert len(results) == 3
+        assert runner.in_flight_peak == 2
+        assert runner.count("Minutes Writer") == 3
+
+    @pytest.mark.asyncio
+    async def test_spill_dir_per_meeting(self, sample_proposal_text, tmp_path):
+        """同じ spill_dir を渡した並行する会議・セッションが別々のディレクトリに書き出すことをテスト."""
+        runner = FakeRunner(delay=0.001)
+        with patch("workflow.Runner.run", new=runner):
+            async with MeetingSession() as first, MeetingSession() as second:
+                runs = [
+                    first.start(sample_proposal_text, rounds=12, spill_dir=tmp_path),
+                    first.start(sample_proposal_text, rounds=12, spill_dir=tmp_path),
+                    second.start(sample_proposal_text, rounds=12, spill_dir=tmp_path),
+                ]
+                results = await asyncio.gather(*runs)
+
+        directories = [tmp_path / f"meeting_{run.run_id}" for run in runs]
+        assert len(set(directories)) == 3
+        for directory, result in zip(directories, results):
+            assert result.discussion_log_path == directory / "discussion_log.md"
+            assert (
+                len((directory / "turns.jsonl").read_bytes().splitlines())
+                == len(result.turns)
+                == 12
+            )
+
+    @pytest.mark.asyncio
+    async def test_failure_raised_from_events_and_await(self, sample_proposal_text):
+        """会議が失敗したらイベントの読み出しと await の両方で例外になることをテスト."""
+        runner = FakeRunner()
+
+        async def failing_runner(agent, prompt, **kwargs):
+            if agent.name == "Minutes Writer":
+                raise RuntimeError("議事録の生成に失敗")
+            return await runner(agent, prompt, **kwargs)
+
+        with patch("workflow.Runner.run", new=failing_runner):
+            async with MeetingSession() as session:
+                run = session.start(sample_proposal_text, rounds=1)
+                events = []
+                with pytest.raises(RuntimeError):
+                    async for event in run:
+                        events.append(event)
+                with pytest.raises(RuntimeError):
+                    await run
+        assert any(isinstance(e, TurnFinished) for e in events)
+        assert not any(isinstance(e, ArtifactReady) for e in events)
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_running_meetings(self, sample_proposal_text):
+        """セッションを閉じると実行中の会議がキャンセルされ、新しい会議は開始できないことをテスト."""
+        runner = FakeRunner(delay=1.0)
+        with patch("workflow.Runner.run", new=runner):
+            session = MeetingSession()
+            run = session.start(sample_proposal_text, rounds=1)
+            await asyncio.sleep(0.01)
+            await session.aclose()
+        assert run.done
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        with pytest.raises(RuntimeError):
+            session.start(sample_proposal_text)
@@ -0,0 +1,161 @@
+"""speculation.pyの単体テスト."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from caller import AgentCaller
+from meeting_agents import create_participant
+from models import FacilitatorDecision, ParticipantResponse
+from speculation import (
+    SPECULATIVE_PROMPT,
+    SpeculationStats,
+    SpeculativeTurn,
+    format_speculation_stats,
+    instruction_match,
+    predict_next_speaker,
+)
+from tests.conftest import FakeRunner
+
+
+def _turn(role, questions=()):
+    return {
+        "role": role,
+        "decision": FacilitatorDecision(
+            next_speaker=role, prompt="ご意見を", rationale="テスト"
+        ),
+        "response": ParticipantResponse(
+            summary=f"{role}の発言", questions=list(questions)
+        ),
+    }
+
+
+class TestPredictNextSpeaker:
+    """predict_next_speaker関数のテスト."""
+
+    def test_first_missing_role_during_coverage(self):
+        """全員発言前は未発言の役割のうち先頭を予測することをテスト."""
+        counts = {"社長": 1, "営業担当役員": 0, "法務の専門家": 0}
+        predicted = predict_next_speaker([_turn("社長")], counts, ["営業担当役員", "法務の専門家"])
+        assert predicted == "営業担当役員"
+
+    def test_role_named_in_question(self):
+        """直前の発言の質問で名前が挙がった役割を優先することをテスト."""
+        counts = {"社長": 2, "営業担当役員": 1, "法務の専門家": 3}
+        turns = [_turn("社長", questions=["法務の専門家の見解は?"])]
+        assert predict_next_speaker(turns, counts, list(counts)) == "法務の専門家"
+
+    def test_least_spoken_excluding_last_speaker(self):
+        """質問がなければ直前の発言者を除いて発言回数の最も少ない役割を予測することをテスト."""
+        counts = {"社長": 1, "営業担当役員": 2, "法務の専門家": 3}
+        assert predict_next_speaker([_turn("社長")], counts, list(counts)) == "営業担当役員"
+        assert predict_next_speaker([], counts, list(counts)) == "社長"
+
+
+class TestInstructionMatch:
+    """instruction_match関数のテスト."""
+
+    def test_generic_instruction_matches(self):
+        """汎用の指示に近い指示は一致とみなすことをテスト."""
+        response = ParticipantResponse(summary="投資回収は3年です")
+        assert instruction_match("役割の観点から見解を述べてください", response) == 1.0
+
+    def test_specific_instruction_covered_by_response(self):
+        """指示の内容が発言に含まれていれば一致度が上がることをテスト."""
+        instruction = "特許の侵害リスクについて"
+        covered = ParticipantResponse(summary="特許の侵害リスクは低い", concerns=["他社特許"])
+        unrelated = ParticipantResponse(summary="売上は伸びる")
+        score = instruction_match(instruction, covered)
+        assert score > instruction_match(instruction, unrelated)
+        assert instruction_match(instruction, unrelated) < 0.5
+
+    def test_empty_instruction(self):
+        """指示が空なら常に一致とみなすことをテスト."""
+        assert instruction_match("", ParticipantResponse(summary="発言")) == 1.0
+
+
+class TestSpeculationStats:
+    """SpeculationStatsのテスト."""
+
+    def test_summary(self):
+        """的中率と集計値をテスト."""
+        stats = SpeculationStats(
+            attempts=4, hits=3, speaker_misses=1, cancelled=1, wasted_tokens=120
+        )
+        assert stats.hit_rate == 0.75
+        assert stats.summary()["hit_rate"] == 0.75
+        assert "3回的中" in format_speculation_stats(stats)
+        assert SpeculationStats().hit_rate == 0.0
+
+
+class TestSpeculativeTurn:
+    """SpeculativeTurnのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_response(self):
+        """発言者と指示が一致すれば投機的な発言を採用し、計測を呼び出し元に加えることをテスト."""
+        runner = FakeRunner(delay=0.01)
+        caller = AgentCaller()
+        stats = SpeculationStats()
+        with patch("caller.Runner.run", new=runner):
+            turn = SpeculativeTurn(caller, create_participant("社長"), "社長", "プロンプト")
+            response = await turn.resolve("社長", SPECULATIVE_PROMPT, stats)
+
+        assert response.summary == "社長の発言"
+        assert stats.hits == 1 and stats.attempts == 1
+        assert [record.agent for record in caller.records] == ["社長"]
+        assert caller.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_speaker_miss_cancels_running_call(self):
+        """発言者が外れたら実行中の呼び出しを取り消すことをテスト."""
+        runner = FakeRunner(delay=10)
+        caller = AgentCaller()
+        stats = SpeculationStats()
+        with patch("caller.Runner.run", new=runner):
+            turn = SpeculativeTurn(caller, create_participant("社長"), "社長", "プロンプト")
+            await asyncio.sleep(0)
+            assert await turn.resolve("営業担当役員", SPECULATIVE_PROMPT, stats) is None
+            await asyncio.sleep(0)
+
+        assert stats.speaker_misses == 1 and stats.cancelled == 1
+        assert turn._task.cancelled()
+        # 取り消した呼び出しも送信済みの入力を無駄として数える
+        assert stats.wasted_tokens == stats.cancelled_tokens > 0
+        assert caller.records == []
+
+    @pytest.mark.asyncio
+    async def test_instruction_miss_counts_wasted_tokens(self):
+        """指示が外れたら発言を捨て、消費トークンを無駄として数えることをテスト."""
+        usage = SimpleNamespace(usage=SimpleNamespace(total_tokens=300))
+
+        async def runner(agent, prompt, **kwargs):
+            result = await FakeRunner()(agent, prompt)
+            result.context_wrapper = usage
+            return result
+
+        caller = AgentCaller()
+        stats = SpeculationStats()
+        with patch("caller.Runner.run", new=runner):
+            turn = SpeculativeTurn(caller, create_participant("社長"), "社長", "プロンプト")
+            assert await turn.resolve("社長", "特許の侵害リスクについて", stats) is None
+
+        assert stats.instruction_misses == 1
+        assert stats.wasted_tokens == 300
+        assert caller.records[-1].tokens == 300
+
+    @pytest.mark.asyncio
+    async def test_failure_falls_back(self):
+        """投機的な呼び出しが失敗しても例外にせず、外れとして扱うことをテスト."""
+
+        async def failing_runner(agent, prompt, **kwargs):
+            raise RuntimeError("API error")
+
+        stats = SpeculationStats()
+        with patch("caller.Runner.run", new=failing_runner):
+            turn = SpeculativeTurn(
+                AgentCaller(), create_participant("社長"), "社長", "プロンプト"
+            )
+            assert await turn.resolve("社長", SPECULATIVE_PROMPT, stats) is None
+        assert stats.failures == 1
@@ -0,0 +1,122 @@
+"""streaming.pyの単体テスト."""
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from models import MinutesOutput, ParticipantResponse, FacilitatorDecision
+from streaming import (
+    ConsoleStream,
+    JsonStringField,
+    StreamTap,
+    stream_field,
+    text_delta,
+)
+
+
+def feed_all(decoder: JsonStringField, text: str, chunk_size: int) -> str:
+    return "".join(
+        decoder.feed(text[idx:idx + chunk_size])
+        for idx in range(0, len(text), chunk_size)
+    )
+
+
+class TestJsonStringField:
+    """JsonStringFieldのテスト."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+    def test_decodes_value_regardless_of_chunking(self, chunk_size):
+        """どこで分割されても値が正しくデコードされることをテスト."""
+        value = '# 議事録\n\n- "合意" 事項\t\\ 🚀 終わり'
+        text = json.dumps({"role": "社長", "markdown": value, "other": "x"})
+        assert feed_all(JsonStringField("markdown"), text, chunk_size) == value
+
+    def test_raw_utf8_and_following_fields_ignored(self):
+        """非ASCII文字をそのまま含むJSONでも、値の終わり以降は出力しないことをテスト."""
+        text = json.dumps({"summary": "売上を重視", "concerns": ["市場"]}, ensure_ascii=False)
+        decoder = JsonStringField("summary")
+        assert feed_all(decoder, text, 4) == "売上を重視"
+        assert decoder.done
+
+    def test_missing_field(self):
+        """フィールドがない場合は何も出力しないことをテスト."""
+        assert feed_all(JsonStringField("markdown"), '{"summary": "a"}', 3) == ""
+
+
+class TestHelpers:
+    """補助関数のテスト."""
+
+    def test_text_delta(self):
+        """出力テキストの差分イベントだけから文字列を取り出すことをテスト."""
+        delta = SimpleNamespace(
+            type="raw_response_event",
+            data=SimpleNamespace(type="response.output_text.delta", delta="abc"),
+        )
+        other = SimpleNamespace(
+            type="raw_response_event", data=SimpleNamespace(type="response.created")
+        )
+        assert text_delta(delta) == "abc"
+        assert text_delta(other) == ""
+        assert text_delta(SimpleNamespace(type="run_item_stream_event")) == ""
+
+    def test_stream_field(self):
+        """出力型ごとに表示するフィールドが選ばれることをテスト."""
+        assert stream_field(MinutesOutput) == "markdown"
+        assert stream_field(ParticipantResponse) == "summary"
+        assert stream_field(FacilitatorDecision) is None
+
+
+class TestStreamTap:
+    """StreamTapのテスト."""
+
+    def test_console_and_file_written_progressively(self, tmp_path):
+        """部分出力がコンソールとファイルに逐次書き出されることをテスト."""
+        out = io.StringIO()
+        path = tmp_path / "minutes.md"
+        tap = StreamTap(
+            "Minutes Writer", "markdown", console=ConsoleStream(out), path=path
+        )
+        tap.feed('{"markdown": "# 議')
+        assert path.read_text(encoding="utf-8") == "# 議"
+        tap.feed('事録"}')
+        tap.close()
+        assert path.read_text(encoding="utf-8") == "# 議事録"
+        assert out.getvalue() == "\n✍️  Minutes Writer: # 議事録\n"
+
+    def test_timings(self):
+        """最初/最後のトークンまでの時間が計測されることをテスト."""
+        tap = StreamTap("社長", None)
+        assert tap.timings(0.0) == (None, None)
+        tap.feed("{")
+        tap.feed("}")
+        ttft, ttlt = tap.timings(tap.first_token_at - 1.0)
+        assert ttft == pytest.approx(1.0)
+        assert ttlt >= ttft
+
+    def test_restart_discards_partial_output(self, tmp_path):
+        """再試行時に途中までのファイルと計測が破棄されることをテスト."""
+        path = tmp_path / "qa.md"
+        tap = StreamTap("Q&A Writer", "markdown", path=path)
+        tap.feed('{"markdown": "途中')
+        tap.restart()
+        assert not path.exists()
+        assert tap.first_token_at is None
+        tap.feed('{"markdown": "やり直し"}')
+        tap.close()
+        assert path.read_text(encoding="utf-8") == "やり直し"
+
+
+class TestConsoleStream:
+    """ConsoleStreamのテスト."""
+
+    def test_header_when_label_changes(self):
+        """表示中の呼び出しが替わると見出しが付くことをテスト."""
+        out = io.StringIO()
+        console = ConsoleStream(out)
+        console.write("A", "1")
+        console.write("A", "2")
+        console.write("B", "x")
+        console.end("A")
+        console.end("B")
+        assert out.getvalue() == "\n✍️  A: 12\n✍️  B: x\n"
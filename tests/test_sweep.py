@@ -0,0 +1,110 @@
+"""sweep.pyの単体テスト."""
+from unittest.mock import patch
+import pytest
+from sweep import SweepVariant, _run_sweep, shared_prefix_end, sweep_variants
+from tests.conftest import FakeRunner
+
+
+class TestSweepVariants:
+    """sweep_variants関数のテスト."""
+
+    def test_product_without_duplicates(self):
+        """rounds × context_turns の組み合わせが重複なく指定順に並ぶことをテスト."""
+        variants = sweep_variants([8, 12, 8], [4, 6])
+        assert variants == [
+            SweepVariant(8, 4),
+            SweepVariant(8, 6),
+            SweepVariant(12, 4),
+            SweepVariant(12, 6),
+        ]
+        assert variants[0].label == "rounds_8_context_4"
+
+    def test_invalid_values(self):
+        """不正な rounds・context_turns でエラーになることをテスト."""
+        with pytest.raises(ValueError):
+            sweep_variants([0], [6])
+        with pytest.raises(ValueError):
+            sweep_variants([12], [-1])
+
+
+class TestSharedPrefixEnd:
+    """shared_prefix_end関数のテスト."""
+
+    def test_same_context_shares_until_shortest(self):
+        """context_turns が同じなら短い方の討論が終わるまで共通になることをテスト."""
+        assert (
+            shared_prefix_end([SweepVariant(10, 6), SweepVariant(14, 6)], role_count=9)
+            == 10
+        )
+
+    def test_different_context_diverges_after_smallest_window(self):
+        """context_turns が異なると最小の context_turns + 1 発言まで共通になることをテスト."""
+        assert (
+            shared_prefix_end([SweepVariant(12, 2), SweepVariant(12, 4)], role_count=9)
+            == 3
+        )
+        assert (
+            shared_prefix_end([SweepVariant(12, 0), SweepVariant(12, 4)], role_count=9)
+            == 1
+        )
+
+    def test_rounds_below_role_count(self):
+        """rounds が参加者数未満でも全員が発言するまでは共通になることをテスト."""
+        assert (
+            shared_prefix_end([SweepVariant(1, 6), SweepVariant(3, 6)], role_count=9)
+            == 9
+        )
+
+
+class TestRunSweep:
+    """_run_sweep関数のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_prefix_runs_once_and_branches_fork(
+        self, sample_proposal_text, all_roles
+    ):
+        """共通部分の討論は1回だけ実行され、分岐後の発言だけが設定ごとに行われることをテスト."""
+        runner = FakeRunner(delay=0.001)
+        with patch("workflow.Runner.run", new=runner):
+            sweep = await _run_sweep(
+                proposal_markdown=sample_proposal_text,
+                rounds=[9, 12],
+                context_turns=[2, 4],
+                verbose=False,
+            )
+
+        # 共通3ラウンド → context_turns ごとに9ラウンド目まで → rounds=12 の分岐だけ12ラウンド目まで
+        assert runner.count("Facilitator") == 3 + 2 * 6 + 2 * 3
+        assert sweep.debate_calls == 2 * 21
+        assert sweep.independent_debate_calls == 2 * (9 + 9 + 12 + 12)
+        assert [len(result.turns) for result in sweep.results] == [9, 9, 12, 12]
+        assert sweep.shared_turns == {
+            SweepVariant(9, 2): 9,
+            SweepVariant(12, 2): 9,
+            SweepVariant(9, 4): 9,
+            SweepVariant(12, 4): 9,
+        }
+        first, _, _, last = sweep.results
+        assert all(a is b for a, b in zip(first.turns[:3], last.turns[:3]))
+        assert {turn["role"] for turn in first.turns} == set(all_roles)
+        assert runner.count("Minutes Writer") == 4
+        assert len(last.call_records) >= 2 * 12
+        assert "削減: 42回 / 50%" in sweep.report
+        assert "| 12 | 4 | 12 | 9 |" in sweep.report
+
+    @pytest.mark.asyncio
+    async def test_single_variant_matches_plain_meeting(
+        self, sample_proposal_text, all_roles
+    ):
+        """設定が1つなら通常の会議と同じ呼び出し数になることをテスト."""
+        runner = FakeRunner()
+        with patch("workflow.Runner.run", new=runner):
+            sweep = await _run_sweep(
+                proposal_markdown=sample_proposal_text,
+                rounds=[1],
+                context_turns=[6],
+                verbose=False,
+            )
+        assert runner.count("Facilitator") == len(all_roles)
+        assert sweep.debate_calls == sweep.independent_debate_calls
+        assert sweep.shared_turns == {}
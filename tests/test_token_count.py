@@ -0,0 +1,15 @@
+"""token_count.pyの単体テスト."""
+from unittest.mock import patch
+from token_count import estimate_tokens, tokenizer_name
+
+
+class TestEstimateTokens:
+    """estimate_tokens関数のテスト."""
+
+    def test_fallback_estimate(self):
+        """tiktoken が使えない場合は ASCII 4文字・その他1文字を1トークンと数えることをテスト."""
+        with patch("token_count._encoding", return_value=None):
+            assert estimate_tokens("abcdefgh") == 2
+            assert estimate_tokens("経営会議") == 4
+            assert estimate_tokens("") == 0
+            assert tokenizer_name() == "文字種ごとの概算"
@@ -0,0 +1,112 @@
+"""tracing.pyの単体テスト."""
+import json
+from unittest.mock import patch
+import pytest
+from meeting_agents import REFINED_PROPOSAL_SECTIONS
+from tests.conftest import FakeRunner
+from tracing import TraceRecorder
+from workflow import _run_meeting
+
+
+def overlaps(a, b):
+    return a.start < b.end and b.start < a.end
+
+
+class TestTraceRecorder:
+    """TraceRecorderクラスのテスト."""
+
+    def test_concurrent_spans_go_to_separate_lanes(self):
+        """重なる区間は別レーン、入れ子の区間と後続の区間は同じレーンに置かれることをテスト."""
+        recorder = TraceRecorder()
+        recorder.add("会議", "meeting", 100.0, 110.0)
+        recorder.add("呼び出しA", "call", 100.0, 103.0)
+        recorder.add("呼び出しB", "call", 101.0, 104.0)
+        recorder.add("呼び出しC", "call", 105.0, 106.0)
+
+        lanes = recorder.lanes()
+        names = [[span.name for span in lane] for lane in lanes]
+        assert names == [["会議", "呼び出しA", "呼び出しC"], ["呼び出しB"]]
+
+    def test_same_start_nests_by_category(self):
+        """開始時刻と終了時刻が同じ区間は、段階の中に呼び出しが入る順で並ぶことをテスト."""
+        recorder = TraceRecorder()
+        recorder.add("Minutes Writer", "call", 5.0, 6.0)
+        recorder.add("議事録", "stage", 5.0, 6.0)
+        assert [span.name for span in recorder.lanes()[0]] == ["議事録", "Minutes Writer"]
+
+    def test_chrome_trace_format(self, tmp_path):
+        """Chrome trace形式（マイクロ秒・完了イベント・スレッド名）で書き出されることをテスト."""
+        recorder = TraceRecorder()
+        recorder.add("Facilitator", "call", 10.0, 10.5, model="gpt-4.1", hedged=None)
+        with recorder.span("議事録", "stage"):
+            pass
+
+        path = recorder.write(tmp_path / "trace.json")
+        trace = json.loads(path.read_text(encoding="utf-8"))
+        complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        call = next(event for event in complete if event["name"] == "Facilitator")
+        assert call == {
+            "name": "Facilitator", "cat": "call", "ph": "X", "ts": 0, "dur": 500000,
+            "pid": 1, "tid": 1, "args": {"model": "gpt-4.1"},
+        }
+        threads = [
+            event for event in trace["traceEvents"] if event["name"] == "thread_name"
+        ]
+        assert [event["tid"] for event in threads] == sorted(
+            {event["tid"] for event in complete}
+        )
+
+    def test_empty_trace(self):
+        """区間がなくてもプロセス名だけのトレースを返すことをテスト."""
+        assert (
+            TraceRecorder().chrome_trace()["traceEvents"][0]["name"] == "process_name"
+        )
+
+
+class TestMeetingTrace:
+    """会議のタイムライン記録のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_meeting_records_rounds_calls_and_stages(
+        self, sample_proposal_text, all_roles
+    ):
+        """ラウンド・エージェント呼び出し・成果物の段階が記録され、並列の段階が重なることをテスト."""
+        runner = FakeRunner(delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=1,
+                verbose=False,
+                section_refine=True,
+                trace=True,
+            )
+
+        spans = result.trace.spans
+        calls = [span for span in spans if span.category == "call"]
+        assert len(calls) == len(result.call_records)
+        rounds = [span for span in spans if span.category == "round"]
+        assert [span.args["speaker"] for span in rounds] == [
+            turn["role"] for turn in result.turns
+        ]
+        stages = {span.name: span for span in spans if span.category == "stage"}
+        assert {"討論", "議事録", "想定問答", "改訂企画書", "評価レポート"} <= set(stages)
+        assert stages["討論"].end <= stages["議事録"].start
+        meeting = next(span for span in spans if span.category == "meeting")
+        assert meeting.args["rounds"] == len(all_roles)
+
+        section_calls = [
+            span for span in calls if span.name.startswith("Section Refiner")
+        ]
+        assert len(section_calls) == len(REFINED_PROPOSAL_SECTIONS)
+        assert all(overlaps(section_calls[0], span) for span in section_calls[1:])
+        lanes = result.trace.lanes()
+        assert len(lanes) >= len(REFINED_PROPOSAL_SECTIONS)
+
+    @pytest.mark.asyncio
+    async def test_not_recorded_by_default(self, sample_proposal_text):
+        """未指定時はタイムラインを記録しないことをテスト."""
+        with patch("workflow.Runner.run", new=FakeRunner()):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text, rounds=1, verbose=False
+            )
+        assert result.trace is None
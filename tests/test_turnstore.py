@@ -0,0 +1,141 @@
+"""turnstore.pyの単体テスト."""
+import pytest
+
+from models import FacilitatorDecision, ParticipantResponse
+from caller import CallRecord
+from turnstore import SpillingCallRecords, SpillingTurnStore
+
+
+def make_turn(idx: int) -> dict:
+    return {
+        "role": "社長",
+        "decision": FacilitatorDecision(
+            next_speaker="社長", prompt=f"指示{idx}", rationale=f"理由{idx}"
+        ),
+        "response": ParticipantResponse(
+            role="社長", summary=f"発言{idx}", concerns=[f"懸念{idx}"]
+        ),
+        "model": "gpt-4.1",
+    }
+
+
+def summaries(turns) -> list:
+    return [turn["response"].summary for turn in turns]
+
+
+def agents(records) -> list:
+    return [record.agent for record in records]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SpillingTurnStore(tmp_path / "turns.jsonl", window=3)
+    for idx in range(10):
+        store.append(make_turn(idx))
+    yield store
+    store.close()
+
+
+class TestSpillingTurnStore:
+    """SpillingTurnStoreのテスト."""
+
+    def test_len_and_file_written(self, store):
+        """追記した発言がすべてファイルに書き出されることをテスト."""
+        assert len(store) == 10
+        assert len(store.path.read_bytes().splitlines()) == 10
+
+    def test_index_from_window_and_disk(self, store):
+        """直近の発言はメモリから、古い発言はファイルから取り出せることをテスト."""
+        assert store[-1]["response"].summary == "発言9"
+        assert store[9] is store[-1]
+        restored = store[2]
+        assert restored["response"].summary == "発言2"
+        assert restored["decision"].rationale == "理由2"
+        assert restored["response"].concerns == ["懸念2"]
+        assert restored["model"] == "gpt-4.1"
+
+    def test_index_out_of_range(self, store):
+        """範囲外のインデックスでIndexErrorになることをテスト."""
+        with pytest.raises(IndexError):
+            store[10]
+        with pytest.raises(IndexError):
+            store[-11]
+
+    def test_slices(self, store):
+        """ウィンドウ内外のスライスが list と同じ結果になることをテスト."""
+        assert summaries(store[-3:]) == ["発言7", "発言8", "発言9"]
+        assert summaries(store[1:4]) == ["発言1", "発言2", "発言3"]
+        assert summaries(store[::4]) == ["発言0", "発言4", "発言8"]
+        assert store[20:] == []
+
+    def test_iteration_in_order(self, store):
+        """反復で全発言が順に得られることをテスト."""
+        assert summaries(store) == [f"発言{idx}" for idx in range(10)]
+
+    def test_empty_store(self, tmp_path):
+        """空のストアの振る舞いをテスト."""
+        store = SpillingTurnStore(tmp_path / "empty" / "turns.jsonl")
+        assert len(store) == 0
+        assert list(store) == []
+        assert store[-6:] == []
+        store.close()
+
+    def test_invalid_window(self, tmp_path):
+        """window が1未満の場合にValueErrorになることをテスト."""
+        with pytest.raises(ValueError):
+            SpillingTurnStore(tmp_path / "turns.jsonl", window=0)
+
+    def test_group_round_trip(self, tmp_path):
+        """部会名が書き出し・読み込みで保持されることをテスト."""
+        store = SpillingTurnStore(tmp_path / "turns.jsonl", window=1)
+        turn = make_turn(0)
+        turn["group"] = "製造部会"
+        store.append(turn)
+        store.append(make_turn(1))
+        assert store[0]["group"] == "製造部会"
+        assert "group" not in list(store)[1]
+        store.close()
+
+
+class TestSpillingCallRecords:
+    """SpillingCallRecordsのテスト."""
+
+    def test_records_spilled_and_read_back(self, tmp_path):
+        """計測記録がファイルに書き出され、直近以外はファイルから読み出せることをテスト."""
+        records = SpillingCallRecords(tmp_path / "calls.jsonl", window=2)
+        records.extend(
+            CallRecord(f"agent{idx}", float(idx), 0.5, model="gpt-4.1", tokens=idx)
+            for idx in range(5)
+        )
+
+        assert len(records) == 5
+        assert len(records._window) == 2
+        assert records[-1].agent == "agent4"
+        assert records[1] == CallRecord("agent1", 1.0, 0.5, model="gpt-4.1", tokens=1)
+        assert agents(records) == [f"agent{idx}" for idx in range(5)]
+        assert [record.tokens for record in records[1:3]] == [1, 2]
+
+    def test_append_after_close(self, tmp_path):
+        """閉じた後に追記した記録もファイルに加わることをテスト."""
+        records = SpillingCallRecords(tmp_path / "calls.jsonl")
+        records.append(CallRecord("Facilitator", 0.0, 1.0))
+        records.close()
+        records.append(CallRecord("Proposal Evaluator", 1.0, 1.0))
+        records.close()
+
+        assert agents(records) == ["Facilitator", "Proposal Evaluator"]
+        with pytest.raises(IndexError):
+            records[2]
+        assert records[0].agent == "Facilitator"
+
+    def test_index_reads_single_line(self, tmp_path, monkeypatch):
+        """ファイル上の記録へのインデックス参照が先頭から読み直さずに済むことをテスト."""
+        records = SpillingCallRecords(tmp_path / "calls.jsonl", window=2)
+        records.extend(CallRecord(f"agent{idx}", float(idx), 0.5) for idx in range(6))
+        monkeypatch.setattr(
+            SpillingCallRecords, "__iter__", lambda self: pytest.fail("全件を読み直した")
+        )
+
+        assert records[3].agent == "agent3"
+        assert agents(records[1:5]) == ["agent1", "agent2", "agent3", "agent4"]
+        assert agents(records[::2]) == ["agent0", "agent2", "agent4"]
@@ -0,0 +1,187 @@
+"""validation.pyの単体テスト."""
+from unittest.mock import patch
+
+import pytest
+
+from caller import AgentCaller
+from meeting_agents import MIN_QA_QUESTIONS, MINUTES_SECTIONS, REFINED_PROPOSAL_SECTIONS
+from models import ArtifactSection, QAOutput, SectionRepairOutput
+from tests.conftest import FakeRunner
+from validation import (
+    MAX_REPAIR_ATTEMPTS,
+    QA_SUPPLEMENT_HEADING,
+    check_artifact,
+    count_questions,
+    merge_questions,
+    merge_sections,
+    missing_sections,
+    repair_artifact,
+)
+
+
+def _questions(count, start=1):
+    return "\n".join(
+        f"Q{number}: 質問{number}\nA{number}: 回答{number}"
+        for number in range(start, start + count)
+    )
+
+
+class TestCheckArtifact:
+    """成果物の検証のテスト."""
+
+    def test_minutes_missing_sections(self):
+        """欠けている議事録の必須見出しを記載順に返すことをテスト."""
+        markdown = "# 議事録\n\n## 1. 会議概要\n概要\n\n## 主な論点\n論点\n\n### **次のアクション**\n- 対応\n"
+        check = check_artifact("minutes", markdown)
+        assert check.missing_sections == ["参加者", "合意事項", "未決事項"]
+        assert not check.ok
+        assert "議事録の見出し不足: 参加者、合意事項、未決事項" == check.describe()
+
+    def test_heading_variants_are_accepted(self):
+        """番号・半角括弧・装飾の付いた見出しも必須見出しとして認めることをテスト."""
+        markdown = "\n".join(
+            f"## {idx}. **{heading}**"
+            for idx, heading in enumerate(REFINED_PROPOSAL_SECTIONS, 1)
+        )
+        markdown = markdown.replace("（フェーズ）", "(フェーズ)")
+        assert check_artifact("refined_proposal", markdown).ok
+        # 本文中に見出しの語があるだけでは認めない
+        assert missing_sections("会議概要は以下のとおり", ["会議概要"]) == ["会議概要"]
+
+    def test_count_questions(self):
+        """さまざまな書き方の質問の行を数えることをテスト."""
+        markdown = (
+            "Q: 一\nA: 答\n- Q1. 二\n**Q2:** 三\n### Q3．四\n1. Q: 五\n"
+            "Ｑ６：六\nQuestion: 数えない\n"
+        )
+        assert count_questions(markdown) == 6
+
+    def test_qa_missing_questions(self):
+        """想定問答集の不足問数を返すことをテスト."""
+        assert (
+            check_artifact("qa", _questions(5)).missing_questions
+            == MIN_QA_QUESTIONS - 5
+        )
+        assert check_artifact("qa", _questions(MIN_QA_QUESTIONS)).ok
+
+
+class TestMerge:
+    """不足分を本文に加える関数のテスト."""
+
+    def test_merge_sections_in_required_order(self):
+        """補った見出しを記載順の位置に、既存の見出しと同じ階層で差し込むことをテスト."""
+        markdown = "# 議事録\n\n### 会議概要\n概要\n\n### 主な論点\n論点\n"
+        sections = {"参加者": "- 社長", "次のアクション": "### 次のアクション\n- 対応", "合意事項": "合意"}
+        merged = merge_sections(markdown, sections, MINUTES_SECTIONS)
+
+        headings = [line for line in merged.splitlines() if line.startswith("#")]
+        assert headings == [
+            "# 議事録",
+            "### 会議概要",
+            "### 参加者",
+            "### 主な論点",
+            "### 合意事項",
+            "### 次のアクション",
+        ]
+        assert "概要\n\n### 参加者\n\n- 社長" in merged
+        assert missing_sections(merged, MINUTES_SECTIONS) == ["未決事項"]
+
+    def test_merge_questions(self):
+        """補った質疑応答を既存の本文の後に、補った側の見出しを除いて加えることをテスト."""
+        merged = merge_questions(
+            "# 想定問答集\n\n" + _questions(2), "# 追加分\n" + _questions(3, start=3)
+        )
+        assert merged.startswith("# 想定問答集\n\nQ1: 質問1")
+        assert f"## {QA_SUPPLEMENT_HEADING}\n\nQ3: 質問3" in merged
+        assert "追加分" not in merged
+        assert count_questions(merged) == 5
+
+    def test_merge_questions_twice_reuses_section(self):
+        """2回目に補った質疑応答は既存の追加分の節の末尾に加え、見出しを重複させないことをテスト."""
+        first = merge_questions("# 想定問答集\n\n" + _questions(2), _questions(2, start=3))
+        second = merge_questions(first, "## 追加分\n" + _questions(2, start=5))
+
+        assert second.count(QA_SUPPLEMENT_HEADING) == 1
+        assert count_questions(second) == 6
+        assert second.index("Q4: 質問4") < second.index("Q5: 質問5")
+        assert second.rstrip().endswith("A6: 回答6")
+
+    def test_merge_questions_keeps_following_sections(self):
+        """追加分の節の後に別の見出しがあれば、その前に加えることをテスト."""
+        markdown = (
+            f"# 想定問答集\n\n{_questions(1)}\n\n"
+            f"## {QA_SUPPLEMENT_HEADING}\n\n{_questions(1, start=2)}\n\n"
+            "## 補足\n注記\n"
+        )
+        merged = merge_questions(markdown, _questions(1, start=3))
+
+        assert merged.count(QA_SUPPLEMENT_HEADING) == 1
+        assert merged.index("Q3: 質問3") < merged.index("## 補足")
+        assert merged.rstrip().endswith("注記")
+
+
+class TestRepairArtifact:
+    """repair_artifact関数のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_repairs_only_missing_sections(self):
+        """欠けている見出しだけを1回の呼び出しで作成して加えることをテスト."""
+        runner = FakeRunner()
+        caller = AgentCaller()
+        markdown = "# 議事録\n\n## 会議概要\n既存の概要\n\n## 参加者\n- 社長\n\n## 主な論点\n論点\n"
+        with patch("caller.Runner.run", new=runner):
+            repaired, calls = await repair_artifact(
+                caller, "minutes", markdown, "## 討論ログ\nログ"
+            )
+
+        assert calls == 1
+        assert check_artifact("minutes", repaired).ok
+        assert "既存の概要" in repaired
+        assert "会議概要の本文" not in repaired  # 既存の見出しは書き換えない
+        assert "合意事項の本文" in repaired
+        name, prompt = runner.calls[0]
+        assert name == "Section Repairer（議事録）"
+        assert "次の見出しがありません: 合意事項、未決事項、次のアクション" in prompt
+        assert "## 討論ログ\nログ" in prompt
+
+    @pytest.mark.asyncio
+    async def test_adds_missing_questions(self):
+        """不足した問数だけを依頼し、追加の質疑応答を加えることをテスト."""
+        runner = FakeRunner(
+            overrides={"Q&A Supplementer": QAOutput(markdown=_questions(7, start=6))}
+        )
+        with patch("caller.Runner.run", new=runner):
+            repaired, calls = await repair_artifact(
+                AgentCaller(), "qa", _questions(5), "## 討論ログ"
+            )
+
+        assert calls == 1
+        assert count_questions(repaired) == MIN_QA_QUESTIONS
+        assert f"{MIN_QA_QUESTIONS}問に7問足りません" in runner.calls[0][1]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """補っても不足が残る場合は上限回数で諦めて、補えた分だけを返すことをテスト."""
+        partial = SectionRepairOutput(
+            sections=[ArtifactSection(heading="合意事項", markdown="合意")]
+        )
+        runner = FakeRunner(overrides={"Section Repairer（議事録）": partial})
+        with patch("caller.Runner.run", new=runner):
+            repaired, calls = await repair_artifact(
+                AgentCaller(), "minutes", "## 会議概要\n概要", ""
+            )
+
+        assert calls == MAX_REPAIR_ATTEMPTS
+        assert repaired.count("## 合意事項") == 1
+        assert not check_artifact("minutes", repaired).ok
+
+    @pytest.mark.asyncio
+    async def test_valid_output_is_not_repaired(self):
+        """検証に通る成果物は呼び出しを行わないことをテスト."""
+        runner = FakeRunner()
+        with patch("caller.Runner.run", new=runner):
+            repaired, calls = await repair_artifact(
+                AgentCaller(), "qa", _questions(MIN_QA_QUESTIONS), ""
+            )
+        assert calls == 0 and runner.calls == []
+        assert repaired == _questions(MIN_QA_QUESTIONS)
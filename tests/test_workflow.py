@@ -1,7 +1,9 @@
 """workflow.pyの単体テスト."""
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
+from caller import AgentCaller
 from workflow import _format_turns, run_board_meeting
 from models import FacilitatorDecision, ParticipantResponse
 
@@ -292,3 +294,1779 @@ class TestWorkflowEdgeCases:
         assert "第一段落" in result
         assert "第二段落" in result
         assert "第三段落" in result
+
+
+class TestRenderDiscussionLog:
+    """_render_discussion_log関数のテスト."""
+
+    def test_contains_rounds_and_counts(self, sample_turns_data):
+        """ラウンド見出しと発言回数が含まれることをテスト."""
+        from workflow import _render_discussion_log
+
+        roles = ["社長", "営業担当役員"]
+        result = _render_discussion_log(
+            sample_turns_data, roles, {"社長": 1, "営業担当役員": 1}
+        )
+        assert result.startswith("# 経営会議 対話履歴")
+        assert "- 討論ラウンド数: 2" in result
+        assert "### ラウンド 1: 社長" in result
+        assert "### ラウンド 2: 営業担当役員" in result
+        assert "- 価格設定が課題" in result
+
+    def test_model_shown_when_recorded(self, sample_turns_data):
+        """発言を生成したモデルが記録されていれば表示されることをテスト."""
+        from workflow import _render_discussion_log
+
+        sample_turns_data[0]["model"] = "gpt-4.1-mini"
+        result = _render_discussion_log(
+            sample_turns_data, ["社長", "営業担当役員"], {"社長": 1, "営業担当役員": 1}
+        )
+        assert result.count("**モデル:**") == 1
+        assert "**モデル:** gpt-4.1-mini" in result
+
+
+class TestRunDebate:
+    """_run_debate関数のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_every_role_speaks(
+        self, sample_proposal_text, fake_runner, all_roles
+    ):
+        """指名が偏っても全員が最低1回発言することをテスト."""
+        from meeting_agents import create_facilitator, create_participant
+        from workflow import _run_debate
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            turns, counts = await _run_debate(
+                proposal_markdown=sample_proposal_text,
+                roles=all_roles,
+                facilitator=create_facilitator(),
+                participants={role: create_participant(role) for role in all_roles},
+                effective_rounds=len(all_roles),
+                context_turns=3,
+                verbose=False,
+                caller=AgentCaller(),
+            )
+
+        assert len(turns) == len(all_roles)
+        assert all(counts[role] == 1 for role in all_roles)
+        assert fake_runner.count("Facilitator") == len(all_roles)
+
+    @pytest.mark.asyncio
+    async def test_opening_statements_run_concurrently(
+        self, sample_proposal_text, all_roles
+    ):
+        """冒頭発言が全員同時に行われ、ファシリテーターは残りのラウンドだけ呼ばれることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import OPENING_STATEMENT_PROMPT, _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=12,
+                verbose=False,
+                opening_statements=True,
+            )
+
+        assert runner.in_flight_peak == len(all_roles)
+        assert runner.count("Facilitator") == 12 - len(all_roles)
+        assert len(result.turns) == 12
+        opening = result.turns[: len(all_roles)]
+        assert [turn["role"] for turn in opening] == all_roles
+        assert all(
+            turn["decision"].prompt == OPENING_STATEMENT_PROMPT for turn in opening
+        )
+        prompts = [prompt for name, prompt in runner.calls if name in all_roles]
+        prompts = prompts[:len(all_roles)]
+        assert all("(まだ発言はありません)" in prompt for prompt in prompts)
+        # 冒頭発言の後の討論は全発言を参照する
+        facilitator_prompt = next(
+            p for name, p in runner.calls if name == "Facilitator"
+        )
+        assert f"{all_roles[-1]}（指名理由: 冒頭発言）" in facilitator_prompt
+        assert len(result.call_records) == len(runner.calls)
+
+    @pytest.mark.asyncio
+    async def test_opening_statement_timeout_stops_debate(self, sample_proposal_text):
+        """冒頭発言が時間予算内に終わらなければ討論を打ち切り、成果物は作成することをテスト."""
+        from scheduler import MeetingDeadline
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner()
+
+        async def hanging_runner(agent, prompt, **kwargs):
+            if agent.name == "社長":
+                await asyncio.sleep(10)
+            return await runner(agent, prompt, **kwargs)
+
+        with patch("workflow.Runner.run", new=hanging_runner):
+            result = await asyncio.wait_for(
+                _run_meeting(
+                    proposal_markdown=sample_proposal_text, rounds=1, verbose=False,
+                    deadline=MeetingDeadline(1.0), opening_statements=True,
+                ),
+                timeout=5,
+            )
+
+        assert result.turns == []
+        assert runner.count("Facilitator") == 0
+        assert any("未発言" in reason for reason in result.degradation)
+        assert runner.count("Minutes Writer") == 1
+
+
+class TestIncrementalDrafts:
+    """討論と並行した議事録・想定問答の下書き更新のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_drafts_updated_during_debate(self, sample_proposal_text):
+        """発言 draft_interval 件ごとに下書きが更新され、最後の下書きがそのまま使われることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=12,
+                verbose=False,
+                draft_interval=4,
+            )
+
+        assert len(result.turns) == 12
+        # ターン4・8・12の時点で更新し、討論後に未反映の発言は残らない
+        assert runner.count("Minutes Writer") == 3
+        assert runner.count("Q&A Writer") == 3
+        minutes_prompts = [
+            prompt for name, prompt in runner.calls if name == "Minutes Writer"
+        ]
+        assert "(まだ下書きはありません)" in minutes_prompts[0]
+        assert "ターン4までを反映済み" in minutes_prompts[1]
+        assert "\n5. " in minutes_prompts[1] and "\n4. " not in minutes_prompts[1]
+        assert "討論はこれで終了" not in minutes_prompts[-1]
+        assert "# Minutes Writer" in result.minutes
+        assert len(result.call_records) == len(runner.calls)
+
+    @pytest.mark.asyncio
+    async def test_remaining_turns_finalized(self, sample_proposal_text):
+        """討論後は下書きに未反映の発言だけを渡して仕上げることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=12,
+                verbose=False,
+                draft_interval=5,
+            )
+
+        qa_prompts = [prompt for name, prompt in runner.calls if name == "Q&A Writer"]
+        assert len(qa_prompts) == 3
+        assert "ターン10までを反映済み" in qa_prompts[-1]
+        assert "\n11. " in qa_prompts[-1] and "\n10. " not in qa_prompts[-1]
+        assert "討論はこれで終了" in qa_prompts[-1]
+        assert "# Q&A Writer" in result.qa
+        assert len(result.call_records) == len(runner.calls)
+
+    @pytest.mark.asyncio
+    async def test_tail_after_debate_shrinks(self, sample_proposal_text):
+        """下書きを使うと最終ラウンドから改訂企画書の完成までの時間が短くなることをテスト."""
+        from events import ArtifactReady, TurnFinished
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        async def tail(draft_interval):
+            times = {}
+
+            def on_event(event):
+                if isinstance(event, TurnFinished):
+                    times["debate"] = time.perf_counter()
+                elif isinstance(event, ArtifactReady):
+                    times[event.kind] = time.perf_counter()
+
+            with patch("workflow.Runner.run", new=FakeRunner(delay=0.05)):
+                await _run_meeting(
+                    proposal_markdown=sample_proposal_text, rounds=9, verbose=False,
+                    on_event=on_event, draft_interval=draft_interval,
+                )
+            assert list(times)[1:] == [
+                "minutes",
+                "qa",
+                "refined_proposal",
+                "evaluation",
+            ]
+            return times["refined_proposal"] - times["debate"]
+
+        baseline = await tail(None)
+        drafted = await tail(3)
+        assert baseline >= 0.15
+        assert drafted < baseline * 0.6
+
+    @pytest.mark.asyncio
+    async def test_finalize_timeout_uses_latest_draft(self, sample_proposal_text):
+        """仕上げが時間予算内に終わらなければ直近の下書きを出力することをテスト."""
+        from scheduler import MeetingDeadline
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner()
+
+        async def hanging_final_runner(agent, prompt, **kwargs):
+            if agent.name == "Minutes Writer" and "討論はこれで終了" in prompt:
+                await asyncio.sleep(10)
+            return await runner(agent, prompt, **kwargs)
+
+        with patch("workflow.Runner.run", new=hanging_final_runner):
+            result = await asyncio.wait_for(
+                _run_meeting(
+                    proposal_markdown=sample_proposal_text, rounds=12, verbose=False,
+                    deadline=MeetingDeadline(1.0), draft_interval=5,
+                ),
+                timeout=5,
+            )
+
+        assert any("ターン10までの下書き" in reason for reason in result.degradation)
+        assert "# Minutes Writer" in result.minutes
+        assert result.artifact_models["minutes"] != "local-fallback"
+        assert runner.count("Proposal Evaluator") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_draft_update_is_finalized(self, sample_proposal_text):
+        """討論中の下書きの更新が失敗しても、それまでの下書きから議事録と想定問答を仕上げることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        failures = []
+
+        async def flaky_runner(agent, prompt, **kwargs):
+            if agent.name not in failures and "ターン4までを反映済み" in prompt:
+                failures.append(agent.name)
+                raise RuntimeError("draft writer down")
+            return await runner(agent, prompt, **kwargs)
+
+        with patch("workflow.Runner.run", new=flaky_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=12,
+                verbose=False,
+                draft_interval=4,
+            )
+
+        assert sorted(failures) == ["Minutes Writer", "Q&A Writer"]
+        assert "# Minutes Writer" in result.minutes
+        assert "# Q&A Writer" in result.qa
+        # 失敗した更新の後は下書きを更新せず、ターン4までの下書きに残りの発言を反映して仕上げる
+        minutes_prompts = [
+            prompt for name, prompt in runner.calls if name == "Minutes Writer"
+        ]
+        final_minutes = minutes_prompts[-1]
+        assert "ターン4までを反映済み" in final_minutes and "討論はこれで終了" in final_minutes
+
+    @pytest.mark.asyncio
+    async def test_draft_records_merged_after_writers(self, sample_proposal_text):
+        """下書きの計測は並行する改訂企画書の作成の後に、議事録・想定問答の順で加えられることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=8,
+                verbose=False,
+                draft_interval=4,
+            )
+
+        agents = [record.agent for record in result.call_records]
+        refiner = agents.index("Proposal Refiner")
+        assert agents[refiner + 1:] == (
+            ["Minutes Writer"] * runner.count("Minutes Writer")
+            + ["Q&A Writer"] * runner.count("Q&A Writer")
+            + ["Proposal Evaluator"]
+        )
+        assert (
+            result.artifact_models["refined_proposal"]
+            == result.call_records[refiner].model
+        )
+        assert len(result.call_records) == len(runner.calls)
+
+    @pytest.mark.asyncio
+    async def test_debate_failure_cancels_drafts(self, sample_proposal_text):
+        """討論が失敗すると実行中の下書きの更新も取り消されることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        cancelled = []
+
+        async def failing_runner(agent, prompt, **kwargs):
+            if agent.name == "Minutes Writer":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(agent.name)
+                    raise
+            if runner.count("Facilitator") == 3:
+                raise RuntimeError("facilitator down")
+            return await runner(agent, prompt, **kwargs)
+
+        with patch("workflow.Runner.run", new=failing_runner):
+            with pytest.raises(RuntimeError):
+                await _run_meeting(
+                    proposal_markdown=sample_proposal_text,
+                    rounds=12,
+                    verbose=False,
+                    draft_interval=1,
+                )
+            await asyncio.sleep(0)
+
+        assert cancelled == ["Minutes Writer"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_draft_interval(self, sample_proposal_text):
+        """draft_interval が1未満ならエラーになることをテスト."""
+        from workflow import _run_meeting
+
+        with pytest.raises(ValueError):
+            await _run_meeting(
+                proposal_markdown=sample_proposal_text, verbose=False, draft_interval=0
+            )
+
+
+class TestSpeculativeExecution:
+    """次の発言者の投機的実行のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_hits_during_coverage_phase(self, sample_proposal_text, all_roles):
+        """全員発言前は予測が当たり、参加者の呼び出しがファシリテーターと並行して1回ずつで済むことをテスト."""
+        from speculation import SPECULATIVE_PROMPT
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        decision = FacilitatorDecision(
+            next_speaker="社長", prompt=SPECULATIVE_PROMPT, rationale="テスト"
+        )
+        runner = FakeRunner(overrides={"Facilitator": decision}, delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=len(all_roles),
+                verbose=False,
+                speculate=True,
+            )
+
+        assert [turn["role"] for turn in result.turns] == all_roles
+        assert result.speculation.hits == len(all_roles)
+        assert result.speculation.hit_rate == 1.0
+        assert sum(runner.count(role) for role in all_roles) == len(all_roles)
+        assert runner.in_flight_peak == 2
+        speculative_prompts = [
+            prompt for name, prompt in runner.calls if name in all_roles
+        ]
+        assert all(SPECULATIVE_PROMPT in prompt for prompt in speculative_prompts)
+        assert len(result.call_records) == len(runner.calls)
+
+    @pytest.mark.asyncio
+    async def test_instruction_miss_recomputes(self, sample_proposal_text, all_roles):
+        """指示が外れた発言は捨てて、指名どおりの指示で発言し直すことをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=len(all_roles),
+                verbose=False,
+                speculate=True,
+            )
+
+        assert result.speculation.instruction_misses == len(all_roles)
+        assert result.speculation.hits == 0
+        assert sum(runner.count(role) for role in all_roles) == 2 * len(all_roles)
+        assert len(result.turns) == len(all_roles)
+        assert len(result.call_records) == len(runner.calls)
+
+    @pytest.mark.asyncio
+    async def test_speaker_miss_cancels(self, sample_proposal_text, all_roles):
+        """予測した発言者が外れた場合は実行中の発言を取り消すことをテスト."""
+        from speculation import SPECULATIVE_PROMPT
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        decision = FacilitatorDecision(
+            next_speaker="会計の専門家", prompt=SPECULATIVE_PROMPT, rationale="テスト"
+        )
+        runner = FakeRunner(overrides={"Facilitator": decision})
+
+        async def slow_participants(agent, prompt, **kwargs):
+            await asyncio.sleep(0.05 if agent.name in all_roles else 0.01)
+            return await runner(agent, prompt, **kwargs)
+
+        with patch("workflow.Runner.run", new=slow_participants):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=len(all_roles) + 2,
+                verbose=False,
+                speculate=True,
+            )
+
+        # 1ラウンド目と全員発言後の2ラウンドは社長を予測するが、指名は会計の専門家
+        assert result.speculation.speaker_misses == 3
+        assert result.speculation.cancelled == 3
+        assert result.speculation.hits == len(all_roles) - 1
+        assert result.turns[0]["role"] == "会計の専門家"
+        assert [turn["role"] for turn in result.turns[-2:]] == ["会計の専門家", "会計の専門家"]
+
+    @pytest.mark.asyncio
+    async def test_facilitator_timeout_counts_cancelled(
+        self, sample_proposal_text, all_roles
+    ):
+        """ファシリテーターが時間切れになった場合も、取り消した投機的な発言を集計に含めることをテスト."""
+        from scheduler import MeetingDeadline
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner()
+        facilitator_calls = []
+
+        async def hanging_facilitator(agent, prompt, **kwargs):
+            if agent.name == "Facilitator":
+                facilitator_calls.append(prompt)
+            # 3ラウンド目はファシリテーターも投機的な発言も時間予算内に終わらない
+            if len(facilitator_calls) >= 3:
+                await asyncio.sleep(10)
+            return await runner(agent, prompt, **kwargs)
+
+        with patch("workflow.Runner.run", new=hanging_facilitator):
+            result = await asyncio.wait_for(
+                _run_meeting(
+                    proposal_markdown=sample_proposal_text,
+                    rounds=len(all_roles),
+                    verbose=False,
+                    deadline=MeetingDeadline(2.0),
+                    speculate=True,
+                ),
+                timeout=10,
+            )
+
+        assert len(result.turns) == 2
+        assert result.speculation.cancelled == 1
+        assert (
+            result.speculation.wasted_tokens == result.speculation.cancelled_tokens > 0
+        )
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, sample_proposal_text, fake_runner):
+        """未指定時は投機的実行を行わないことをテスト."""
+        from workflow import _run_meeting
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text, rounds=1, verbose=False
+            )
+        assert result.speculation is None
+
+
+class TestCompactContext:
+    """発言履歴の簡潔な形式（context_format="compact"）のテスト."""
+
+    def test_compact_format(self, sample_turns_data):
+        """凡例を1回だけ付け、指名理由を省き、懸念・提案・質問を発言番号つきのIDで並べることをテスト."""
+        from workflow import COMPACT_LEGEND, _format_context
+
+        result = _format_context(sample_turns_data, "compact")
+        assert result.startswith(COMPACT_LEGEND)
+        assert result.count(COMPACT_LEGEND) == 1
+        assert "#1 社長 >全社視点での見解をお聞かせください" in result
+        assert "C1.1 市場リスクの詳細が不明" in result
+        assert "P2.1 市場調査を実施" in result
+        assert "Q1.1 営業担当の見解は?" in result
+        assert "最初の発言として" not in result
+        assert len(result) < len(_format_turns(sample_turns_data))
+
+    def test_compact_format_without_instruction(self, sample_turns_data):
+        """include_instruction が False ならファシリテーターの指示を省くことをテスト."""
+        from workflow import _format_context
+
+        result = _format_context(
+            sample_turns_data, "compact", start=5, include_instruction=False
+        )
+        assert "#5 社長\n" in result
+        assert "全社視点" not in result
+        assert "C6.1 価格設定が課題" in result
+
+    def test_markdown_is_default(self, sample_turns_data):
+        """未指定時は従来の Markdown 形式と同じであることをテスト."""
+        from workflow import _format_context
+
+        assert _format_context(sample_turns_data) == _format_turns(sample_turns_data)
+        assert _format_context([], "compact") == ""
+
+    @pytest.mark.asyncio
+    async def test_prompts_use_compact_history(
+        self, sample_proposal_text, fake_runner, all_roles
+    ):
+        """ファシリテーターには指示つき、参加者には指示なしの簡潔な履歴を渡すことをテスト."""
+        from workflow import COMPACT_LEGEND, _run_meeting
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=3,
+                verbose=False,
+                context_format="compact",
+            )
+
+        facilitator_prompts = [
+            prompt for name, prompt in fake_runner.calls if name == "Facilitator"
+        ]
+        participant_prompts = [
+            prompt for name, prompt in fake_runner.calls if name in all_roles
+        ]
+        # 全員発言するまで続くため9ターン。直近6件を通し番号（#3〜#8）で渡す
+        assert len(result.turns) == len(all_roles)
+        assert COMPACT_LEGEND in facilitator_prompts[-1]
+        assert f"#8 {all_roles[7]} >ご意見を" in facilitator_prompts[-1]
+        assert "#2 " not in facilitator_prompts[-1]
+        assert f"#3 {all_roles[2]}\nS {all_roles[2]}の発言" in participant_prompts[-1]
+        assert ">ご意見を" not in participant_prompts[-1]
+        assert "（指名理由:" not in facilitator_prompts[-1]
+        # 対話履歴は Markdown のまま
+        assert "**ファシリテーターからの指示:**" in result.discussion_log
+
+    @pytest.mark.asyncio
+    async def test_invalid_format_raises(self, sample_proposal_text):
+        """未知の形式を指定するとエラーになることをテスト."""
+        from workflow import _run_meeting
+
+        with pytest.raises(ValueError):
+            await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                verbose=False,
+                context_format="yaml",
+            )
+
+
+class TestOutputValidation:
+    """成果物の検証と不足分の修復（validate_outputs）のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_repairs_missing_parts(self, sample_proposal_text, all_roles):
+        """見出しや問数の足りない成果物は不足分だけを補い、修復回数を計測値に含めることをテスト."""
+        from events import ArtifactReady, MeetingMetrics
+        from meeting_agents import MIN_QA_QUESTIONS, MINUTES_SECTIONS
+        from models import MinutesOutput, QAOutput
+        from tests.conftest import FakeRunner
+        from validation import check_artifact, count_questions
+        from workflow import _run_meeting
+
+        sections = "".join(f"## {h}\n本文\n\n" for h in MINUTES_SECTIONS[:4])
+        minutes = MinutesOutput(markdown="# 議事録\n\n" + sections)
+        extra = "\n".join(f"Q: 追加{n}\nA: 回答" for n in range(MIN_QA_QUESTIONS))
+        runner = FakeRunner(
+            overrides={
+                "Minutes Writer": minutes,
+                "Q&A Supplementer": QAOutput(markdown=extra),
+            }
+        )
+        events = []
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=len(all_roles),
+                verbose=False,
+                validate_outputs=True,
+                on_event=events.append,
+            )
+
+        assert result.repairs == {"minutes": 1, "qa": 1, "refined_proposal": 1}
+        assert runner.count("Section Repairer（議事録）") == 1
+        assert runner.count("Section Repairer（改訂企画書）") == 1
+        assert runner.count("Q&A Supplementer") == 1
+        assert check_artifact("minutes", result.minutes).ok
+        assert check_artifact("refined_proposal", result.refined_proposal).ok
+        assert count_questions(result.qa) >= MIN_QA_QUESTIONS
+        # 既存の本文は残し、不足分だけを加える
+        assert result.minutes.startswith(minutes.markdown.rstrip())
+        assert "未決事項の本文" in result.minutes
+        assert len(result.call_records) == len(runner.calls)
+        assert (
+            isinstance(events[-1], MeetingMetrics)
+            and events[-1].repairs == result.repairs
+        )
+        ready = {
+            event.kind: event.markdown
+            for event in events
+            if isinstance(event, ArtifactReady)
+        }
+        assert ready["minutes"] == result.minutes
+
+    @pytest.mark.asyncio
+    async def test_repairs_drafted_artifacts(self, sample_proposal_text, all_roles):
+        """逐次下書きと併用しても仕上げた成果物の不足分を補うことをテスト."""
+        from tests.conftest import FakeRunner
+        from validation import check_artifact
+        from workflow import _run_meeting
+
+        runner = FakeRunner(delay=0.001)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=len(all_roles),
+                verbose=False,
+                validate_outputs=True,
+                draft_interval=3,
+            )
+
+        assert result.repairs["minutes"] == 1
+        assert check_artifact("minutes", result.minutes).ok
+        assert len(result.call_records) == len(runner.calls)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, sample_proposal_text, fake_runner):
+        """未指定時は検証・修復を行わないことをテスト."""
+        from workflow import _run_meeting
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text, rounds=1, verbose=False
+            )
+        assert result.repairs == {}
+        assert fake_runner.count("Section Repairer（議事録）") == 0
+
+
+class TestAgendaPlanning:
+    """アジェンダ計画モード（agenda_size）のテスト."""
+
+    async def run_debate(self, runner, roles, agenda_size, rounds=None):
+        from meeting_agents import create_agenda_facilitator, create_participant
+        from workflow import _run_debate
+
+        with patch("workflow.Runner.run", new=runner):
+            return await _run_debate(
+                proposal_markdown="# 企画書",
+                roles=roles,
+                facilitator=create_agenda_facilitator(agenda_size),
+                participants={role: create_participant(role) for role in roles},
+                effective_rounds=rounds or len(roles),
+                context_turns=3,
+                verbose=False,
+                caller=AgentCaller(),
+                agenda_size=agenda_size,
+            )
+
+    @pytest.mark.asyncio
+    async def test_facilitator_calls_reduced(self, fake_runner, all_roles):
+        """ファシリテーターの呼び出しが1/agenda_sizeになることをテスト."""
+        turns, counts = await self.run_debate(fake_runner, all_roles, agenda_size=3)
+        assert len(turns) == len(all_roles)
+        assert all(counts[role] == 1 for role in all_roles)
+        assert fake_runner.count("Facilitator") == 3
+        assert "3人分" in fake_runner.calls[0][1]
+
+    @pytest.mark.asyncio
+    async def test_replans_when_question_targets_unplanned_role(self, all_roles):
+        """予定外の役割への質問が出たらアジェンダを作り直すことをテスト."""
+        from models import ParticipantResponse
+        from tests.conftest import FakeRunner
+
+        question = ParticipantResponse(summary="発言", questions=["会計の専門家の見解は?"])
+        runner = FakeRunner(overrides={"社長": question})
+        turns, _ = await self.run_debate(runner, all_roles, agenda_size=3)
+        # 社長の発言直後に作り直すため、3ターンごとより多く呼ばれる
+        assert runner.count("Facilitator") > 3
+        assert len(turns) == len(all_roles)
+
+    @pytest.mark.asyncio
+    async def test_no_replan_when_question_targets_planned_role(self):
+        """質問先がアジェンダに含まれていれば作り直さないことをテスト."""
+        from models import FacilitatorAgenda, FacilitatorDecision, ParticipantResponse
+        from tests.conftest import FakeRunner
+
+        roles = ["社長", "会計の専門家", "法務の専門家"]
+        agenda = FacilitatorAgenda(
+            next_speaker="社長",
+            prompt="ご意見を",
+            rationale="最初",
+            upcoming=[
+                FacilitatorDecision(
+                    next_speaker="会計の専門家", prompt="収益性は", rationale="数字"
+                ),
+                FacilitatorDecision(
+                    next_speaker="法務の専門家", prompt="規制は", rationale="法務"
+                ),
+            ],
+        )
+        question = ParticipantResponse(summary="発言", questions=["会計の専門家の見解は?"])
+        runner = FakeRunner(overrides={"Facilitator": agenda, "社長": question})
+        turns, _ = await self.run_debate(runner, roles, agenda_size=3)
+        assert runner.count("Facilitator") == 1
+        assert [turn["role"] for turn in turns] == roles
+        assert turns[1]["decision"].prompt == "収益性は"
+
+
+class TestDiscussionDigest:
+    """討論ログの階層的ダイジェストのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_blocks_summarized_then_reduced(self, sample_turns_data, fake_runner):
+        """ブロックごとの要約の後、fan_in件ずつ段階的に統合されることをテスト."""
+        from workflow import _digest_discussion
+
+        turns = sample_turns_data * 10
+        with patch("workflow.Runner.run", new=fake_runner):
+            digest = await _digest_discussion(
+                turns, AgentCaller(), block_size=4, fan_in=3
+            )
+
+        assert fake_runner.count("Discussion Summarizer") == 5
+        # 5件 → 2件（3+2） → 1件
+        assert fake_runner.count("Discussion Digest Reducer") == 3
+        assert digest.summary == "Discussion Digest Reducerによる要約"
+        block_prompts = [
+            prompt
+            for name, prompt in fake_runner.calls
+            if name == "Discussion Summarizer"
+        ]
+        assert any(
+            "ターン17〜20" in prompt and "17. 社長" in prompt
+            for prompt in block_prompts
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_block_not_reduced(self, sample_turns_data, fake_runner):
+        """1ブロックに収まる場合は統合呼び出しを行わないことをテスト."""
+        from workflow import _digest_discussion
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            await _digest_discussion(sample_turns_data, AgentCaller(), block_size=4)
+        assert fake_runner.count("Discussion Summarizer") == 1
+        assert fake_runner.count("Discussion Digest Reducer") == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_without_deadline_propagates(self, sample_proposal_text):
+        """時間予算なしで要約がタイムアウトした場合は、縮退せずに例外を伝えることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner()
+
+        async def timing_out_run(agent, prompt, **kwargs):
+            if agent.name == "Discussion Summarizer":
+                raise asyncio.TimeoutError()
+            return await runner(agent, prompt)
+
+        with patch("workflow.Runner.run", new=timing_out_run):
+            with pytest.raises(asyncio.TimeoutError):
+                await _run_meeting(
+                    proposal_markdown=sample_proposal_text,
+                    rounds=1,
+                    verbose=False,
+                    digest_block_size=2,
+                )
+
+    def test_format_digest_keeps_references(self):
+        """ダイジェストの各項目に役職とターン番号が付くことをテスト."""
+        from models import DiscussionDigest, DiscussionPoint, RolePosition
+        from workflow import _format_discussion_digest
+
+        digest = DiscussionDigest(
+            summary="投資判断を議論した",
+            role_positions=[RolePosition(role="社長", position="段階投資を支持")],
+            concerns=[
+                DiscussionPoint(
+                    point="市場リスク", roles=["社長", "会計の専門家"], turns=[1, 7]
+                )
+            ],
+        )
+        text = _format_discussion_digest(digest, total_turns=40)
+        assert "全40ターン" in text
+        assert "read_discussion_turns" in text
+        assert "- 社長: 段階投資を支持" in text
+        assert "- 市場リスク（社長, 会計の専門家／ターン 1, 7）" in text
+        assert "未解決の質問" not in text
+
+    def test_read_turns_range_and_limit(self, sample_turns_data):
+        """原文参照がターン番号どおりで、件数に上限があることをテスト."""
+        from workflow import MAX_TURNS_PER_LOOKUP, _read_turns
+
+        turns = sample_turns_data * 20
+        text = _read_turns(turns, 3, 4)
+        assert text.startswith("3. 社長")
+        assert "4. 営業担当役員" in text
+        assert "5. " not in text
+        long_text = _read_turns(turns, 1, 40)
+        assert f"{MAX_TURNS_PER_LOOKUP}. " in long_text
+        assert f"{MAX_TURNS_PER_LOOKUP + 1}. " not in long_text
+        assert "該当する発言はありません" in _read_turns(turns, 50, 60)
+
+    @pytest.mark.asyncio
+    async def test_writers_receive_digest(self, sample_proposal_text, fake_runner):
+        """長い討論では成果物作成エージェントに全文ではなくダイジェストが渡ることをテスト."""
+        from workflow import _run_meeting
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=9,
+                verbose=False,
+                digest_block_size=3,
+            )
+
+        assert result.discussion_digest is not None
+        assert fake_runner.count("Discussion Summarizer") == 3
+        for writer in (
+            "Minutes Writer",
+            "Q&A Writer",
+            "Proposal Refiner",
+            "Proposal Evaluator",
+        ):
+            prompt = next(p for name, p in fake_runner.calls if name == writer)
+            assert "Discussion Digest Reducerによる要約" in prompt
+            assert "社長の発言" not in prompt
+        # 対話履歴は従来どおり全文
+        assert "社長の発言" in result.discussion_log
+
+    @pytest.mark.asyncio
+    async def test_short_meeting_uses_raw_log(self, sample_proposal_text, fake_runner):
+        """討論がブロックサイズ以下なら全文を使うことをテスト."""
+        from workflow import _run_meeting
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=9,
+                verbose=False,
+                digest_block_size=20,
+            )
+        assert result.discussion_digest is None
+        assert fake_runner.count("Discussion Summarizer") == 0
+
+    @pytest.mark.asyncio
+    async def test_streaming_reduce_with_bounded_blocks(
+        self, sample_turns_data, fake_runner
+    ):
+        """max_parallel_blocks 指定時にブロックを分割して要約し、逐次統合することをテスト."""
+        from workflow import _digest_discussion
+
+        turns = sample_turns_data * 15
+        with patch("workflow.Runner.run", new=fake_runner):
+            digest = await _digest_discussion(
+                turns, AgentCaller(), block_size=3, fan_in=3, max_parallel_blocks=4
+            )
+
+        # 10ブロック → 3件ずつ逐次統合（3回）→ 2段目の3件を統合（1回）→ 残り2件を統合（1回）
+        assert fake_runner.count("Discussion Summarizer") == 10
+        assert fake_runner.count("Discussion Digest Reducer") == 5
+        assert fake_runner.in_flight_peak <= 4
+        assert digest.summary == "Discussion Digest Reducerによる要約"
+
+
+class TestBoundedMemory:
+    """発言履歴をディスクに書き出す省メモリモードのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_turns_spilled_and_log_written_to_file(
+        self, sample_proposal_text, fake_runner, tmp_path
+    ):
+        """発言履歴と対話履歴がファイルに書き出され、成果物作成にはダイジェストが渡ることをテスト."""
+        from turnstore import SpillingTurnStore
+        from workflow import _run_meeting
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=20,
+                verbose=False,
+                spill_dir=tmp_path,
+            )
+
+        assert isinstance(result.turns, SpillingTurnStore)
+        assert len(result.turns) == 20
+        assert result.discussion_log == ""
+        assert result.discussion_log_path == tmp_path / "discussion_log.md"
+        log = result.discussion_log_path.read_text(encoding="utf-8")
+        assert "### ラウンド 1:" in log
+        assert "### ラウンド 20:" in log
+        assert result.discussion_digest is not None
+        minutes_prompt = next(
+            p for name, p in fake_runner.calls if name == "Minutes Writer"
+        )
+        assert "社長の発言" not in minutes_prompt
+
+    @pytest.mark.asyncio
+    async def test_peak_memory_flat_in_rounds(self, sample_proposal_text, tmp_path):
+        """省メモリモードではラウンド数に対するピークメモリの増加が小さいことをテスト."""
+        import tracemalloc
+        from tests.conftest import FakeRunResult, make_fake_output
+        from workflow import _run_meeting
+
+        async def light_runner(agent, prompt, **kwargs):
+            return FakeRunResult(make_fake_output(agent))
+
+        async def peak(rounds, spill_dir):
+            tracemalloc.start()
+            try:
+                with patch("workflow.Runner.run", new=light_runner):
+                    await _run_meeting(
+                        proposal_markdown=sample_proposal_text,
+                        rounds=rounds,
+                        verbose=False,
+                        digest_block_size=8,
+                        spill_dir=spill_dir,
+                    )
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        in_memory_growth = await peak(250, None) - await peak(50, None)
+        long_peak = await peak(250, tmp_path / "long")
+        spilled_growth = long_peak - await peak(50, tmp_path / "short")
+        assert spilled_growth < in_memory_growth / 3
+
+    @pytest.mark.asyncio
+    async def test_peak_memory_does_not_grow_with_rounds(
+        self, sample_proposal_text, tmp_path
+    ):
+        """省メモリモードでは発言だけでなく呼び出しの計測記録も書き出され、ピークメモリがラウンド数によらないことをテスト."""
+        import tracemalloc
+        from tests.conftest import FakeRunResult, make_fake_output
+        from turnstore import SpillingCallRecords
+        from workflow import _run_meeting
+
+        async def light_runner(agent, prompt, **kwargs):
+            return FakeRunResult(make_fake_output(agent))
+
+        async def run(rounds):
+            spill_dir = tmp_path / f"rounds_{rounds}"
+            tracemalloc.start()
+            try:
+                with patch("workflow.Runner.run", new=light_runner):
+                    result = await _run_meeting(
+                        proposal_markdown=sample_proposal_text,
+                        rounds=rounds,
+                        verbose=False,
+                        digest_block_size=8,
+                        spill_dir=spill_dir,
+                    )
+                return result, tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        short, short_peak = await run(100)
+        long, long_peak = await run(800)
+
+        assert isinstance(long.call_records, SpillingCallRecords)
+        assert len(long.call_records) == len(
+            (tmp_path / "rounds_800" / "calls.jsonl").read_bytes().splitlines()
+        )
+        assert long.call_records[0].agent == "Facilitator"
+        assert [record.agent for record in long.call_records][
+            -1
+        ] == "Proposal Evaluator"
+        # 8倍のラウンド数でもピークはほぼ同じ（ガベージコレクションの時機による揺れを許す）
+        assert long_peak < short_peak * 1.3
+
+
+class TestProposalDigest:
+    """企画書ダイジェストのキャッシュのテスト."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        import workflow
+
+        workflow._DIGEST_CACHE.clear()
+        yield
+        workflow._DIGEST_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_digest_cached_in_process(self, sample_proposal_text, fake_runner):
+        """同一企画書のダイジェストは1回だけ生成されることをテスト."""
+        from meeting_agents import create_digest_writer
+        from workflow import _get_proposal_digest
+
+        writer = create_digest_writer()
+        with patch("workflow.Runner.run", new=fake_runner):
+            first = await _get_proposal_digest(sample_proposal_text, writer)
+            second = await _get_proposal_digest(sample_proposal_text, writer)
+
+        assert first is second
+        assert fake_runner.count("Proposal Digest Writer") == 1
+
+    @pytest.mark.asyncio
+    async def test_digest_cached_on_disk(
+        self, sample_proposal_text, fake_runner, tmp_path
+    ):
+        """ディスクキャッシュがプロセスをまたいで再利用されることをテスト."""
+        import workflow
+        from meeting_agents import create_digest_writer
+        from workflow import _get_proposal_digest
+
+        writer = create_digest_writer()
+        with patch("workflow.Runner.run", new=fake_runner):
+            digest = await _get_proposal_digest(
+                sample_proposal_text, writer, cache_dir=tmp_path
+            )
+            workflow._DIGEST_CACHE.clear()
+            restored = await _get_proposal_digest(
+                sample_proposal_text, writer, cache_dir=tmp_path
+            )
+
+        assert restored == digest
+        assert len(list(tmp_path.glob("*.json"))) == 1
+        assert fake_runner.count("Proposal Digest Writer") == 1
+
+
+class TestRunComparativeMeeting:
+    """_run_comparative_meeting関数のテスト."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        import workflow
+
+        workflow._DIGEST_CACHE.clear()
+        yield
+        workflow._DIGEST_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_single_meeting_for_all_candidates(
+        self, sample_proposal_text, fake_runner, all_roles
+    ):
+        """候補数に関わらず討論は1回分で済むことをテスト."""
+        from workflow import _run_comparative_meeting
+
+        proposals = {
+            "案A": sample_proposal_text,
+            "案B": sample_proposal_text + "\n追加案",
+            "案C": sample_proposal_text + "\n別案",
+        }
+        with patch("workflow.Runner.run", new=fake_runner):
+            minutes, discussion_log, comparison = await _run_comparative_meeting(
+                proposals=proposals, rounds=1, context_turns=2, verbose=False
+            )
+
+        assert fake_runner.count("Proposal Digest Writer") == 3
+        assert fake_runner.count("Facilitator") == len(all_roles)
+        assert fake_runner.count("Comparative Evaluator") == 1
+        assert comparison.startswith("# 比較評価レポート")
+        assert "| 1 | 案A | 80/100 |" in comparison
+        assert "案Aを推奨" in comparison
+        assert "順位が付いていない候補: 案B, 案C" in comparison
+        assert discussion_log.startswith("# 比較経営会議 対話履歴")
+        facilitator_prompt = next(
+            p for name, p in fake_runner.calls if name == "Facilitator"
+        )
+        assert "### 案A: テスト企画" in facilitator_prompt
+        assert "### 案C: テスト企画" in facilitator_prompt
+
+    @pytest.mark.asyncio
+    async def test_on_result_receives_meeting_result(
+        self, sample_proposal_text, fake_runner, all_roles
+    ):
+        """on_result に発言履歴と計測値を含む MeetingResult が渡されることをテスト."""
+        from workflow import _run_comparative_meeting
+
+        results = []
+        with patch("workflow.Runner.run", new=fake_runner):
+            minutes, _, comparison = await _run_comparative_meeting(
+                proposals={
+                    "案A": sample_proposal_text,
+                    "案B": sample_proposal_text + "\n別案",
+                },
+                rounds=1,
+                context_turns=2,
+                verbose=False,
+                on_result=results.append,
+            )
+
+        (result,) = results
+        assert (result.minutes, result.evaluation) == (minutes, comparison)
+        assert len(result.turns) == len(all_roles)
+        assert len(result.call_records) == len(fake_runner.calls)
+        assert set(result.artifact_models) == {"minutes", "evaluation"}
+
+    @pytest.mark.asyncio
+    async def test_requires_two_candidates(self, sample_proposal_text):
+        """候補が1件のみの場合はエラーになることをテスト."""
+        from workflow import _run_comparative_meeting
+
+        with pytest.raises(ValueError):
+            await _run_comparative_meeting(
+                proposals={"案A": sample_proposal_text}, verbose=False
+            )
+
+
+class TestRenderComparisonMarkdown:
+    """_render_comparison_markdown関数のテスト."""
+
+    def test_ranking_table_sorted_by_rank(self):
+        """順位表が構造化された順位から順位順に生成されることをテスト."""
+        from models import CandidateRanking, ComparativeEvaluationOutput
+        from workflow import _render_comparison_markdown
+
+        comparison = ComparativeEvaluationOutput(
+            rankings=[
+                CandidateRanking(
+                    candidate_id="案B", rank=2, score=70, weaknesses=["コスト"]
+                ),
+                CandidateRanking(
+                    candidate_id="案A", rank=1, score=82, strengths=["市場性", "実現性"]
+                ),
+            ],
+            recommendation="案Aを推奨",
+            markdown="# 比較評価",
+        )
+        text = _render_comparison_markdown(comparison, ["案A", "案B"])
+        assert text.startswith("# 比較評価\n\n## 候補の順位")
+        assert text.index("| 1 | 案A | 82/100 | 市場性、実現性 | - |") < text.index(
+            "| 2 | 案B | 70/100 | - | コスト |"
+        )
+        assert "## 推奨案\n\n案Aを推奨" in text
+        assert "不整合" not in text
+
+    def test_mismatched_candidates_reported(self):
+        """順位の漏れ・未知の候補・重複が明記されることをテスト."""
+        from models import CandidateRanking, ComparativeEvaluationOutput
+        from workflow import _render_comparison_markdown
+
+        comparison = ComparativeEvaluationOutput(
+            rankings=[
+                CandidateRanking(candidate_id="案A", rank=1, score=82),
+                CandidateRanking(candidate_id="案A", rank=2, score=80),
+                CandidateRanking(candidate_id="案X", rank=3, score=60),
+            ],
+            recommendation="案Aを推奨",
+            markdown="# 比較評価",
+        )
+        text = _render_comparison_markdown(comparison, ["案A", "案B"])
+        assert "順位が付いていない候補: 案B" in text
+        assert "候補にないID: 案X" in text
+        assert "重複して順位が付いた候補: 案A" in text
+
+
+class TestRenderEvaluationMarkdown:
+    """_render_evaluation_markdown関数のテスト."""
+
+    def test_markdown_only_passthrough(self):
+        """構造化スコアがなければ本文をそのまま返すことをテスト."""
+        from models import EvaluationOutput
+        from workflow import _render_evaluation_markdown
+
+        assert _render_evaluation_markdown(EvaluationOutput(markdown="# 評価")) == "# 評価"
+
+    def test_scorecard_rendered_from_scores(self):
+        """スコアカード表とGo/No-Go判定が構造化スコアから生成されることをテスト."""
+        from models import AxisScore, EvaluationOutput
+        from workflow import _render_evaluation_markdown
+
+        evaluation = EvaluationOutput(
+            markdown="# 評価\n\n## 総合評価\n良好",
+            axis_scores=[
+                AxisScore(axis="リスク", original=6, refined=10, comment="対策が具体化"),
+                AxisScore(axis="シナジー", original=7, refined=8),
+            ],
+            verdict="条件付きGo",
+            verdict_conditions=["PoCで受注率を検証"],
+        )
+        result = _render_evaluation_markdown(evaluation)
+        assert "## 定量的評価スコアカード（100点満点）" in result
+        assert "| リスク | 6/10 | 10/10 | 対策が具体化 |" in result
+        assert "| 売上規模 | - | - | (未採点) |" in result
+        assert "| **合計（100点換算）** | **65** | **90** | |" in result
+        assert "- 判定: **条件付きGo**" in result
+        assert "- PoCで受注率を検証" in result
+
+
+class TestMeetingDeadline:
+    """時間予算つき会議（縮退モード）のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_debate_cut_after_everyone_spoke(
+        self, sample_proposal_text, all_roles
+    ):
+        """予算が不足すると全員発言後に討論が打ち切られることをテスト."""
+        from scheduler import MeetingDeadline
+        from tests.conftest import FakeRunner
+        from tests.test_scheduler import FakeClock
+        from workflow import _run_meeting
+
+        clock = FakeClock()
+        runner = FakeRunner()
+
+        async def slow_runner(agent, prompt, **kwargs):
+            clock.advance(5)
+            return await runner(agent, prompt, **kwargs)
+
+        deadline = MeetingDeadline(200, clock=clock)
+        with patch("workflow.Runner.run", new=slow_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=40,
+                verbose=False,
+                deadline=deadline,
+            )
+
+        # 1ラウンド10秒、成果物用に60秒確保 → 全員(9人)が発言した後、14ラウンドで打ち切り
+        assert len(result.turns) == 14
+        assert len({turn["role"] for turn in result.turns}) == len(all_roles)
+        assert runner.count("Proposal Evaluator") == 1
+        assert result.degradation and "14ラウンドで打ち切り" in result.degradation[0]
+        assert result.minutes.startswith("> ⚠️")
+        assert result.evaluation.startswith("> ⚠️")
+
+    @pytest.mark.asyncio
+    async def test_writer_timeout_falls_back(self, sample_proposal_text):
+        """成果物作成が時間切れでも簡易版が出力されることをテスト."""
+        from scheduler import MeetingDeadline
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner()
+
+        async def hanging_qa_runner(agent, prompt, **kwargs):
+            if agent.name == "Q&A Writer":
+                await asyncio.sleep(10)
+            return await runner(agent, prompt, **kwargs)
+
+        with patch("workflow.Runner.run", new=hanging_qa_runner):
+            result = await asyncio.wait_for(
+                _run_meeting(
+                    proposal_markdown=sample_proposal_text,
+                    rounds=1,
+                    verbose=False,
+                    deadline=MeetingDeadline(0.5),
+                ),
+                timeout=5,
+            )
+
+        assert "# 想定問答集（簡易版）" in result.qa
+        assert any("想定問答" in reason for reason in result.degradation)
+        assert "# Minutes Writer" in result.minutes
+        assert "> ⚠️" in result.discussion_log
+        assert runner.count("Proposal Evaluator") == 1
+        assert result.artifact_models["qa"] == "local-fallback"
+
+    @pytest.mark.asyncio
+    async def test_no_deadline_no_notice(self, sample_proposal_text, fake_runner):
+        """時間予算なしでは注記が付かないことをテスト."""
+        from workflow import _run_meeting
+
+        with patch("workflow.Runner.run", new=fake_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text, rounds=1, verbose=False
+            )
+        assert result.degradation == []
+        assert not result.minutes.startswith(">")
+
+    def test_fallback_artifacts_use_discussion(
+        self, sample_turns_data, sample_proposal_text
+    ):
+        """簡易版の成果物が討論内容から作られることをテスト."""
+        from workflow import _fallback_minutes, _fallback_qa, _fallback_refined_proposal
+
+        minutes = _fallback_minutes(sample_turns_data, ["社長", "営業担当役員"])
+        assert "売上拡大に期待します" in minutes
+        assert "- Q: 営業担当の見解は?（社長）" in _fallback_qa(sample_turns_data)
+        refined = _fallback_refined_proposal(sample_proposal_text, sample_turns_data)
+        assert refined.startswith("# 新規事業企画書")
+        assert "- 市場調査を実施（営業担当役員）" in refined
+
+
+class TestModelFallbackInMeeting:
+    """フォールバックモデル使用時の会議のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_turns_and_artifacts_record_model(self, sample_proposal_text):
+        """各発言と成果物に生成したモデルが記録されることをテスト."""
+        from caller import AgentCaller
+        from resilience import ModelRouter
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner()
+
+        async def degraded_runner(agent, prompt, **kwargs):
+            if agent.model == "primary":
+                raise RuntimeError("primary は障害中")
+            return await runner(agent, prompt, **kwargs)
+
+        router = ModelRouter(["primary", "backup"])
+        with patch("workflow.Runner.run", new=degraded_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=1,
+                verbose=False,
+                caller=AgentCaller(router=router),
+            )
+
+        assert all(turn["model"] == "backup" for turn in result.turns)
+        assert set(result.artifact_models.values()) == {"backup"}
+        assert "**モデル:** backup" in result.discussion_log
+        assert router.summary()["primary"] == "open"
+
+
+class TestHierarchicalMeeting:
+    """部会ごとの討論を並行して行う階層型の会議のテスト."""
+
+    @staticmethod
+    def make_board(group_count: int = 4, members_per_group: int = 5):
+        from board import BoardConfig, RoleGroup
+
+        roles = {"社長": "あなたは社長です。"}
+        groups = []
+        for group_idx in range(1, group_count + 1):
+            members = [
+                f"部会{group_idx}メンバー{member_idx}"
+                for member_idx in range(1, members_per_group + 1)
+            ]
+            roles.update({member: f"あなたは{member}です。" for member in members})
+            groups.append(
+                RoleGroup(name=f"部会{group_idx}", lead=members[0], members=members)
+            )
+        return BoardConfig(roles=roles, groups=groups)
+
+    @pytest.mark.asyncio
+    async def test_groups_run_concurrently_then_plenary(self, sample_proposal_text):
+        """部会が並行して討論し、報告を受けて全体会議が行われることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import GROUP_REPORT_PROMPT, _run_meeting
+
+        board = self.make_board()
+        runner = FakeRunner(delay=0.001)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=5,
+                verbose=False,
+                board=board,
+            )
+
+        # 全員が部会で発言し、部会ごとにリードの報告が1件ずつある
+        spoken = {turn["role"] for turn in result.turns}
+        assert spoken == set(board.roles)
+        reports = [
+            turn
+            for turn in result.turns
+            if turn["decision"].prompt == GROUP_REPORT_PROMPT
+        ]
+        assert [turn["group"] for turn in reports] == ["部会1", "部会2", "部会3", "部会4"]
+        assert [turn["role"] for turn in reports] == [
+            group.lead for group in board.groups
+        ]
+        # 部会は同時に進む
+        assert runner.in_flight_peak >= 4
+        # 全体会議は部会に属さない役割とリードだけで、ラウンド数は rounds
+        plenary = [turn for turn in result.turns if "group" not in turn]
+        assert len(plenary) == 5
+        assert {turn["role"] for turn in plenary} == set(board.plenary_roles())
+        plenary_prompts = [
+            prompt for name, prompt in runner.calls if name == "Facilitator"
+        ]
+        assert plenary_prompts
+        assert all(
+            "部会からの報告" in prompt and "部会1メンバー2" not in prompt
+            for prompt in plenary_prompts
+        )
+        # 並行した部会の呼び出しも会議の計測記録にまとめられる
+        assert len(result.call_records) == len(runner.calls)
+        assert "**部会:** 部会1" in result.discussion_log
+
+    @pytest.mark.asyncio
+    async def test_wall_time_grows_with_groups_not_members(self, sample_proposal_text):
+        """40人の会議でも、部会に分ければ所要時間は部会数に応じた分しかかからないことをテスト."""
+        import time
+        from board import BoardConfig
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        hierarchical = self.make_board(group_count=8, members_per_group=5)
+        flat = BoardConfig(roles=hierarchical.roles)
+
+        async def wall_time(board):
+            started_at = time.perf_counter()
+            with patch("workflow.Runner.run", new=FakeRunner(delay=0.01)):
+                await _run_meeting(
+                    proposal_markdown=sample_proposal_text,
+                    rounds=1,
+                    verbose=False,
+                    board=board,
+                )
+            return time.perf_counter() - started_at
+
+        # 全員が順に発言する構成は約 2×41 回、階層型は部会内 2×5+1 回と全体会議 2×9 回の直列呼び出し
+        flat_time = await wall_time(flat)
+        assert await wall_time(hierarchical) < flat_time * 0.6
+
+    @pytest.mark.asyncio
+    async def test_group_rounds(self, sample_proposal_text, fake_runner):
+        """group_rounds で部会内のラウンド数を指定できることをテスト."""
+        from workflow import _run_meeting
+
+        board = self.make_board(group_count=2, members_per_group=3)
+        with patch("workflow.Runner.run", new=fake_runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=1,
+                verbose=False,
+                board=board,
+                group_rounds=6,
+            )
+        group_turns = [turn for turn in result.turns if turn.get("group") == "部会1"]
+        # 6ラウンド + 報告1件
+        assert len(group_turns) == 7
+
+
+class TestStreamingMeeting:
+    """ストリーミング実行の会議のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_artifacts_streamed_to_files(
+        self, sample_proposal_text, tmp_path, capsys
+    ):
+        """成果物の本文が生成中にファイルへ書き出され、TTFT/TTLTが記録されることをテスト."""
+        from tests.conftest import FakeStreamedRunner
+        from workflow import _run_board_meeting
+
+        runner = FakeStreamedRunner()
+        results = []
+        with patch("workflow.Runner.run_streamed", new=runner):
+            await _run_board_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=1,
+                verbose=True,
+                stream_dir=tmp_path,
+                on_result=results.append,
+            )
+
+        for kind, writer in (
+            ("minutes", "Minutes Writer"),
+            ("qa", "Q&A Writer"),
+            ("refined_proposal", "Proposal Refiner"),
+            ("evaluation", "Proposal Evaluator"),
+        ):
+            assert (tmp_path / f"{kind}.md").read_text(
+                encoding="utf-8"
+            ) == f"# {writer}"
+        assert all(record.ttft is not None for record in results[0].call_records)
+        out = capsys.readouterr().out
+        assert "✍️  社長: 社長の発言" in out
+        assert "⚡ ストリーミング: 最初のトークンまで" in out
+
+
+class TestSectionRefine:
+    """改訂企画書を見出しごとに並列で作成するモードのテスト."""
+
+    @staticmethod
+    def make_turn(role: str, summary: str, concerns=None) -> dict:
+        return {
+            "role": role,
+            "decision": FacilitatorDecision(
+                next_speaker=role, prompt="ご意見を", rationale="テスト"
+            ),
+            "response": ParticipantResponse(summary=summary, concerns=concerns or []),
+        }
+
+    @pytest.mark.asyncio
+    async def test_sections_refined_in_parallel_then_checked(
+        self, sample_proposal_text
+    ):
+        """8つの見出しが並列に改訂され、整合性確認の後に見出し順でまとめられることをテスト."""
+        from meeting_agents import REFINED_PROPOSAL_SECTIONS
+        from tests.conftest import FakeRunner
+        from workflow import LOCAL_FALLBACK_MODEL, _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=1,
+                verbose=False,
+                section_refine=True,
+            )
+
+        assert runner.count("Proposal Refiner") == 0
+        assert runner.in_flight_peak == len(REFINED_PROPOSAL_SECTIONS)
+        names = [name for name, _ in runner.calls]
+        checker_idx = names.index("Consistency Checker")
+        for heading in REFINED_PROPOSAL_SECTIONS:
+            assert names.index(f"Section Refiner（{heading}）") < checker_idx
+        # 評価は見出しごとにまとめた改訂版を受け取る
+        assert names.index("Proposal Evaluator") > checker_idx
+        positions = [
+            result.refined_proposal.index(f"## {heading}\n")
+            for heading in REFINED_PROPOSAL_SECTIONS
+        ]
+        assert positions == sorted(positions)
+        assert result.refined_proposal.startswith("# 新規事業企画書（改訂版）")
+        assert result.artifact_models["refined_proposal"] != LOCAL_FALLBACK_MODEL
+
+    @pytest.mark.asyncio
+    async def test_timeout_without_deadline_propagates(self, sample_proposal_text):
+        """時間予算なしで見出しの改訂がタイムアウトした場合は、例外を伝えることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner()
+
+        async def timing_out_run(agent, prompt, **kwargs):
+            if agent.name.startswith("Section Refiner"):
+                raise asyncio.TimeoutError()
+            return await runner(agent, prompt)
+
+        with patch("workflow.Runner.run", new=timing_out_run):
+            with pytest.raises(asyncio.TimeoutError):
+                await _run_meeting(
+                    proposal_markdown=sample_proposal_text,
+                    rounds=1,
+                    verbose=False,
+                    section_refine=True,
+                )
+
+    @pytest.mark.asyncio
+    async def test_section_prompt_has_only_relevant_turns(self, sample_proposal_text):
+        """各見出しには、その見出しのキーワードを含む発言だけが発言番号付きで渡されることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _refine_by_section
+
+        turns = [
+            self.make_turn("法務の専門家", "特許の出願状況を確認すべきです"),
+            self.make_turn("会計の専門家", "初期投資の回収が不透明です", concerns=["予算超過"]),
+        ]
+        runner = FakeRunner()
+        with patch("workflow.Runner.run", new=runner):
+            await _refine_by_section(sample_proposal_text, turns, AgentCaller())
+
+        prompts = dict(runner.calls)
+        budget_prompt = prompts["Section Refiner（予算と収益見通し）"]
+        assert "2. 会計の専門家" in budget_prompt
+        assert "特許の出願状況" not in budget_prompt
+        assert "1. 法務の専門家" in prompts["Section Refiner（リスクと対策（法務・知財含む））"]
+        assert "(関係する発言はありません)" in prompts["Section Refiner（体制と役割）"]
+
+    @pytest.mark.asyncio
+    async def test_consistency_revisions_applied(self, sample_proposal_text):
+        """整合性確認で書き直された見出しだけが差し替えられることをテスト."""
+        from models import ConsistencyIssue, ConsistencyReview, ProposalSection
+        from tests.conftest import FakeRunner
+        from workflow import LOCAL_FALLBACK_MODEL, _refine_by_section
+
+        review = ConsistencyReview(
+            issues=[
+                ConsistencyIssue(
+                    headings=["予算と収益見通し", "成功指標（KPI）"],
+                    issue="売上目標が一致しない",
+                )
+            ],
+            revised_sections=[
+                ProposalSection(
+                    heading="成功指標（KPI）",
+                    markdown="## 成功指標（KPI）\n\n- 3年目売上3億円",
+                ),
+                ProposalSection(heading="存在しない見出し", markdown="無視される"),
+            ],
+        )
+        runner = FakeRunner(overrides={"Consistency Checker": review})
+        with patch("workflow.Runner.run", new=runner):
+            refined, model = await _refine_by_section(
+                sample_proposal_text, [], AgentCaller()
+            )
+
+        assert "## 成功指標（KPI）\n\n- 3年目売上3億円\n" in refined.markdown
+        assert refined.markdown.count("## 成功指標（KPI）") == 1
+        assert "# Section Refiner（予算と収益見通し）" in refined.markdown
+        assert "無視される" not in refined.markdown
+        assert model != LOCAL_FALLBACK_MODEL
+
+
+class TestAxisEvaluation:
+    """評価観点ごとに並列で採点するモードのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_axes_scored_in_parallel_then_aggregated(self, sample_proposal_text):
+        """9観点が並列に採点され、総合評価の後にスコアカードがまとめられることをテスト."""
+        from models import EVALUATION_AXES
+        from tests.conftest import FakeRunner
+        from workflow import LOCAL_FALLBACK_MODEL, _run_meeting
+
+        runner = FakeRunner(delay=0.01)
+        with patch("workflow.Runner.run", new=runner):
+            result = await _run_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=1,
+                verbose=False,
+                axis_evaluate=True,
+            )
+
+        assert runner.count("Proposal Evaluator") == 0
+        assert runner.in_flight_peak == len(EVALUATION_AXES)
+        names = [name for name, _ in runner.calls]
+        aggregator_idx = names.index("Evaluation Aggregator")
+        for axis in EVALUATION_AXES:
+            assert names.index(f"Axis Evaluator（{axis}）") < aggregator_idx
+        scores = result.evaluation_output.axis_scores
+        assert [score.axis for score in scores] == EVALUATION_AXES
+        assert result.evaluation_output.total_refined == 70
+        assert "| リスク | 5/10 | 7/10 | Axis Evaluator（リスク）の採点 |" in result.evaluation
+        assert result.artifact_models["evaluation"] != LOCAL_FALLBACK_MODEL
+
+    @pytest.mark.asyncio
+    async def test_timeout_without_deadline_propagates(self, sample_proposal_text):
+        """時間予算なしで観点の採点がタイムアウトした場合は、例外を伝えることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _run_meeting
+
+        runner = FakeRunner()
+
+        async def timing_out_run(agent, prompt, **kwargs):
+            if agent.name.startswith("Axis Evaluator"):
+                raise asyncio.TimeoutError()
+            return await runner(agent, prompt)
+
+        with patch("workflow.Runner.run", new=timing_out_run):
+            with pytest.raises(asyncio.TimeoutError):
+                await _run_meeting(
+                    proposal_markdown=sample_proposal_text,
+                    rounds=1,
+                    verbose=False,
+                    axis_evaluate=True,
+                )
+
+    @pytest.mark.asyncio
+    async def test_axis_prompt_has_only_relevant_turns(self, sample_proposal_text):
+        """各観点には、その観点のキーワードを含む発言だけが渡されることをテスト."""
+        from tests.conftest import FakeRunner
+        from workflow import _evaluate_by_axis
+
+        turns = [
+            TestSectionRefine.make_turn("法務の専門家", "特許侵害のリスクがあります"),
+            TestSectionRefine.make_turn("営業担当役員", "初年度の売上は保守的に見るべきです"),
+        ]
+        runner = FakeRunner()
+        with patch("workflow.Runner.run", new=runner):
+            await _evaluate_by_axis(sample_proposal_text, "# 改訂版", turns, AgentCaller())
+
+        prompts = dict(runner.calls)
+        assert "1. 法務の専門家" in prompts["Axis Evaluator（リスク）"]
+        assert "営業担当役員" not in prompts["Axis Evaluator（リスク）"]
+        assert "2. 営業担当役員" in prompts["Axis Evaluator（売上規模）"]
+        assert "リスク: 原版 5/10 → 改訂版 7/10" in prompts["Evaluation Aggregator"]
+
+    def test_rescore_only_selected_axes(self, sample_proposal_text):
+        """指定した観点だけが採点し直され、他の観点のスコアは引き継がれることをテスト."""
+        from models import EVALUATION_AXES, AxisScore, EvaluationOutput
+        from tests.conftest import FakeRunner
+        from workflow import MeetingResult, rescore_axes
+
+        previous = EvaluationOutput(
+            markdown="# 前回の評価",
+            axis_scores=[
+                AxisScore(axis=axis, original=3, refined=3) for axis in EVALUATION_AXES
+            ],
+            verdict="No-Go",
+        )
+        result = MeetingResult(
+            minutes="",
+            qa="",
+            refined_proposal="# 改訂版",
+            discussion_log="",
+            evaluation="",
+            evaluation_output=previous,
+        )
+        runner = FakeRunner()
+        with patch("workflow.Runner.run", new=runner):
+            evaluation = rescore_axes(sample_proposal_text, result, ["リスク"])
+
+        assert [name for name, _ in runner.calls] == [
+            "Axis Evaluator（リスク）",
+            "Evaluation Aggregator",
+        ]
+        by_axis = evaluation.scores_by_axis()
+        assert by_axis["リスク"].refined == 7
+        assert by_axis["売上規模"].refined == 3
+        assert result.evaluation_output is evaluation
+        assert result.evaluation.startswith("# Evaluation Aggregator")
+        assert len(result.call_records) == 2
+
+    def test_rescore_unknown_axis(self, sample_proposal_text):
+        """評価観点でない名前を指定するとValueErrorになることをテスト."""
+        from workflow import MeetingResult, rescore_axes
+
+        result = MeetingResult(
+            minutes="", qa="", refined_proposal="", discussion_log="", evaluation=""
+        )
+        with pytest.raises(ValueError, match="デザイン"):
+            rescore_axes(sample_proposal_text, result, ["デザイン"])
+
+
+class TestSharedHttpPoolMeeting:
+    """共有HTTP接続プールを使う会議のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_all_calls_use_pool_run_config(
+        self, sample_proposal_text, monkeypatch
+    ):
+        """全呼び出しに共有クライアントの run_config が渡され、統計が記録されることをテスト."""
+        from http_pool import HttpPoolConfig
+        from tests.conftest import FakeRunner
+        from workflow import _run_board_meeting
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        runner = FakeRunner()
+        run_configs = []
+
+        async def recording_run(agent, prompt, **kwargs):
+            run_configs.append(kwargs.get("run_config"))
+            return await runner(agent, prompt)
+
+        results = []
+        with patch("workflow.Runner.run", new=recording_run):
+            await _run_board_meeting(
+                proposal_markdown=sample_proposal_text,
+                rounds=1,
+                verbose=False,
+                on_result=results.append,
+                http_pool=HttpPoolConfig(max_connections=4),
+            )
+
+        assert run_configs and run_configs[0] is not None
+        assert all(config is run_configs[0] for config in run_configs)
+        assert results[0].http_pool_stats.requests == 0
+
+    @pytest.mark.asyncio
+    async def test_comparative_meeting_uses_pool(
+        self, sample_proposal_text, monkeypatch
+    ):
+        """比較会議でも全呼び出しに共有クライアントの run_config が渡されることをテスト."""
+        import workflow
+        from http_pool import HttpPoolConfig
+        from tests.conftest import FakeRunner
+        from workflow import _run_comparative_meeting
+
+        workflow._DIGEST_CACHE.clear()
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        runner = FakeRunner()
+        run_configs = []
+
+        async def recording_run(agent, prompt, **kwargs):
+            run_configs.append(kwargs.get("run_config"))
+            return await runner(agent, prompt)
+
+        with patch("workflow.Runner.run", new=recording_run):
+            await _run_comparative_meeting(
+                proposals={
+                    "案A": sample_proposal_text,
+                    "案B": sample_proposal_text + "\n別案",
+                },
+                rounds=1,
+                verbose=False,
+                http_pool=HttpPoolConfig(max_connections=4),
+            )
+        workflow._DIGEST_CACHE.clear()
+
+        assert run_configs and run_configs[0] is not None
+        assert all(config is run_configs[0] for config in run_configs)
@@ -0,0 +1,32 @@
+"""テキストのトークン数のローカルな見積もり（tiktoken があればそれを使い、なければ文字種ごとに概算する）."""
+import math
+from functools import lru_cache
+from typing import Any
+
+try:
+    import tiktoken  # type: ignore[import-not-found]
+except ImportError:  # tiktoken がない環境では文字種ごとの概算を使う
+    tiktoken = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Any:
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:  # エンコーディング定義を取得できない（オフラインなど）場合は概算に切り替える
+        return None
+
+
+def tokenizer_name() -> str:
+    return "tiktoken (o200k_base)" if _encoding() is not None else "文字種ごとの概算"
+
+
+def estimate_tokens(text: str) -> int:
+    """text のトークン数を見積もる（tiktoken がなければ ASCII 4文字・その他1文字を1トークンと数える）."""
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars))
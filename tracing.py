@@ -0,0 +1,137 @@
+"""会議のタイムラインを Chrome trace / Perfetto 形式のJSONとして記録する."""
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# 開始時刻が同じ区間を入れ子にするときの外側からの順
+CATEGORY_ORDER = {"meeting": 0, "stage": 1, "round": 2, "call": 3}
+
+
+@dataclass
+class TraceSpan:
+    """タイムライン上の1区間（時刻は time.time() の秒）."""
+
+    name: str
+    category: str
+    start: float
+    end: float
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class TraceRecorder:
+    """1回の会議の区間（会議全体・討論や成果物作成などの段階・ラウンド・エージェント呼び出し）を記録する.
+
+    並行して進む区間は別のレーン（Chrome trace のスレッド）に振り分けて書き出すため、
+    並列化した段階が実際に重なっているか、どの区間がクリティカルパスになっているかを
+    chrome://tracing や Perfetto UI（https://ui.perfetto.dev）で時系列に確認できる。
+    """
+
+    def __init__(self, name: str = "経営会議"):
+        self.name = name
+        self.spans: List[TraceSpan] = []
+
+    def add(
+        self, name: str, category: str, start: float, end: float, **args: Any
+    ) -> None:
+        self.spans.append(
+            TraceSpan(
+                name,
+                category,
+                start,
+                max(start, end),
+                {k: v for k, v in args.items() if v is not None},
+            )
+        )
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        """with ブロックの実行中を1区間として記録する（例外で抜けた場合も記録する）."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add(name, category, start, time.time(), **args)
+
+    def lanes(self) -> List[List[TraceSpan]]:
+        """区間をレーンに振り分ける.
+
+        同じレーンの区間は重ならないか、完全に入れ子になる（Chrome trace の同一スレッドの制約）。
+        """
+        lanes: List[List[TraceSpan]] = []
+        # レーンごとの、まだ閉じていない区間の終了時刻（外側から順）
+        open_ends: List[List[int]] = []
+        origin = min((span.start for span in self.spans), default=0.0)
+        timed = sorted(
+            (
+                (_micros(span.start - origin), _micros(span.end - origin), span)
+                for span in self.spans
+            ),
+            key=lambda item: (
+                item[0],
+                -item[1],
+                CATEGORY_ORDER.get(item[2].category, len(CATEGORY_ORDER)),
+            ),
+        )
+        for start, end, span in timed:
+            for lane, ends in zip(lanes, open_ends):
+                while ends and ends[-1] <= start:
+                    ends.pop()
+                if not ends or end <= ends[-1]:
+                    lane.append(span)
+                    ends.append(end)
+                    break
+            else:
+                lanes.append([span])
+                open_ends.append([end])
+        return lanes
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace event format（Perfetto でも読み込める）の辞書を返す."""
+        origin = min((span.start for span in self.spans), default=0.0)
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 0,
+                "args": {"name": self.name},
+            }
+        ]
+        for tid, lane in enumerate(self.lanes(), start=1):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": f"レーン {tid}"},
+                }
+            )
+            for span in lane:
+                start = _micros(span.start - origin)
+                events.append({
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": start,
+                    "dur": _micros(span.end - origin) - start,
+                    "pid": 1,
+                    "tid": tid,
+                    "args": span.args,
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> Path:
+        path = Path(path)
+        path.write_text(
+            json.dumps(self.chrome_trace(), ensure_ascii=False, indent=1),
+            encoding="utf-8",
+        )
+        return path
+
+
+def _micros(seconds: float) -> int:
+    return int(round(seconds * 1_000_000))
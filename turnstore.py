@@ -0,0 +1,184 @@
+"""討論の発言履歴をディスクに逐次書き出すストア（長時間の会議向けの省メモリモード）."""
+import json
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, Union, overload
+
+from caller import CallRecord
+from models import FacilitatorDecision, ParticipantResponse
+
+
+def _dump_turn(turn: Dict) -> bytes:
+    record = {
+        "role": turn["role"],
+        "decision": turn["decision"].model_dump(),
+        "response": turn["response"].model_dump(),
+        "model": turn.get("model", ""),
+    }
+    if turn.get("group"):
+        record["group"] = turn["group"]
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _load_turn(line: bytes) -> Dict:
+    record = json.loads(line)
+    turn = {
+        "role": record["role"],
+        "decision": FacilitatorDecision(**record["decision"]),
+        "response": ParticipantResponse(**record["response"]),
+        "model": record.get("model", ""),
+    }
+    if "group" in record:
+        turn["group"] = record["group"]
+    return turn
+
+
+class SpillingTurnStore(Sequence[Dict]):
+    """発言を追記専用のJSON Linesファイルに書き出し、直近 window 件だけをメモリに保持する.
+
+    list と同じくインデックス・スライス・反復で発言を参照でき、直近の発言はメモリから、
+    それより前の発言はファイルから読み出す（反復はファイルを先頭から順に読む）。
+    メモリ上に残るのは直近の発言と、各発言のファイル内位置（1件8バイト）だけである。
+    """
+
+    def __init__(self, path: Path, window: int = 16):
+        if window < 1:
+            raise ValueError("window は1以上を指定してください。")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = open(self.path, "wb")
+        self._offsets = array("q")
+        self._window: Deque[Dict] = deque(maxlen=window)
+
+    def append(self, turn: Dict) -> None:
+        self._offsets.append(self._writer.tell())
+        self._writer.write(_dump_turn(turn))
+        self._writer.flush()
+        self._window.append(turn)
+
+    def close(self) -> None:
+        if not self._writer.closed:
+            self._writer.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _read(self, start: int, count: int) -> List[Dict]:
+        if count <= 0:
+            return []
+        turns = []
+        with open(self.path, "rb") as reader:
+            reader.seek(self._offsets[start])
+            for _ in range(count):
+                turns.append(_load_turn(reader.readline()))
+        return turns
+
+    @overload
+    def __getitem__(self, key: int) -> Dict: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> List[Dict]: ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        window_start = len(self) - len(self._window)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[idx] for idx in range(start, stop, step)]
+            if start >= window_start:
+                return list(self._window)[start - window_start:stop - window_start]
+            return self._read(start, stop - start)
+        index = key + len(self) if key < 0 else key
+        if not 0 <= index < len(self):
+            raise IndexError("発言のインデックスが範囲外です")
+        if index >= window_start:
+            return self._window[index - window_start]
+        return self._read(index, 1)[0]
+
+    def __iter__(self) -> Iterator[Dict]:
+        count = len(self)
+        if count == 0:
+            return
+        with open(self.path, "rb") as reader:
+            for _ in range(count):
+                yield _load_turn(reader.readline())
+
+
+class SpillingCallRecords(Sequence[CallRecord]):
+    """エージェント呼び出しの計測記録（CallRecord）を JSON Lines ファイルに書き出し、直近 window 件だけを保持する.
+
+    AgentCaller.records の代わりに使う。append / extend と直近の記録（records[-1] など）はメモリで、
+    それより前の記録と反復はファイルから読み出す。メモリ上に残るのは直近の記録と、各記録のファイル内位置（1件8バイト）だけである。
+    """
+
+    def __init__(self, path: Path, window: int = 16):
+        if window < 1:
+            raise ValueError("window は1以上を指定してください。")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = open(self.path, "wb")
+        self._offsets = array("q")
+        self._window: Deque[CallRecord] = deque(maxlen=window)
+
+    def append(self, record: CallRecord) -> None:
+        if self._writer.closed:
+            self._writer = open(self.path, "ab")
+        self._offsets.append(self._writer.tell())
+        # asdict は deepcopy の循環参照を1件ごとに残しピークメモリを押し上げるため、フィールドをそのまま書き出す
+        self._writer.write(
+            (json.dumps(vars(record), ensure_ascii=False) + "\n").encode("utf-8")
+        )
+        self._writer.flush()
+        self._window.append(record)
+
+    def extend(self, records: Iterable[CallRecord]) -> None:
+        for record in records:
+            self.append(record)
+
+    def close(self) -> None:
+        if not self._writer.closed:
+            self._writer.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _read(self, start: int, count: int) -> List[CallRecord]:
+        if count <= 0:
+            return []
+        with open(self.path, "rb") as reader:
+            reader.seek(self._offsets[start])
+            return [CallRecord(**json.loads(reader.readline())) for _ in range(count)]
+
+    @overload
+    def __getitem__(self, key: int) -> CallRecord: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> List[CallRecord]: ...
+
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union[CallRecord, List[CallRecord]]:
+        window_start = len(self) - len(self._window)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[idx] for idx in range(start, stop, step)]
+            if start >= window_start:
+                return list(self._window)[start - window_start:stop - window_start]
+            return self._read(start, stop - start)
+        index = key + len(self) if key < 0 else key
+        if not 0 <= index < len(self):
+            raise IndexError("計測記録のインデックスが範囲外です")
+        if index >= window_start:
+            return self._window[index - window_start]
+        return self._read(index, 1)[0]
+
+    def __iter__(self) -> Iterator[CallRecord]:
+        count = len(self)
+        if count == 0:
+            return
+        with open(self.path, "rb") as reader:
+            for _ in range(count):
+                yield CallRecord(**json.loads(reader.readline()))
@@ -0,0 +1,222 @@
+"""成果物（議事録・想定問答集・改訂企画書）の形式のローカル検証と、不足分だけを補う修復."""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+from caller import AgentCaller
+from meeting_agents import (
+    MIN_QA_QUESTIONS,
+    MINUTES_SECTIONS,
+    REFINED_PROPOSAL_SECTIONS,
+    create_qa_supplementer,
+    create_section_repairer,
+)
+from models import QAOutput, SectionRepairOutput
+
+ARTIFACT_LABELS: Dict[str, str] = {
+    "minutes": "議事録",
+    "qa": "想定問答集",
+    "refined_proposal": "改訂企画書",
+}
+# 成果物ごとの必須見出し（記載順）
+REQUIRED_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "minutes": MINUTES_SECTIONS,
+    "refined_proposal": tuple(REFINED_PROPOSAL_SECTIONS),
+}
+# 1つの成果物に対する修復の呼び出し回数の上限（補った後も不足していればもう一度だけ補う）
+MAX_REPAIR_ATTEMPTS = 2
+QA_SUPPLEMENT_HEADING = "追加の想定問答"
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+# 「Q:」「- Q1.」「**Q2:**」「### Q3．」「1. Q:」のような質問の行
+_QUESTION = re.compile(
+    r"^\s*(?:#{1,6}\s+|[-*+]\s+|\d+[.)．]\s*)?(?:\*\*)?[QＱ]\s*\d*\s*(?:\*\*)?\s*[:：.．]"
+)
+_IGNORED_CHARS = re.compile(r"[\s*_`]")
+
+
+def _normalize(text: str) -> str:
+    return _IGNORED_CHARS.sub("", text).replace("(", "（").replace(")", "）")
+
+
+def _find_heading(lines: Sequence[str], heading: str) -> int:
+    """heading を含む見出し行の位置（なければ -1）. 番号や装飾の付いた見出しも認める."""
+    wanted = _normalize(heading)
+    for idx, line in enumerate(lines):
+        match = _HEADING.match(line)
+        if match and wanted in _normalize(match.group(2)):
+            return idx
+    return -1
+
+
+def missing_sections(markdown: str, headings: Sequence[str]) -> List[str]:
+    lines = markdown.splitlines()
+    return [heading for heading in headings if _find_heading(lines, heading) < 0]
+
+
+def count_questions(markdown: str) -> int:
+    return sum(1 for line in markdown.splitlines() if _QUESTION.match(line))
+
+
+@dataclass
+class ArtifactCheck:
+    """成果物の検証結果."""
+
+    kind: str
+    missing_sections: List[str] = field(default_factory=list)
+    missing_questions: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing_sections and self.missing_questions == 0
+
+    def describe(self) -> str:
+        problems = []
+        if self.missing_sections:
+            problems.append(f"見出し不足: {'、'.join(self.missing_sections)}")
+        if self.missing_questions:
+            problems.append(f"質問が{self.missing_questions}問不足")
+        return (
+            f"{ARTIFACT_LABELS[self.kind]}の{' / '.join(problems)}" if problems else ""
+        )
+
+
+def check_artifact(kind: str, markdown: str) -> ArtifactCheck:
+    """kind（minutes / qa / refined_proposal）の必須見出し・最低問数を確認する."""
+    if kind == "qa":
+        return ArtifactCheck(
+            kind, missing_questions=max(0, MIN_QA_QUESTIONS - count_questions(markdown))
+        )
+    return ArtifactCheck(
+        kind, missing_sections=missing_sections(markdown, REQUIRED_SECTIONS[kind])
+    )
+
+
+def _strip_heading(heading: str, body: str) -> str:
+    lines = body.strip().splitlines()
+    if (
+        lines
+        and _HEADING.match(lines[0])
+        and _normalize(heading) in _normalize(lines[0])
+    ):
+        lines = lines[1:]
+    return "\n".join(lines).strip()
+
+
+def merge_sections(
+    markdown: str, sections: Dict[str, str], order: Sequence[str]
+) -> str:
+    """補った見出しを、必須見出しの順序で次に来る既存の見出しの前（なければ末尾）に差し込む."""
+    lines = markdown.rstrip().splitlines()
+    present = [
+        idx for idx in (_find_heading(lines, heading) for heading in order) if idx >= 0
+    ]
+    first = _HEADING.match(lines[present[0]]) if present else None
+    marker = first.group(1) if first else "##"
+    for position in reversed(range(len(order))):
+        heading = order[position]
+        if heading not in sections:
+            continue
+        block = [
+            f"{marker} {heading}",
+            "",
+            _strip_heading(heading, sections[heading]),
+            "",
+        ]
+        following = [
+            idx
+            for idx in (_find_heading(lines, h) for h in order[position + 1:])
+            if idx >= 0
+        ]
+        if following:
+            lines[min(following):min(following)] = block
+        else:
+            lines.extend([""] + block)
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def merge_questions(markdown: str, addition: str) -> str:
+    """補った質疑応答を末尾の見出しの下に加える（補った側が付けた見出し行は除く）.
+
+    すでに追加分の見出しがあれば（2回目の補完など）、新たな見出しは作らずにその節の末尾に加える。
+    """
+    body = "\n".join(
+        line
+        for line in addition.strip().splitlines()
+        if not _HEADING.match(line) or _QUESTION.match(line)
+    )
+    lines = markdown.rstrip().splitlines()
+    start = _find_heading(lines, QA_SUPPLEMENT_HEADING)
+    if start < 0:
+        return f"{markdown.rstrip()}\n\n## {QA_SUPPLEMENT_HEADING}\n\n{body.strip()}\n"
+    heading = _HEADING.match(lines[start])
+    assert heading is not None  # _find_heading は見出し行の位置だけを返す
+    level = len(heading.group(1))
+    end = len(lines)
+    for idx in range(start + 1, len(lines)):
+        match = _HEADING.match(lines[idx])
+        if match and len(match.group(1)) <= level and not _QUESTION.match(lines[idx]):
+            end = idx
+            break
+    section = "\n".join(lines[start:end]).rstrip()
+    merged = (
+        lines[:start]
+        + [f"{section}\n\n{body.strip()}"]
+        + ([""] + lines[end:] if end < len(lines) else [])
+    )
+    return "\n".join(merged).rstrip() + "\n"
+
+
+def _repair_prompt(check: ArtifactCheck, markdown: str, source: str) -> str:
+    label = ARTIFACT_LABELS[check.kind]
+    if check.missing_sections:
+        headings = "、".join(check.missing_sections)
+        request = f"""作成済みの{label}に、次の見出しがありません: {headings}
+討論の内容をもとに、これらの見出しの本文だけを作成してください。"""
+    else:
+        missing = check.missing_questions
+        written = MIN_QA_QUESTIONS - missing
+        request = f"""作成済みの{label}は{written}問で、{MIN_QA_QUESTIONS}問に{missing}問足りません。
+作成済みの質問と重複しない質疑応答を{missing}問作成してください。"""
+    return f"""{request}
+
+## 作成済みの{label}
+{markdown}
+
+{source}
+"""
+
+
+async def repair_artifact(
+    caller: AgentCaller, kind: str, markdown: str, source: str
+) -> Tuple[str, int]:
+    """検証に通らなければ不足分だけを生成して本文に加え、(修復後の本文, 修復の呼び出し回数) を返す.
+
+    source には不足分の作成に使う資料（討論ログなど）を Markdown で渡す。
+    MAX_REPAIR_ATTEMPTS 回補っても不足が残る場合は、そのまま返す。
+    """
+    calls = 0
+    check = check_artifact(kind, markdown)
+    while not check.ok and calls < MAX_REPAIR_ATTEMPTS:
+        calls += 1
+        prompt = _repair_prompt(check, markdown, source)
+        if check.missing_sections:
+            repaired = await caller.run(
+                create_section_repairer(ARTIFACT_LABELS[kind]),
+                prompt,
+                SectionRepairOutput,
+            )
+            wanted = {
+                _normalize(heading): heading for heading in check.missing_sections
+            }
+            sections = {
+                wanted[_normalize(section.heading)]: section.markdown
+                for section in repaired.sections
+                if _normalize(section.heading) in wanted and section.markdown.strip()
+            }
+            markdown = merge_sections(markdown, sections, REQUIRED_SECTIONS[kind])
+        else:
+            supplement = await caller.run(create_qa_supplementer(), prompt, QAOutput)
+            markdown = merge_questions(markdown, supplement.markdown)
+        check = check_artifact(kind, markdown)
+    return markdown, calls
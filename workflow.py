@@ -1,24 +1,130 @@
 """経営会議の討論ワークフロー."""
 import asyncio
-from typing import Dict, List, Tuple
+import hashlib
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from agents import Runner
+from agents import Agent, FunctionTool, RunConfig, Runner, function_tool
+from caller import AgentCaller, CallRecord
+from events import (
+    ArtifactReady,
+    MeetingEvent,
+    MeetingMetrics,
+    TurnFinished,
+    TurnStarted,
+)
+from tracing import TraceRecorder
+from http_pool import HttpPoolConfig, PoolStats, SharedHttpClient, format_pool_stats
+from resilience import HedgePolicy, ModelRouter
+from board import BoardConfig, RoleGroup, default_board
 from meeting_agents import (
+    EVALUATION_AXIS_FOCUS,
+    REFINED_PROPOSAL_SECTIONS,
     ROLE_INSTRUCTIONS,
     create_facilitator,
+    create_agenda_facilitator,
+    create_group_facilitator,
+    create_group_reporter,
     create_minutes_writer,
     create_participant,
     create_qa_writer,
     create_refiner,
+    create_section_refiner,
+    create_consistency_checker,
     create_evaluator,
+    create_axis_evaluator,
+    create_evaluation_aggregator,
+    create_digest_writer,
+    create_comparative_evaluator,
+    create_discussion_summarizer,
+    create_discussion_reducer,
+)
+from models import (
+    FacilitatorAgenda,
+    FacilitatorDecision,
+    MinutesOutput,
+    ParticipantResponse,
+    QAOutput,
+    RefinedProposalOutput,
+    ProposalSectionOutput,
+    ConsistencyReview,
+    EvaluationOutput,
+    EvaluationSummary,
+    AxisScore,
+    ProposalDigest,
+    ComparativeEvaluationOutput,
+    DiscussionDigest,
+    DiscussionPoint,
+    EVALUATION_AXES,
+    AXIS_MAX_SCORE,
+)
+from scheduler import WRITER_CALLS, MeetingDeadline
+from speculation import (
+    SPECULATIVE_PROMPT,
+    SpeculationStats,
+    SpeculativeTurn,
+    format_speculation_stats,
+    predict_next_speaker,
 )
-from models import FacilitatorDecision, MinutesOutput, ParticipantResponse, QAOutput, RefinedProposalOutput, EvaluationOutput
+from streaming import ConsoleStream
+from turnstore import SpillingCallRecords, SpillingTurnStore
+from validation import ARTIFACT_LABELS, check_artifact, repair_artifact
+
+T = TypeVar("T")
+# 本文（markdown）を持つ成果物の出力型
+ArtifactT = TypeVar(
+    "ArtifactT", bound=Union[MinutesOutput, QAOutput, RefinedProposalOutput]
+)
+
+# 時間予算切れで討論内容から組み立てた簡易版成果物のモデル名
+LOCAL_FALLBACK_MODEL = "local-fallback"
+# 討論ログのダイジェストで、1回の統合呼び出しにまとめる要約の数
+DIGEST_FAN_IN = 6
+# 成果物作成エージェントが1回のツール呼び出しで参照できる発言数
+MAX_TURNS_PER_LOOKUP = 20
+# 省メモリモードで digest_block_size が未指定の場合のブロックサイズと、同時に要約するブロック数
+SPILL_DIGEST_BLOCK_SIZE = 8
+SPILL_MAX_PARALLEL_BLOCKS = 4
+# 部会のリードが全体会議に報告する発言の指示
+GROUP_REPORT_PROMPT = "部会での議論を全体会議に報告してください"
+# 冒頭発言フェーズで各役割に与える指示
+OPENING_STATEMENT_PROMPT = "企画書に対する冒頭の見解を、役割の観点から述べてください"
+# 見出しごとの改訂・観点ごとの評価で1回の呼び出しに渡す発言数の上限（関係する発言のうち直近のもの）
+FOCUSED_MAX_TURNS = 12
+# エージェントに渡す発言履歴の形式（markdown: 人が読む形式、compact: 簡潔な機械向けの形式）
+CONTEXT_FORMATS = ("markdown", "compact")
+# compact 形式の発言履歴の先頭に付ける凡例
+COMPACT_LEGEND = "（形式: #発言番号 役割@部会 >指示 / S 要約 / C 懸念 / P 提案 / Q 質問。各項目は 発言番号.連番 で参照）"
+
+# 企画書本文のSHA-256 → ダイジェスト（プロセス内キャッシュ）
+_DIGEST_CACHE: Dict[str, ProposalDigest] = {}
 
 
-def _format_turns(turns: List[Dict], include_details: bool = True) -> str:
+def _format_turns(
+    turns: List[Dict], include_details: bool = True, start: int = 1
+) -> str:
     lines: List[str] = []
-    for idx, turn in enumerate(turns, start=1):
-        lines.append(f"{idx}. {turn['role']}（指名理由: {turn['decision'].rationale}）")
+    for idx, turn in enumerate(turns, start=start):
+        group = f"［{turn['group']}］" if turn.get("group") else ""
+        lines.append(
+            f"{idx}. {turn['role']}{group}（指名理由: {turn['decision'].rationale}）"
+        )
         lines.append(f"   - ファシリテーター指示: {turn['decision'].prompt}")
         lines.append(f"   - 発言要約: {turn['response'].summary}")
         if include_details:
@@ -34,40 +140,87 @@ def _format_turns(turns: List[Dict], include_details: bool = True) -> str:
     return "\n".join(lines)
 
 
-async def _run_board_meeting(
-    proposal_markdown: str,
-    rounds: int = 12,
-    context_turns: int = 6,
-    verbose: bool = True,
-) -> Tuple[str, str, str, str, str]:
-    roles = list(ROLE_INSTRUCTIONS.keys())
-    effective_rounds = max(rounds, len(roles))
+def _format_turns_compact(
+    turns: Sequence[Dict],
+    include_details: bool = True,
+    start: int = 1,
+    include_instruction: bool = True,
+) -> str:
+    """発言履歴を簡潔な機械向けの形式で整形する（凡例は含まない）.
 
-    facilitator = create_facilitator()
-    participants = {role: create_participant(role) for role in roles}
-    minutes_writer = create_minutes_writer()
-    qa_writer = create_qa_writer()
-    refiner = create_refiner()
-    evaluator = create_evaluator()
+    指名理由は載せず、include_instruction が False ならファシリテーターの指示も省く。
+    懸念・提案・質問は「C3.1」のように発言番号つきのIDで1行ずつ並べる。
+    """
+    lines: List[str] = []
+    for idx, turn in enumerate(turns, start=start):
+        group = f"@{turn['group']}" if turn.get("group") else ""
+        head = f"#{idx} {turn['role']}{group}"
+        if include_instruction:
+            head += f" >{turn['decision'].prompt}"
+        response = turn["response"]
+        lines.append(head)
+        lines.append(f"S {response.summary}")
+        if include_details:
+            for key, items in (
+                ("C", response.concerns),
+                ("P", response.proposals),
+                ("Q", response.questions),
+            ):
+                lines.extend(
+                    f"{key}{idx}.{number} {item}"
+                    for number, item in enumerate(items, start=1)
+                )
+    return "\n".join(lines)
 
-    counts: Dict[str, int] = {role: 0 for role in roles}
-    turns: List[Dict] = []
 
-    if verbose:
-        print("=" * 80)
-        print("🏢 経営会議討論を開始します")
-        print("=" * 80)
-        print(f"\n📋 参加者: {', '.join(roles)}")
-        print(f"🔄 討論ラウンド数: {effective_rounds}\n")
+def _format_context(
+    turns: Sequence[Dict],
+    context_format: str = "markdown",
+    include_details: bool = True,
+    start: int = 1,
+    include_instruction: bool = True,
+) -> str:
+    """エージェントに渡す発言履歴を context_format の形式で整形する（発言がなければ空文字列）."""
+    return _format_numbered_context(
+        list(enumerate(turns, start=start)),
+        context_format,
+        include_details,
+        include_instruction,
+    )
 
-    for round_idx in range(effective_rounds):
-        missing_roles = [role for role, count in counts.items() if count == 0]
-        allowed_roles = missing_roles if missing_roles else roles
 
-        recent_turns = turns[-context_turns:] if context_turns > 0 else []
-        discussion_context = _format_turns(recent_turns, include_details=True) or "(まだ発言はありません)"
+def _format_numbered_context(
+    numbered_turns: Sequence[Tuple[int, Dict]],
+    context_format: str = "markdown",
+    include_details: bool = True,
+    include_instruction: bool = True,
+) -> str:
+    """（発言番号, 発言）の並びを context_format の形式で整形する（番号が連続していなくてもよい）."""
+    if context_format == "compact":
+        body = "\n".join(
+            _format_turns_compact(
+                [turn],
+                include_details,
+                start=idx,
+                include_instruction=include_instruction,
+            )
+            for idx, turn in numbered_turns
+        )
+        return f"{COMPACT_LEGEND}\n{body}" if body else ""
+    return "\n".join(
+        _format_turns([turn], include_details, start=idx)
+        for idx, turn in numbered_turns
+    )
 
-        facilitator_prompt = f"""あなたは経営会議のファシリテーターです。
+
+def _build_facilitator_prompt(
+    proposal_markdown: str,
+    discussion_context: str,
+    roles: List[str],
+    counts: Dict[str, int],
+    allowed_roles: List[str],
+) -> str:
+    return f"""あなたは経営会議のファシリテーターです。
 次の発言者を選んでください。
 
 ## 企画書（抜粋）
@@ -85,13 +238,294 @@ async def _run_board_meeting(
 指名理由は簡潔にし、重要論点が未整理なら質問で掘り下げてください。
 """
 
+
+def _build_participant_prompt(
+    speaker: str,
+    proposal_markdown: str,
+    instruction: str,
+    discussion_context: str,
+) -> str:
+    return f"""あなたは「{speaker}」として発言してください。
+
+## 企画書
+{proposal_markdown}
+
+## ファシリテーターからの指示
+{instruction}
+
+## これまでの議論（直近）
+{discussion_context}
+
+上記を踏まえ、役割の観点から意見・懸念・改善提案・質問を出してください。
+"""
+
+
+def _build_agenda_request(agenda_size: int) -> str:
+    return f"""
+今後{agenda_size}人分の発言順と、それぞれへの質問/指示をまとめて決めてください。
+未発言の役割がいる場合は、その役割から順に指名してください。
+"""
+
+
+def _agenda_is_stale(
+    response: ParticipantResponse, plan: List[FacilitatorDecision], roles: List[str]
+) -> bool:
+    """発言中の質問が、残りのアジェンダに含まれない役割に向けられているか."""
+    planned = {decision.next_speaker.strip() for decision in plan}
+    return any(
+        role in question and role not in planned
+        for question in response.questions
+        for role in roles
+    )
+
+
+@dataclass
+class DebateCheckpoint:
+    """討論の途中状態（発言履歴・発言回数と、そこまでのエージェント呼び出しの計測）.
+
+    発言履歴のリストは分岐ごとに複製して使うため、分岐先で追記しても他の分岐には影響しない。
+    """
+
+    turns: List[Dict] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+    records: List[CallRecord] = field(default_factory=list)
+
+    @property
+    def rounds(self) -> int:
+        return len(self.turns)
+
+
+def _stop_debate_on_timeout(
+    deadline: MeetingDeadline, round_idx: int, missing_roles: List[str]
+) -> None:
+    reason = f"ラウンド{round_idx + 1}の呼び出しが時間予算内に終わらなかったため討論を打ち切りました"
+    if missing_roles:
+        reason += f"（未発言: {', '.join(missing_roles)}）"
+    deadline.degrade(reason)
+
+
+async def _run_opening_statements(
+    proposal_markdown: str,
+    roles: List[str],
+    participants: Dict[str, Agent],
+    caller: AgentCaller,
+    deadline: Optional[MeetingDeadline] = None,
+    group: Optional[str] = None,
+    on_event: Optional[Callable[[MeetingEvent], None]] = None,
+    first_round: int = 1,
+) -> List[Dict]:
+    """roles の全員の冒頭発言を企画書だけをもとに同時に行い、roles の順の発言履歴を返す.
+
+    呼び出しは並行して進むため、計測は child() で分けた呼び出し元に記録してから caller に加える。
+    on_event には各発言の開始・終了を発生順に通知する（roles の順に first_round ラウンド目からと数える）。
+    """
+
+    async def speak(
+        round_number: int, role: str
+    ) -> Tuple[ParticipantResponse, AgentCaller]:
+        child = caller.child()
+        prompt = _build_participant_prompt(
+            role, proposal_markdown, OPENING_STATEMENT_PROMPT, "(まだ発言はありません)"
+        )
+        if on_event is not None:
+            on_event(TurnStarted(round_number, role, group))
+        with child.span(f"ラウンド {round_number}", "round", speaker=role, group=group):
+            response = await child.run(
+                participants[role], prompt, ParticipantResponse,
+                timeout=deadline.debate_call_timeout() if deadline else None,
+            )
+        if on_event is not None:
+            model = child.records[-1].model
+            on_event(TurnFinished(round_number, role, response, model, group))
+        return response, child
+
+    with caller.span("冒頭発言", "stage", group=group):
+        statements = await asyncio.gather(
+            *[speak(first_round + idx, role) for idx, role in enumerate(roles)]
+        )
+    turns = []
+    for role, (response, child) in zip(roles, statements):
+        caller.records.extend(child.records)
+        caller.call_count += child.call_count
+        if deadline is not None:
+            deadline.observe_call(child.records[-1].duration)
+        turn = {
+            "role": role,
+            "decision": FacilitatorDecision(
+                next_speaker=role, prompt=OPENING_STATEMENT_PROMPT, rationale="冒頭発言"
+            ),
+            "response": response,
+            "model": child.records[-1].model,
+        }
+        if group is not None:
+            turn["group"] = group
+        turns.append(turn)
+    return turns
+
+
+async def _run_debate(
+    proposal_markdown: str,
+    roles: List[str],
+    facilitator: Agent,
+    participants: Dict[str, Agent],
+    effective_rounds: int,
+    context_turns: int,
+    verbose: bool,
+    caller: AgentCaller,
+    facilitator_proposal: Optional[str] = None,
+    deadline: Optional[MeetingDeadline] = None,
+    agenda_size: int = 1,
+    turn_store: Optional[Union[List[Dict], SpillingTurnStore]] = None,
+    group: Optional[str] = None,
+    checkpoint: Optional[DebateCheckpoint] = None,
+    stop_at: Optional[int] = None,
+    opening_statements: bool = False,
+    on_event: Optional[Callable[[MeetingEvent], None]] = None,
+    speculation: Optional[SpeculationStats] = None,
+    context_format: str = "markdown",
+) -> Tuple[List[Dict], Dict[str, int]]:
+    """ファシリテーターの指名に従って討論を進め、発言履歴と発言回数を返す.
+
+    facilitator_proposal を指定した場合、ファシリテーターには企画書全文の代わりに
+    その抜粋（ダイジェスト）を渡す。deadline を指定した場合、全員の発言後に
+    時間予算が不足しそうならその時点で討論を打ち切る。
+    agenda_size が2以上の場合、facilitator（create_agenda_facilitator）は
+    agenda_size 人分の指名をまとめて返し、それを使い切るか、発言中の質問が
+    予定外の役割に向けられた時点で作り直す。
+    turn_store を指定した場合、発言はそこに追記され、戻り値の発言履歴も turn_store になる
+    （既に含まれる発言は直近の議論として参照されるが、ラウンド数には数えない）。
+    group を指定した場合、発言にその部会名を記録する。
+    checkpoint を指定した場合、その発言履歴の複製と発言回数から討論を再開する
+    （checkpoint の発言はラウンド数に数える）。stop_at を指定した場合、通算 stop_at ラウンドで止める。
+    opening_statements を指定した場合、まだ発言していない全員が企画書だけをもとに冒頭発言を同時に行い
+    （1人1ラウンドとして数える）、その後ファシリテーターの指名による討論を続ける。
+    on_event を指定した場合、各発言の開始（発言者の決定後）と終了を通知する。
+    speculation を指定した場合、ファシリテーターの呼び出しと並行して、次に指名されそうな役割の発言を
+    汎用の指示（SPECULATIVE_PROMPT）で始め、指名された発言者と指示が一致すれば採用する
+    （一致しなければ捨てて指名どおりに発言させる）。採否の集計は speculation に加える。
+    context_format が "compact" の場合、直近の発言は簡潔な形式で渡す（参加者にはファシリテーターの指示も省く）。
+    """
+    if checkpoint is not None and turn_store is not None:
+        raise ValueError("checkpoint と turn_store は同時に指定できません。")
+    counts: Dict[str, int] = {role: 0 for role in roles}
+    # SpillingTurnStore は list と同じく追記・インデックス・スライス・反復で参照できる
+    turns = cast(List[Dict], turn_store) if turn_store is not None else []
+    first_turn = len(turns)
+    if checkpoint is not None:
+        counts.update(checkpoint.counts)
+        turns = list(checkpoint.turns)
+        first_turn = 0
+    plan: List[FacilitatorDecision] = []
+
+    opening_roles = (
+        [role for role in roles if counts[role] == 0] if opening_statements else []
+    )
+    if opening_roles:
+        if verbose:
+            print(f"\n🎤 冒頭発言（{len(opening_roles)}人が同時に発言）")
+        try:
+            opening = await _run_opening_statements(
+                proposal_markdown,
+                opening_roles,
+                participants,
+                caller,
+                deadline=deadline,
+                group=group,
+                on_event=on_event,
+                first_round=len(turns) - first_turn + 1,
+            )
+        except asyncio.TimeoutError:
+            if deadline is None:
+                raise
+            _stop_debate_on_timeout(deadline, len(turns) - first_turn, opening_roles)
+            return turns, counts
+        for turn in opening:
+            counts[turn["role"]] += 1
+            turns.append(turn)
+            if verbose:
+                print(f"   💬 {turn['role']}: {turn['response'].summary}")
+
+    last_round = effective_rounds if stop_at is None else min(stop_at, effective_rounds)
+    for round_idx in range(len(turns) - first_turn, last_round):
+        missing_roles = [role for role, count in counts.items() if count == 0]
+        allowed_roles = missing_roles if missing_roles else roles
+
+        if deadline is not None and not missing_roles and deadline.should_stop_debate():
+            deadline.degrade(f"時間予算が不足するため討論を{round_idx}ラウンドで打ち切りました")
+            break
+        round_started_at = deadline.elapsed() if deadline else 0.0
+        round_clock = time.time()
+
+        recent_turns = turns[-context_turns:] if context_turns > 0 else []
+        # compact では ID（C3.1 など）が議論全体で一意になるよう、直近の発言も通し番号で示す
+        start = len(turns) - len(recent_turns) + 1 if context_format == "compact" else 1
+        discussion_context = (
+            _format_context(recent_turns, context_format, start=start)
+            or "(まだ発言はありません)"
+        )
+        participant_context = (
+            _format_context(
+                recent_turns, context_format, start=start, include_instruction=False
+            )
+            or "(まだ発言はありません)"
+            if context_format == "compact"
+            else discussion_context
+        )
+
         if verbose:
             print(f"\n{'─' * 80}")
             print(f"🔄 ラウンド {round_idx + 1}/{effective_rounds}")
             print(f"{'─' * 80}")
 
-        decision_result = await Runner.run(facilitator, facilitator_prompt)
-        decision = decision_result.final_output_as(FacilitatorDecision)
+        speculative: Optional[SpeculativeTurn] = None
+        if not plan:
+            facilitator_prompt = _build_facilitator_prompt(
+                facilitator_proposal or proposal_markdown,
+                discussion_context,
+                roles,
+                counts,
+                allowed_roles,
+            )
+            if agenda_size > 1:
+                facilitator_prompt += _build_agenda_request(agenda_size)
+            if speculation is not None:
+                predicted = predict_next_speaker(turns, counts, allowed_roles)
+                speculative = SpeculativeTurn(
+                    caller,
+                    participants[predicted],
+                    predicted,
+                    _build_participant_prompt(
+                        predicted,
+                        proposal_markdown,
+                        SPECULATIVE_PROMPT,
+                        participant_context,
+                    ),
+                    timeout=deadline.debate_call_timeout() if deadline else None,
+                )
+            try:
+                planned = await caller.run(
+                    facilitator, facilitator_prompt,
+                    FacilitatorAgenda if agenda_size > 1 else FacilitatorDecision,
+                    timeout=deadline.debate_call_timeout() if deadline else None,
+                )
+            except BaseException as exc:
+                if speculative is not None:
+                    speculative.cancel(speculation)
+                if not isinstance(exc, asyncio.TimeoutError) or deadline is None:
+                    raise
+                _stop_debate_on_timeout(deadline, round_idx, missing_roles)
+                break
+            if deadline is not None:
+                deadline.observe_call(caller.records[-1].duration)
+            plan = (
+                planned.decisions()[:agenda_size]
+                if isinstance(planned, FacilitatorAgenda)
+                else [planned]
+            )
+            if verbose and agenda_size > 1:
+                print("\n📋 アジェンダ: " + " → ".join(d.next_speaker for d in plan))
+
+        decision = plan.pop(0)
         speaker = decision.next_speaker.strip()
 
         if verbose:
@@ -102,26 +536,36 @@ async def _run_board_meeting(
         if speaker not in allowed_roles:
             speaker = allowed_roles[0]
 
-        participant_prompt = f"""あなたは「{speaker}」として発言してください。
-
-## 企画書
-{proposal_markdown}
-
-## ファシリテーターからの指示
-{decision.prompt}
-
-## これまでの議論（直近）
-{discussion_context}
-
-上記を踏まえ、役割の観点から意見・懸念・改善提案・質問を出してください。
-"""
+        participant_prompt = _build_participant_prompt(
+            speaker, proposal_markdown, decision.prompt, participant_context
+        )
+        if on_event is not None:
+            on_event(TurnStarted(round_idx + 1, speaker, group))
 
-        response_result = await Runner.run(participants[speaker], participant_prompt)
-        response = response_result.final_output_as(ParticipantResponse)
+        try:
+            response = None
+            if speculative is not None and speculation is not None:
+                response = await speculative.resolve(
+                    speaker, decision.prompt, speculation
+                )
+            if response is None:
+                response = await caller.run(
+                    participants[speaker], participant_prompt, ParticipantResponse,
+                    timeout=deadline.debate_call_timeout() if deadline else None,
+                )
+        except asyncio.TimeoutError:
+            if deadline is None:
+                raise
+            _stop_debate_on_timeout(deadline, round_idx, missing_roles)
+            break
+        if deadline is not None:
+            deadline.observe_call(caller.records[-1].duration)
+            deadline.observe_round(deadline.elapsed() - round_started_at)
 
         if verbose:
             print(f"\n💬 {speaker} の発言:")
-            print(f"   {response.summary}")
+            if caller.console is None:
+                print(f"   {response.summary}")
             if response.concerns:
                 print(f"   ⚠️  懸念点: {len(response.concerns)}件")
             if response.proposals:
@@ -129,31 +573,235 @@ async def _run_board_meeting(
             if response.questions:
                 print(f"   ❓ 質問: {len(response.questions)}件")
 
+        if plan and _agenda_is_stale(response, plan, roles):
+            plan = []
+            if verbose:
+                print("   🔁 質問を受けてアジェンダを作り直します")
+
         counts[speaker] += 1
-        turns.append(
-            {
-                "role": speaker,
-                "decision": decision,
-                "response": response,
-            }
+        turn = {
+            "role": speaker,
+            "decision": decision,
+            "response": response,
+            "model": caller.records[-1].model,
+        }
+        if group is not None:
+            turn["group"] = group
+        turns.append(turn)
+        caller.trace(
+            f"ラウンド {round_idx + 1}",
+            "round",
+            round_clock,
+            speaker=speaker,
+            group=group,
         )
+        if on_event is not None:
+            on_event(
+                TurnFinished(round_idx + 1, speaker, response, turn["model"], group)
+            )
 
-        if all(counts[role] > 0 for role in roles) and len(turns) >= effective_rounds:
+        if (
+            all(counts[role] > 0 for role in roles)
+            and len(turns) - first_turn >= effective_rounds
+        ):
             break
 
+    return turns, counts
+
+
+async def _run_group_session(
+    group: RoleGroup,
+    board: BoardConfig,
+    proposal_markdown: str,
+    group_rounds: Optional[int],
+    context_turns: int,
+    caller: AgentCaller,
+    facilitator_proposal: Optional[str] = None,
+    deadline: Optional[MeetingDeadline] = None,
+    opening_statements: bool = False,
+    on_event: Optional[Callable[[MeetingEvent], None]] = None,
+    speculation: Optional[SpeculationStats] = None,
+    context_format: str = "markdown",
+) -> Tuple[List[Dict], Optional[Dict], Dict[str, int], AgentCaller]:
+    """部会内の討論を行い、発言履歴・リードによる全体会議への報告（発言形式）・発言回数を返す.
+
+    部会は並行して進むため、呼び出しの計測は child() で分けた呼び出し元に記録して返す。
+    報告が時間予算内に終わらなかった場合、報告は None になる。
+    """
+    caller = caller.child()
+    started_at = time.time()
+    participants = {
+        member: create_participant(member, board.roles[member])
+        for member in group.members
+    }
+    turns, counts = await _run_debate(
+        proposal_markdown=proposal_markdown,
+        roles=group.members,
+        facilitator=create_group_facilitator(group.name),
+        participants=participants,
+        effective_rounds=max(group_rounds or 0, len(group.members)),
+        context_turns=context_turns,
+        verbose=False,
+        caller=caller,
+        facilitator_proposal=facilitator_proposal,
+        deadline=deadline,
+        group=group.name,
+        opening_statements=opening_statements,
+        on_event=on_event,
+        speculation=speculation,
+        context_format=context_format,
+    )
+
+    report_prompt = f"""部会「{group.name}」の討論ログをもとに、全体会議への報告をまとめてください。
+
+## 企画書（抜粋）
+{facilitator_proposal or proposal_markdown}
+
+## 部会の討論ログ
+{_format_context(turns, context_format)}
+"""
+    try:
+        report = await caller.run(
+            create_group_reporter(group.name, group.lead),
+            report_prompt,
+            ParticipantResponse,
+            timeout=deadline.debate_call_timeout() if deadline else None,
+        )
+    except asyncio.TimeoutError:
+        if deadline is None:
+            raise
+        deadline.degrade(f"部会「{group.name}」の報告が時間予算内に終わらなかったため省略しました")
+        caller.trace(f"部会「{group.name}」", "stage", started_at)
+        return turns, None, counts, caller
+    counts[group.lead] += 1
+    model = caller.records[-1].model
+    report_turn = {
+        "role": group.lead,
+        "decision": FacilitatorDecision(
+            next_speaker=group.lead,
+            prompt=GROUP_REPORT_PROMPT,
+            rationale=f"{group.name}の報告",
+        ),
+        "response": report,
+        "model": model,
+        "group": group.name,
+    }
+    if on_event is not None:
+        on_event(TurnFinished(len(turns) + 1, group.lead, report, model, group.name))
+    caller.trace(f"部会「{group.name}」", "stage", started_at)
+    return turns, report_turn, counts, caller
+
+
+async def _run_hierarchical_debate(
+    proposal_markdown: str,
+    board: BoardConfig,
+    facilitator: Agent,
+    effective_rounds: int,
+    group_rounds: Optional[int],
+    context_turns: int,
+    verbose: bool,
+    caller: AgentCaller,
+    facilitator_proposal: Optional[str] = None,
+    deadline: Optional[MeetingDeadline] = None,
+    agenda_size: int = 1,
+    turn_store: Optional[Union[List[Dict], SpillingTurnStore]] = None,
+    opening_statements: bool = False,
+    on_event: Optional[Callable[[MeetingEvent], None]] = None,
+    speculation: Optional[SpeculationStats] = None,
+    context_format: str = "markdown",
+) -> Tuple[List[Dict], Dict[str, int]]:
+    """部会ごとの討論を並行して行い、各リードの報告を受けて全体会議を行う.
+
+    部会は同時に進むため、討論の所要時間は最も長い部会と全体会議のラウンド数で決まり、
+    参加者の総数にはよらない。全体会議には部会に属さない役割と各部会のリードが参加し、
+    全部会の報告を企画書とあわせて参照する。発言履歴は部会ごとの発言と報告を部会順に並べ、
+    その後に全体会議の発言を続けたものになる。
+    """
     if verbose:
-        print("\n" + "=" * 80)
-        print("✅ 討論完了")
-        print("=" * 80)
-        print("\n📊 発言回数:")
-        for role in roles:
-            print(f"   - {role}: {counts[role]}回")
-        print(f"\n📝 議事録・想定問答・改訂企画書を生成中...\n")
+        print(f"\n🧩 部会を並行して開催します: {', '.join(group.name for group in board.groups)}")
 
-    full_discussion = _format_turns(turns, include_details=True)
-    
-    # 対話履歴をMarkdown形式で整形
-    discussion_log_md = f"""# 経営会議 対話履歴
+    sessions = await asyncio.gather(
+        *[
+            _run_group_session(
+                group,
+                board,
+                proposal_markdown,
+                group_rounds,
+                context_turns,
+                caller,
+                facilitator_proposal=facilitator_proposal,
+                deadline=deadline,
+                opening_statements=opening_statements,
+                on_event=on_event,
+                speculation=speculation,
+                context_format=context_format,
+            )
+            for group in board.groups
+        ]
+    )
+
+    turns = turn_store if turn_store is not None else []
+    counts: Dict[str, int] = {role: 0 for role in board.roles}
+    reports: List[Dict] = []
+    for group, (group_turns, report, group_counts, group_caller) in zip(
+        board.groups, sessions
+    ):
+        for turn in group_turns:
+            turns.append(turn)
+        if report is not None:
+            turns.append(report)
+            reports.append(report)
+        for role, count in group_counts.items():
+            counts[role] += count
+        caller.records.extend(group_caller.records)
+        caller.call_count += group_caller.call_count
+        if verbose:
+            print(f"   ✅ {group.name}: {len(group_turns)}件の発言（リード: {group.lead}）")
+
+    reports_markdown = "\n\n## 部会からの報告\n" + (
+        _format_context(reports, context_format) or "(報告はありません)"
+    )
+    plenary_roles = board.plenary_roles()
+    if verbose:
+        print(f"\n🏛️  全体会議: {', '.join(plenary_roles)}")
+
+    plenary_started_at = time.time()
+    turns, plenary_counts = await _run_debate(
+        proposal_markdown=proposal_markdown + reports_markdown,
+        roles=plenary_roles,
+        facilitator=facilitator,
+        participants={
+            role: create_participant(role, board.roles[role]) for role in plenary_roles
+        },
+        effective_rounds=effective_rounds,
+        context_turns=context_turns,
+        verbose=verbose,
+        caller=caller,
+        facilitator_proposal=(
+            facilitator_proposal + reports_markdown if facilitator_proposal else None
+        ),
+        deadline=deadline,
+        agenda_size=agenda_size,
+        turn_store=turns,
+        opening_statements=opening_statements,
+        on_event=on_event,
+        speculation=speculation,
+        context_format=context_format,
+    )
+    caller.trace("全体会議", "stage", plenary_started_at)
+    for role, count in plenary_counts.items():
+        counts[role] += count
+    return turns, counts
+
+
+def _iter_discussion_log(
+    turns: Sequence[Dict],
+    roles: List[str],
+    counts: Dict[str, int],
+    title: str = "経営会議 対話履歴",
+) -> Iterator[str]:
+    """対話履歴Markdownを発言1件ずつのチャンクとして生成する（ファイルへの逐次書き出し用）."""
+    header = f"""# {title}
 
 ## 会議情報
 - 討論ラウンド数: {len(turns)}
@@ -162,12 +810,17 @@ async def _run_board_meeting(
 ## 発言回数
 """
     for role in roles:
-        discussion_log_md += f"- {role}: {counts[role]}回\n"
+        header += f"- {role}: {counts[role]}回\n"
     
-    discussion_log_md += "\n## 討論詳細\n\n"
+    header += "\n## 討論詳細\n\n"
+    yield header
     
     for idx, turn in enumerate(turns, start=1):
-        discussion_log_md += f"### ラウンド {idx}: {turn['role']}\n\n"
+        discussion_log_md = f"### ラウンド {idx}: {turn['role']}\n\n"
+        if turn.get("group"):
+            discussion_log_md += f"**部会:** {turn['group']}\n\n"
+        if turn.get("model"):
+            discussion_log_md += f"**モデル:** {turn['model']}\n\n"
         discussion_log_md += f"**ファシリテーターの指名理由:** {turn['decision'].rationale}\n\n"
         discussion_log_md += f"**ファシリテーターからの指示:**\n{turn['decision'].prompt}\n\n"
         discussion_log_md += f"**発言要約:**\n{turn['response'].summary}\n\n"
@@ -191,45 +844,1058 @@ async def _run_board_meeting(
             discussion_log_md += "\n"
         
         discussion_log_md += "---\n\n"
+        yield discussion_log_md
 
-    minutes_prompt = f"""以下の経営会議の討論ログを議事録にまとめてください。
 
-## 企画書
+def _render_discussion_log(
+    turns: Sequence[Dict],
+    roles: List[str],
+    counts: Dict[str, int],
+    title: str = "経営会議 対話履歴",
+) -> str:
+    return "".join(_iter_discussion_log(turns, roles, counts, title))
+
+
+def _format_points(title: str, points: List[DiscussionPoint]) -> List[str]:
+    if not points:
+        return []
+    lines = [f"### {title}"]
+    for point in points:
+        refs = ", ".join(point.roles)
+        if point.turns:
+            refs += (
+                ("／" if refs else "")
+                + "ターン "
+                + ", ".join(str(turn) for turn in point.turns)
+            )
+        lines.append(f"- {point.point}" + (f"（{refs}）" if refs else ""))
+    return lines + [""]
+
+
+def _format_discussion_digest(
+    digest: DiscussionDigest, total_turns: Optional[int] = None
+) -> str:
+    lines: List[str] = []
+    if total_turns is not None:
+        lines += [
+            f"（全{total_turns}ターンの討論ログの要約です。発言の原文が必要な場合は "
+            "read_discussion_turns ツールでターン番号を指定して参照してください）",
+            "",
+        ]
+    lines += ["### 議論の流れ", digest.summary, ""]
+    if digest.role_positions:
+        lines.append("### 役職ごとの立場")
+        lines += [
+            f"- {position.role}: {position.position}"
+            for position in digest.role_positions
+        ]
+        lines.append("")
+    lines += _format_points("主な懸念点", digest.concerns)
+    lines += _format_points("主な提案", digest.proposals)
+    lines += _format_points("未解決の質問", digest.open_questions)
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def _read_turns(
+    turns: List[Dict], start: int, end: int, context_format: str = "markdown"
+) -> str:
+    """ターン番号 start〜end（1始まり、最大 MAX_TURNS_PER_LOOKUP 件）の発言原文."""
+    start = max(1, start)
+    end = min(len(turns), end, start + MAX_TURNS_PER_LOOKUP - 1)
+    if start > end:
+        return f"該当する発言はありません（全{len(turns)}ターン）。"
+    return _format_context(turns[start - 1:end], context_format, start=start)
+
+
+def _create_raw_log_tool(
+    turns: List[Dict], context_format: str = "markdown"
+) -> FunctionTool:
+    @function_tool
+    def read_discussion_turns(start: int, end: int) -> str:
+        """討論ログの発言原文を返す.
+
+        Args:
+            start: 最初のターン番号（1始まり）
+            end: 最後のターン番号（1回の呼び出しで最大20ターン）
+        """
+        return _read_turns(turns, start, end, context_format)
+
+    return read_discussion_turns
+
+
+async def _digest_discussion(
+    turns: List[Dict],
+    caller: AgentCaller,
+    block_size: int,
+    fan_in: int = DIGEST_FAN_IN,
+    max_parallel_blocks: Optional[int] = None,
+    context_format: str = "markdown",
+) -> DiscussionDigest:
+    """討論ログを block_size ターンごとに並列で要約し、fan_in 件ずつ段階的に統合する.
+
+    各段の呼び出しは並列に行うため、所要時間はターン数に対して対数的にしか増えず、
+    成果物作成エージェントへの入力は会議の長さによらずほぼ一定になる。
+    max_parallel_blocks を指定すると、ブロックをその数ずつ順に要約し、fan_in 件そろった段から
+    逐次統合する（メモリ上に保持する要約は段数×fan_in 件までに抑えられる）。
+    """
+    summarizer = create_discussion_summarizer()
+    reducer = create_discussion_reducer()
+
+    async def summarize_block(start: int) -> DiscussionDigest:
+        block = turns[start - 1:start - 1 + block_size]
+        prompt = f"""以下は経営会議の討論ログのターン{start}〜{start + len(block) - 1}です。構造化して要約してください。
+
+## 討論ログ
+{_format_context(block, context_format, start=start)}
+"""
+        return await caller.run(summarizer, prompt, DiscussionDigest)
+
+    async def reduce_group(group: List[DiscussionDigest]) -> DiscussionDigest:
+        if len(group) == 1:
+            return group[0]
+        sections = "\n".join(
+            f"## 要約{idx}\n{_format_discussion_digest(digest)}"
+            for idx, digest in enumerate(group, start=1)
+        )
+        prompt = f"""以下は同じ経営会議の討論ログを時系列順の区間ごとに要約したものです。1つのダイジェストに統合してください。
+
+{sections}
+"""
+        return await caller.run(reducer, prompt, DiscussionDigest)
+
+    starts = range(1, len(turns) + 1, block_size)
+    if max_parallel_blocks:
+        # levels[k] は k 段目の統合待ちの要約（上の段ほど古い区間をまとめたもの）
+        levels: List[List[DiscussionDigest]] = []
+        for offset in range(0, len(starts), max_parallel_blocks):
+            batch = starts[offset:offset + max_parallel_blocks]
+            for digest in await asyncio.gather(
+                *[summarize_block(start) for start in batch]
+            ):
+                level = 0
+                while True:
+                    if len(levels) <= level:
+                        levels.append([])
+                    levels[level].append(digest)
+                    if len(levels[level]) < fan_in:
+                        break
+                    digest = await reduce_group(levels[level])
+                    levels[level] = []
+                    level += 1
+        digests = [digest for pending in reversed(levels) for digest in pending]
+    else:
+        digests = list(
+            await asyncio.gather(*[summarize_block(start) for start in starts])
+        )
+    while len(digests) > 1:
+        groups = [digests[idx:idx + fan_in] for idx in range(0, len(digests), fan_in)]
+        digests = list(await asyncio.gather(*[reduce_group(group) for group in groups]))
+    return digests[0]
+
+
+def _render_evaluation_markdown(evaluation: EvaluationOutput) -> str:
+    """評価本文に、構造化スコアから生成したスコアカードとGo/No-Go判定を付け加える."""
+    if not evaluation.axis_scores and not evaluation.verdict:
+        return evaluation.markdown
+
+    evaluation_md = evaluation.markdown.rstrip() + "\n\n## 定量的評価スコアカード（100点満点）\n\n"
+    evaluation_md += "| 評価観点 | 原版 | 改訂版 | 採点理由 |\n"
+    evaluation_md += "|----------|------|--------|----------|\n"
+    by_axis = evaluation.scores_by_axis()
+    for axis in EVALUATION_AXES:
+        if axis in by_axis:
+            score = by_axis[axis]
+            evaluation_md += (
+                f"| {axis} | {score.original}/{AXIS_MAX_SCORE} "
+                f"| {score.refined}/{AXIS_MAX_SCORE} | {score.comment} |\n"
+            )
+        else:
+            evaluation_md += f"| {axis} | - | - | (未採点) |\n"
+    evaluation_md += (
+        f"| **合計（100点換算）** | **{evaluation.total_original}** "
+        f"| **{evaluation.total_refined}** | |\n"
+    )
+
+    if evaluation.verdict:
+        evaluation_md += f"\n## Go/No-Go判定\n\n- 判定: **{evaluation.verdict}**\n"
+        for condition in evaluation.verdict_conditions:
+            evaluation_md += f"- {condition}\n"
+    return evaluation_md
+
+
+def _render_comparison_markdown(
+    comparison: ComparativeEvaluationOutput, candidate_ids: List[str]
+) -> str:
+    """比較評価本文に、構造化された順位から生成した順位表と推奨案を付け加える.
+
+    順位付けの対象が候補と一致しない場合（漏れ・未知の候補・重複）はその旨を明記する。
+    """
+    comparison_md = comparison.markdown.rstrip() + "\n\n## 候補の順位\n\n"
+    comparison_md += "| 順位 | 候補 | 総合スコア | 強み | 弱み |\n"
+    comparison_md += "|------|------|------------|------|------|\n"
+    for ranking in sorted(comparison.rankings, key=lambda r: r.rank):
+        comparison_md += (
+            f"| {ranking.rank} | {ranking.candidate_id} | {ranking.score}/100 "
+            f"| {'、'.join(ranking.strengths) or '-'} "
+            f"| {'、'.join(ranking.weaknesses) or '-'} |\n"
+        )
+    if comparison.recommendation:
+        comparison_md += f"\n## 推奨案\n\n{comparison.recommendation}\n"
+
+    ranked = [ranking.candidate_id for ranking in comparison.rankings]
+    issues = []
+    missing = [
+        candidate_id for candidate_id in candidate_ids if candidate_id not in ranked
+    ]
+    if missing:
+        issues.append(f"順位が付いていない候補: {', '.join(missing)}")
+    unknown = sorted(
+        {candidate_id for candidate_id in ranked if candidate_id not in candidate_ids}
+    )
+    if unknown:
+        issues.append(f"候補にないID: {', '.join(unknown)}")
+    duplicated = sorted(
+        {candidate_id for candidate_id in ranked if ranked.count(candidate_id) > 1}
+    )
+    if duplicated:
+        issues.append(f"重複して順位が付いた候補: {', '.join(duplicated)}")
+    if issues:
+        comparison_md += (
+            "\n## ⚠️ 順位付けの不整合\n\n"
+            + "\n".join(f"- {issue}" for issue in issues)
+            + "\n"
+        )
+    return comparison_md
+
+
+async def _write_artifact(
+    caller: AgentCaller,
+    deadline: Optional[MeetingDeadline],
+    agent: Agent,
+    prompt: str,
+    output_type: Type[T],
+    writer_calls_left: int,
+    label: str,
+    fallback: Callable[[], T],
+    stream_path: Optional[Path] = None,
+) -> Tuple[T, str]:
+    """成果物を生成し、出力と生成したモデル名を返す.
+
+    時間予算を超えた場合は呼び出しを打ち切って簡易版を返す（モデル名は LOCAL_FALLBACK_MODEL）。
+    stream_path を指定すると、ストリーミング実行時に生成中の本文をそのファイルに逐次書き出す。
+    """
+    with caller.span(label, "stage"):
+        if deadline is None:
+            output = await caller.run(
+                agent, prompt, output_type, stream_path=stream_path
+            )
+            return output, caller.records[-1].model
+        try:
+            output = await caller.run(
+                agent,
+                prompt,
+                output_type,
+                timeout=deadline.writer_call_timeout(writer_calls_left),
+                stream_path=stream_path,
+            )
+        except asyncio.TimeoutError:
+            deadline.degrade(f"{label}の生成が時間予算内に終わらなかったため簡易版を出力しました")
+            return fallback(), LOCAL_FALLBACK_MODEL
+        return output, caller.records[-1].model
+
+
+def _stream_path(stream_dir: Optional[Path], kind: str) -> Optional[Path]:
+    return Path(stream_dir) / f"{kind}.md" if stream_dir is not None else None
+
+
+def _fallback_minutes(turns: List[Dict], roles: List[str]) -> str:
+    return (
+        "# 議事録（簡易版）\n\n## 参加者\n"
+        + "\n".join(f"- {role}" for role in roles)
+        + "\n\n## 主な論点\n"
+        + (_format_turns(turns, include_details=False) or "(発言はありません)")
+        + "\n"
+    )
+
+
+def _fallback_qa(turns: List[Dict]) -> str:
+    questions = [
+        f"- Q: {q}（{turn['role']}）"
+        for turn in turns
+        for q in turn["response"].questions
+    ]
+    return "# 想定問答集（簡易版）\n\n## 討論で挙がった質問（回答未作成）\n" + (
+        "\n".join(questions) or "(質問はありません)"
+    ) + "\n"
+
+
+def _fallback_refined_proposal(proposal_markdown: str, turns: List[Dict]) -> str:
+    proposals = [
+        f"- {p}（{turn['role']}）" for turn in turns for p in turn["response"].proposals
+    ]
+    return (
+        proposal_markdown.rstrip()
+        + "\n\n## 会議で挙がった改善提案（未反映）\n"
+        + ("\n".join(proposals) or "(提案はありません)")
+        + "\n"
+    )
+
+
+def _keyword_turns(
+    turns: Sequence[Dict], keywords: Sequence[str], limit: int = FOCUSED_MAX_TURNS
+) -> List[Tuple[int, Dict]]:
+    """キーワードを含む発言を (発言番号, 発言) で返す（多い場合は直近の limit 件）."""
+    selected: deque = deque(maxlen=limit)
+    for idx, turn in enumerate(turns, start=1):
+        response = turn["response"]
+        text = " ".join(
+            [
+                response.summary,
+                *response.concerns,
+                *response.proposals,
+                *response.questions,
+            ]
+        )
+        if any(keyword in text for keyword in keywords):
+            selected.append((idx, turn))
+    return list(selected)
+
+
+def _section_body(heading: str, markdown: str) -> str:
+    """見出し1つ分の本文（モデルが見出し行を付けてきた場合は取り除く）."""
+    lines = markdown.strip().splitlines()
+    if lines and lines[0].startswith("#") and lines[0].lstrip("#").strip() == heading:
+        lines = lines[1:]
+    return "\n".join(lines).strip()
+
+
+def _render_sections(proposal_markdown: str, sections: Dict[str, str]) -> str:
+    title = next(
+        (
+            line[2:].strip()
+            for line in proposal_markdown.splitlines()
+            if line.startswith("# ")
+        ),
+        "企画書",
+    )
+    return f"# {title}（改訂版）\n\n" + "\n".join(
+        f"## {heading}\n\n{body}\n" for heading, body in sections.items()
+    )
+
+
+async def _refine_by_section(
+    proposal_markdown: str,
+    turns: Sequence[Dict],
+    caller: AgentCaller,
+    verbose: bool = False,
+    context_format: str = "markdown",
+) -> Tuple[RefinedProposalOutput, str]:
+    """必須見出しごとに並列で改訂し、見出し間の整合性を確認してから1つの企画書にまとめる.
+
+    各見出しの改訂には企画書全体と、その見出しのキーワードを含む発言だけを渡す。
+    最後の整合性確認では食い違い（予算とKPIの数値など）のある見出しだけを書き直させる。
+    戻り値のモデル名は整合性確認を行ったモデル。
+    """
+    prompts = []
+    for heading, keywords in REFINED_PROPOSAL_SECTIONS.items():
+        discussion = _format_numbered_context(
+            _keyword_turns(turns, keywords), context_format
+        )
+        prompts.append(f"""以下の企画書の「{heading}」を経営会議の議論を踏まえてブラッシュアップしてください。
+
+## 元の企画書
+{proposal_markdown}
+
+## 「{heading}」に関係する発言
+{discussion or "(関係する発言はありません)"}
+""")
+    outputs = await asyncio.gather(*[
+        caller.run(create_section_refiner(heading), prompt, ProposalSectionOutput)
+        for heading, prompt in zip(REFINED_PROPOSAL_SECTIONS, prompts)
+    ])
+    sections = {
+        heading: _section_body(heading, output.markdown)
+        for heading, output in zip(REFINED_PROPOSAL_SECTIONS, outputs)
+    }
+
+    review_prompt = f"""以下の改訂企画書は見出しごとに分担して作成したものです。見出し間の整合性を確認してください。
+
+{_render_sections(proposal_markdown, sections)}
+"""
+    review = await caller.run(
+        create_consistency_checker(), review_prompt, ConsistencyReview
+    )
+    for revised in review.revised_sections:
+        if revised.heading in sections:
+            sections[revised.heading] = _section_body(revised.heading, revised.markdown)
+    if verbose and review.issues:
+        print(f"🔧 見出し間の食い違いを{len(review.issues)}件修正しました:")
+        for issue in review.issues:
+            print(f"   - {'・'.join(issue.headings)}: {issue.issue}")
+    return (
+        RefinedProposalOutput(markdown=_render_sections(proposal_markdown, sections)),
+        caller.records[-1].model,
+    )
+
+
+def _format_axis_scores(scores: Sequence[AxisScore]) -> str:
+    return "\n".join(
+        f"- {score.axis}: 原版 {score.original}/{AXIS_MAX_SCORE}"
+        f" → 改訂版 {score.refined}/{AXIS_MAX_SCORE}（{score.comment}）"
+        for score in scores
+    )
+
+
+async def _evaluate_by_axis(
+    proposal_markdown: str,
+    refined_markdown: str,
+    turns: Sequence[Dict],
+    caller: AgentCaller,
+    axes: Optional[Sequence[str]] = None,
+    previous: Optional[EvaluationOutput] = None,
+    context_format: str = "markdown",
+) -> Tuple[EvaluationOutput, str]:
+    """評価観点ごとに並列で採点し、最後に総合評価（Go/No-Go判定と本文）をまとめる.
+
+    各観点の採点には原版・改訂版の企画書と、その観点のキーワードを含む発言だけを渡す。
+    axes を指定するとその観点だけを採点し、それ以外の観点は previous のスコアを引き継ぐ。
+    戻り値のモデル名は総合評価を行ったモデル。
+    """
+    axes = list(EVALUATION_AXES if axes is None else axes)
+    unknown = [axis for axis in axes if axis not in EVALUATION_AXIS_FOCUS]
+    if unknown:
+        raise ValueError(f"評価観点ではありません: {', '.join(unknown)}")
+
+    async def score_axis(axis: str) -> AxisScore:
+        _, keywords = EVALUATION_AXIS_FOCUS[axis]
+        discussion = _format_numbered_context(
+            _keyword_turns(turns, keywords), context_format
+        )
+        prompt = f"""以下の原版と改訂版の企画書を「{axis}」の観点で比較評価してください。
+
+## 原版企画書
+{proposal_markdown}
+
+## 改訂版企画書（経営会議の議論を踏まえた改訂）
+{refined_markdown}
+
+## 「{axis}」に関係する発言
+{discussion or "(関係する発言はありません)"}
+"""
+        score = await caller.run(create_axis_evaluator(axis), prompt, AxisScore)
+        return score.model_copy(update={"axis": axis})
+
+    scores = previous.scores_by_axis() if previous is not None else {}
+    for score in await asyncio.gather(*[score_axis(axis) for axis in axes]):
+        scores[score.axis] = score
+    axis_scores = [scores[axis] for axis in EVALUATION_AXES if axis in scores]
+
+    summary_prompt = f"""以下の改訂版企画書について、観点ごとの採点結果をもとに総合評価をまとめてください。
+
+## 改訂版企画書
+{refined_markdown}
+
+## 観点ごとの採点結果
+{_format_axis_scores(axis_scores)}
+"""
+    summary = await caller.run(
+        create_evaluation_aggregator(), summary_prompt, EvaluationSummary
+    )
+    evaluation = EvaluationOutput(axis_scores=axis_scores, **summary.model_dump())
+    return evaluation, caller.records[-1].model
+
+
+class _RunningDraft(Generic[ArtifactT]):
+    """討論と並行して更新する成果物（議事録・想定問答）の下書き.
+
+    poke() は討論の発言が終わるたびに呼ばれ、下書きに未反映の発言が interval 件以上あり、
+    更新中でなければバックグラウンドで更新を始める（直前の下書きと新しい発言だけを渡す）。
+    討論の呼び出しと並行して進むため、計測は child() で分けた呼び出し元に記録し、
+    並行する成果物の作成がすべて終わってから merge() で caller に加える。
+    """
+
+    def __init__(
+        self,
+        caller: AgentCaller,
+        agent: Agent,
+        output_type: Type[ArtifactT],
+        label: str,
+        task: str,
+        context: str,
+        interval: int,
+        context_format: str = "markdown",
+    ):
+        self.caller = caller
+        self.agent = agent
+        self.output_type = output_type
+        self.label = label
+        self.task = task
+        self.context = context
+        self.interval = interval
+        self.context_format = context_format
+        self.output: Optional[ArtifactT] = None
+        self.model = ""
+        # 下書きに反映済みの発言数と、バックグラウンドでの更新回数
+        self.covered = 0
+        self.updates = 0
+        self.records: List[CallRecord] = []
+        self.call_count = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def _prompt(self, new_turns: Sequence[Dict], final: bool) -> str:
+        if final:
+            status = "討論はこれで終了です。下書きに新しい発言を反映し、最終版として仕上げてください。"
+        else:
+            status = "討論は続いています。ここまでの発言の範囲で下書きを更新してください。"
+        previous = self.output.markdown if self.output is not None else "(まだ下書きはありません)"
+        start = self.covered + 1
+        new = _format_context(new_turns, self.context_format, start=start)
+        return f"""{self.task}
+討論の途中で作成した下書きがあるため、新しい発言を反映して更新してください。
+
+{self.context}
+
+## これまでの下書き（ターン{self.covered}までを反映済み）
+{previous}
+
+## 新しい発言
+{new or "(新しい発言はありません)"}
+
+{status}
+"""
+
+    async def _update(self, turns: Sequence[Dict], final: bool) -> None:
+        end = len(turns)
+        child = self.caller.child()
+        child.console = None
+        prompt = self._prompt(turns[self.covered:end], final)
+        name = f"{self.label}の最終化" if final else f"{self.label}の下書き"
+        with child.span(name, "stage", turns=f"{self.covered + 1}-{end}"):
+            output = await child.run(self.agent, prompt, self.output_type)
+        self.output, self.model, self.covered = output, child.records[-1].model, end
+        self.records.extend(child.records)
+        self.call_count += child.call_count
+        if not final:
+            self.updates += 1
+
+    def poke(self, turns: Sequence[Dict]) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        if self._task is not None and self._task.exception() is not None:
+            return
+        if len(turns) - self.covered >= self.interval:
+            self._task = asyncio.ensure_future(self._update(turns, final=False))
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def finish(self, turns: Sequence[Dict]) -> Tuple[ArtifactT, str]:
+        """更新中の下書きを待ち、未反映の発言があれば最終化してから返す.
+
+        バックグラウンドの更新が失敗・取り消しで終わっていた場合は、それまでの下書きから最終化する。
+        """
+        if self._task is not None:
+            await asyncio.wait({self._task})
+            if not self._task.cancelled():
+                # 失敗した更新の例外は取り出して捨てる（下書きと反映済みの発言数は更新前のまま）
+                self._task.exception()
+        if self.output is None or self.covered < len(turns):
+            await self._update(turns, final=True)
+        assert self.output is not None
+        return self.output, self.model
+
+    async def finalize(
+        self,
+        turns: Sequence[Dict],
+        deadline: Optional[MeetingDeadline],
+        writer_calls_left: int,
+        fallback: Callable[[], ArtifactT],
+    ) -> Tuple[ArtifactT, str]:
+        """finish() を実行する.
+
+        時間予算を超えた場合は、下書きがあればそれを、なければ簡易版を返す。
+        """
+        try:
+            return await asyncio.wait_for(
+                self.finish(turns),
+                deadline.writer_call_timeout(writer_calls_left) if deadline else None,
+            )
+        except asyncio.TimeoutError:
+            if deadline is None:
+                raise
+            if self.output is not None:
+                deadline.degrade(
+                    f"{self.label}の最終化が時間予算内に終わらなかったため"
+                    f"ターン{self.covered}までの下書きを出力しました"
+                )
+                return self.output, self.model
+            deadline.degrade(f"{self.label}の生成が時間予算内に終わらなかったため簡易版を出力しました")
+            return fallback(), LOCAL_FALLBACK_MODEL
+
+    def merge(self) -> None:
+        """下書きの計測を caller に加える（並行する成果物が records[-1] を読み終えてから呼ぶ）."""
+        self.caller.records.extend(self.records)
+        self.caller.call_count += self.call_count
+        self.records, self.call_count = [], 0
+
+
+@dataclass
+class MeetingResult:
+    """1回の会議で生成された成果物と発言履歴."""
+
+    minutes: str
+    qa: str
+    refined_proposal: str
+    discussion_log: str
+    evaluation: str
+    turns: List[Dict] = field(default_factory=list)
+    evaluation_output: Optional[EvaluationOutput] = None
+    started_at: float = 0.0
+    duration: float = 0.0
+    call_records: Union[List[CallRecord], SpillingCallRecords] = field(
+        default_factory=list
+    )
+    degradation: List[str] = field(default_factory=list)
+    artifact_models: Dict[str, str] = field(default_factory=dict)
+    discussion_digest: Optional[DiscussionDigest] = None
+    discussion_log_path: Optional[Path] = None
+    http_pool_stats: Optional[PoolStats] = None
+    trace: Optional[TraceRecorder] = None
+    speculation: Optional[SpeculationStats] = None
+    repairs: Dict[str, int] = field(default_factory=dict)
+
+    def as_tuple(self) -> Tuple[str, str, str, str, str]:
+        return (
+            self.minutes,
+            self.qa,
+            self.refined_proposal,
+            self.discussion_log,
+            self.evaluation,
+        )
+
+
+async def _run_meeting(
+    proposal_markdown: str,
+    rounds: int = 12,
+    context_turns: int = 6,
+    verbose: bool = True,
+    caller: Optional[AgentCaller] = None,
+    proposal_digest: Optional[ProposalDigest] = None,
+    deadline: Optional[MeetingDeadline] = None,
+    agenda_size: int = 1,
+    digest_block_size: Optional[int] = None,
+    spill_dir: Optional[Path] = None,
+    board: Optional[BoardConfig] = None,
+    group_rounds: Optional[int] = None,
+    stream_dir: Optional[Path] = None,
+    section_refine: bool = False,
+    axis_evaluate: bool = False,
+    debate: Optional[DebateCheckpoint] = None,
+    opening_statements: bool = False,
+    on_event: Optional[Callable[[MeetingEvent], None]] = None,
+    trace: bool = False,
+    draft_interval: Optional[int] = None,
+    speculate: bool = False,
+    context_format: str = "markdown",
+    validate_outputs: bool = False,
+) -> MeetingResult:
+    """経営会議を1回実行する.
+
+    caller を共有すると複数の会議で同時実行数の上限を共有できる。
+    proposal_digest を渡すとファシリテーターへの企画書抜粋としてダイジェストを使う。
+    deadline を渡すと時間予算内に収まるよう討論を短縮し、間に合わない成果物は
+    討論内容から簡易版を作成する（いずれの場合も全成果物を返す）。
+    agenda_size を2以上にすると、ファシリテーターは1回の呼び出しでその人数分の指名を行う。
+    digest_block_size を指定すると、討論がそれより長い場合は成果物作成エージェントに
+    討論ログ全文の代わりにダイジェストを渡す（原文はツールで必要な分だけ参照させる）。
+    spill_dir を指定すると省メモリモードになり、発言は spill_dir/turns.jsonl に、呼び出しの計測記録は
+    spill_dir/calls.jsonl に逐次書き出して直近の分だけをメモリに残す。成果物作成にはダイジェストを使い、対話履歴は
+    spill_dir/discussion_log.md に直接書き出す（MeetingResult.discussion_log_path）。
+    board を指定するとその参加者構成で討論する（未指定時は ROLE_INSTRUCTIONS の役割全員）。
+    board に部会がある場合は階層型の会議になり、部会ごとに group_rounds ラウンド
+    （未指定時・メンバー数未満の場合はメンバー数）の討論を並行して行った後、rounds ラウンドの全体会議を行う。
+    caller がストリーミング実行の場合、stream_dir を指定すると各成果物の生成中の本文を
+    stream_dir/<成果物>.md に逐次書き出す（最終版は呼び出し側で上書きする）。
+    section_refine を指定すると、改訂企画書を必須見出しごとに並列で作成してから整合性を確認する
+    （改訂企画書の生成中の本文は書き出さない）。
+    axis_evaluate を指定すると、評価観点ごとに並列で採点してから総合評価をまとめる
+    （評価レポートの生成中の本文は書き出さない）。
+    debate を指定すると討論は行わず、その発言履歴から成果物を作成する
+    （討論の呼び出しの計測は MeetingResult.call_records の先頭に含める）。
+    opening_statements を指定すると、全員の冒頭発言を企画書だけをもとに同時に行ってから
+    ファシリテーターの指名による討論を始める（部会がある場合は各部会と全体会議のそれぞれで行う）。
+    on_event を指定すると、発言の開始・終了、各成果物の完成、最後に会議全体の計測値を通知する。
+    trace を指定すると、会議全体・各段階・ラウンド・エージェント呼び出しの区間を記録する（MeetingResult.trace）。
+    draft_interval を指定すると、討論と並行して議事録・想定問答の下書きを発言 draft_interval 件ごとに
+    バックグラウンドで更新し、討論後は残りの発言を反映して仕上げるだけにする（部会の発言は
+    部会の終了後に反映する）。討論後の議事録・想定問答の仕上げと改訂企画書の作成は並行して行う。
+    speculate を指定すると、ファシリテーターの指名と並行して次の発言者を予測して発言を始め、
+    指名と一致すれば採用する（的中率と無駄になったトークン数は MeetingResult.speculation）。
+    context_format を "compact" にすると、エージェントに渡す発言履歴を簡潔な機械向けの形式にする
+    （指名理由を省き、懸念・提案・質問は発言番号つきのIDで並べる）。対話履歴（discussion_log）は常に Markdown。
+    validate_outputs を指定すると、議事録・改訂企画書の必須見出しと想定問答集の問数をローカルで確認し、
+    不足があれば不足分だけを追加の呼び出しで作成して本文に加える（成果物ごとの呼び出し回数は MeetingResult.repairs）。
+    """
+    if context_format not in CONTEXT_FORMATS:
+        raise ValueError(
+            f"context_format は {', '.join(CONTEXT_FORMATS)} のいずれかを指定してください。"
+        )
+    if agenda_size < 1:
+        raise ValueError("agenda_size は1以上を指定してください。")
+    if draft_interval is not None and draft_interval < 1:
+        raise ValueError("draft_interval は1以上を指定してください。")
+    turn_store: Optional[SpillingTurnStore] = None
+    if spill_dir is not None:
+        turn_store = SpillingTurnStore(
+            Path(spill_dir) / "turns.jsonl", window=max(1, context_turns)
+        )
+        digest_block_size = digest_block_size or SPILL_DIGEST_BLOCK_SIZE
+    caller = (caller or AgentCaller()).child()
+    if spill_dir is not None:
+        caller.records = SpillingCallRecords(Path(spill_dir) / "calls.jsonl")
+    if trace:
+        caller.tracer = TraceRecorder()
+    started_at = time.time()
+    board = board or default_board()
+    roles = list(board.roles)
+    effective_rounds = max(rounds, len(board.plenary_roles()))
+
+    facilitator = (
+        create_agenda_facilitator(agenda_size)
+        if agenda_size > 1
+        else create_facilitator()
+    )
+    minutes_writer = create_minutes_writer()
+    qa_writer = create_qa_writer()
+    refiner = create_refiner()
+    evaluator = create_evaluator()
+
+    if verbose:
+        print("=" * 80)
+        print("🏢 経営会議討論を開始します")
+        print("=" * 80)
+        print(f"\n📋 参加者: {', '.join(roles)}")
+        for group in board.groups:
+            print(f"   🧩 {group.name}（リード: {group.lead}）: {', '.join(group.members)}")
+        print(f"🔄 討論ラウンド数: {effective_rounds}\n")
+
+    minutes_task = "以下の経営会議の討論ログを議事録にまとめてください。"
+    minutes_context = f"""## 企画書
 {proposal_markdown}
 
 ## 参加者
-""" + "\n".join([f"- {role}" for role in roles]) + f"""
+""" + "\n".join([f"- {role}" for role in roles])
+    qa_task = "以下の経営会議内容をもとに想定問答集を作成してください。"
+    qa_context = f"""## 企画書
+{proposal_markdown}"""
+
+    # 下書きの更新は討論中の発言履歴を直接参照する
+    live_turns: Union[List[Dict], SpillingTurnStore] = (
+        turn_store if turn_store is not None else []
+    )
+    drafts: List[_RunningDraft] = []
+    if draft_interval is not None:
+        drafts = [
+            _RunningDraft(
+                caller,
+                minutes_writer,
+                MinutesOutput,
+                "議事録",
+                minutes_task,
+                minutes_context,
+                draft_interval,
+                context_format=context_format,
+            ),
+            _RunningDraft(
+                caller,
+                qa_writer,
+                QAOutput,
+                "想定問答",
+                qa_task,
+                qa_context,
+                draft_interval,
+                context_format=context_format,
+            ),
+        ]
+
+    def poke_drafts(event: MeetingEvent) -> None:
+        """イベントを on_event に渡し、発言が終わるたびに下書きの更新を促す."""
+        if on_event is not None:
+            on_event(event)
+        if isinstance(event, TurnFinished):
+            for draft in drafts:
+                draft.poke(live_turns)
+
+    debate_on_event: Optional[Callable[[MeetingEvent], None]] = (
+        poke_drafts if drafts else on_event
+    )
+
+    speculation = SpeculationStats() if speculate else None
+    facilitator_proposal = _format_digest(proposal_digest) if proposal_digest else None
+    debate_started_at = time.time()
+    try:
+        if debate is not None:
+            turns, counts = list(debate.turns), dict(debate.counts)
+            caller.records.extend(debate.records)
+        elif board.hierarchical:
+            turns, counts = await _run_hierarchical_debate(
+                proposal_markdown=proposal_markdown,
+                board=board,
+                facilitator=facilitator,
+                effective_rounds=effective_rounds,
+                group_rounds=group_rounds,
+                context_turns=context_turns,
+                verbose=verbose,
+                caller=caller,
+                facilitator_proposal=facilitator_proposal,
+                deadline=deadline,
+                agenda_size=agenda_size,
+                turn_store=live_turns,
+                opening_statements=opening_statements,
+                on_event=debate_on_event,
+                speculation=speculation,
+                context_format=context_format,
+            )
+        else:
+            turns, counts = await _run_debate(
+                proposal_markdown=proposal_markdown,
+                roles=roles,
+                facilitator=facilitator,
+                participants={
+                    role: create_participant(role, board.roles[role]) for role in roles
+                },
+                effective_rounds=effective_rounds,
+                context_turns=context_turns,
+                verbose=verbose,
+                caller=caller,
+                facilitator_proposal=facilitator_proposal,
+                deadline=deadline,
+                agenda_size=agenda_size,
+                turn_store=live_turns,
+                opening_statements=opening_statements,
+                on_event=debate_on_event,
+                speculation=speculation,
+                context_format=context_format,
+            )
+    except BaseException:
+        for draft in drafts:
+            draft.cancel()
+        raise
+    if turn_store is not None:
+        turn_store.close()
+    caller.trace("討論", "stage", debate_started_at)
+
+    if verbose:
+        print("\n" + "=" * 80)
+        print("✅ 討論完了")
+        print("=" * 80)
+        print("\n📊 発言回数:")
+        for role in roles:
+            print(f"   - {role}: {counts[role]}回")
+        print(f"\n📝 議事録・想定問答・改訂企画書を生成中...\n")
+
+    discussion_digest: Optional[DiscussionDigest] = None
+    if digest_block_size and len(turns) > digest_block_size:
+        if verbose:
+            print(f"🗜️  討論ログ（{len(turns)}ターン）を{digest_block_size}ターンごとに要約中...\n")
+        parallel = SPILL_MAX_PARALLEL_BLOCKS if turn_store is not None else None
+        timeout = deadline.writer_call_timeout(WRITER_CALLS + 1) if deadline else None
+        try:
+            with caller.span("討論ログの要約", "stage"):
+                discussion_digest = await asyncio.wait_for(
+                    _digest_discussion(
+                        turns,
+                        caller,
+                        digest_block_size,
+                        max_parallel_blocks=parallel,
+                        context_format=context_format,
+                    ),
+                    timeout,
+                )
+        except asyncio.TimeoutError:
+            if deadline is None:
+                raise
+            deadline.degrade("討論ログの要約が時間予算内に終わらなかったため全文を使用しました")
+    if discussion_digest is not None:
+        full_discussion = _format_discussion_digest(
+            discussion_digest, total_turns=len(turns)
+        )
+        raw_log_tool = _create_raw_log_tool(turns, context_format)
+        minutes_writer, qa_writer, refiner, evaluator = [
+            writer.clone(tools=[raw_log_tool])
+            for writer in (minutes_writer, qa_writer, refiner, evaluator)
+        ]
+    else:
+        full_discussion = _format_context(turns, context_format)
+
+    # 対話履歴をMarkdown形式で整形（省メモリモードでは最後にファイルへ直接書き出す）
+    discussion_log_md = (
+        _render_discussion_log(turns, roles, counts) if turn_store is None else ""
+    )
+
+    def minutes_fallback() -> MinutesOutput:
+        return MinutesOutput(markdown=_fallback_minutes(turns, roles))
+
+    def qa_fallback() -> QAOutput:
+        return QAOutput(markdown=_fallback_qa(turns))
+
+    refined_prompt = f"""以下の企画書を経営会議の議論を踏まえてブラッシュアップしてください。
+
+## 元の企画書
+{proposal_markdown}
 
 ## 討論ログ
 {full_discussion}
 """
 
-    minutes_result = await Runner.run(minutes_writer, minutes_prompt)
-    minutes = minutes_result.final_output_as(MinutesOutput)
+    def refined_fallback() -> RefinedProposalOutput:
+        return RefinedProposalOutput(
+            markdown=_fallback_refined_proposal(proposal_markdown, turns)
+        )
 
-    qa_prompt = f"""以下の経営会議内容をもとに想定問答集を作成してください。
+    repairs: Dict[str, int] = {}
 
-## 企画書
-{proposal_markdown}
+    async def repair(
+        kind: str, output: ArtifactT, model: str, writer_calls_left: int, source: str
+    ) -> ArtifactT:
+        """validate_outputs の場合、成果物の不足分（見出し・質問）だけを補う（簡易版は対象外）."""
+        if not validate_outputs or model == LOCAL_FALLBACK_MODEL:
+            return output
+        check = check_artifact(kind, output.markdown)
+        if check.ok:
+            return output
+        label = ARTIFACT_LABELS[kind]
+        # 並行して作成中の成果物が records[-1] でモデル名を取るため、別の呼び出し元で補って後から加える
+        repairer = caller.child()
+        timeout = deadline.writer_call_timeout(writer_calls_left) if deadline else None
+        try:
+            with caller.span(f"{label}の修復", "stage"):
+                markdown, calls = await asyncio.wait_for(
+                    repair_artifact(repairer, kind, output.markdown, source),
+                    timeout,
+                )
+        except asyncio.TimeoutError:
+            if deadline is None:
+                raise
+            deadline.degrade(f"{label}の不足分を時間予算内に補えなかったため補う前の版を出力しました")
+            return output
+        finally:
+            caller.records.extend(repairer.records)
+            caller.call_count += repairer.call_count
+        repairs[kind] = calls
+        if verbose:
+            print(f"🩹 {check.describe()}を{calls}回の呼び出しで補いました")
+        return type(output)(markdown=markdown)
+
+    minutes_source = f"{minutes_context}\n\n## 討論ログ\n{full_discussion}"
+    qa_source = f"{qa_context}\n\n## 討論ログ\n{full_discussion}"
+
+    async def write_refined() -> Tuple[RefinedProposalOutput, str]:
+        if not section_refine:
+            return await _write_artifact(
+                caller,
+                deadline,
+                refiner,
+                refined_prompt,
+                RefinedProposalOutput,
+                2,
+                "改訂企画書",
+                refined_fallback,
+                stream_path=_stream_path(stream_dir, "refined_proposal"),
+            )
+        try:
+            with caller.span("改訂企画書", "stage"):
+                return await asyncio.wait_for(
+                    _refine_by_section(
+                        proposal_markdown,
+                        turns,
+                        caller,
+                        verbose=verbose,
+                        context_format=context_format,
+                    ),
+                    deadline.writer_call_timeout(2) if deadline else None,
+                )
+        except asyncio.TimeoutError:
+            if deadline is None:
+                raise
+            deadline.degrade("改訂企画書の生成が時間予算内に終わらなかったため簡易版を出力しました")
+            return refined_fallback(), LOCAL_FALLBACK_MODEL
+
+    if drafts:
+        minutes_draft, qa_draft = drafts
+        if verbose:
+            print(
+                f"📝 討論中に議事録の下書きを{minutes_draft.updates}回・"
+                f"想定問答の下書きを{qa_draft.updates}回更新しました。"
+                "残りの発言を反映して仕上げます\n"
+            )
+        # 下書きの仕上げ（討論中の呼び出し元とは別に記録）と改訂企画書の作成を並行して行う
+        minutes_future = asyncio.ensure_future(
+            minutes_draft.finalize(turns, deadline, 4, minutes_fallback)
+        )
+        qa_future = asyncio.ensure_future(
+            qa_draft.finalize(turns, deadline, 3, qa_fallback)
+        )
+        refined_future = asyncio.ensure_future(write_refined())
+        pending: List[asyncio.Future] = [minutes_future, qa_future, refined_future]
+        try:
+            minutes, minutes_model = await minutes_future
+            minutes = await repair("minutes", minutes, minutes_model, 3, minutes_source)
+            if on_event is not None:
+                on_event(ArtifactReady("minutes", minutes.markdown, minutes_model))
+            qa_output, qa_model = await qa_future
+            qa_output = await repair("qa", qa_output, qa_model, 2, qa_source)
+            if on_event is not None:
+                on_event(ArtifactReady("qa", qa_output.markdown, qa_model))
+            refined_output, refined_model = await refined_future
+        finally:
+            for task in pending:
+                task.cancel()
+            # 並行する改訂企画書の作成が records[-1] でモデル名を取り終えてから、決まった順に加える
+            for draft in drafts:
+                draft.merge()
+    else:
+        minutes_prompt = f"""{minutes_task}
+
+{minutes_context}
 
 ## 討論ログ
 {full_discussion}
 """
 
-    qa_result = await Runner.run(qa_writer, qa_prompt)
-    qa_output = qa_result.final_output_as(QAOutput)
+        minutes, minutes_model = await _write_artifact(
+            caller, deadline, minutes_writer, minutes_prompt, MinutesOutput, 4, "議事録",
+            minutes_fallback, stream_path=_stream_path(stream_dir, "minutes"),
+        )
+        minutes = await repair("minutes", minutes, minutes_model, 3, minutes_source)
+        if on_event is not None:
+            on_event(ArtifactReady("minutes", minutes.markdown, minutes_model))
 
-    refined_prompt = f"""以下の企画書を経営会議の議論を踏まえてブラッシュアップしてください。
+        qa_prompt = f"""{qa_task}
 
-## 元の企画書
-{proposal_markdown}
+{qa_context}
 
 ## 討論ログ
 {full_discussion}
 """
 
-    refined_result = await Runner.run(refiner, refined_prompt)
-    refined_output = refined_result.final_output_as(RefinedProposalOutput)
+        qa_output, qa_model = await _write_artifact(
+            caller, deadline, qa_writer, qa_prompt, QAOutput, 3, "想定問答",
+            qa_fallback, stream_path=_stream_path(stream_dir, "qa"),
+        )
+        qa_output = await repair("qa", qa_output, qa_model, 2, qa_source)
+        if on_event is not None:
+            on_event(ArtifactReady("qa", qa_output.markdown, qa_model))
+
+        refined_output, refined_model = await write_refined()
+    refined_output = await repair(
+        "refined_proposal", refined_output, refined_model, 1, refined_prompt
+    )
+    if on_event is not None:
+        on_event(
+            ArtifactReady("refined_proposal", refined_output.markdown, refined_model)
+        )
 
     if verbose:
         print("📊 提案書の評価レポートを生成中...\n")
@@ -248,13 +1914,193 @@ async def _run_board_meeting(
 上記を踏まえ、提案の質を詳細に評価し、経営判断のための推奨事項をまとめてください。
 """
 
-    evaluation_result = await Runner.run(evaluator, evaluation_prompt)
-    evaluation_output = evaluation_result.final_output_as(EvaluationOutput)
+    def evaluation_fallback() -> EvaluationOutput:
+        return EvaluationOutput(
+            markdown="# 企画書評価レポート（未生成）\n\n時間予算内に評価を完了できませんでした。",
+            verdict="",
+        )
+
+    if axis_evaluate:
+        try:
+            with caller.span("評価レポート", "stage"):
+                evaluation_output, evaluation_model = await asyncio.wait_for(
+                    _evaluate_by_axis(
+                        proposal_markdown,
+                        refined_output.markdown,
+                        turns,
+                        caller,
+                        context_format=context_format,
+                    ),
+                    deadline.writer_call_timeout(1) if deadline else None,
+                )
+        except asyncio.TimeoutError:
+            if deadline is None:
+                raise
+            deadline.degrade("評価レポートの生成が時間予算内に終わらなかったため簡易版を出力しました")
+            evaluation_output = evaluation_fallback()
+            evaluation_model = LOCAL_FALLBACK_MODEL
+    else:
+        evaluation_output, evaluation_model = await _write_artifact(
+            caller,
+            deadline,
+            evaluator,
+            evaluation_prompt,
+            EvaluationOutput,
+            1,
+            "評価レポート",
+            evaluation_fallback,
+            stream_path=_stream_path(stream_dir, "evaluation"),
+        )
+    if on_event is not None:
+        on_event(
+            ArtifactReady(
+                "evaluation",
+                _render_evaluation_markdown(evaluation_output),
+                evaluation_model,
+            )
+        )
 
     if verbose:
         print("✅ すべての成果物の生成が完了しました\n")
 
-    return minutes.markdown, qa_output.markdown, refined_output.markdown, discussion_log_md, evaluation_output.markdown
+    result = MeetingResult(
+        minutes=minutes.markdown,
+        qa=qa_output.markdown,
+        refined_proposal=refined_output.markdown,
+        discussion_log=discussion_log_md,
+        evaluation=_render_evaluation_markdown(evaluation_output),
+        turns=turns,
+        evaluation_output=evaluation_output,
+        started_at=started_at,
+        duration=time.time() - started_at,
+        call_records=caller.records,
+        discussion_digest=discussion_digest,
+        speculation=speculation,
+        repairs=repairs,
+        artifact_models={
+            "minutes": minutes_model,
+            "qa": qa_model,
+            "refined_proposal": refined_model,
+            "evaluation": evaluation_model,
+        },
+    )
+    notice = deadline.notice() if deadline is not None and deadline.degraded else ""
+    if spill_dir is not None and isinstance(caller.records, SpillingCallRecords):
+        caller.records.close()
+        result.discussion_log_path = Path(spill_dir) / "discussion_log.md"
+        with open(result.discussion_log_path, "w", encoding="utf-8") as log_file:
+            log_file.write(notice)
+            for chunk in _iter_discussion_log(turns, roles, counts):
+                log_file.write(chunk)
+    if deadline is not None and notice:
+        result.minutes = notice + result.minutes
+        result.qa = notice + result.qa
+        result.refined_proposal = notice + result.refined_proposal
+        if turn_store is None:
+            result.discussion_log = notice + result.discussion_log
+        result.evaluation = notice + result.evaluation
+        result.degradation = list(deadline.reasons)
+        if verbose:
+            print("⚠️  時間予算のため縮退モードで生成しました:")
+            for reason in deadline.reasons:
+                print(f"   - {reason}")
+    caller.trace(
+        "会議", "meeting", started_at, rounds=len(turns), calls=len(result.call_records)
+    )
+    result.trace = caller.tracer
+    if on_event is not None:
+        on_event(
+            MeetingMetrics(
+                result.duration,
+                len(result.call_records),
+                len(turns),
+                list(result.degradation),
+                dict(repairs),
+            )
+        )
+    return result
+
+
+async def _run_board_meeting(
+    proposal_markdown: str,
+    rounds: int = 12,
+    context_turns: int = 6,
+    verbose: bool = True,
+    on_result: Optional[Callable[[MeetingResult], None]] = None,
+    time_budget: Optional[float] = None,
+    hedge: Optional[HedgePolicy] = None,
+    router: Optional[ModelRouter] = None,
+    agenda_size: int = 1,
+    digest_block_size: Optional[int] = None,
+    spill_dir: Optional[Path] = None,
+    board: Optional[BoardConfig] = None,
+    group_rounds: Optional[int] = None,
+    stream_dir: Optional[Path] = None,
+    section_refine: bool = False,
+    axis_evaluate: bool = False,
+    http_pool: Optional[HttpPoolConfig] = None,
+    opening_statements: bool = False,
+    trace: bool = False,
+    run_config: Optional[RunConfig] = None,
+    draft_interval: Optional[int] = None,
+    speculate: bool = False,
+    context_format: str = "markdown",
+    validate_outputs: bool = False,
+) -> Tuple[str, str, str, str, str]:
+    """run_board_meeting の本体. run_config を指定すると全呼び出しに渡す（ドライランのスタブモデルなど）."""
+    if http_pool is not None and run_config is not None:
+        raise ValueError("http_pool と run_config は同時に指定できません。")
+    streaming = stream_dir is not None
+    pool = SharedHttpClient(http_pool) if http_pool is not None else None
+    if pool is not None:
+        run_config = pool.run_config
+    try:
+        result = await _run_meeting(
+            proposal_markdown=proposal_markdown,
+            rounds=rounds,
+            context_turns=context_turns,
+            verbose=verbose,
+            caller=AgentCaller(
+                hedge=hedge,
+                router=router,
+                streaming=streaming,
+                console=ConsoleStream() if streaming and verbose else None,
+                run_config=run_config,
+            ),
+            deadline=MeetingDeadline(time_budget) if time_budget else None,
+            agenda_size=agenda_size,
+            digest_block_size=digest_block_size,
+            spill_dir=spill_dir,
+            board=board,
+            group_rounds=group_rounds,
+            stream_dir=stream_dir,
+            section_refine=section_refine,
+            axis_evaluate=axis_evaluate,
+            opening_statements=opening_statements,
+            trace=trace,
+            draft_interval=draft_interval,
+            speculate=speculate,
+            context_format=context_format,
+            validate_outputs=validate_outputs,
+        )
+        if pool is not None:
+            result.http_pool_stats = pool.stats()
+    finally:
+        if pool is not None:
+            await pool.aclose()
+    if verbose and result.http_pool_stats is not None:
+        print(format_pool_stats(result.http_pool_stats))
+    if verbose and streaming:
+        _print_stream_summary(result.call_records)
+    if verbose and hedge is not None:
+        _print_hedge_summary(hedge)
+    if verbose and router is not None:
+        _print_router_summary(router)
+    if verbose and result.speculation is not None:
+        print(format_speculation_stats(result.speculation))
+    if on_result is not None:
+        on_result(result)
+    return result.as_tuple()
 
 
 def run_board_meeting(
@@ -262,12 +2108,358 @@ def run_board_meeting(
     rounds: int = 12,
     context_turns: int = 6,
     verbose: bool = True,
+    on_result: Optional[Callable[[MeetingResult], None]] = None,
+    time_budget: Optional[float] = None,
+    hedge: Optional[HedgePolicy] = None,
+    router: Optional[ModelRouter] = None,
+    agenda_size: int = 1,
+    digest_block_size: Optional[int] = None,
+    spill_dir: Optional[Path] = None,
+    board: Optional[BoardConfig] = None,
+    group_rounds: Optional[int] = None,
+    stream_dir: Optional[Path] = None,
+    section_refine: bool = False,
+    axis_evaluate: bool = False,
+    http_pool: Optional[HttpPoolConfig] = None,
+    opening_statements: bool = False,
+    trace: bool = False,
+    draft_interval: Optional[int] = None,
+    speculate: bool = False,
+    context_format: str = "markdown",
+    validate_outputs: bool = False,
 ) -> Tuple[str, str, str, str, str]:
+    """経営会議を実行し、5つの成果物Markdownを返す.
+
+    on_result を指定すると、発言履歴・計測値・構造化スコアを含む MeetingResult を受け取れる。
+    time_budget（秒）を指定すると、その時間内に必ず成果物を返すよう討論と成果物作成を調整する。
+    hedge を指定すると、遅い呼び出しに複製を発行してテールレイテンシを抑える。
+    router を指定すると、障害中のモデルを避けてフォールバックモデルで呼び出しを続ける。
+    agenda_size を2以上にすると、ファシリテーターの呼び出しを約 1/agenda_size に減らす。
+    digest_block_size を指定すると、長い討論ログは並列要約したダイジェストとして成果物作成に渡す。
+    spill_dir を指定すると省メモリモードで実行する。対話履歴は spill_dir/discussion_log.md に
+    書き出され、戻り値の対話履歴は空文字列になる。
+    board を指定するとその参加者構成で討論し、部会がある場合は部会ごとの討論を並行して行う。
+    stream_dir を指定するとストリーミング実行になり、生成中の本文をコンソールに逐次表示し、
+    各成果物を stream_dir/<成果物>.md に逐次書き出す。
+    section_refine を指定すると、改訂企画書を見出しごとに並列で作成し、最後に見出し間の整合性を確認する。
+    axis_evaluate を指定すると、評価観点ごとに並列で採点し、最後に総合評価をまとめる
+    （rescore_axes で一部の観点だけを採点し直せる）。
+    http_pool を指定すると、全エージェントの呼び出しでその設定の共有HTTPクライアント（接続プール）を使い、
+    接続プールの統計を MeetingResult.http_pool_stats に記録する。
+    opening_statements を指定すると、全員の冒頭発言を同時に行ってから討論を始める
+    （全員が最低1回発言するための直列の呼び出しがなくなる）。
+    trace を指定すると、会議のタイムライン（段階・ラウンド・エージェント呼び出し）を MeetingResult.trace に記録する
+    （TraceRecorder.write で Chrome trace / Perfetto 形式のJSONに書き出せる）。
+    draft_interval を指定すると、討論中に発言 draft_interval 件ごとに議事録・想定問答の下書きを
+    バックグラウンドで更新し、討論後は残りの発言を反映して仕上げるだけにする。
+    speculate を指定すると、ファシリテーターの指名を待たずに次の発言者を予測して発言を始める
+    （外れた発言は捨てるため、的中率に応じて所要時間が縮み、トークン消費が増える）。
+    context_format を "compact" にすると、エージェントに渡す発言履歴を簡潔な機械向けの形式にして
+    入力トークンを減らす（対話履歴は常に Markdown）。
+    validate_outputs を指定すると、議事録・想定問答集・改訂企画書の必須見出しと問数を確認し、
+    不足分だけを追加の呼び出しで補う。
+    """
     return asyncio.run(
         _run_board_meeting(
             proposal_markdown=proposal_markdown,
             rounds=rounds,
             context_turns=context_turns,
             verbose=verbose,
+            on_result=on_result,
+            time_budget=time_budget,
+            hedge=hedge,
+            router=router,
+            agenda_size=agenda_size,
+            digest_block_size=digest_block_size,
+            spill_dir=spill_dir,
+            board=board,
+            group_rounds=group_rounds,
+            stream_dir=stream_dir,
+            section_refine=section_refine,
+            axis_evaluate=axis_evaluate,
+            http_pool=http_pool,
+            opening_statements=opening_statements,
+            trace=trace,
+            draft_interval=draft_interval,
+            speculate=speculate,
+            context_format=context_format,
+            validate_outputs=validate_outputs,
+        )
+    )
+
+
+def rescore_axes(
+    proposal_markdown: str, result: MeetingResult, axes: Sequence[str]
+) -> EvaluationOutput:
+    """会議結果の評価のうち axes の観点だけを採点し直し、総合評価をまとめ直す.
+
+    その他の観点は result.evaluation_output のスコアを引き継ぐ。result の評価
+    （evaluation・evaluation_output・artifact_models・call_records）を更新し、更新後の評価を返す。
+    """
+    caller = AgentCaller()
+    evaluation, model = asyncio.run(
+        _evaluate_by_axis(
+            proposal_markdown, result.refined_proposal, result.turns, caller,
+            axes=axes, previous=result.evaluation_output,
+        )
+    )
+    result.evaluation_output = evaluation
+    result.evaluation = _render_evaluation_markdown(evaluation)
+    result.artifact_models["evaluation"] = model
+    result.call_records.extend(caller.records)
+    return evaluation
+
+
+def _print_stream_summary(records: Sequence[CallRecord]) -> None:
+    ttfts = [record.ttft for record in records if record.ttft is not None]
+    ttlts = [record.ttlt for record in records if record.ttlt is not None]
+    if not ttfts:
+        return
+    print(
+        f"⚡ ストリーミング: 最初のトークンまで 平均{sum(ttfts) / len(ttfts):.1f}秒"
+        f" / 最大{max(ttfts):.1f}秒、最後のトークンまで 平均{sum(ttlts) / len(ttlts):.1f}秒"
+        f" / 最大{max(ttlts):.1f}秒（{len(ttfts)}回）"
+    )
+
+
+def _print_hedge_summary(hedge: HedgePolicy) -> None:
+    summary = hedge.summary()
+    print(
+        f"🛡️  ヘッジリクエスト: {summary['hedges_issued']}回発行 / "
+        f"うち{summary['hedges_won']}回で複製が先に完了（通常呼び出し {summary['primary_calls']}回）"
+    )
+
+
+def _print_router_summary(router: ModelRouter) -> None:
+    states = ", ".join(f"{model}: {state}" for model, state in router.summary().items())
+    print(f"🔀 モデル: {states}（フォールバック {router.fallbacks}回）")
+
+
+def _proposal_key(proposal_markdown: str) -> str:
+    return hashlib.sha256(proposal_markdown.encode("utf-8")).hexdigest()
+
+
+async def _get_proposal_digest(
+    proposal_markdown: str,
+    digest_writer: Agent,
+    cache_dir: Optional[Path] = None,
+    caller: Optional[AgentCaller] = None,
+) -> ProposalDigest:
+    """企画書のダイジェストを返す。同一本文ならキャッシュを再利用する."""
+    key = _proposal_key(proposal_markdown)
+    if key in _DIGEST_CACHE:
+        return _DIGEST_CACHE[key]
+
+    cache_path = cache_dir / f"{key}.json" if cache_dir is not None else None
+    if cache_path is not None and cache_path.exists():
+        digest = ProposalDigest.model_validate_json(
+            cache_path.read_text(encoding="utf-8")
+        )
+        _DIGEST_CACHE[key] = digest
+        return digest
+
+    digest_prompt = f"""以下の企画書のダイジェストを作成してください。
+
+## 企画書
+{proposal_markdown}
+"""
+    caller = caller or AgentCaller()
+    digest = await caller.run(digest_writer, digest_prompt, ProposalDigest)
+
+    _DIGEST_CACHE[key] = digest
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(digest.model_dump_json(indent=2), encoding="utf-8")
+    return digest
+
+
+def _format_digest(digest: ProposalDigest, heading: str = "###") -> str:
+    lines: List[str] = [f"{heading} {digest.title}", digest.summary]
+    if digest.key_points:
+        lines.append("- 主要な論点:")
+        lines.extend([f"  - {p}" for p in digest.key_points])
+    if digest.investment:
+        lines.append(f"- 予算・投資規模: {digest.investment}")
+    if digest.risks:
+        lines.append("- 主なリスク:")
+        lines.extend([f"  - {r}" for r in digest.risks])
+    return "\n".join(lines)
+
+
+def _format_digests(digests: Dict[str, ProposalDigest]) -> str:
+    sections: List[str] = ["本会議では以下の候補企画書を比較検討し、同じ予算枠にどの案を採用すべきかを議論します。"]
+    for candidate_id, digest in digests.items():
+        sections.append(_format_digest(digest, heading=f"### {candidate_id}:"))
+    return "\n\n".join(sections)
+
+
+async def _run_comparative_meeting(
+    proposals: Dict[str, str],
+    rounds: int = 12,
+    context_turns: int = 6,
+    verbose: bool = True,
+    cache_dir: Optional[Path] = None,
+    http_pool: Optional[HttpPoolConfig] = None,
+    on_result: Optional[Callable[[MeetingResult], None]] = None,
+) -> Tuple[str, str, str]:
+    """複数の候補企画書を1回の会議で比較討論する.
+
+    各候補はダイジェスト化（キャッシュ済みなら再利用）した上で同じ討論に載せ、
+    議事録・対話履歴・比較評価レポートのMarkdownを返す。
+    http_pool を指定すると、全エージェントの呼び出しでその設定の共有HTTPクライアントを使う。
+    on_result を指定すると、発言履歴と計測値を含む MeetingResult を受け取れる
+    （比較評価レポートは evaluation、想定問答と改訂企画書は空）。
+    """
+    if len(proposals) < 2:
+        raise ValueError("比較会議には2件以上の企画書が必要です。")
+
+    pool = SharedHttpClient(http_pool) if http_pool is not None else None
+    try:
+        caller = AgentCaller(run_config=pool.run_config if pool is not None else None)
+        result = await _compare_proposals(
+            proposals, rounds, context_turns, verbose, cache_dir, caller
+        )
+        if pool is not None and verbose:
+            print(format_pool_stats(pool.stats()))
+        if on_result is not None:
+            on_result(result)
+        return result.minutes, result.discussion_log, result.evaluation
+    finally:
+        if pool is not None:
+            await pool.aclose()
+
+
+async def _compare_proposals(
+    proposals: Dict[str, str],
+    rounds: int,
+    context_turns: int,
+    verbose: bool,
+    cache_dir: Optional[Path],
+    caller: AgentCaller,
+) -> MeetingResult:
+    started_at = time.time()
+    roles = list(ROLE_INSTRUCTIONS.keys())
+    effective_rounds = max(rounds, len(roles))
+
+    digest_writer = create_digest_writer()
+    facilitator = create_facilitator()
+    participants = {role: create_participant(role) for role in roles}
+    minutes_writer = create_minutes_writer()
+    comparative_evaluator = create_comparative_evaluator()
+
+    if verbose:
+        print("=" * 80)
+        print("🏢 比較経営会議を開始します")
+        print("=" * 80)
+        print(f"\n📑 候補: {', '.join(proposals.keys())}")
+
+    digest_list = await asyncio.gather(
+        *[
+            _get_proposal_digest(
+                text, digest_writer, cache_dir=cache_dir, caller=caller
+            )
+            for text in proposals.values()
+        ]
+    )
+    digests = dict(zip(proposals.keys(), digest_list))
+    candidates_markdown = _format_digests(digests)
+
+    if verbose:
+        print(f"📋 参加者: {', '.join(roles)}")
+        print(f"🔄 討論ラウンド数: {effective_rounds}\n")
+
+    turns, counts = await _run_debate(
+        proposal_markdown=candidates_markdown,
+        roles=roles,
+        facilitator=facilitator,
+        participants=participants,
+        effective_rounds=effective_rounds,
+        context_turns=context_turns,
+        verbose=verbose,
+        caller=caller,
+    )
+
+    if verbose:
+        print("\n" + "=" * 80)
+        print("✅ 討論完了")
+        print("=" * 80)
+        print("\n📝 議事録・比較評価レポートを生成中...\n")
+
+    full_discussion = _format_turns(turns, include_details=True)
+    discussion_log_md = _render_discussion_log(
+        turns, roles, counts, title="比較経営会議 対話履歴"
+    )
+
+    minutes_prompt = f"""以下の比較経営会議の討論ログを議事録にまとめてください。
+複数の候補企画書を比較した会議である点を踏まえ、候補ごとの論点を整理してください。
+
+## 候補企画書
+{candidates_markdown}
+
+## 参加者
+""" + "\n".join([f"- {role}" for role in roles]) + f"""
+
+## 討論ログ
+{full_discussion}
+"""
+
+    comparison_prompt = f"""以下の候補企画書を経営会議の議論を踏まえて比較評価し、順位を付けてください。
+
+## 候補企画書
+{candidates_markdown}
+
+## 討論ログ
+{full_discussion}
+
+すべての候補を同一の基準で評価し、推奨案とその判断理由を明確にしてください。
+"""
+
+    minutes, comparison = await asyncio.gather(
+        caller.run(minutes_writer, minutes_prompt, MinutesOutput),
+        caller.run(
+            comparative_evaluator, comparison_prompt, ComparativeEvaluationOutput
+        ),
+    )
+
+    if verbose:
+        print("✅ すべての成果物の生成が完了しました\n")
+
+    # 議事録と比較評価は並行して作成するため、モデル名はエージェントごとの最後の記録から取る
+    models_by_agent = {record.agent: record.model for record in caller.records}
+    return MeetingResult(
+        minutes=minutes.markdown,
+        qa="",
+        refined_proposal="",
+        discussion_log=discussion_log_md,
+        evaluation=_render_comparison_markdown(comparison, list(proposals)),
+        turns=turns,
+        started_at=started_at,
+        duration=time.time() - started_at,
+        call_records=caller.records,
+        artifact_models={
+            "minutes": models_by_agent.get(minutes_writer.name, ""),
+            "evaluation": models_by_agent.get(comparative_evaluator.name, ""),
+        },
+    )
+
+
+def run_comparative_meeting(
+    proposals: Dict[str, str],
+    rounds: int = 12,
+    context_turns: int = 6,
+    verbose: bool = True,
+    cache_dir: Optional[Path] = None,
+    http_pool: Optional[HttpPoolConfig] = None,
+    on_result: Optional[Callable[[MeetingResult], None]] = None,
+) -> Tuple[str, str, str]:
+    return asyncio.run(
+        _run_comparative_meeting(
+            proposals=proposals,
+            rounds=rounds,
+            context_turns=context_turns,
+            verbose=verbose,
+            cache_dir=cache_dir,
+            http_pool=http_pool,
+            on_result=on_result,
         )
     )